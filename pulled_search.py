@@ -36,9 +36,11 @@ exit 2
 
     Usage:
         pulled_search.py -c file -d path
-            {-P [-m path] [-a] [-i | -e [-b] | -r] |
-             -F /path/filename [-a] [-i | -e [-b -g] | -r] |
-             -I [-n path]}
+            {-P [-m path] [-a] [-j N] [-i | -e [-b] | -r] |
+             -F /path/filename [-a] [-j N] [-i | -e [-b -g] | -r] |
+             -I [-n path] [-j N] [-L] |
+             -B [-j N] |
+             -W [-i | -e [-b -g] | -r]}
             [-t email {email2 email3 ...} {-s subject_line}]
             [-y flavor_id]
             [-v | -h]
@@ -56,6 +58,8 @@ exit 2
             -m dir_path => Directory to monitor for doc ID files.
                 NOTE: This will override the config file setting.
             -a => This is an archive log search.
+            -j N => Number of worker processes used to search the log files.
+                Default is 1 (no worker pool).
 
         -F /path/filename => Process DocIDs from an input file.
             -i => Insert the log entries into Mongodb.
@@ -64,10 +68,33 @@ exit 2
                 -g => Sends data via email body instead of as an attachment.
             -r => Publish log entries to RabbitMQ.
             -a => This is an archive log search.
+            -j N => Number of worker processes used to search the log files.
+                Default is 1 (no worker pool).
 
         -I => Insert Pulled Search files into Mongodb.
             -n dir_path => Directory to monitor for pulled search files.  This
                 overrides the config file setting.
+            -j N => Number of worker threads used to process the files.  The
+                threads share one Mongo writer and each file is inserted in
+                its own batch.  Default is 1 (no worker pool).
+            -L => Monitor the directory and insert new files as they arrive.
+                The directory is also rescanned every monitor_interval
+                seconds.  Runs until interrupted.
+
+        -B => Build or update the docid index of the archive log files.
+            Only new or changed log files are indexed.
+            -j N => Number of worker processes used to index the log files.
+                Default is 1 (no worker pool).
+
+        -W => Watch the active log files for new accesses to the recalled
+            docids in the watchlist (see watch_file).  Only log entries
+            appended since the last check are searched.  Runs until
+            interrupted.
+            -i => Insert the log entries into Mongodb.
+            -e => Email log entries.
+                -b => Summary count of docid findings written to file.
+                -g => Sends data via email body instead of as an attachment.
+            -r => Publish log entries to RabbitMQ.
 
         -t email_address(es) => Send output to one or more email addresses for
             reporting any errors detected within the program.
@@ -81,8 +108,9 @@ exit 2
             the incorrect servername will be set in the JSON document.
 
         NOTE 1:  -v or -h overrides the other options.
-        NOTE 2:  -s requires -t option to be included.
-        NOTE 3:  -P, -F and -I are XOR options.
+        NOTE 2:  -s requires -t option to be included and -L requires -I
+            option to be included.
+        NOTE 3:  -P, -F, -I, -B and -W are XOR options.
         NOTE 4:  -m and -n options will override the configuration settings.
             The -m option is mapped to the doc_dir configuration entry, and
             the -n option is mapped to the monitor_dir configuration entry.
@@ -91,6 +119,18 @@ exit 2
             of compressed file will not work.
         NOTE 6: The -b option writes file to base directory of processed_file
             in the configuration file.  File is named: docid_transfer.YYYYMM
+        NOTE 7: If index_dir is set in the configuration file, -a searches
+            will only read the indexed lines of archive log files that have
+            not changed since they were indexed (see -B option).  When
+            index_dir or bloom_dir is set, -a searches only match a docid
+            where it is captured by docid_token.
+        NOTE 8: If bloom_dir is set in the configuration file, -a searches
+            write a Bloom filter sidecar of the docids in each archive log
+            file the first time it is scanned.  Later -a searches skip the
+            archive log files where the sidecar rules out the docids.
+        NOTE 9: If watch_file is set in the configuration file, the docids
+            processed by the -P and -F options are added to the watchlist
+            used by the -W option.
 
     Input files:
         The file for the -F option must be in the following layout in ACSII
@@ -117,7 +157,18 @@ exit 2
     doc_dir = ["DOC_DIR_PATH", "DOC_DIR_PATH2"]
     # Path and file name for previous processed files.
     processed_file = "BASE_PATH/processed/processed"
+    # Store for the previous processed docids:  file|sqlite
+    #   sqlite keeps them in processed_file + ".db" and imports the flat
+    #   processed_file the first time the database is opened.
+    processed_store = "file"
+    # Number of months processed docids are kept in the sqlite store.
+    #   Set to None to keep them forever.
+    processed_retention = None
+    # File where the watermarks of the pulled file directories are kept.
+    #   Set to None to examine all of the pulled files in each run.
+    watermark_file = None
     # Temporary file where check_log will write to.
+    # Note:  Only used when search_backend is set to "checklog".
     outfile = "BASE_PATH/tmp/checklog.out"
     # Directory path to where error and non-processed files are saved to.
     error_dir = "BASE_PATH/search_error"
@@ -131,18 +182,62 @@ exit 2
     file_regex = "-PULLED-"
     # Regular expression for search for recalled products.
     pattern = "JAC.pull.subtype.*.SECURITY RECALL"
+    # File where the security recall verdicts of the pulled files are kept.
+    #   Set to None to search every pulled file on each run.
+    recall_cache = None
     # Type of apache log files to checked.
     log_type = "access_log"
     # Mapping of commands to keywords.
     # This is for the naming of the access logs which are not always under the
     #   command name.
     command = {"eucom": "intelink", "acic": "usacic"}
+    # Search backend used to search the log files.
+    # Values:  "native" - In-process streaming search (default).
+    #          "checklog" - Use the check_log program (writes to the outfile).
+    search_backend = "native"
+
+    # Directory where the docid index (index.db) of the archive log files is
+    #   kept.  Set to None to not use an index.  The index is built by the -B
+    #   option.
+    index_dir = None
+    # Regular expression to locate docids in a log entry.  Must contain one
+    #   group which is the docid.  Used by the archive index and the Bloom
+    #   filters, archive searches then only match docids captured by it.
+    docid_token = "docid=([0-9A-Za-z]+)"
+    # Directory where the Bloom filter sidecars of the archive log files are
+    #   kept.  Set to None to not use Bloom filters.  Uses docid_token.
+    bloom_dir = None
+    # SQLite file of the catalog of the archive log files.  Set to None to
+    #   list the archive directories for each search.
+    catalog_file = None
+    # Skip the log files which cannot hold entries between the docid's
+    #   published and pulled dates:  True|False
+    prune_files = False
+    # Regular expression of the date stamp (YYYYMMDD) in the log file names.
+    #   Must contain one group which is the date stamp.  Set to None to use
+    #   the modification time of the log files.
+    file_date_regex = None
+    # Number of days of log entries in a log file from its date stamp.
+    file_date_days = 1
+
+    # File where the watchlist of recalled docids is kept.  Set to None to
+    #   not keep a watchlist.  Required for the -W option.
+    watch_file = None
+    # File where the watch mode checkpoints of the active log files are
+    #   kept.  Default is watch_file with a .checkpoint extension.
+    checkpoint_file = None
+    # Number of seconds between checks of the active log files.
+    watch_interval = 60
 
     # Email Configuration section.
     # Email address to rabbitmq alias for the rmq_2_mail.py program.
     to_addr = None
     # Name of the RabbitMQ queue.
     subj = None
+    # Send the emails from a background queue over one SMTP session.
+    mail_queue = False
+    # Maximum number of emails waiting in the mail queue, 0 is no limit.
+    mail_queue_size = 0
 
     # RabbitMQ Configuration section.
     # Login information.
@@ -171,11 +266,20 @@ exit 2
     q_durable = True
     # Do queues automatically delete once message is processed:  True|False
     auto_delete = False
+    # Maximum size in bytes of the log entries in an email or RabbitMQ
+    #   message.  Larger JSON documents are split into parts.
+    #   Set to None to send each JSON document in one message.
+    chunk_size = None
+    # Encoding of the email and RabbitMQ message payloads:  None|gzip
+    #   gzip compresses and base64 encodes the JSON behind a marker.
+    payload_encoding = None
 
     # Directory where to monitor for new files to insert into Mongodb.
     monitor_dir = "MONITOR_DIR_PATH"
     # Regular expression for search for Insert/Mongodb file names.
     mfile_regex = "_mongo.json"
+    # Number of seconds between rescans of monitor_dir for the -I -L option.
+    monitor_interval = 300
 
     # Directory path to where Insert/Mongodb archived files are saved to.
     marchive_dir = "BASE_PATH/mongo_archive"
@@ -184,6 +288,15 @@ exit 2
     merror_dir = "BASE_PATH/mongo_error"
     # The config file is saved to the same location as the -d option.
     mconfig = "mongo"
+    # Number of documents to insert into Mongo at a time.  If greater than 1,
+    #   documents are inserted in bulk inserts over a single connection.
+    mongo_batch = 1000
+    # Number of batches that can wait to be inserted by a writer thread while
+    #   parsing continues.  Set to 0 to insert the batches in-line.
+    mongo_queue = 4
+    # Upsert documents keyed by a hash of the docid, server and log entry,
+    #   so processing the same data again does not add duplicates.
+    mongo_upsert = False
 
     # WARNING: Do not modify this section unless you know regular expressions.
     # Log parsing section.
@@ -284,9 +397,24 @@ import os
 import socket
 import datetime
 import re
+import gzip
+import concurrent.futures
+import sqlite3
+import ctypes
+import ctypes.util
+import select
+import struct
+import hashlib
+import math
+import mmap
+import time
+import queue
+import threading
 import base64
 import ast
 import binascii
+import zlib
+import uuid
 
 try:
     import simplejson as json
@@ -298,8 +426,12 @@ import smtplib
 from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
 import getpass
 
+# Third party
+from pymongo import UpdateOne
+
 # Local
 try:
     from .lib import gen_libs
@@ -319,6 +451,9 @@ except (ValueError, ImportError) as err:
 
 __version__ = version.__version__
 
+# Marker in front of a gzip compressed and base64 encoded payload
+PAYLOAD_MARKER = "PSGZ1:"
+
 
 def help_message():
 
@@ -334,7 +469,7 @@ def help_message():
     print(__doc__)
 
 
-def non_processed(docid_files, error_dir, log, mail=None):
+def non_processed(docid_files, error_dir, log, mail=None, mail_sink=None):
 
     """Function:  non_processed
 
@@ -345,6 +480,7 @@ def non_processed(docid_files, error_dir, log, mail=None):
         (input) error_dir -> Directory to move non-processed files to
         (input) log -> Log class instance
         (input) mail -> Mail instance
+        (input) mail_sink -> MailSink class instance
 
     """
 
@@ -365,7 +501,31 @@ def non_processed(docid_files, error_dir, log, mail=None):
         if mail:
             log.log_info("non_processed:  Send email of non-processed file.")
             mail.add_2_msg(docid_files)
-            mail.send_mail()
+            send_mail(mail, mail_sink=mail_sink)
+
+
+def get_archive_months(pubdate, **kwargs):
+
+    """Function:  get_archive_months
+
+    Description:  Get list of archive year/month directories between the
+        published date and the pulled date (or yesterday).
+
+    Arguments:
+        (input) pubdate -> Published date of document
+        (input) kwargs:
+            pulldate -> Date document was pulled.
+        (output) List of year/month directories (YYYY/MM)
+
+    """
+
+    start_dt = datetime.datetime.strptime(pubdate[0:6], "%Y%m")
+    end_dt = datetime.datetime.strptime(kwargs.get("pulldate")[0:6], "%Y%m") \
+        if kwargs.get("pulldate", None)                                      \
+        else datetime.datetime.now() - datetime.timedelta(days=1)
+
+    return [datetime.date.strftime(date, "%Y/%m")
+            for date in gen_libs.date_range(start_dt, end_dt)]
 
 
 def get_archive_files(archive_dir, cmd, pubdate, cmd_regex, **kwargs):
@@ -387,20 +547,140 @@ def get_archive_files(archive_dir, cmd, pubdate, cmd_regex, **kwargs):
 
     log_files = []
     cmd_dir = os.path.join(archive_dir, cmd)
-    start_dt = datetime.datetime.strptime(pubdate[0:6], "%Y%m")
-    end_dt = datetime.datetime.strptime(kwargs.get("pulldate")[0:6], "%Y%m") \
-        if kwargs.get("pulldate", None)                                      \
-        else datetime.datetime.now() - datetime.timedelta(days=1)
 
-    for date in gen_libs.date_range(start_dt, end_dt):
-        yearmon = datetime.date.strftime(date, "%Y/%m")
+    for yearmon in get_archive_months(pubdate, **kwargs):
         full_dir = os.path.join(cmd_dir, yearmon)
-        log_files = log_files + gen_libs.filename_search(
-            full_dir, cmd_regex, add_path=True)
+        log_files.extend(
+            gen_libs.filename_search(full_dir, cmd_regex, add_path=True))
 
     return log_files
 
 
+def open_catalog(catalog_file):
+
+    """Function:  open_catalog
+
+    Description:  Open the archive catalog database and create the tables if
+        they do not exist.
+
+    Arguments:
+        (input) catalog_file -> SQLite database file of the archive catalog
+        (output) conn -> SQLite connection instance
+
+    """
+
+    conn = sqlite3.connect(catalog_file, timeout=60)
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS dirs (
+            path TEXT PRIMARY KEY, mtime REAL);
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY, dir TEXT, command TEXT, month TEXT,
+            server TEXT, size INTEGER, mtime REAL, compressed INTEGER);
+        CREATE INDEX IF NOT EXISTS files_month ON files (command, month);
+        CREATE INDEX IF NOT EXISTS files_dir ON files (dir);
+        """)
+
+    return conn
+
+
+def refresh_catalog(conn, month_dir, cmd, yearmon):
+
+    """Function:  refresh_catalog
+
+    Description:  Update the catalog entries of an archive month directory if
+        the directory has changed since it was last listed.
+
+    Arguments:
+        (input) conn -> SQLite connection instance
+        (input) month_dir -> Archive month directory
+        (input) cmd -> Command of the directory
+        (input) yearmon -> Year/month of the directory (YYYY/MM)
+        (output) status -> True|False - Directory was listed
+
+    """
+
+    try:
+        mtime = os.stat(month_dir).st_mtime
+
+    except FileNotFoundError:
+        mtime = None
+
+    row = conn.execute(
+        "SELECT mtime FROM dirs WHERE path = ?", (month_dir,)).fetchone()
+    status = row is None or row[0] != mtime
+
+    if status:
+        entries = []
+
+        # A removed directory is kept with no files
+        if mtime is not None:
+            with os.scandir(month_dir) as dir_entries:
+                for entry in dir_entries:
+                    if not entry.is_file():
+                        continue
+
+                    data = entry.name.split(".")
+                    stat = entry.stat()
+                    entries.append((
+                        entry.path, month_dir, cmd, yearmon,
+                        data[-2] if data[-1] == "gz" else data[-1],
+                        stat.st_size, stat.st_mtime,
+                        int(data[-1] == "gz")))
+
+        with conn:
+            conn.execute("DELETE FROM files WHERE dir = ?", (month_dir,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                entries)
+            # A directory changed within the last few seconds is listed again
+            #   next time, in case of a change in the same mtime tick
+            conn.execute(
+                "INSERT OR REPLACE INTO dirs VALUES (?, ?)",
+                (month_dir, mtime if mtime is None or time.time() - mtime > 2
+                 else -1))
+
+    return status
+
+
+def get_catalog_files(cfg, cmd, pubdate, cmd_regex, **kwargs):
+
+    """Function:  get_catalog_files
+
+    Description:  Get list of archive log files from the archive catalog.
+        Only the month directories that have changed since they were last
+        listed are listed again.
+
+    Arguments:
+        (input) cfg -> Configuration setup
+        (input) cmd -> Command to search in
+        (input) pubdate -> Published date of document
+        (input) cmd_regex -> Regular expression of log file name
+        (input) kwargs:
+            pulldate -> Date document was pulled.
+        (output) log_files -> List of archive log files to search
+
+    """
+
+    months = get_archive_months(pubdate, **kwargs)
+    conn = open_catalog(cfg.catalog_file)
+
+    try:
+        for yearmon in months:
+            refresh_catalog(
+                conn, os.path.join(cfg.log_dir, cmd, yearmon), cmd, yearmon)
+
+        rows = conn.execute(
+            "SELECT path FROM files WHERE command = ? AND month >= ? AND"
+            " month <= ? ORDER BY month, path",
+            (cmd, months[0], months[-1])).fetchall() if months else []
+
+    finally:
+        conn.close()
+
+    return [path for path, in rows
+            if re.search(cmd_regex, os.path.basename(path))]
+
+
 def rm_file(ofile, log):
 
     """Function:  rm_file
@@ -420,833 +700,4199 @@ def rm_file(ofile, log):
             log.log_warn(f"rm_file:  {err_msg}")
 
 
-def process_data(ofile, log_json, fname, server, log):
+def get_command(cfg, command):
 
-    """Function:  process_data
+    """Function:  get_command
 
-    Description:  Convert data from file into dictionary list.
+    Description:  Get the log file keyword for the command.  The command is
+        mapped to a different keyword if one is set in the configuration.
 
     Arguments:
-        (input) ofile -> File name - containing processed log entries
-        (input) log_json -> Dictionary list of log entries
+        (input) cfg -> Configuration setup
+        (input) command -> Command name
+        (output) cmd -> Log file keyword for the command
+
+    """
+
+    cmd = command.lower()
+
+    # Check to see if the command is mapped to a different keyword file
+    if cmd in cfg.command:
+        cmd = cfg.command[cmd]
+
+    return cmd
+
+
+def get_server(args, fname):
+
+    """Function:  get_server
+
+    Description:  Get the server name for the log file.  Archive log files
+        have the server name as part of the file name, otherwise it is the
+        local host.
+
+    Arguments:
+        (input) args -> ArgParser class instance
         (input) fname -> Log file name
-        (input) server -> Server name
-        (input) log -> Log class instance
-        (output) log_json -> Dictionary list of log entries
+        (output) server -> Server name
 
     """
 
-    if os.path.exists(ofile) and not gen_libs.is_empty_file(ofile):
-        log.log_info(f"process_docid:  Log entries detected in: {fname}")
-        file_log = gen_libs.file_2_list(ofile)
+    server = socket.gethostname()
 
-        log_json["servers"][server] = \
-            log_json["servers"][server] + file_log \
-            if server in log_json["servers"] else file_log
+    if args.arg_exist("-a"):
+        data = fname.split(".")
+        server = data[-2] if data[-1] == "gz" else data[-1]
 
-    return log_json
+    return server
 
 
-def process_docid(args, cfg, docid_dict, log):          # pylint:disable=R0914
+def get_log_files(args, cfg, docid_dict, log):
 
-    """Function:  process_docid
+    """Function:  get_log_files
 
-    Description:  Processes the docid.
+    Description:  Get list of log files to search for the docid.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
         (input) docid_dict -> Dictionary containing docid information
         (input) log -> Log class instance
-        (output) status -> True|False - File has successfully processed
+        (output) log_files -> List of log files to search
 
     """
 
-    status = True
-    docid_dict = dict(docid_dict)
-    log.log_info(f"process_docid:  Processing docid: {docid_dict}")
-    cmd = docid_dict["command"].lower()
-    server = socket.gethostname()
-
-    # Check to see if the command is mapped to a different keyword file
-    if cmd in cfg.command:
-        cmd = cfg.command[cmd]
-
+    cmd = get_command(cfg, docid_dict["command"])
     cmd_regex = cmd + ".*" + cfg.log_type
 
     if args.arg_exist("-a"):
         log.log_info(
-            f"process_docid:  Searching archive directory: {cfg.log_dir}")
+            f"get_log_files:  Searching archive directory: {cfg.log_dir}")
         pulldate = docid_dict["pulldate"] if "pulldate" in docid_dict else None
-        log_files = get_archive_files(
-            cfg.log_dir, cmd, docid_dict["pubdate"], cmd_regex,
-            pulldate=pulldate)
+
+        if getattr(cfg, "catalog_file", None):
+            log_files = get_catalog_files(
+                cfg, cmd, docid_dict["pubdate"], cmd_regex,
+                pulldate=pulldate)
+
+        else:
+            log_files = get_archive_files(
+                cfg.log_dir, cmd, docid_dict["pubdate"], cmd_regex,
+                pulldate=pulldate)
 
     else:
         log.log_info(
-            f"process_docid:  Searching apache log directory: {cfg.log_dir}")
+            f"get_log_files:  Searching apache log directory: {cfg.log_dir}")
         log_files = gen_libs.filename_search(
             cfg.log_dir, cmd_regex, add_path=True)
 
-    dtg = datetime.datetime.strftime(
-        datetime.datetime.now(), "%Y-%m-%dT%H:%M:%SZ")
-    log_json = {"docid": docid_dict["docid"], "command": docid_dict["command"],
-                "pubDate": docid_dict["pubdate"], "network": cfg.enclave,
-                "asOf": dtg, "servers": {}}
-    log.log_info("process_docid:  Running check_log search.")
-
-    for fname in log_files:
-
-        if args.arg_exist("-a"):
-            data = fname.split(".")
-            server = data[-2] if data[-1] == "gz" else data[-1]
-
-        ofile = cfg.outfile + datetime.datetime.strftime(
-            datetime.datetime.now(), "%Y%m%d%H%M%S")
-        cmdline = [
-            "check_log.py", "-g", "w", "-f", fname, "-S",
-            [docid_dict["docid"]], "-k", "or", "-o", ofile, "-z"]
-        chk_opt_val = ["-g", "-f", "-S", "-k", "-o"]
-        multi_val = ["-f"]
-        chk_args = gen_class.ArgParser(
-            cmdline, opt_val=chk_opt_val, multi_val=multi_val, do_parse=True)
-        check_log.run_program(chk_args)
-        log_json = process_data(ofile, log_json, fname, server, log)
-        rm_file(ofile, log)
-
-    status = process_json(args, cfg, log, log_json)
-
-    return status
+    return log_files
 
 
-def insert_mongo(args, cfg, log, data):
+def get_search_window(docid_dict):
 
-    """Function:  insert_mongo
+    """Function:  get_search_window
 
-    Description:  Insert JSON document into Mongo database.
+    Description:  Get the time window to search for a docid, from the day
+        before the published date to the day after the pulled date (or now).
+        The extra day allows for the time zone of the log entries.
 
     Arguments:
-        (input) args -> ArgParser class instance
-        (input) cfg -> Configuration setup
-        (input) log -> Log class instance
-        (input) log_json -> JSON log document
-        (output) status -> True|False - Successful insertion into Mongo
+        (input) docid_dict -> Dictionary containing docid information
+        (output) window -> (start, end) datetimes or None if the dates are
+            not valid
 
     """
 
-    status = True
-    mcfg = gen_libs.load_module(cfg.mconfig, args.get_val("-d"))
-    mongo_stat = mongo_libs.ins_doc(mcfg, mcfg.dbs, mcfg.tbl, data)
-
-    if not mongo_stat[0]:
-        log.log_err("insert_mongo:  Insertion into Mongo failed.")
-        log.log_err(f"Mongo error message:  {mongo_stat[1]}")
-        fname = os.path.join(
-            cfg.merror_dir, data["docid"] + ".failed_to_insert.json")
-        gen_libs.write_file(fname=fname, mode="a", data=data)
-        status = False
+    try:
+        start_dt = datetime.datetime.strptime(
+            docid_dict["pubdate"][0:8], "%Y%m%d")
+        end_dt = datetime.datetime.strptime(
+            docid_dict["pulldate"][0:8], "%Y%m%d") \
+            + datetime.timedelta(days=1) if docid_dict.get("pulldate", None) \
+            else datetime.datetime.now()
+        window = (start_dt - datetime.timedelta(days=1),
+                  end_dt + datetime.timedelta(days=1))
 
-    if not status and args.get_val("-t"):
-        mail = gen_class.setup_mail(
-            args.get_val("-t"), subj="Pulledsearch_Failed_to_Insert_Mongo")
-        mail.add_2_msg("Failed to insert the entries in the file into Mongo")
-        mail.add_2_msg("File: " + fname)
-        mail.send_mail()
+    except (KeyError, ValueError):
+        window = None
 
-    return status
+    return window
 
 
-def filter_data(cfg, log, log_json):
+def prune_log_files(cfg, log_files, docid_dict, mtimes):
 
-    """Function:  filter_data
+    """Function:  prune_log_files
 
-    Description:  Filter out non-required data entries.
+    Description:  Drop the log files whose time span cannot overlap the
+        search window of the docid.  If file_date_regex is set, a file with a
+        date stamp in its name holds the entries from the date stamp for
+        file_date_days days.  Otherwise a file's entries end at the file's
+        modification time.
 
     Arguments:
         (input) cfg -> Configuration setup
-        (input) log -> Log class instance
-        (input) log_json -> Dictionary log document
-        (output) log_json -> Modified dictionary log document
+        (input) log_files -> List of log files
+        (input) docid_dict -> Dictionary containing docid information
+        (input) mtimes -> Dictionary of file modification times by log file
+        (output) log_files -> List of log files that may hold the docid
 
     """
 
-    log_json = dict(log_json)
-    log.log_info(
-        f"filter_data:  Writing to raw data toarchive: {cfg.raw_archive_dir}")
-    fname = os.path.join(
-        cfg.raw_archive_dir,
-        log_json["docid"] + "." + log_json["asOf"] + ".raw")
-    gen_libs.write_file(fname=fname, mode="w", data=log_json)
-    log.log_info("filter_data:  Start filtering JSON document.")
+    window = get_search_window(docid_dict)
+    date_regex = getattr(cfg, "file_date_regex", None)
+    span = datetime.timedelta(days=getattr(cfg, "file_date_days", 1))
+    pruned = list(log_files) if window is None else []
 
-    # Loop on servers
-    for svr in log_json["servers"]:
-        uname = os.path.join(
-            cfg.unparsable_dir,
-            log_json["docid"] + "." + svr + log_json["asOf"] + ".unparsable")
-        parsed_list = []
+    for fname in log_files if window else []:
+        match = re.search(date_regex, os.path.basename(fname)) \
+            if date_regex else None
+        stamp = None
 
-        # Loop on log entries for each server
-        for line in log_json["servers"][svr]:
-            parsed_line = re.match(cfg.regex, line)
+        if match:
+            try:
+                stamp = datetime.datetime.strptime(match.group(1), "%Y%m%d")
 
-            # Parse the log entry
-            if parsed_line:
-                parsed_line = parsed_line.groupdict()
+            except ValueError:
+                stamp = None
 
-                # Filter out non-related entries
-                if log_json["docid"] in parsed_line["url"]      \
-                   and "transformer" in parsed_line["url"]      \
-                   and "2ndReview" not in parsed_line["url"]    \
-                   and parsed_line["status"] == "200"           \
-                   and ".ic.gov" not in parsed_line["userid"]:
-                    parsed_list.append(line)
+        if stamp is None and fname not in mtimes:
+            try:
+                mtimes[fname] = os.path.getmtime(fname)
 
-            else:
-                log.log_warn(
-                    f"filter_data:  Unparsable data written to {uname}")
-                gen_libs.write_file(fname=uname, mode="a", data=line)
+            except OSError:
+                mtimes[fname] = None
 
-        log_json["servers"][svr] = parsed_list
+        if stamp is not None:
+            keep = stamp < window[1] and stamp + span > window[0]
 
-    return log_json
+        else:
+            keep = mtimes[fname] is None \
+                or mtimes[fname] >= window[0].timestamp()
 
+        if keep:
+            pruned.append(fname)
 
-def parse_data(args, cfg, log, log_json):
+    return pruned
 
-    """Function:  parse_data
 
-    Description:  Parse data prior to inserting into Mongo database.
+def create_log_json(cfg, docid_dict, dtg):
+
+    """Function:  create_log_json
+
+    Description:  Create the JSON log document for the docid.
 
     Arguments:
-        (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
-        (input) log -> Log class instance
-        (input) log_json -> JSON log document
-        (output) status -> True|False - Successful insertion into Mongo
+        (input) docid_dict -> Dictionary containing docid information
+        (input) dtg -> Date and time of the search
+        (output) log_json -> JSON log document
 
     """
 
-    log.log_info("parse_data:  Start parsing JSON document.")
-    status = True
-    first_stage = {}
-    first_stage["command"] = log_json["command"]
-    first_stage["docid"] = log_json["docid"]
-    first_stage["network"] = log_json["network"]
-    first_stage["pubDate"] = log_json["pubDate"]
-    first_stage["asOf"] = log_json["asOf"]
-    second_stage = dict(first_stage)
-    log.log_info(f"parse_data:  Writing to archive: {cfg.marchive_dir}")
-    fname = os.path.join(
-        cfg.marchive_dir, log_json["docid"] + "." + log_json["asOf"] + ".json")
-    gen_libs.write_file(fname=fname, mode="w", data=log_json)
-    log.log_info(f'parse_data:  Parsing docid: {first_stage["docid"]}')
-
-    # Loop on servers
-    for svr in log_json["servers"]:
-        second_stage["server"] = svr
-        third_stage = dict(second_stage)
+    return {"docid": docid_dict["docid"], "command": docid_dict["command"],
+            "pubDate": docid_dict["pubdate"], "network": cfg.enclave,
+            "asOf": dtg, "servers": {}}
 
-        # Loop on log entries for each server
-        for line in log_json["servers"][svr]:
-            third_stage["entry"] = line
-            parsed_line = re.match(cfg.regex, line)
 
-            # Parse the log entry
-            parsed_line = parsed_line.groupdict()
+def run_checklog(cfg, fname, docids):
 
-            for entry in parsed_line:
-                if entry in cfg.allowable and entry == "url":
-                    third_stage[entry] = \
-                        "https://" + parsed_line[entry]
+    """Function:  run_checklog
 
-                elif entry in cfg.allowable:
-                    third_stage[entry] = parsed_line[entry]
+    Description:  Run a check_log search of the log file for one or more
+        docids.
 
-            status = status & insert_mongo(args, cfg, log, third_stage)
+    Arguments:
+        (input) cfg -> Configuration setup
+        (input) fname -> Log file name
+        (input) docids -> List of docids to search for
+        (output) ofile -> File name - containing matched log entries
 
-            third_stage = dict(second_stage)
+    """
 
-        second_stage = dict(first_stage)
+    ofile = cfg.outfile + datetime.datetime.strftime(
+        datetime.datetime.now(), "%Y%m%d%H%M%S")
+    cmdline = [
+        "check_log.py", "-g", "w", "-f", fname, "-S", list(docids), "-k",
+        "or", "-o", ofile, "-z"]
+    chk_opt_val = ["-g", "-f", "-S", "-k", "-o"]
+    multi_val = ["-f"]
+    chk_args = gen_class.ArgParser(
+        cmdline, opt_val=chk_opt_val, multi_val=multi_val, do_parse=True)
+    check_log.run_program(chk_args)
 
-    return status
+    return ofile
 
 
-def write_summary(cfg, log, log_json):
+def split_data(ofile, log_jsons, fname, server, log):
 
-    """Function:  write_summary
+    """Function:  split_data
 
-    Description:  Write summary results for docid to docid transfer file.
+    Description:  Convert data from file into dictionary lists and split the
+        log entries out to the JSON log document of each docid they contain.
 
     Arguments:
-        (input) cfg -> Configuration setup
+        (input) ofile -> File name - containing processed log entries
+        (input) log_jsons -> Dictionary of JSON log documents keyed by docid
+        (input) fname -> Log file name
+        (input) server -> Server name
         (input) log -> Log class instance
-        (input) log_json -> JSON log document
-        (output) status -> True|False - Successful processing
+        (output) log_jsons -> Dictionary of JSON log documents keyed by docid
 
     """
 
-    log.log_info(f'write_summary:  Updating Docid Transfer summary for'
-                 f' {log_json["docid"]}')
-    yearmon = datetime.datetime.strftime(datetime.datetime.now(), "%Y%m")
-    fname = os.path.join(
-        os.path.dirname(cfg.processed_file), "docid_transfer." + yearmon)
-    file_entry = {
-        "docid": log_json["docid"], "network": log_json["network"],
-        "count": 0}
-
-    for svr in log_json["servers"]:
-        file_entry["count"] += len(log_json["servers"][svr])
+    if os.path.exists(ofile) and not gen_libs.is_empty_file(ofile):
+        log.log_info(f"split_data:  Log entries detected in: {fname}")
 
-    log.log_info(f"write_summary: {file_entry}")
+        for line in gen_libs.file_2_list(ofile):
+            for docid, log_json in log_jsons.items():
+                if docid in line:
+                    log_json["servers"].setdefault(server, []).append(line)
 
-    if file_entry["count"]:
-        with open(fname, mode="a", encoding="UTF-8") as fhdr:
-            fhdr.write(json.dumps(file_entry) + "\n")
+    return log_jsons
 
 
-def process_json(args, cfg, log, log_json):             # pylint:disable=R0915
+def create_matcher(docids):
 
-    """Function:  process_json
+    """Function:  create_matcher
 
-    Description:  Process the JSON document from the pulled search results.
+    Description:  Create a single compiled regular expression that will
+        match any of the docids in one pass over a log entry.
 
     Arguments:
-        (input) args -> ArgParser class instance
-        (input) cfg -> Configuration setup
-        (input) log -> Log class instance
-        (input) log_json -> JSON log document
-        (output) status -> True|False - Successful processing
+        (input) docids -> List of docids to search for
+        (output) Compiled regular expression instance
 
     """
 
-    log.log_info("process_json:  Processing JSON document.")
-    status = False
+    return re.compile(
+        "|".join(re.escape(docid) for docid in
+                 sorted(set(docids), key=len, reverse=True)))
+
+
+def match_docids(line, docids, token_regex=None):
+
+    """Function:  match_docids
+
+    Description:  Get the docids a log entry contains.  If a token regular
+        expression is passed, a docid must be one of the docid tokens of the
+        log entry, the same rule used by the archive index and the Bloom
+        filter sidecars.  Otherwise a docid can be anywhere in the entry.
+
+    Arguments:
+        (input) line -> Log entry
+        (input) docids -> List of docids to search for
+        (input) token_regex -> Compiled regular expression to locate docids
+        (output) List of docids in the log entry
+
+    """
+
+    if token_regex:
+        line_tokens = set(token_regex.findall(line))
+
+        return [docid for docid in docids if docid in line_tokens]
+
+    return [docid for docid in docids if docid in line]
+
+
+def open_log(fname):
+
+    """Function:  open_log
+
+    Description:  Open a log file for reading.  Log files ending with .gz
+        are read as gzip compressed files.
+
+    Arguments:
+        (input) fname -> Log file name
+        (output) File handler for the log file
+
+    """
+
+    if fname.endswith(".gz"):
+        return gzip.open(fname, mode="rt", encoding="UTF-8", errors="replace")
+
+    return open(fname, mode="r", encoding="UTF-8", errors="replace")
+
+
+def mmap_log_file(fname, docids, token_regex=None):
+
+    """Function:  mmap_log_file
+
+    Description:  Memory map an uncompressed log file and return the log
+        entries that contain any of the docids.  The docids are located in
+        one pass over the mapped file with a single byte pattern of all of the
+        docids and only the log entries around the hits are decoded.
+
+    Arguments:
+        (input) fname -> Log file name
+        (input) docids -> List of docids to search for
+        (input) token_regex -> Compiled regular expression to locate docids
+        (output) entries -> Dictionary of log entry lists keyed by docid
+
+    """
+
+    entries = {}
+    lines = []
+
+    with open(fname, mode="rb") as fhdr:
+        if not docids or not os.fstat(fhdr.fileno()).st_size:
+            return entries
+
+        pattern = re.compile(b"|".join(
+            re.escape(docid.encode()) for docid in set(docids)))
+
+        with mmap.mmap(fhdr.fileno(), 0, access=mmap.ACCESS_READ) as mdata:
+            match = pattern.search(mdata)
+
+            # The search goes on from the end of each hit's log entry
+            while match:
+                start = mdata.rfind(b"\n", 0, match.start()) + 1
+                end = mdata.find(b"\n", match.end())
+                end = len(mdata) if end == -1 else end
+                lines.append(mdata[start:end].decode(
+                    "UTF-8", errors="replace").rstrip("\r\n"))
+                match = pattern.search(mdata, end)
+
+    for line in lines:
+        for docid in match_docids(line, docids, token_regex):
+            entries.setdefault(docid, []).append(line)
+
+    return entries
+
+
+def scan_log_file(fname, docids, **kwargs):
+
+    """Function:  scan_log_file
+
+    Description:  Stream a log file, plain or gzip compressed, and return the
+        log entries that contain any of the docids.  If a token regular
+        expression is passed, the docids are matched against the docid tokens
+        of the log entries and if a tokens set is also passed, the docid
+        tokens of every log entry are collected.  Uncompressed log files are
+        memory mapped instead, unless the docid tokens are collected.
+
+    Arguments:
+        (input) fname -> Log file name
+        (input) docids -> List of docids to search for
+        (input) kwargs:
+            token_regex -> Compiled regular expression to locate docids
+            tokens -> Set to add the docid tokens found to
+        (output) entries -> Dictionary of log entry lists keyed by docid
+
+    """
+
+    entries = {}
+    token_regex = kwargs.get("token_regex", None)
+    tokens = kwargs.get("tokens", None)
+
+    if tokens is None and not fname.endswith(".gz"):
+        return mmap_log_file(fname, docids, token_regex=token_regex)
+
+    matcher = create_matcher(docids)
+
+    with open_log(fname) as fhdr:
+        for line in fhdr:
+            if tokens is not None:
+                tokens.update(token_regex.findall(line))
+
+            if matcher.search(line):
+                line = line.rstrip("\r\n")
+
+                for docid in match_docids(line, docids, token_regex):
+                    entries.setdefault(docid, []).append(line)
+
+    return entries
+
+
+def merge_entries(log_jsons, entries, fname, server, log):
+
+    """Function:  merge_entries
+
+    Description:  Merge the log entries found in a log file into the JSON log
+        document of each docid.
+
+    Arguments:
+        (input) log_jsons -> Dictionary of JSON log documents keyed by docid
+        (input) entries -> Dictionary of log entry lists keyed by docid
+        (input) fname -> Log file name
+        (input) server -> Server name
+        (input) log -> Log class instance
+        (output) log_jsons -> Dictionary of JSON log documents keyed by docid
+
+    """
+
+    if entries:
+        log.log_info(f"merge_entries:  Log entries detected in: {fname}")
+
+    for docid, lines in entries.items():
+        log_jsons[docid]["servers"].setdefault(server, []).extend(lines)
+
+    return log_jsons
+
+
+def open_log_bytes(fname):
+
+    """Function:  open_log_bytes
+
+    Description:  Open a log file for reading in binary mode.  Log files
+        ending with .gz are read as gzip compressed files.
+
+    Arguments:
+        (input) fname -> Log file name
+        (output) File handler for the log file
+
+    """
+
+    if fname.endswith(".gz"):
+        return gzip.open(fname, mode="rb")
+
+    return open(fname, mode="rb")
+
+
+def get_index_file(cfg):
+
+    """Function:  get_index_file
+
+    Description:  Get the SQLite database file name of the archive index.
+
+    Arguments:
+        (input) cfg -> Configuration setup
+        (output) Index file name
+
+    """
+
+    return os.path.join(cfg.index_dir, "index.db")
+
+
+def open_index(index_file):
+
+    """Function:  open_index
+
+    Description:  Open the archive index database and create the tables if
+        they do not exist.  The postings table holds one row for each line
+        of a log file that contains a docid.
+
+    Arguments:
+        (input) index_file -> SQLite database file of the archive index
+        (output) conn -> SQLite connection instance
+
+    """
+
+    conn = sqlite3.connect(index_file, timeout=60)
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY, dir TEXT, size INTEGER, mtime REAL);
+        CREATE INDEX IF NOT EXISTS files_dir ON files (dir);
+        CREATE TABLE IF NOT EXISTS postings (
+            docid TEXT, file TEXT, offset INTEGER,
+            PRIMARY KEY (docid, file, offset)) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS postings_file ON postings (file);
+        """)
+
+    return conn
+
+
+def load_index(conn, month_dir):
+
+    """Function:  load_index
+
+    Description:  Get the index entries of the log files in an archive month
+        directory.
+
+    Arguments:
+        (input) conn -> SQLite connection instance
+        (input) month_dir -> Archive month directory
+        (output) index -> Dictionary of index entries keyed by log file
+
+    """
+
+    return {path: {"size": size, "mtime": mtime}
+            for path, size, mtime in conn.execute(
+                "SELECT path, size, mtime FROM files WHERE dir = ?",
+                (month_dir,))}
+
+
+def write_index(conn, entries, removed):
+
+    """Function:  write_index
+
+    Description:  Write the index entries of the log files to the archive
+        index and drop the entries of the removed log files.  The changes
+        are made in a single transaction.
+
+    Arguments:
+        (input) conn -> SQLite connection instance
+        (input) entries -> Iterable of (log file, index entry) pairs
+        (input) removed -> List of removed log files
+
+    """
+
+    with conn:
+        for fname in removed:
+            conn.execute("DELETE FROM postings WHERE file = ?", (fname,))
+            conn.execute("DELETE FROM files WHERE path = ?", (fname,))
+
+        for fname, entry in entries:
+            conn.execute("DELETE FROM postings WHERE file = ?", (fname,))
+            conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                (fname, os.path.dirname(fname), entry["size"],
+                 entry["mtime"]))
+            conn.executemany(
+                "INSERT OR IGNORE INTO postings VALUES (?, ?, ?)",
+                ((docid, fname, offset)
+                 for docid, offsets in entry["docids"].items()
+                 for offset in offsets))
+
+
+def index_log_file(fname, docid_token):
+
+    """Function:  index_log_file
+
+    Description:  Index a log file.  Records the line offsets of each docid
+        found in the log file.  The offsets are from the start of the
+        uncompressed data.
+
+    Arguments:
+        (input) fname -> Log file name
+        (input) docid_token -> Regular expression to locate docids
+        (output) entry -> Dictionary of the log file's index entry
+
+    """
+
+    token_regex = re.compile(docid_token.encode())
+    stat = os.stat(fname)
+    entry = {"size": stat.st_size, "mtime": stat.st_mtime, "docids": {}}
+    offset = 0
+
+    with open_log_bytes(fname) as fhdr:
+        for line in fhdr:
+            for token in set(token_regex.findall(line)):
+                entry["docids"].setdefault(
+                    token.decode(errors="replace"), []).append(offset)
+
+            offset += len(line)
+
+    return entry
+
+
+def is_indexed(entry, fname):
+
+    """Function:  is_indexed
+
+    Description:  Determine if the index entry is current for the log file.
+
+    Arguments:
+        (input) entry -> Dictionary of the log file's index entry
+        (input) fname -> Log file name
+        (output) True|False - Index entry matches the log file
+
+    """
+
+    stat = os.stat(fname)
+
+    return entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime
+
+
+def get_index_offsets(conn, fname, docids, chunk_size=500):
+
+    """Function:  get_index_offsets
+
+    Description:  Get the line offsets of the docids in an archive log file
+        from the archive index.
+
+    Arguments:
+        (input) conn -> SQLite connection instance
+        (input) fname -> Archive log file name
+        (input) docids -> List of docids to search for
+        (input) chunk_size -> Number of docids to look up per query
+        (output) offsets -> List of line offsets or None if not indexed
+
+    """
+
+    offsets = None
+    row = conn.execute(
+        "SELECT size, mtime FROM files WHERE path = ?", (fname,)).fetchone()
+
+    if row and is_indexed({"size": row[0], "mtime": row[1]}, fname):
+        docids = list(docids)
+        offsets = set()
+
+        for cnt in range(0, len(docids), chunk_size):
+            chunk = docids[cnt:cnt + chunk_size]
+            offsets.update(
+                offset for offset, in conn.execute(
+                    "SELECT offset FROM postings WHERE file = ? AND docid IN"
+                    f" ({','.join('?' * len(chunk))})", [fname] + chunk))
+
+        offsets = sorted(offsets)
+
+    return offsets
+
+
+def read_offset_lines(fhdr, offsets, stream=False):
+
+    """Function:  read_offset_lines
+
+    Description:  Read the lines at the offsets in a log file.  Gzip files
+        cannot seek without decompressing from the start, so when stream is
+        set the file is read through once up to the last offset instead.
+
+    Arguments:
+        (input) fhdr -> Binary file handler of the log file
+        (input) offsets -> Sorted list of line offsets
+        (input) stream -> True|False - Read through instead of seeking
+        (output) Generator of the lines at the offsets
+
+    """
+
+    if stream:
+        wanted = set(offsets)
+        offset = 0
+
+        for line in fhdr:
+            if offset in wanted:
+                yield line
+
+            offset += len(line)
+
+            if offset > offsets[-1]:
+                break
+
+    else:
+        for offset in offsets:
+            fhdr.seek(offset)
+            yield fhdr.readline()
+
+
+def read_log_offsets(fname, docids, offsets, token_regex=None):
+
+    """Function:  read_log_offsets
+
+    Description:  Read only the lines at the offsets in a log file and return
+        the log entries that contain any of the docids.  The docids are
+        matched the same way as a full scan of the log file.
+
+    Arguments:
+        (input) fname -> Log file name
+        (input) docids -> List of docids to search for
+        (input) offsets -> Sorted list of line offsets
+        (input) token_regex -> Compiled regular expression to locate docids
+        (output) entries -> Dictionary of log entry lists keyed by docid
+
+    """
+
+    entries = {}
+
+    if offsets:
+        with open_log_bytes(fname) as fhdr:
+            for line in read_offset_lines(
+                    fhdr, offsets, stream=fname.endswith(".gz")):
+                line = line.decode("UTF-8", errors="replace").rstrip("\r\n")
+
+                for docid in match_docids(line, docids, token_regex):
+                    entries.setdefault(docid, []).append(line)
+
+    return entries
+
+
+def get_bloom_file(cfg, fname):
+
+    """Function:  get_bloom_file
+
+    Description:  Get the Bloom filter sidecar file name for an archive log
+        file.  The sidecar files mirror the archive directory layout.
+
+    Arguments:
+        (input) cfg -> Configuration setup
+        (input) fname -> Archive log file name
+        (output) Bloom filter file name
+
+    """
+
+    return os.path.join(
+        cfg.bloom_dir, os.path.relpath(fname, cfg.log_dir) + ".bloom")
+
+
+def bloom_positions(token, num_bits, num_hashes):
+
+    """Function:  bloom_positions
+
+    Description:  Get the bit positions of a token in a Bloom filter.  Uses
+        double hashing of a single digest of the token.
+
+    Arguments:
+        (input) token -> Token to hash
+        (input) num_bits -> Number of bits in the filter
+        (input) num_hashes -> Number of hash functions
+        (output) List of bit positions
+
+    """
+
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    hash1 = int.from_bytes(digest[:8], "big")
+    hash2 = int.from_bytes(digest[8:], "big") | 1
+
+    return [(hash1 + cnt * hash2) % num_bits for cnt in range(num_hashes)]
+
+
+def create_bloom(tokens, fp_rate=0.01):
+
+    """Function:  create_bloom
+
+    Description:  Create a Bloom filter of the tokens.  The filter is sized
+        for the number of tokens and the false positive rate.
+
+    Arguments:
+        (input) tokens -> Set of tokens
+        (input) fp_rate -> False positive rate
+        (output) bloom -> Dictionary of the Bloom filter
+
+    """
+
+    count = max(len(tokens), 1)
+    num_bits = max(
+        int(math.ceil(-count * math.log(fp_rate) / math.log(2) ** 2)), 64)
+    num_hashes = max(int(round(num_bits / count * math.log(2))), 1)
+    bloom = {"bits": num_bits, "hashes": num_hashes,
+             "filter": bytearray((num_bits + 7) // 8)}
+
+    for token in tokens:
+        for pos in bloom_positions(token, num_bits, num_hashes):
+            bloom["filter"][pos // 8] |= 1 << (pos % 8)
+
+    return bloom
+
+
+def check_bloom(bloom, docid):
+
+    """Function:  check_bloom
+
+    Description:  Check if a docid may be in the Bloom filter.
+
+    Arguments:
+        (input) bloom -> Dictionary of the Bloom filter
+        (input) docid -> Docid to check
+        (output) True|False - Docid may be in the filter
+
+    """
+
+    return all(
+        bloom["filter"][pos // 8] & (1 << (pos % 8))
+        for pos in bloom_positions(docid, bloom["bits"], bloom["hashes"]))
+
+
+def load_bloom(bloom_file, fname):
+
+    """Function:  load_bloom
+
+    Description:  Read in a Bloom filter sidecar file.  The filter is only
+        returned if it is current for the log file.
+
+    Arguments:
+        (input) bloom_file -> Bloom filter file name
+        (input) fname -> Log file name
+        (output) bloom -> Dictionary of the Bloom filter or None
+
+    """
+
+    bloom = None
+
+    if os.path.exists(bloom_file):
+        try:
+            with open(bloom_file, mode="r", encoding="UTF-8") as fhdr:
+                data = json.load(fhdr)
+
+            if is_indexed(data, fname):
+                data["filter"] = base64.b64decode(data["filter"])
+                bloom = data
+
+        except (ValueError, KeyError):
+            bloom = None
+
+    return bloom
+
+
+def write_bloom(bloom_file, bloom):
+
+    """Function:  write_bloom
+
+    Description:  Write a Bloom filter sidecar file.  The file is written to
+        a temporary file first and then moved into place.
+
+    Arguments:
+        (input) bloom_file -> Bloom filter file name
+        (input) bloom -> Dictionary of the Bloom filter
+
+    """
+
+    data = dict(bloom)
+    data["filter"] = base64.b64encode(bytes(bloom["filter"])).decode()
+    os.makedirs(os.path.dirname(bloom_file), exist_ok=True)
+    tmp_file = bloom_file + ".tmp"
+
+    with open(tmp_file, mode="w", encoding="UTF-8") as fhdr:
+        json.dump(data, fhdr)
+
+    os.replace(tmp_file, bloom_file)
+
+
+def filter_bloom(cfg, fname, docids):
+
+    """Function:  filter_bloom
+
+    Description:  Remove the docids ruled out by the Bloom filter sidecar of
+        an archive log file.  If there is no current sidecar for the log file
+        all of the docids are kept and the sidecar file name is returned so
+        the sidecar can be written when the log file is scanned.  The sidecar
+        only holds docid tokens, so it can be trusted because searches using
+        it match the docids by docid token (see match_docids).
+
+    Arguments:
+        (input) cfg -> Configuration setup
+        (input) fname -> Archive log file name
+        (input) docids -> List of docids to search for
+        (output) docids -> List of docids that may be in the log file
+        (output) bloom_file -> Bloom filter file name to write or None
+
+    """
+
+    bloom_file = get_bloom_file(cfg, fname)
+    bloom = load_bloom(bloom_file, fname)
+
+    if bloom:
+        return [docid for docid in docids if check_bloom(bloom, docid)], None
+
+    return docids, bloom_file
+
+
+def search_log_file(fname, docids, offsets=None, bloom_file=None,
+                    docid_token=None):
+
+    """Function:  search_log_file
+
+    Description:  Search a log file for the docids.  If the line offsets are
+        known from the archive index only those lines are read, otherwise the
+        whole file is scanned.  If a Bloom filter file name is passed, the
+        docid tokens are collected during the scan and written to the Bloom
+        filter sidecar.  If the docid token is passed, the docids are matched
+        against the docid tokens of the log entries, so the index, the Bloom
+        filter and a full scan find the same log entries.
+
+    Arguments:
+        (input) fname -> Log file name
+        (input) docids -> List of docids to search for
+        (input) offsets -> Sorted list of line offsets or None
+        (input) bloom_file -> Bloom filter file name to write or None
+        (input) docid_token -> Regular expression to locate docids
+        (output) entries -> Dictionary of log entry lists keyed by docid
+
+    """
+
+    token_regex = re.compile(docid_token) if docid_token else None
+
+    if offsets is not None:
+        return read_log_offsets(fname, docids, offsets, token_regex)
+
+    if bloom_file is None:
+        return scan_log_file(fname, docids, token_regex=token_regex)
+
+    stat = os.stat(fname)
+    tokens = set()
+    entries = scan_log_file(
+        fname, docids, token_regex=token_regex, tokens=tokens)
+    bloom = create_bloom(tokens)
+    bloom["size"] = stat.st_size
+    bloom["mtime"] = stat.st_mtime
+    write_bloom(bloom_file, bloom)
+
+    return entries
+
+
+def get_month_dirs(archive_dir):
+
+    """Function:  get_month_dirs
+
+    Description:  Get list of command/year/month directories in the archive
+        directory.
+
+    Arguments:
+        (input) archive_dir -> Directory path to base archive logs
+        (output) month_dirs -> List of archive month directories
+
+    """
+
+    month_dirs = []
+
+    for cmd in sorted(os.listdir(archive_dir)):
+        cmd_dir = os.path.join(archive_dir, cmd)
+
+        if not os.path.isdir(cmd_dir):
+            continue
+
+        for year in sorted(os.listdir(cmd_dir)):
+            year_dir = os.path.join(cmd_dir, year)
+
+            if not re.match(r"^\d{4}$", year) or not os.path.isdir(year_dir):
+                continue
+
+            for month in sorted(os.listdir(year_dir)):
+                month_dir = os.path.join(year_dir, month)
+
+                if re.match(r"^\d{2}$", month) and os.path.isdir(month_dir):
+                    month_dirs.append(month_dir)
+
+    return month_dirs
+
+
+def build_index(args, cfg, log, **kwargs):         # pylint:disable=W0613
+
+    """Function:  build_index
+
+    Description:  Build or update the docid index of the archive log files.
+        Only log files that are new or have changed since the last run are
+        indexed, entries for removed log files are dropped.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) kwargs:
+            mail_sink -> MailSink class instance, not used
+
+    """
+
+    log.log_info(f"build_index:  Indexing archive directory: {cfg.log_dir}")
+    jobs = get_jobs(args)
+    pool = concurrent.futures.ProcessPoolExecutor(max_workers=jobs) \
+        if jobs > 1 else None
+    conn = open_index(get_index_file(cfg))
+
+    try:
+        for month_dir in get_month_dirs(cfg.log_dir):
+            index = load_index(conn, month_dir)
+            log_files = gen_libs.filename_search(
+                month_dir, cfg.log_type, add_path=True)
+            new_files = [
+                fname for fname in log_files
+                if fname not in index or not is_indexed(index[fname], fname)]
+            names = set(log_files)
+            removed = [fname for fname in index if fname not in names]
+
+            if not new_files and not removed:
+                continue
+
+            log.log_info(f"build_index:  Indexing {len(new_files)} files in:"
+                         f" {month_dir}")
+            tokens = [cfg.docid_token] * len(new_files)
+            results = pool.map(index_log_file, new_files, tokens) if pool \
+                else map(index_log_file, new_files, tokens)
+
+            write_index(conn, zip(new_files, results), removed)
+
+    finally:
+        conn.close()
+
+        if pool:
+            pool.shutdown()
+
+
+def get_jobs(args):
+
+    """Function:  get_jobs
+
+    Description:  Get the number of worker processes to use from the -j
+        option.  The -j option is validated by valid_jobs in main.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) jobs -> Number of worker processes
+
+    """
+
+    return int(args.get_val("-j", def_val=1))
+
+
+def valid_jobs(args):
+
+    """Function:  valid_jobs
+
+    Description:  Validate the -j option is a positive integer.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - -j option is valid
+
+    """
+
+    status = True
+    jobs = args.get_val("-j", def_val=None)
+
+    if jobs is not None and (not str(jobs).isdigit() or int(jobs) < 1):
+        print(f"Error:  -j option must be a positive integer: {jobs}")
+        status = False
+
+    return status
+
+
+def search_files(args, cfg, file_docids, log_jsons,     # pylint:disable=R0914
+                 log, **kwargs):
+
+    """Function:  search_files
+
+    Description:  Search each log file for the docids that require it and
+        add the log entries to the JSON log document of each docid.  For
+        archive searches the archive index and the Bloom filter sidecars are
+        used if they are configured.  Log files where the Bloom filter rules
+        out all of the docids are not searched.  When either is configured
+        the docids are matched against the docid tokens of the log entries.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) file_docids -> Dictionary of docid lists keyed by log file
+        (input) log_jsons -> Dictionary of JSON log documents keyed by docid
+        (input) log -> Log class instance
+        (input) kwargs:
+            pool -> Worker pool instance to search the log files with
+        (output) log_jsons -> Dictionary of JSON log documents keyed by docid
+
+    """
+
+    backend = getattr(cfg, "search_backend", "native")
+    pool = kwargs.get("pool", None)
+    log.log_info(f"search_files:  Running {backend} search.")
+
+    if backend == "checklog":
+        for fname, docids in file_docids.items():
+            server = get_server(args, fname)
+            ofile = run_checklog(cfg, fname, docids)
+            split_data(
+                ofile, {docid: log_jsons[docid] for docid in docids}, fname,
+                server, log)
+            rm_file(ofile, log)
+
+    else:
+        fnames, docid_lists, offset_lists, bloom_files = [], [], [], []
+        index_dir = getattr(cfg, "index_dir", None) \
+            if args.arg_exist("-a") else None
+        bloom_dir = getattr(cfg, "bloom_dir", None) \
+            if args.arg_exist("-a") else None
+        conn = open_index(get_index_file(cfg)) if index_dir else None
+
+        try:
+            for fname, docids in file_docids.items():
+                offsets = None
+                bloom_file = None
+
+                if conn:
+                    offsets = get_index_offsets(conn, fname, docids)
+
+                if bloom_dir and offsets is None:
+                    docids, bloom_file = filter_bloom(cfg, fname, docids)
+
+                if docids:
+                    fnames.append(fname)
+                    docid_lists.append(docids)
+                    offset_lists.append(offsets)
+                    bloom_files.append(bloom_file)
+
+        finally:
+            if conn:
+                conn.close()
+
+        # The docid token is the matching rule whenever it is used to search
+        tokens = [cfg.docid_token if index_dir or bloom_dir else None] \
+            * len(fnames)
+        results = pool.map(
+            search_log_file, fnames, docid_lists, offset_lists, bloom_files,
+            tokens) if pool \
+            else map(search_log_file, fnames, docid_lists, offset_lists,
+                     bloom_files, tokens)
+
+        # Results are returned in file order, same as a serial search
+        for fname, entries in zip(fnames, results):
+            merge_entries(
+                log_jsons, entries, fname, get_server(args, fname), log)
+
+    return log_jsons
+
+
+def get_month_runs(months):
+
+    """Function:  get_month_runs
+
+    Description:  Merge a list of year/month directories into runs of
+        consecutive months.
+
+    Arguments:
+        (input) months -> Sorted list of year/month directories (YYYY/MM)
+        (output) runs -> List of (first, last) year/month directories
+
+    """
+
+    runs = []
+    last_num = None
+
+    for month in months:
+        num = int(month[0:4]) * 12 + int(month[5:7])
+
+        if runs and num == last_num + 1:
+            runs[-1] = (runs[-1][0], month)
+
+        else:
+            runs.append((month, month))
+
+        last_num = num
+
+    return runs
+
+
+def plan_search(args, cfg, cmd_list, log):              # pylint:disable=R0914
+
+    """Function:  plan_search
+
+    Description:  Plan the search of a command's docids by mapping each log
+        file to the docids it must be searched for, so each log file is
+        opened once for all of its docids.  For archive searches the date
+        windows of the docids are merged into runs of consecutive months and
+        each run is listed once.  If prune_files is set, a docid is only
+        mapped to the log files which can hold entries between its published
+        and pulled dates.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) cmd_list -> List of dictionaries containing docid information
+        (input) log -> Log class instance
+        (output) file_docids -> Dictionary of docid lists keyed by log file
+
+    """
+
+    file_docids = {}
+    docid_months = {}
+    month_files = {}
+    log_files = []
+    mtimes = {}
+
+    if args.arg_exist("-a"):
+        for docid_dict in cmd_list:
+            docid_months[docid_dict["docid"]] = get_archive_months(
+                docid_dict["pubdate"],
+                pulldate=docid_dict.get("pulldate", None))
+
+        for first, last in get_month_runs(
+                sorted(set().union(*docid_months.values()))):
+            log.log_info(f"plan_search:  Listing archive months: {first} to"
+                         f" {last}")
+            run_dict = {
+                "command": cmd_list[0]["command"],
+                "pubdate": first.replace("/", "") + "01",
+                "pulldate": last.replace("/", "") + "01"}
+
+            for fname in get_log_files(args, cfg, run_dict, log):
+                month = "/".join(os.path.dirname(fname).split(os.sep)[-2:])
+                month_files.setdefault(month, []).append(fname)
+
+    # Active log files are the same for every docid in the command
+    elif cmd_list:
+        log_files = get_log_files(args, cfg, cmd_list[0], log)
+
+    for docid_dict in cmd_list:
+        docid_files = [
+            fname for month in docid_months[docid_dict["docid"]]
+            for fname in month_files.get(month, [])] \
+            if args.arg_exist("-a") else log_files
+
+        if getattr(cfg, "prune_files", False):
+            docid_files = prune_log_files(
+                cfg, docid_files, docid_dict, mtimes)
+
+        for fname in docid_files:
+            file_docids.setdefault(fname, []).append(docid_dict["docid"])
+
+    return file_docids
+
+
+def search_command(args, cfg, cmd_list, log, **kwargs):
+
+    """Function:  search_command
+
+    Description:  Search the log files of a command for all of the command's
+        docids and process the JSON log document of each docid.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) cmd_list -> List of dictionaries containing docid information
+        (input) log -> Log class instance
+        (input) kwargs:
+            dtg -> Date and time of the search
+            pool -> Worker pool instance to search the log files with
+            writer -> MongoWriter class instance
+            publisher -> RmqPublisher class instance
+            mail_sink -> MailSink class instance
+        (output) failed_dict -> Dictionary of docids that failed to process
+
+    """
+
+    failed_dict = {}
+    log_jsons = {}
+    dtg = kwargs.get("dtg", datetime.datetime.strftime(
+        datetime.datetime.now(), "%Y-%m-%dT%H:%M:%SZ"))
+
+    for docid_dict in cmd_list:
+        log_jsons[docid_dict["docid"]] = create_log_json(cfg, docid_dict, dtg)
+
+    file_docids = plan_search(args, cfg, cmd_list, log)
+    search_files(
+        args, cfg, file_docids, log_jsons, log, pool=kwargs.get("pool", None))
+
+    for docid, log_json in log_jsons.items():
+        if not process_json(
+                args, cfg, log, log_json, writer=kwargs.get("writer", None),
+                publisher=kwargs.get("publisher", None),
+                mail_sink=kwargs.get("mail_sink", None)):
+            log.log_err(f"search_command: Error detected for docid: {docid}")
+            failed_dict[docid] = "Failed the process_docid process"
+
+    return failed_dict
+
+
+def process_docids(args, cfg, docid_list, log,          # pylint:disable=R0914
+                   **kwargs):
+
+    """Function:  process_docids
+
+    Description:  Processes a list of docids.  The docids are grouped by
+        command and each log file is searched only once for all of the docids
+        that require it.  The log entries are then split back out to a JSON
+        log document for each docid.  The search is done in-process unless
+        the check_log backend is set in the configuration.  With the -j
+        option the log files are searched by a pool of worker processes which
+        is kept for all of the docids.  With the -r option the log documents
+        are published over a single RabbitMQ connection for all of the
+        docids.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) docid_list -> List of dictionaries containing docid information
+        (input) log -> Log class instance
+        (input) kwargs:
+            mail_sink -> MailSink class instance
+        (output) failed_dict -> Dictionary of docids that failed to process
+
+    """
+
+    failed_dict = {}
+    cmd_dict = {}
+    mail_sink = kwargs.get("mail_sink", None)
+    backend = getattr(cfg, "search_backend", "native")
+    jobs = get_jobs(args)
+    pool = None
+    dtg = datetime.datetime.strftime(
+        datetime.datetime.now(), "%Y-%m-%dT%H:%M:%SZ")
+
+    for docid_dict in docid_list:
+        log.log_info(f"process_docids:  Processing docid: {docid_dict}")
+        cmd = get_command(cfg, docid_dict["command"])
+        cmd_dict.setdefault(cmd, []).append(dict(docid_dict))
+
+    if jobs > 1 and backend != "checklog":
+        log.log_info(f"process_docids:  Starting worker pool: {jobs}")
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+
+    writer = create_writer(args, cfg, log, mail_sink=mail_sink) \
+        if args.arg_exist("-i") else None
+    publisher = create_publisher(args, cfg, log, mail_sink=mail_sink)
+
+    try:
+        for cmd, cmd_list in cmd_dict.items():
+            log.log_info(
+                f"process_docids:  Searching logs for command: {cmd}")
+            failed_dict.update(
+                search_command(
+                    args, cfg, cmd_list, log, dtg=dtg, pool=pool,
+                    writer=writer, publisher=publisher, mail_sink=mail_sink))
+
+    finally:
+        if pool:
+            pool.shutdown()
+
+        if writer:
+            writer.close()
+
+        if publisher:
+            publisher.close()
+            failed_dict.update(
+                {docid: "Failed the process_docid process"
+                 for docid, status in publisher.published.items()
+                 if not status})
+
+    if getattr(cfg, "watch_file", None):
+        update_watchlist(
+            cfg, log, [docid_dict for docid_dict in docid_list
+                       if docid_dict["docid"] not in failed_dict])
+
+    return failed_dict
+
+
+def insert_mongo(args, cfg, log, data, **kwargs):
+
+    """Function:  insert_mongo
+
+    Description:  Insert JSON document into Mongo database.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) log_json -> JSON log document
+        (input) kwargs:
+            mail_sink -> MailSink class instance
+        (output) status -> True|False - Successful insertion into Mongo
+
+    """
+
+    status = True
+    mcfg = gen_libs.load_module(cfg.mconfig, args.get_val("-d"))
+    mongo_stat = mongo_libs.ins_doc(mcfg, mcfg.dbs, mcfg.tbl, data)
+
+    if not mongo_stat[0]:
+        log.log_err("insert_mongo:  Insertion into Mongo failed.")
+        log.log_err(f"Mongo error message:  {mongo_stat[1]}")
+        fname = os.path.join(
+            cfg.merror_dir, data["docid"] + ".failed_to_insert.json")
+        gen_libs.write_file(fname=fname, mode="a", data=data)
+        status = False
+
+    if not status and args.get_val("-t"):
+        mail = gen_class.setup_mail(
+            args.get_val("-t"), subj="Pulledsearch_Failed_to_Insert_Mongo")
+        mail.add_2_msg("Failed to insert the entries in the file into Mongo")
+        mail.add_2_msg("File: " + fname)
+        send_mail(mail, mail_sink=kwargs.get("mail_sink", None))
+
+    return status
+
+
+def load_parser(cfg):
+
+    """Function:  load_parser
+
+    Description:  Compile the log parsing regular expression in the
+        configuration once, so it is not compiled for every log entry.
+
+    Arguments:
+        (input) cfg -> Configuration setup
+        (output) cfg -> Modified configuration setup
+
+    """
+
+    if getattr(cfg, "regex", None):
+        cfg.parser = re.compile(cfg.regex)
+
+    return cfg
+
+
+def parse_line(cfg, line):
+
+    """Function:  parse_line
+
+    Description:  Parse a log entry into its named fields.
+
+    Arguments:
+        (input) cfg -> Configuration setup
+        (input) line -> Log entry
+        (output) Dictionary of the parsed fields or None if unparsable
+
+    """
+
+    parser = getattr(cfg, "parser", None) or re.compile(cfg.regex)
+    parsed_line = parser.match(line)
+
+    return parsed_line.groupdict() if parsed_line else None
+
+
+def get_doc_id(doc):
+
+    """Function:  get_doc_id
+
+    Description:  Get a stable key for a Mongo document from a hash of its
+        docid, server, log entry and the occurrence of the log entry in the
+        server's log entries, so repeated identical log entries are each kept.
+
+    Arguments:
+        (input) doc -> Document to insert
+        (output) Hex digest of the document's docid, server, log entry and
+            occurrence
+
+    """
+
+    return hashlib.sha256("\0".join(
+        [doc["docid"], doc["server"], doc["entry"],
+         str(doc.get("occurrence", 0))]).encode()).hexdigest()
+
+
+class MongoWriter():                                    # pylint:disable=R0902
+
+    """Class:  MongoWriter
+
+    Description:  Class which batches documents into unordered bulk inserts
+        into the Mongo database over a single connection.  If a queue size is
+        set, the batches are inserted by a writer thread while the caller
+        keeps adding documents.  In upsert mode each document is keyed by a
+        hash of its contents, so documents already in the database are left
+        as they are.
+
+    Methods:
+        __init__
+        connect
+        add
+        insert
+        run
+        flush
+        write_failed
+        close
+
+    """
+
+    def __init__(self, args, cfg, log, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the MongoWriter class.
+
+        Arguments:
+            (input) args -> ArgParser class instance
+            (input) cfg -> Configuration setup
+            (input) log -> Log class instance
+            (input) kwargs:
+                mail_sink -> MailSink class instance
+
+        """
+
+        self.args = args
+        self.cfg = cfg
+        self.log = log
+        self.mail_sink = kwargs.get("mail_sink", None)
+        self.batch_size = max(getattr(cfg, "mongo_batch", 1), 1)
+        self.upsert = getattr(cfg, "mongo_upsert", False)
+        self.mcfg = gen_libs.load_module(cfg.mconfig, args.get_val("-d"))
+        self.coll = None
+        self.err_msg = None
+        self.docs = []
+        self.failures = 0
+        self.queue = None
+        self.thread = None
+        self.lock = threading.Lock()
+
+        if getattr(cfg, "mongo_queue", 0) > 0:
+            self.queue = queue.Queue(maxsize=cfg.mongo_queue)
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Connect to the Mongo database, if not already
+            connected.  Worker threads sharing the writer connect only once.
+
+        Arguments:
+            (output) True|False - Connected to the Mongo database
+
+        """
+
+        with self.lock:
+            if self.coll is None:
+                coll = mongo_libs.crt_coll_inst(
+                    self.mcfg, self.mcfg.dbs, self.mcfg.tbl)
+                status, self.err_msg = coll.connect()
+
+                if status:
+                    self.coll = coll
+
+        return self.coll is not None
+
+    def add(self, doc):
+
+        """Method:  add
+
+        Description:  Add a document to the batch and insert the batch once
+            it is full.  With a writer thread the full batch is queued
+            instead, this waits while the queue is full.
+
+        Arguments:
+            (input) doc -> Document to insert
+            (output) True|False - No failures if the batch was inserted
+
+        """
+
+        self.docs.append(doc)
+
+        if len(self.docs) < self.batch_size:
+            return True
+
+        if self.queue:
+            docs, self.docs = self.docs, []
+            self.queue.put(docs)
+
+            return True
+
+        return self.flush()
+
+    def insert(self, docs):
+
+        """Method:  insert
+
+        Description:  Insert a batch of documents.  Documents that failed to
+            insert are written to the merror_dir directory.
+
+        Arguments:
+            (input) docs -> List of documents to insert
+            (output) True|False - All documents in the batch inserted
+
+        """
+
+        failed = []
+
+        if docs and not self.connect():
+            failed = docs
+
+        elif docs:
+            try:
+                if self.upsert:
+                    self.coll.db_coll.bulk_write(
+                        [UpdateOne({"_id": get_doc_id(doc)},
+                                   {"$setOnInsert": doc}, upsert=True)
+                         for doc in docs], ordered=False)
+
+                else:
+                    # Copies, so the generated _id is not added to the docs
+                    self.coll.db_coll.insert_many(
+                        [dict(doc) for doc in docs], ordered=False)
+
+            except Exception as err:                # pylint:disable=W0718
+                details = getattr(err, "details", None) or {}
+                indexes = {
+                    item["index"] for item in details["writeErrors"]} \
+                    if "writeErrors" in details else range(len(docs))
+                failed = [docs[cnt] for cnt in sorted(indexes)]
+                self.err_msg = str(err)
+
+        if failed:
+            self.write_failed(failed)
+
+        return not failed
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Writer thread which inserts the queued batches until
+            it receives None.
+
+        Arguments:
+
+        """
+
+        while True:
+            docs = self.queue.get()
+
+            try:
+                if docs is None:
+                    break
+
+                if not self.insert(docs):
+                    self.failures += 1
+
+            except Exception as err:                # pylint:disable=W0718
+                self.log.log_err(f"MongoWriter:  Writer thread error: {err}")
+                self.failures += 1
+
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Insert the documents in the batch.  With a writer
+            thread, this waits until all of the queued batches are inserted.
+
+        Arguments:
+            (output) True|False - All documents since the last flush inserted
+
+        """
+
+        docs, self.docs = self.docs, []
+
+        if not self.queue:
+            return self.insert(docs)
+
+        if docs:
+            self.queue.put(docs)
+
+        self.queue.join()
+        status = not self.failures
+        self.failures = 0
+
+        return status
+
+    def write_failed(self, failed):
+
+        """Method:  write_failed
+
+        Description:  Write the documents that failed to insert to the
+            merror_dir directory and send an email if set.
+
+        Arguments:
+            (input) failed -> List of documents that failed to insert
+
+        """
+
+        self.log.log_err(
+            f"MongoWriter:  Insertion of {len(failed)} documents into Mongo"
+            f" failed.")
+        self.log.log_err(f"Mongo error message:  {self.err_msg}")
+        fnames = []
+
+        for doc in failed:
+            fname = os.path.join(
+                self.cfg.merror_dir, doc["docid"] + ".failed_to_insert.json")
+            gen_libs.write_file(fname=fname, mode="a", data=doc)
+
+            if fname not in fnames:
+                fnames.append(fname)
+
+        if self.args.get_val("-t"):
+            mail = gen_class.setup_mail(
+                self.args.get_val("-t"),
+                subj="Pulledsearch_Failed_to_Insert_Mongo")
+            mail.add_2_msg(
+                "Failed to insert the entries in the file into Mongo")
+
+            for fname in fnames:
+                mail.add_2_msg("File: " + fname)
+
+            send_mail(mail, mail_sink=self.mail_sink)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Insert any remaining documents and disconnect from the
+            Mongo database.
+
+        Arguments:
+            (output) status -> True|False - All documents inserted
+
+        """
+
+        status = self.flush()
+
+        if self.thread:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+        if self.coll:
+            self.coll.disconnect()
+            self.coll = None
+
+        return status
+
+
+class MongoBatch():
+
+    """Class:  MongoBatch
+
+    Description:  Class which batches the documents of one insert file into
+        bulk inserts through a shared Mongo writer.  Worker threads each use
+        their own batch, so they share the writer's Mongo connection while the
+        success of each file is still known.
+
+    Methods:
+        __init__
+        add
+        flush
+        close
+
+    """
+
+    def __init__(self, writer):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the MongoBatch class.
+
+        Arguments:
+            (input) writer -> MongoWriter class instance
+
+        """
+
+        self.writer = writer
+        self.batch_size = writer.batch_size
+        self.docs = []
+        self.status = True
+
+    def add(self, doc):
+
+        """Method:  add
+
+        Description:  Add a document to the batch and insert the batch once
+            it is full.
+
+        Arguments:
+            (input) doc -> Document to insert
+            (output) True|False - No failures if the batch was inserted
+
+        """
+
+        self.docs.append(doc)
+
+        if len(self.docs) < self.batch_size:
+            return True
+
+        return self.flush()
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Insert the documents in the batch through the writer.
+
+        Arguments:
+            (output) True|False - All documents since the last flush inserted
+
+        """
+
+        docs, self.docs = self.docs, []
+        status = self.writer.insert(docs)
+        self.status = self.status and status
+
+        return status
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Insert any remaining documents.  The writer's
+            connection is left open for the other batches.
+
+        Arguments:
+            (output) True|False - All documents of the batch inserted
+
+        """
+
+        self.flush()
+
+        return self.status
+
+
+def create_writer(args, cfg, log, **kwargs):
+
+    """Function:  create_writer
+
+    Description:  Create a Mongo writer instance if bulk inserts
+        (mongo_batch greater than 1) or upserts are set in the configuration
+        file.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) kwargs:
+            mail_sink -> MailSink class instance
+        (output) MongoWriter class instance or None
+
+    """
+
+    if getattr(cfg, "mongo_batch", 1) > 1 \
+       or getattr(cfg, "mongo_upsert", False):
+        return MongoWriter(
+            args, cfg, log, mail_sink=kwargs.get("mail_sink", None))
+
+    return None
+
+
+class RmqPublisher():                                   # pylint:disable=R0902
+
+    """Class:  RmqPublisher
+
+    Description:  Class which publishes JSON log documents to RabbitMQ over a
+        single connection and channel kept for the whole run.  Publisher
+        confirms are turned on for the channel and each document is published
+        as it is added.  Documents that are not confirmed are written to the
+        error_dir directory as NonPublished files and are listed in one email
+        when the publisher is closed.
+
+    Methods:
+        __init__
+        connect
+        add
+        publish
+        write_failed
+        close
+
+    """
+
+    def __init__(self, args, cfg, log, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the RmqPublisher
+            class.
+
+        Arguments:
+            (input) args -> ArgParser class instance
+            (input) cfg -> Configuration setup
+            (input) log -> Log class instance
+            (input) kwargs:
+                mail_sink -> MailSink class instance
+
+        """
+
+        self.args = args
+        self.cfg = cfg
+        self.log = log
+        self.mail_sink = kwargs.get("mail_sink", None)
+        self.rmq = None
+        self.err_msg = None
+        self.published = {}
+        self.failed_files = []
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Connect to RabbitMQ and turn on publisher confirms for
+            the channel, if not already connected.
+
+        Arguments:
+            (output) True|False - Connected to RabbitMQ
+
+        """
+
+        if self.rmq is None:
+            rmq = rabbitmq_class.RabbitMQPub(
+                self.cfg.user, self.cfg.japd, self.cfg.host, self.cfg.port,
+                exchange_name=self.cfg.exchange_name,
+                exchange_type=self.cfg.exchange_type,
+                queue_name=self.cfg.queue, routing_key=self.cfg.r_key,
+                x_durable=self.cfg.x_durable, q_durable=self.cfg.q_durable,
+                auto_delete=self.cfg.auto_delete,
+                host_list=self.cfg.host_list)
+            status, err_msg = rmq.create_connection()
+
+            if status and rmq.channel.is_open:
+                rmq.channel.confirm_delivery()
+                self.rmq = rmq
+
+            else:
+                self.err_msg = f"Connection failure: {err_msg}"
+                rmq.close()
+
+        return self.rmq is not None
+
+    def add(self, log_json):
+
+        """Method:  add
+
+        Description:  Publish a document and record its status by docid.  A
+            document that is not confirmed is written to a NonPublished file.
+
+        Arguments:
+            (input) log_json -> JSON log document
+            (output) status -> True|False - Document confirmed by the broker
+
+        """
+
+        status = self.publish(log_json)
+        self.published[log_json["docid"]] = \
+            self.published.get(log_json["docid"], True) and status
+
+        if not status:
+            self.write_failed(log_json)
+
+        return status
+
+    def publish(self, log_json):
+
+        """Method:  publish
+
+        Description:  Publish a document and wait for the broker to confirm
+            it.  The connection is dropped on an error, so the next document
+            reconnects.
+
+        Arguments:
+            (input) log_json -> JSON log document
+            (output) status -> True|False - Document confirmed by the broker
+
+        """
+
+        status = False
+
+        if self.connect():
+            try:
+                status = self.rmq.publish_msg(
+                    encode_payload(self.cfg, log_json))
+
+                if not status:
+                    self.err_msg = "Failed to publish message to RabbitMQ"
+
+            except Exception as err:                # pylint:disable=W0718
+                self.err_msg = str(err)
+                self.rmq.close()
+                self.rmq = None
+
+        return status
+
+    def write_failed(self, log_json):
+
+        """Method:  write_failed
+
+        Description:  Write a document that failed to publish to the
+            error_dir directory.
+
+        Arguments:
+            (input) log_json -> JSON log document that failed to publish
+
+        """
+
+        self.log.log_err("RmqPublisher:  Error detected during publication.")
+        self.log.log_err(f"RmqPublisher:  Message: {self.err_msg}")
+        dtg = datetime.datetime.strftime(
+            datetime.datetime.now(), "%Y%m%d_%H%M%S")
+        fname = os.path.join(
+            self.cfg.error_dir,
+            "NonPublished." + log_json["docid"] + get_part_suffix(log_json)
+            + "." + dtg)
+        self.log.log_err(
+            f"RmqPublisher:  Writing JSON document to file: {fname}")
+        gen_libs.write_file(fname, mode="w", data=log_json)
+        self.failed_files.append(fname)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the connection to RabbitMQ and send one email of
+            the NonPublished files, if any and if set.
+
+        Arguments:
+            (output) True|False - All documents published
+
+        """
+
+        if self.rmq:
+            self.rmq.close()
+            self.rmq = None
+
+        if self.failed_files and self.args.get_val("-t", def_val=False):
+            subj = self.args.get_val("-s", def_val="") + "Error: NonPublished"
+            mail = gen_class.setup_mail(self.args.get_val("-t"), subj=subj)
+            mail.add_2_msg("Unable to publish message to RabbitMQ")
+
+            for fname in self.failed_files:
+                mail.add_2_msg("File: " + fname)
+
+            send_mail(mail, mail_sink=self.mail_sink)
+
+        return not self.failed_files
+
+
+def create_publisher(args, cfg, log, **kwargs):
+
+    """Function:  create_publisher
+
+    Description:  Create a RabbitMQ publisher instance if the log entries
+        are to be published to RabbitMQ.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) kwargs:
+            mail_sink -> MailSink class instance
+        (output) RmqPublisher class instance or None
+
+    """
+
+    if args.arg_exist("-r") and not args.arg_exist("-i") \
+       and not args.arg_exist("-e"):
+        return RmqPublisher(
+            args, cfg, log, mail_sink=kwargs.get("mail_sink", None))
+
+    return None
+
+
+def filter_data(cfg, log, log_json, **kwargs):
+
+    """Function:  filter_data
+
+    Description:  Filter out non-required data entries.  The parsed fields
+        of the log entries kept are added to the parsed dictionary, if one is
+        passed, so the log entries are not parsed again.
+
+    Arguments:
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) log_json -> Dictionary log document
+        (input) kwargs:
+            parsed -> Dictionary to add parsed field lists keyed by server to
+        (output) log_json -> Modified dictionary log document
+
+    """
+
+    parsed = kwargs.get("parsed", {})
+
+    log_json = dict(log_json)
+    log.log_info(
+        f"filter_data:  Writing to raw data toarchive: {cfg.raw_archive_dir}")
+    fname = os.path.join(
+        cfg.raw_archive_dir,
+        log_json["docid"] + "." + log_json["asOf"] + ".raw")
+    gen_libs.write_file(fname=fname, mode="w", data=log_json)
+    log.log_info("filter_data:  Start filtering JSON document.")
+
+    # Loop on servers
+    for svr in log_json["servers"]:
+        uname = os.path.join(
+            cfg.unparsable_dir,
+            log_json["docid"] + "." + svr + log_json["asOf"] + ".unparsable")
+        parsed_list = []
+        parsed[svr] = []
+
+        # Loop on log entries for each server
+        for line in log_json["servers"][svr]:
+            parsed_line = parse_line(cfg, line)
+
+            # Parse the log entry
+            if parsed_line:
+
+                # Filter out non-related entries
+                if log_json["docid"] in parsed_line["url"]      \
+                   and "transformer" in parsed_line["url"]      \
+                   and "2ndReview" not in parsed_line["url"]    \
+                   and parsed_line["status"] == "200"           \
+                   and ".ic.gov" not in parsed_line["userid"]:
+                    parsed_list.append(line)
+                    parsed[svr].append(parsed_line)
+
+            else:
+                log.log_warn(
+                    f"filter_data:  Unparsable data written to {uname}")
+                gen_libs.write_file(fname=uname, mode="a", data=line)
+
+        log_json["servers"][svr] = parsed_list
+
+    return log_json
+
+
+def parse_data(args, cfg, log, log_json, **kwargs):     # pylint:disable=R0914
+
+    """Function:  parse_data
+
+    Description:  Parse data prior to inserting into Mongo database.  Log
+        entries already parsed by filter_data are not parsed again.  If bulk
+        inserts are set, the documents are inserted in batches through a
+        Mongo writer, otherwise one at a time.  If upserts are set, each
+        document has the occurrence of its log entry in the server's log
+        entries, counted on from the offsets of a part of a split document.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) log_json -> JSON log document
+        (input) kwargs:
+            parsed -> Dictionary of parsed field lists keyed by server
+            writer -> MongoWriter class instance
+            mail_sink -> MailSink class instance
+        (output) status -> True|False - Successful insertion into Mongo
+
+    """
+
+    parsed = kwargs.get("parsed", {})
+    writer = kwargs.get("writer", None)
+    mail_sink = kwargs.get("mail_sink", None)
+    upsert = getattr(cfg, "mongo_upsert", False)
+    own_writer = None
+
+    if writer is None:
+        writer = own_writer = create_writer(
+            args, cfg, log, mail_sink=mail_sink)
+
+    log.log_info("parse_data:  Start parsing JSON document.")
+    status = True
+    first_stage = {}
+    first_stage["command"] = log_json["command"]
+    first_stage["docid"] = log_json["docid"]
+    first_stage["network"] = log_json["network"]
+    first_stage["pubDate"] = log_json["pubDate"]
+    first_stage["asOf"] = log_json["asOf"]
+    second_stage = dict(first_stage)
+    log.log_info(f"parse_data:  Writing to archive: {cfg.marchive_dir}")
+    fname = os.path.join(
+        cfg.marchive_dir, log_json["docid"] + "." + log_json["asOf"]
+        + get_part_suffix(log_json) + ".json")
+    gen_libs.write_file(fname=fname, mode="w", data=log_json)
+    log.log_info(f'parse_data:  Parsing docid: {first_stage["docid"]}')
+
+    # Loop on servers
+    for svr in log_json["servers"]:
+        second_stage["server"] = svr
+        third_stage = dict(second_stage)
+
+        parsed_lines = parsed.get(svr, None)
+        occurrences = dict(log_json.get("offsets", {}).get(svr, {}))
+
+        # Loop on log entries for each server
+        for cnt, line in enumerate(log_json["servers"][svr]):
+            third_stage["entry"] = line
+
+            # Identical log entries are told apart by their occurrence
+            if upsert:
+                third_stage["occurrence"] = occurrences.get(line, 0)
+                occurrences[line] = third_stage["occurrence"] + 1
+
+            # Parse the log entry
+            parsed_line = parsed_lines[cnt] if parsed_lines is not None \
+                else parse_line(cfg, line)
+
+            for entry in parsed_line:
+                if entry in cfg.allowable and entry == "url":
+                    third_stage[entry] = \
+                        "https://" + parsed_line[entry]
+
+                elif entry in cfg.allowable:
+                    third_stage[entry] = parsed_line[entry]
+
+            if writer:
+                status = status & writer.add(third_stage)
+
+            else:
+                status = status & insert_mongo(
+                    args, cfg, log, third_stage, mail_sink=mail_sink)
+
+            third_stage = dict(second_stage)
+
+        second_stage = dict(first_stage)
+
+    if own_writer:
+        status = status & own_writer.close()
+
+    elif writer:
+        status = status & writer.flush()
+
+    return status
+
+
+def write_summary(cfg, log, log_json):
+
+    """Function:  write_summary
+
+    Description:  Write summary results for docid to docid transfer file.
+
+    Arguments:
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) log_json -> JSON log document
+        (output) status -> True|False - Successful processing
+
+    """
+
+    log.log_info(f'write_summary:  Updating Docid Transfer summary for'
+                 f' {log_json["docid"]}')
+    yearmon = datetime.datetime.strftime(datetime.datetime.now(), "%Y%m")
+    fname = os.path.join(
+        os.path.dirname(cfg.processed_file), "docid_transfer." + yearmon)
+    file_entry = {
+        "docid": log_json["docid"], "network": log_json["network"],
+        "count": 0}
+
+    for svr in log_json["servers"]:
+        file_entry["count"] += len(log_json["servers"][svr])
+
+    log.log_info(f"write_summary: {file_entry}")
+
+    if file_entry["count"]:
+        with open(fname, mode="a", encoding="UTF-8") as fhdr:
+            fhdr.write(json.dumps(file_entry) + "\n")
+
+
+def process_json(args, cfg, log, log_json, **kwargs):   # pylint:disable=R0915
+
+    """Function:  process_json
+
+    Description:  Process the JSON document from the pulled search results.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) log_json -> JSON log document
+        (input) kwargs:
+            writer -> MongoWriter class instance
+            publisher -> RmqPublisher class instance
+            mail_sink -> MailSink class instance
+        (output) status -> True|False - Successful processing
+
+    """
+
+    log.log_info("process_json:  Processing JSON document.")
+    status = False
+    parsed = {}
 
     # Filter the raw data
-    log_json = filter_data(cfg, log, log_json)
+    log_json = filter_data(cfg, log, log_json, parsed=parsed)
+    parts = [log_json]
+
+    if getattr(cfg, "chunk_size", None) and not args.arg_exist("-i"):
+        parts = split_log_json(log_json, cfg.chunk_size)
+
+        if len(parts) > 1:
+            log.log_info(f"process_json:  Splitting JSON document into"
+                         f" {len(parts)} parts, run id: {parts[0]['run_id']}")
+
+    # Insert entries into Mongo
+    if args.arg_exist("-i"):
+        log.log_info("process_json:  Inserting JSON log entries into Mongo")
+        status = parse_data(
+            args, cfg, log, log_json, parsed=parsed,
+            writer=kwargs.get("writer", None),
+            mail_sink=kwargs.get("mail_sink", None))
+
+    # Email entries
+    elif args.arg_exist("-e"):
+        log.log_info(f"process_json:  Email log entries to: {cfg.to_addr},"
+                     f"Subject: {cfg.subj}")
+
+        if args.arg_exist("-b"):
+            write_summary(cfg, log, log_json)
+
+        for log_part in parts:
+            email_json(
+                args, cfg, log, log_part,
+                mail_sink=kwargs.get("mail_sink", None))
+
+        status = True
+
+    # Publish entries to RabbitMQ
+    elif args.arg_exist("-r"):
+        log.log_info("process_json:  Publishing log entries to RabbitMQ.")
+        status = True
+
+        for log_part in parts:
+            if kwargs.get("publisher", None):
+                status = kwargs["publisher"].add(log_part) and status
+
+            else:
+                status = publish_json(
+                    args, cfg, log, log_part,
+                    mail_sink=kwargs.get("mail_sink", None)) and status
+
+    return status
+
+
+def email_json(args, cfg, log, log_json, **kwargs):
+
+    """Function:  email_json
+
+    Description:  Email the JSON log document either in the body of the
+        email or as an attachment.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) log_json -> JSON log document
+        (input) kwargs:
+            mail_sink -> MailSink class instance
+
+    """
+
+    mail_sink = kwargs.get("mail_sink", None)
+
+    if args.arg_exist("-g"):
+        log.log_info("email_json:  Email data in body")
+        mail = gen_class.setup_mail(cfg.to_addr, subj=cfg.subj)
+        mail.add_2_msg(encode_payload(cfg, log_json))
+        send_mail(mail, mail_sink=mail_sink)
+
+    else:
+        log.log_info("email_json:  Email data as attachment")
+        msg = MIMEMultipart()
+        msg["From"] = getpass.getuser() + "@" + socket.gethostname()
+        msg["To"] = cfg.to_addr
+        msg["Subject"] = cfg.subj
+        fname = log_json["docid"] + "_docid" + get_part_suffix(log_json)
+        part = MIMEBase("application", "json")
+        part.set_payload(encode_payload(cfg, log_json))
+
+        # A compressed payload is already base64 encoded
+        if getattr(cfg, "payload_encoding", None) == "gzip":
+            encoders.encode_7or8bit(part)
+
+        else:
+            encoders.encode_base64(part)
+
+        part.add_header(
+            "Content-Disposition", "attachment", filename=fname)
+        msg.attach(part)
+        send_smtp(
+            msg["From"], msg["To"], msg.as_string(), mail_sink=mail_sink)
+
+
+def publish_json(args, cfg, log, log_json, **kwargs):
+
+    """Function:  publish_json
+
+    Description:  Publish the JSON log document to RabbitMQ.  If the
+        publication fails, the document is written to the error directory.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) log_json -> JSON log document
+        (output) status -> True|False - Document published
+
+    """
+
+    status, err_msg = rabbitmq_class.pub_2_rmq(
+        cfg, encode_payload(cfg, log_json))
+
+    if status:
+        log.log_info("publish_json:  Log entries published to RabbitMQ.")
+
+    else:
+        log.log_err(
+            "publish_json:  Error detected during publication.")
+        log.log_err(f"publish_json:  Message: {err_msg}")
+        dtg = datetime.datetime.strftime(
+            datetime.datetime.now(), "%Y%m%d_%H%M%S")
+        name = "NonPublished." + log_json["docid"] \
+            + get_part_suffix(log_json) + "." + dtg
+        fname = os.path.join(cfg.error_dir, name)
+        log.log_err(
+            f"publish_json:  Writing JSON document to file: {fname}")
+        gen_libs.write_file(fname, mode="w", data=log_json)
+
+        if args.get_val("-t", def_val=False):
+            log.log_info(
+                f'publish_json:  Email error to: {args.get_val("-t")}')
+            subj = args.get_val("-s", def_val="") + "Error: NonPublished"
+            mail = gen_class.setup_mail(args.get_val("-t"), subj=subj)
+            mail.add_2_msg("Unable to publish message to RabbitMQ")
+            mail.add_2_msg("File: " + fname)
+            send_mail(mail, mail_sink=kwargs.get("mail_sink", None))
+
+    return status
+
+
+class MailSink():
+
+    """Class:  MailSink
+
+    Description:  Class which sends the emails of a run from a background
+        thread over one SMTP session, so a slow mail server does not hold up
+        the processing.  The SMTP session is reconnected if the server drops
+        it.
+
+    Methods:
+        __init__
+        sendmail
+        connect
+        deliver
+        run
+        close
+
+    """
+
+    def __init__(self, log, host="localhost", queue_size=0):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the MailSink class.
+
+        Arguments:
+            (input) log -> Log class instance
+            (input) host -> SMTP server
+            (input) queue_size -> Maximum number of queued emails, 0 is no
+                limit
+
+        """
+
+        self.log = log
+        self.host = host
+        self.smtp = None
+        self.failures = 0
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def sendmail(self, frm, to_addr, text):
+
+        """Method:  sendmail
+
+        Description:  Queue a message to be sent over the SMTP session.
+
+        Arguments:
+            (input) frm -> From address
+            (input) to_addr -> To address
+            (input) text -> Message text
+
+        """
+
+        self.queue.put((frm, to_addr, text))
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Open the SMTP session, if not already open.
+
+        Arguments:
+            (output) smtp -> SMTP instance
+
+        """
+
+        if self.smtp is None:
+            self.smtp = smtplib.SMTP(self.host)
+
+        return self.smtp
+
+    def deliver(self, message):
+
+        """Method:  deliver
+
+        Description:  Send a message over the SMTP session.  If the server
+            has dropped the session, it is opened again and the message is
+            sent once more.
+
+        Arguments:
+            (input) message -> Tuple of from address, to address and text
+
+        """
+
+        try:
+            self.connect().sendmail(*message)
+
+        except smtplib.SMTPServerDisconnected:
+            self.smtp = None
+            self.connect().sendmail(*message)
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Sender thread which sends the queued emails until it
+            receives None.
+
+        Arguments:
+
+        """
+
+        while True:
+            message = self.queue.get()
+
+            try:
+                if message is None:
+                    break
+
+                self.deliver(message)
+
+            except Exception as err:                # pylint:disable=W0718
+                self.log.log_err(f"MailSink:  Failed to send email: {err}")
+                self.failures += 1
+
+            finally:
+                self.queue.task_done()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Wait until all of the queued emails are sent and close
+            the SMTP session.
+
+        Arguments:
+            (output) status -> True|False - All emails sent
+
+        """
+
+        if self.thread:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+        if self.smtp:
+            try:
+                self.smtp.quit()
+
+            except smtplib.SMTPException:
+                pass
+
+            self.smtp = None
+
+        return not self.failures
+
+
+def mail_message(mail):
+
+    """Function:  mail_message
+
+    Description:  Build the message of a Mail instance, so it can be sent
+        over an SMTP session.
+
+    Arguments:
+        (input) mail -> Mail class instance
+        (output) frm -> From address
+        (output) to_addr -> List of to addresses
+        (output) text -> Message text
+
+    """
+
+    to_addr = mail.to if isinstance(mail.to, list) else mail.to.split()
+    msg = MIMEText(mail.msg)
+    msg["From"] = mail.frm
+    msg["To"] = ", ".join(to_addr)
+    msg["Subject"] = " ".join(mail.subj) if isinstance(mail.subj, list) \
+        else mail.subj or ""
+
+    return mail.frm, to_addr, msg.as_string()
+
+
+def send_mail(mail, mail_sink=None):
+
+    """Function:  send_mail
+
+    Description:  Send a Mail instance over the SMTP session of the mail
+        sink if one is passed, otherwise send it now.
+
+    Arguments:
+        (input) mail -> Mail class instance
+        (input) mail_sink -> MailSink class instance
+
+    """
+
+    if mail_sink:
+        mail_sink.sendmail(*mail_message(mail))
+
+    else:
+        mail.send_mail()
+
+
+def send_smtp(frm, to_addr, text, mail_sink=None):
+
+    """Function:  send_smtp
+
+    Description:  Send a message with SMTP through the mail sink if one is
+        passed, otherwise over a new SMTP session.
+
+    Arguments:
+        (input) frm -> From address
+        (input) to_addr -> To address
+        (input) text -> Message text
+        (input) mail_sink -> MailSink class instance
+
+    """
+
+    if mail_sink:
+        mail_sink.sendmail(frm, to_addr, text)
+
+    else:
+        smtp = smtplib.SMTP("localhost")
+        smtp.sendmail(frm, to_addr, text)
+        smtp.quit()
+
+
+def encode_payload(cfg, log_json):
+
+    """Function:  encode_payload
+
+    Description:  Convert a JSON log document to the payload of an email or
+        RabbitMQ message.  If payload_encoding is set to gzip, the JSON is
+        gzip compressed and base64 encoded behind the payload marker.
+
+    Arguments:
+        (input) cfg -> Configuration setup
+        (input) log_json -> JSON log document
+        (output) data -> Payload string
+
+    """
+
+    data = json.dumps(log_json)
+
+    if getattr(cfg, "payload_encoding", None) == "gzip":
+        data = PAYLOAD_MARKER + base64.encodebytes(
+            gzip.compress(data.encode(), compresslevel=6)).decode("ascii")
+
+    return data
+
+
+def split_log_json(log_json, chunk_size):
+
+    """Function:  split_log_json
+
+    Description:  Split the log entries of a JSON log document into parts of
+        about chunk_size bytes of serialized log entries.  Each part is a
+        JSON log document with the part number, total number of parts and a
+        run id shared by all of the parts.  The offsets of a part are the
+        number of times each of its log entries is in the earlier parts, so
+        repeated log entries keep their occurrence in the whole document.  A
+        document which fits in one part is returned as it is.
+
+    Arguments:
+        (input) log_json -> JSON log document
+        (input) chunk_size -> Maximum size in bytes of the log entries a part
+        (output) List of JSON log documents
+
+    """
+
+    chunks = []
+    servers = {}
+    offsets = {}
+    seen = {}
+    in_part = set()
+    size = 0
+
+    for svr, lines in log_json["servers"].items():
+        seen[svr] = {}
+
+        for line in lines:
+            line_size = len(json.dumps(line)) + 2
+
+            if size and size + line_size > chunk_size:
+                chunks.append((servers, offsets))
+                servers = {}
+                offsets = {}
+                in_part = set()
+                size = 0
+
+            if svr not in servers:
+                servers[svr] = []
+                size += len(json.dumps(svr)) + 6
+
+            # First time in this part of a log entry in an earlier part
+            if (svr, line) not in in_part:
+                in_part.add((svr, line))
+
+                if seen[svr].get(line):
+                    offsets.setdefault(svr, {})[line] = seen[svr][line]
+
+            servers[svr].append(line)
+            seen[svr][line] = seen[svr].get(line, 0) + 1
+            size += line_size
+
+    if not chunks:
+        return [log_json]
+
+    chunks.append((servers, offsets))
+    header = {key: val for key, val in log_json.items() if key != "servers"}
+    run_id = uuid.uuid4().hex
+
+    return [dict(header, servers=servers, offsets=offsets, part=cnt,
+                 total=len(chunks), run_id=run_id)
+            for cnt, (servers, offsets) in enumerate(chunks, 1)]
+
+
+def get_part_suffix(log_json):
+
+    """Function:  get_part_suffix
+
+    Description:  Get the file name suffix of a part of a JSON log document.
+
+    Arguments:
+        (input) log_json -> JSON log document
+        (output) Suffix of the part or an empty string if not a part
+
+    """
+
+    return f".part{log_json['part']}" if "part" in log_json else ""
+
+
+def is_base64(data):
+
+    """Function:  is_base64
+
+    Description:  Determines if the data is base64 encoded.
+
+    Arguments:
+        (input) data -> Data string to be checked
+        (output) status -> True|False - Is base64 encoded
+
+    """
+
+    try:
+        status = base64.b64encode(
+            base64.b64decode(data))[1:70].decode() == data[1:70]
+
+    except TypeError:
+        status = False
+
+    except binascii.Error:
+        status = False
+
+    return status
+
+
+def is_base64_file(f_hdr, size=72):
+
+    """Function:  is_base64_file
+
+    Description:  Determines if a file is base64 encoded from the first bytes
+        of the file.  The file is returned to the start.
+
+    Arguments:
+        (input) f_hdr -> File handler opened in binary mode
+        (input) size -> Number of encoded characters to check
+        (output) status -> True|False - Is base64 encoded
+
+    """
+
+    # Allow for the encoded data being split into multiple lines
+    head = f_hdr.read(size * 2).translate(None, b"\r\n")
+    f_hdr.seek(0)
+    head = head[:min(size, len(head) - len(head) % 4)]
+
+    try:
+        status = bool(head) and is_base64(head.decode("ascii"))
+
+    except UnicodeDecodeError:
+        status = False
+
+    return status
+
+
+def b64decode_file(f_hdr, chunk_size=1048576, gunzip=False):
+
+    """Function:  b64decode_file
+
+    Description:  Base64 decodes a file a chunk at a time, so the encoded
+        data is not held in memory.  The decoded data is gzip decompressed as
+        it is decoded if gunzip is set.
+
+    Arguments:
+        (input) f_hdr -> File handler opened in binary mode
+        (input) chunk_size -> Number of bytes to read at a time
+        (input) gunzip -> True|False - Decoded data is gzip compressed
+        (output) data -> Decoded data
+
+    """
+
+    data = bytearray()
+    rest = b""
+    # Pass the data through unchanged unless it is to be decompressed
+    decomp = zlib.decompressobj(wbits=31) if gunzip else None
+    convert = decomp.decompress if gunzip else bytes
+
+    for chunk in iter(lambda: f_hdr.read(chunk_size), b""):
+        chunk = rest + chunk.translate(None, b" \t\r\n")
+        cut = len(chunk) - len(chunk) % 4
+        data += convert(binascii.a2b_base64(chunk[:cut]))
+        rest = chunk[cut:]
+
+    if rest:
+        data += convert(binascii.a2b_base64(rest))
+
+    if decomp:
+        data += decomp.flush()
+
+    return data
+
+
+def parse_literal(data):                           # pylint:disable=R0912,R0915
+
+    """Function:  parse_literal
+
+    Description:  Parse a Python literal of dictionaries, lists, strings,
+        numbers, True, False and None, as written by str() of a dictionary.
+        This is a single pass over the data and does not build a syntax tree
+        like ast.literal_eval.  Strings with escape sequences are decoded by
+        ast.literal_eval one string at a time.
+
+    Arguments:
+        (input) data -> Python literal string
+        (output) Converted value
+
+    """
+
+    token_re = re.compile(
+        r"""\s*(?:(?P<str>'[^'\\]*(?:\\.[^'\\]*)*'|"[^"\\]*(?:\\.[^"\\]*)*")"""
+        r"""|(?P<num>-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)"""
+        r"""|(?P<const>True|False|None)|(?P<punct>[][{}:,]))""", re.S)
+    consts = {"True": True, "False": False, "None": None}
+    stack = []
+    result = []
+    state = "value"
+    key = None
+    pos = 0
+    match = token_re.match(data, pos)
+
+    while match and state != "end":
+        pos = match.end()
+        token = match.group(match.lastgroup)
+        value = None
+        is_value = True
+
+        if match.lastgroup == "str":
+            value = token[1:-1] if "\\" not in token \
+                else ast.literal_eval(token)
+
+        elif match.lastgroup == "num":
+            value = float(token) if "." in token or "e" in token.lower() \
+                else int(token)
+
+        elif match.lastgroup == "const":
+            value = consts[token]
+
+        elif token in "{[" and state == "value":
+            stack.append(({} if token == "{" else [], key))
+            state = "key" if token == "{" else "value"
+            is_value = False
+
+        elif token in "}]" and stack \
+                and isinstance(stack[-1][0], dict) == (token == "}") \
+                and state in ("sep", "key" if token == "}" else "value"):
+            value, key = stack.pop()
+            state = "value"
+
+        elif token == "," and state == "sep":
+            state = "key" if isinstance(stack[-1][0], dict) else "value"
+            is_value = False
+
+        elif token == ":" and state == "colon":
+            state = "value"
+            is_value = False
+
+        else:
+            break
+
+        if is_value and state not in ("value", "key"):
+            break
+
+        if is_value and not stack:
+            result.append(value)
+            state = "end"
+
+        elif is_value and state == "key":
+            key = value
+            state = "colon"
+
+        elif is_value and isinstance(stack[-1][0], dict):
+            stack[-1][0][key] = value
+            state = "sep"
+
+        elif is_value:
+            stack[-1][0].append(value)
+            state = "sep"
+
+        match = token_re.match(data, pos)
+
+    if state != "end" or data[pos:].strip():
+        raise ValueError(f"parse_literal:  Invalid literal at position {pos}")
+
+    return result[0]
+
+
+def read_insert_file(fname):
+
+    """Function:  read_insert_file
+
+    Description:  Read an insert file and convert it to a dictionary.  The
+        encoding is detected from the start of the file.  A plain file is
+        parsed as JSON straight from the file.  Base64 data is decoded as it
+        is read and passed to the parser as text, as simplejson does not
+        accept bytes.  A compressed payload, marked by the payload marker, is
+        also decompressed as it is read.  Decoded data that is not JSON is
+        converted as a Python literal.
+
+    Arguments:
+        (input) fname -> Insert file name
+        (output) log_json -> Dictionary log document or None if not converted
+
+    """
+
+    marker = PAYLOAD_MARKER.encode("ascii")
+
+    with open(fname, mode="rb") as f_hdr:
+        compressed = f_hdr.read(len(marker)) == marker
+
+        if not compressed:
+            f_hdr.seek(0)
+
+        encoded = compressed or is_base64_file(f_hdr)
+
+        try:
+            data = b64decode_file(f_hdr, gunzip=compressed).decode("UTF-8") \
+                if encoded else None
+
+        except (binascii.Error, zlib.error, UnicodeDecodeError):
+            data = ""
+
+    if not encoded:
+        try:
+            with open(fname, mode="r", encoding="UTF-8") as f_hdr:
+                log_json = json.load(f_hdr)
+
+        except ValueError:
+            log_json = None
+
+    else:
+        try:
+            log_json = json.loads(data)
+
+        except ValueError:
+            log_json = None
+
+        if log_json is None and not compressed:
+            try:
+                log_json = parse_literal(data)
+
+            except (ValueError, SyntaxError):
+                log_json = None
+
+    return log_json
+
+
+def process_insert(args, cfg, fname, log, **kwargs):
+
+    """Function:  process_insert
+
+    Description:  Process the insert file and send to a database.  A part of
+        a split JSON log document is inserted on its own.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) fname -> Insert file name
+        (input) log -> Log class instance
+        (input) kwargs:
+            writer -> MongoWriter class instance
+            mail_sink -> MailSink class instance
+        (output) status -> True|False - File has successfully processed
+
+    """
+
+    log.log_info("process_insert:  Converting data to JSON.")
+    status = True
+    log_json = read_insert_file(fname)
+
+    if isinstance(log_json, dict):
+        if "part" in log_json:
+            log.log_info(
+                f"process_insert:  Inserting part {log_json['part']} of"
+                f" {log_json['total']}, run id: {log_json['run_id']}")
+
+        status = parse_data(
+            args, cfg, log, log_json, writer=kwargs.get("writer", None),
+            mail_sink=kwargs.get("mail_sink", None))
+
+    else:
+        log.log_err("process_insert: Data failed to convert to JSON.")
+        status = False
+
+    return status
+
+
+def cleanup_files(docid_files, processed_list, dest_dir, log):
+
+    """Function:  cleanup_files
+
+    Description:  Send processed files to destination directory and remove
+        from master file list.
+
+    Arguments:
+        (input) docid_files -> List of files to be processed
+        (input) processed_list -> List of files that were processed
+        (input) dest_dir -> Directory to move processed files to
+        (input) log -> Log class instance
+        (output) docid_files -> Modified list of files not processed
+
+    """
+
+    log.log_info("cleanup_files:  Post-cleanup of files.")
+    docid_files = list(docid_files)
+    processed_list = list(processed_list)
+
+    for fname in processed_list:
+        log.log_info(f"cleanup_files:  Archiving file:"
+                     f" {os.path.basename(fname)} to {dest_dir}")
+        dtg = datetime.datetime.strftime(
+            datetime.datetime.now(), "%Y%m%d_%H%M%S")
+        new_fname = os.path.basename(fname)
+        gen_libs.mv_file2(fname, dest_dir, new_fname=new_fname + "." + dtg)
+        docid_files.remove(fname)
+
+    return docid_files
+
+
+def load_processed(processed_fname):
+
+    """Function:  load_processed
+
+    Description:  Read in the previous processed docids.
+
+    Arguments:
+        (input) processed_fname -> Name of processed file
+        (output) processed_docids -> List of processed docids
+
+    """
+
+    try:
+        with open(processed_fname, mode="r", encoding="UTF-8") as fhdr:
+            processed_docids = [line.rstrip() for line in fhdr.readlines()]
+
+    except IOError as msg:
+        if msg.args[1] == "No such file or directory":
+            processed_docids = []
+
+    return processed_docids
+
+
+def open_processed(processed_fname):
+
+    """Function:  open_processed
+
+    Description:  Open the processed docids database and create the table if
+        it does not exist.  The docids in the flat processed file are
+        imported into the database the first time it is opened.
+
+    Arguments:
+        (input) processed_fname -> Name of processed file
+        (output) conn -> SQLite connection instance
+
+    """
+
+    conn = sqlite3.connect(processed_fname + ".db", timeout=60)
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS processed (
+            docid TEXT PRIMARY KEY, month TEXT) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS processed_month ON processed (month);
+        CREATE TABLE IF NOT EXISTS imports (path TEXT PRIMARY KEY);
+        """)
+    imported = conn.execute(
+        "SELECT 1 FROM imports WHERE path = ?",
+        (os.path.abspath(processed_fname),)).fetchone()
+
+    if not imported and os.path.isfile(processed_fname):
+        import_processed(conn, processed_fname)
+
+    return conn
+
+
+def import_processed(conn, processed_fname):
+
+    """Function:  import_processed
+
+    Description:  Import the docids of a flat processed file into the
+        processed docids database.  The import is done in a single
+        transaction and is recorded so it is only done once.
+
+    Arguments:
+        (input) conn -> SQLite connection instance
+        (input) processed_fname -> Name of processed file
+        (output) Number of docids in the database
+
+    """
+
+    yearmon = datetime.date.today().strftime("%Y%m")
+
+    with open(processed_fname, mode="r", encoding="UTF-8") as fhdr:
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO processed (docid, month) VALUES (?, ?)",
+                ((line.rstrip(), yearmon) for line in fhdr if line.rstrip()))
+            conn.execute(
+                "INSERT OR IGNORE INTO imports (path) VALUES (?)",
+                (os.path.abspath(processed_fname),))
+
+    return conn.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
+
+
+def get_processed(conn, docids, chunk_size=500):
+
+    """Function:  get_processed
+
+    Description:  Get the docids which are in the processed docids database.
+
+    Arguments:
+        (input) conn -> SQLite connection instance
+        (input) docids -> List of docids to check
+        (input) chunk_size -> Number of docids to check per query
+        (output) processed_docids -> Set of processed docids
+
+    """
+
+    docids = list(docids)
+    processed_docids = set()
+
+    for cnt in range(0, len(docids), chunk_size):
+        chunk = docids[cnt:cnt + chunk_size]
+        processed_docids.update(
+            docid for docid, in conn.execute(
+                "SELECT docid FROM processed WHERE docid IN"
+                f" ({','.join('?' * len(chunk))})", chunk))
+
+    return processed_docids
+
+
+def update_processed(log, processed_fname, file_dict, **kwargs):
+
+    """Function:  update_processed
+
+    Description:  Update the processed file with new file entries.  If the
+        store is set to sqlite, the entries are added to the processed
+        docids database in a single transaction instead.
+
+    Arguments:
+        (input) log -> Log class instance
+        (input) processed_fname -> Name of processed file
+        (input) file_dict -> Dictionary list of new files processed
+        (input) kwargs:
+            store -> Processed docids store:  file|sqlite
+            retention -> Number of months to keep docids in the database
+
+    """
+
+    file_dict = dict(file_dict)
+
+    if kwargs.get("store", "file") == "sqlite":
+        log.log_info(
+            f"update_processed:  Updating processed database:"
+            f" {processed_fname}.db")
+        today = datetime.date.today()
+        conn = open_processed(processed_fname)
+
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO processed (docid, month)"
+                    " VALUES (?, ?)",
+                    ((item, today.strftime("%Y%m")) for item in file_dict))
+
+                if kwargs.get("retention", None):
+                    months = today.year * 12 + today.month - 1 \
+                        - kwargs["retention"]
+                    conn.execute(
+                        "DELETE FROM processed WHERE month < ?",
+                        (f"{months // 12:04d}{months % 12 + 1:02d}",))
+
+        finally:
+            conn.close()
+
+    else:
+        log.log_info(
+            f"update_processed:  Updating processed file: {processed_fname}")
+
+        with open(processed_fname, mode="a", encoding="UTF-8") as fhdr:
+            for item in file_dict:
+                fhdr.write(item + "\n")
+
+
+def process_failed(args, cfg, log, failed_dict, **kwargs):
+
+    """Function:  process_failed
+
+    Description:  Process the failed files.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) failed_dict -> Dictionary list of failed files
+        (input) kwargs:
+            mail_sink -> MailSink class instance
+
+    """
+
+    log.log_info("process_failed:  Processing failed entries.")
+    dtg = datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d_%H%M%S")
+    failed_file = os.path.join(cfg.error_dir, "failed_process." + dtg)
 
-    # Insert entries into Mongo
-    if args.arg_exist("-i"):
-        log.log_info("process_json:  Inserting JSON log entries into Mongo")
-        status = parse_data(args, cfg, log, log_json)
+    with open(failed_file, mode="a", encoding="UTF-8") as fhdr:
+        fhdr.write(json.dumps(failed_dict, indent=4))
 
-    # Email entries
-    elif args.arg_exist("-e"):
-        log.log_info(f"process_json:  Email log entries to: {cfg.to_addr},"
-                     f"Subject: {cfg.subj}")
+    # Send email if set
+    if args.get_val("-t", def_val=False):
+        subj = args.get_val("-s", def_val="") + " Process failed files"
+        mail = gen_class.setup_mail(args.get_val("-t"), subj=subj)
+        mail.add_2_msg(json.dumps(failed_dict, indent=4))
+        send_mail(mail, mail_sink=kwargs.get("mail_sink", None))
 
-        if args.arg_exist("-b"):
-            write_summary(cfg, log, log_json)
 
-        if args.arg_exist("-g"):
-            log.log_info("process_json:  Email data in body")
-            mail = gen_class.setup_mail(cfg.to_addr, subj=cfg.subj)
-            mail.add_2_msg(json.dumps(log_json))
-            mail.send_mail()
+def remove_processed(cfg, log, file_dict):
 
-        else:
-            log.log_info("process_json:  Email data as attachment")
-            msg = MIMEMultipart()
-            msg["From"] = getpass.getuser() + "@" + socket.gethostname()
-            msg["To"] = cfg.to_addr
-            msg["Subject"] = cfg.subj
-            fname = log_json["docid"] + "_docid"
-            part = MIMEBase("application", "json")
-            part.set_payload(json.dumps(log_json))
-            encoders.encode_base64(part)
-            part.add_header(
-                "Content-Disposition", "attachment", filename=fname)
-            msg.attach(part)
-            text = msg.as_string()
-            mail = smtplib.SMTP("localhost")
-            mail.sendmail(msg["From"], msg["To"], text)
+    """Function:  remove_processed
 
-        status = True
+    Description:  Removes any previous processed docids from the file_dict.
+        If processed_store is set to sqlite, only the docids in the file_dict
+        are looked up in the processed docids database.
 
-    # Publish entries to RabbitMQ
-    elif args.arg_exist("-r"):
-        log.log_info("process_json:  Publishing log entries to RabbitMQ.")
-        status, err_msg = rabbitmq_class.pub_2_rmq(
-            cfg, json.dumps(log_json))
+    Arguments:
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) file_dict -> Dictionary list of docids
+        (output) file_dict -> Dict list of docids, processed docids removed
 
-        if status:
-            log.log_info("process_json:  Log entries published to RabbitMQ.")
+    """
+
+    log.log_info("remove_processed:  Removing previous processed docids.")
+
+    if getattr(cfg, "processed_store", "file") == "sqlite":
+        conn = open_processed(cfg.processed_file)
+
+        try:
+            processed_docids = get_processed(conn, file_dict)
+
+        finally:
+            conn.close()
+
+    else:
+        processed_docids = set(load_processed(cfg.processed_file))
+
+    return {docid: value for docid, value in file_dict.items()
+            if docid not in processed_docids}
 
-        else:
-            log.log_err(
-                "process_json:  Error detected during publication.")
-            log.log_err(f"process_json:  Message: {err_msg}")
-            dtg = datetime.datetime.strftime(
-                datetime.datetime.now(), "%Y%m%d_%H%M%S")
-            name = "NonPublished." + log_json["docid"] + "." + dtg
-            fname = os.path.join(cfg.error_dir, name)
-            log.log_err(
-                f"process_json:  Writing JSON document to file: {fname}")
-            gen_libs.write_file(fname, mode="w", data=log_json)
-
-            if args.get_val("-t", def_val=False):
-                log.log_info(
-                    f'process_json:  Email error to: {args.get_val("-t")}')
-                subj = args.get_val("-s", def_val="") + "Error: NonPublished"
-                mail = gen_class.setup_mail(args.get_val("-t"), subj=subj)
-                mail.add_2_msg("Unable to publish message to RabbitMQ")
-                mail.add_2_msg("File: " + fname)
-                mail.send_mail()
+
+def is_recall(pattern, fname):
+
+    """Function:  is_recall
+
+    Description:  Determines if a pulled file is a security recall.  The file
+        is read a line at a time and the search stops at the first line which
+        matches the pattern.
+
+    Arguments:
+        (input) pattern -> Compiled bytes regular expression of a recall
+        (input) fname -> Pulled file name
+        (output) status -> True|False - Pattern found in the file
+
+    """
+
+    status = False
+
+    with open(fname, mode="rb") as fhdr:
+        for line in fhdr:
+            if pattern.search(line.rstrip()):
+                status = True
+                break
 
     return status
 
 
-def is_base64(data):
+def check_recall(pattern, fname, verdicts):
 
-    """Function:  is_base64
+    """Function:  check_recall
 
-    Description:  Determines if the data is base64 encoded.
+    Description:  Determines if a pulled file is a security recall, using the
+        cached verdict if the file has not changed since it was checked.
 
     Arguments:
-        (input) data -> Data string to be checked
-        (output) status -> True|False - Is base64 encoded
+        (input) pattern -> Compiled bytes regular expression of a recall
+        (input) fname -> Pulled file name
+        (input) verdicts -> Dictionary of [mtime, size, verdict, checked] by
+            file name
+        (output) status -> True|False - Pattern found in the file
 
     """
 
-    try:
-        status = base64.b64encode(
-            base64.b64decode(data))[1:70].decode() == data[1:70]
+    stat = os.stat(fname)
+    verdict = verdicts.get(fname, None)
 
-    except TypeError:
-        status = False
+    if verdict and verdict[0:2] == [stat.st_mtime, stat.st_size]:
+        status = verdict[2]
 
-    except binascii.Error:
-        status = False
+    else:
+        status = is_recall(pattern, fname)
+
+    verdicts[fname] = [stat.st_mtime, stat.st_size, status, time.time()]
 
     return status
 
 
-def process_insert(args, cfg, fname, log):
+def recall_search(args, cfg, log, file_dict, **kwargs):  # pylint:disable=R0914
 
-    """Function:  process_insert
+    """Function:  recall_search
 
-    Description:  Process the insert file and send to a database.
+    Description:  Search for security recalled products in the pulled files
+        and process those files.  If recall_cache is set, the verdict for
+        each file is kept and files which have not changed are not searched
+        again.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
-        (input) fname -> Insert file name
         (input) log -> Log class instance
-        (output) status -> True|False - File has successfully processed
+        (input) file_dict -> Dictionary list of new pulled files to process
+        (input) kwargs:
+            mail_sink -> MailSink class instance
+        (output) failed_dict -> Dictionary list of files that failed to process
 
     """
 
-    log.log_info("process_insert:  Converting data to JSON.")
-    status = True
-
-    with open(fname, mode="r", encoding="UTF-8") as f_hdr:
-        data = f_hdr.read()
+    log.log_info("recall_search:  Processing new pulled files.")
+    docid_list = []
+    failed_dict = {}
+    file_dict = dict(file_dict)
+    pattern = re.compile(cfg.pattern.encode())
+    cache_file = getattr(cfg, "recall_cache", None)
+    verdicts = load_json_file(cache_file) if cache_file else None
 
-    # Check the first 70 chars in case the encoded is split into multiple lines
-    if is_base64(data):
-        log_json = ast.literal_eval(base64.b64decode(data).decode())
+    for docid in file_dict:
+        log.log_info(
+            f"recall_search:  Docid: {docid} File: {file_dict[docid]}")
+        log.log_info("recall_search:  Searching for security recall.")
 
-    else:
         try:
-            log_json = json.loads(data)
+            status = is_recall(pattern, file_dict[docid]) \
+                if verdicts is None \
+                else check_recall(pattern, file_dict[docid], verdicts)
 
-        except ValueError:
-            log_json = data
+        except IOError as msg:
+            log.log_err("recall_search: Failed to open file!")
+            failed_dict[docid] = msg.args[1]
+            status = False
 
-    if isinstance(log_json, dict):
-        status = parse_data(args, cfg, log, log_json)
+        if status:
+            fname = os.path.basename(file_dict[docid])
+            fields = re.split(r"-|\.", fname)
+            log.log_info(f"recall_search:  Security recall product found in:"
+                         f" {file_dict[docid]}")
+            docid_list.append({
+                "command": fname.split("-")[0],
+                "pubdate": fields[fields.index("PULLED") + 1],
+                "docid": docid})
+
+    if verdicts is not None:
+        cutoff = time.time() - 62 * 86400
+        write_json_file(
+            cache_file, {fname: verdict for fname, verdict in verdicts.items()
+                         if verdict[3] >= cutoff})
+
+    if docid_list:
+        failed_dict.update(process_docids(
+            args, cfg, docid_list, log,
+            mail_sink=kwargs.get("mail_sink", None)))
+
+    return failed_dict
+
+
+def recall_search2(args, cfg, log, docid_dict, **kwargs):
+
+    """Function:  recall_search2
+
+    Description:  Get docids from an input file and process the docids.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) docid_dict -> Dictionary of docids to process
+        (input) kwargs:
+            mail_sink -> MailSink class instance
+        (output) failed_dict -> Dictionary of docids that failed to process
+
+    """
+
+    docid_dict = dict(docid_dict)
+    t_docid = {}
+    docid_list = []
+    failed_dict = {}
+
+    for docid in docid_dict:
+        log.log_info(f"recall_search2:  Processing docid: {docid}")
+        t_docid["docid"] = docid
+        t_docid["command"] = docid_dict[docid]["command"]
+        t_docid["pubdate"] = docid_dict[docid]["pubdate"]
+        t_docid["pulldate"] = docid_dict[docid]["pulldate"]
+        docid_list.append(t_docid)
+        t_docid = {}
+
+    if docid_list:
+        failed_dict.update(process_docids(
+            args, cfg, docid_list, log,
+            mail_sink=kwargs.get("mail_sink", None)))
+
+    return failed_dict
+
+
+def scan_doc_dir(cfg, docdir, watermarks):
+
+    """Function:  scan_doc_dir
+
+    Description:  Get the pulled files in a directory which are new or have
+        changed since the directory's watermark.  The directory is only
+        listed if it has changed since the last run.  The watermark of the
+        directory is updated and watermarks of directories not checked in
+        the last 62 days are dropped.
+
+    Arguments:
+        (input) cfg -> Configuration setup
+        (input) docdir -> Directory of pulled files
+        (input) watermarks -> Dictionary of watermarks keyed by directory
+        (output) docid_files -> List of new or changed pulled files
+
+    """
+
+    docid_files = []
+    mtime = os.stat(docdir).st_mtime
+    mark = watermarks.get(docdir, {})
+    today = datetime.date.today()
+
+    if mark.get("mtime", None) != mtime:
+        files = {}
+
+        with os.scandir(docdir) as dir_entries:
+            for entry in dir_entries:
+                if entry.is_file() and re.search(cfg.file_regex, entry.name):
+                    files[entry.name] = entry.stat().st_mtime
+
+                    if mark.get("files", {}).get(entry.name, None) \
+                       != files[entry.name]:
+                        docid_files.append(entry.path)
+
+        # A directory changed within the last few seconds is listed again
+        #   next time, in case of a change in the same mtime tick
+        mark = {"mtime": mtime if time.time() - mtime > 2 else -1,
+                "files": files}
+
+    mark["checked"] = today.isoformat()
+    watermarks[docdir] = mark
+
+    for dir_path in list(watermarks):
+        if watermarks[dir_path].get("checked", "") \
+           < (today - datetime.timedelta(days=62)).isoformat():
+            watermarks.pop(dir_path)
+
+    return docid_files
+
+
+def process_files(args, cfg, log, **kwargs):       # pylint:disable=R0914,R0912
+
+    """Function:  process_files
+
+    Description:  Processes the docid files.  If watermark_file is set, only
+        pulled files which are new since the last run are examined and the
+        previous month's directory is also checked.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) kwargs:
+            mail_sink -> MailSink class instance
+
+    """
+
+    log.log_info("process_files:  Locating pulled files.")
+    docid_files = []
+    now = datetime.datetime.now()
+    yearmons = [datetime.date.strftime(now, "%Y/%m")]
+    search_dir = []
+    watermark_file = getattr(cfg, "watermark_file", None)
+    watermarks = load_json_file(watermark_file) if watermark_file else None
+
+    # Files which land late in the previous month are picked up
+    if watermark_file:
+        yearmons.insert(0, datetime.date.strftime(
+            now.replace(day=1) - datetime.timedelta(days=1), "%Y/%m"))
+
+    if args.get_val("-m", def_val=None):
+        search_dir.append(args.get_val("-m"))
 
     else:
-        log.log_err("process_insert: Data failed to convert to JSON.")
-        status = False
+        for dir_entry in cfg.doc_dir:
+            for yearmon in yearmons:
+                dir_path = os.path.join(dir_entry, yearmon)
 
-    return status
+                if os.path.isdir(dir_path):
+                    search_dir.append(dir_path)
 
+                else:
+                    log.log_warn(f"process_files: {dir_path} does not exist")
 
-def cleanup_files(docid_files, processed_list, dest_dir, log):
+    for docdir in search_dir:
+        log.log_info(f"process_files:  Searching directory: {docdir}")
 
-    """Function:  cleanup_files
+        if watermarks is None:
+            tmp_list = gen_libs.filename_search(
+                docdir, cfg.file_regex, add_path=True)
 
-    Description:  Send processed files to destination directory and remove
-        from master file list.
+        else:
+            tmp_list = scan_doc_dir(cfg, docdir, watermarks)
+
+        docid_files.extend(tmp_list)
+
+    log.log_info("process_files:  Removing duplicate pulled docids.")
+    file_dict = {}
+
+    for filename in docid_files:
+        docid = re.split(
+            r"-|\.", os.path.basename(filename))[
+                re.split(r"-|\.", filename).index('html') - 1]
+
+        if docid not in file_dict:
+            file_dict[docid] = filename
+
+    file_dict = remove_processed(cfg, log, file_dict)
+    failed_dict = recall_search(
+        args, cfg, log, file_dict, mail_sink=kwargs.get("mail_sink", None))
+
+    if file_dict:
+        update_processed(
+            log, cfg.processed_file, file_dict,
+            store=getattr(cfg, "processed_store", "file"),
+            retention=getattr(cfg, "processed_retention", None))
+
+    if watermarks is not None:
+        log.log_info(
+            f"process_files:  Updating watermarks: {watermark_file}")
+        write_json_file(watermark_file, watermarks)
+
+    if failed_dict:
+        process_failed(
+            args, cfg, log, failed_dict,
+            mail_sink=kwargs.get("mail_sink", None))
+
+
+def file_input(args, cfg, log, **kwargs):
+
+    """Function:  file_input
+
+    Description:  Process docids via input file.
 
     Arguments:
-        (input) docid_files -> List of files to be processed
-        (input) processed_list -> List of files that were processed
-        (input) dest_dir -> Directory to move processed files to
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
         (input) log -> Log class instance
-        (output) docid_files -> Modified list of files not processed
+        (input) kwargs:
+            mail_sink -> MailSink class instance
 
     """
 
-    log.log_info("cleanup_files:  Post-cleanup of files.")
-    docid_files = list(docid_files)
-    processed_list = list(processed_list)
+    log.log_info("file_input:  Processing docids from input file.")
+    docid_dict = {}
+    file_list = gen_libs.file_2_list(args.get_val("-F"))
+
+    for line in file_list:
+        docid = line.split(" ")[0]
+        metadata = {
+            "command": line.split(" ")[1],
+            "pubdate": line.split(" ")[2],
+            "pulldate": line.split(" ")[3]}
+
+        if docid not in docid_dict:
+            docid_dict[docid] = metadata
+
+        else:
+            log.log_warn("file_input: Duplicate lines detected in file.")
+            log.log_warn(f"Docid: {docid}")
+            log.log_want(f"Line 1: {docid_dict[docid]}")
+            log.log_want(f"Line 2: {metadata}")
+
+    docid_dict = remove_processed(cfg, log, docid_dict)
+    failed_dict = recall_search2(
+        args, cfg, log, docid_dict, mail_sink=kwargs.get("mail_sink", None))
+
+    if docid_dict:
+        update_processed(
+            log, cfg.processed_file, docid_dict,
+            store=getattr(cfg, "processed_store", "file"),
+            retention=getattr(cfg, "processed_retention", None))
+
+    if failed_dict:
+        process_failed(
+            args, cfg, log, failed_dict,
+            mail_sink=kwargs.get("mail_sink", None))
+
+
+def load_json_file(fname):
+
+    """Function:  load_json_file
+
+    Description:  Read in a JSON file of a dictionary, such as the watchlist,
+        the watch mode checkpoints or a cache file.  A missing file or a
+        corrupt file (e.g. one cut short) is read as an empty dictionary, so
+        it is rebuilt by the next write.
+
+    Arguments:
+        (input) fname -> Name of file
+        (output) data -> Dictionary read from the file
+
+    """
+
+    data = {}
+
+    if os.path.exists(fname):
+        try:
+            with open(fname, mode="r", encoding="UTF-8") as fhdr:
+                data = json.load(fhdr)
 
-    for fname in processed_list:
-        log.log_info(f"cleanup_files:  Archiving file:"
-                     f" {os.path.basename(fname)} to {dest_dir}")
-        dtg = datetime.datetime.strftime(
-            datetime.datetime.now(), "%Y%m%d_%H%M%S")
-        new_fname = os.path.basename(fname)
-        gen_libs.mv_file2(fname, dest_dir, new_fname=new_fname + "." + dtg)
-        docid_files.remove(fname)
+        except ValueError:
+            data = {}
 
-    return docid_files
+    return data
 
 
-def load_processed(processed_fname):
+def write_json_file(fname, data):
 
-    """Function:  load_processed
+    """Function:  write_json_file
 
-    Description:  Read in the previous processed docids.
+    Description:  Write data to a JSON file.  The file is written to a
+        temporary file first and then moved into place.
 
     Arguments:
-        (input) processed_fname -> Name of processed file
-        (output) processed_docids -> List of processed docids
+        (input) fname -> Name of file
+        (input) data -> Data to write
 
     """
 
-    try:
-        with open(processed_fname, mode="r", encoding="UTF-8") as fhdr:
-            processed_docids = [line.rstrip() for line in fhdr.readlines()]
+    tmp_file = fname + ".tmp"
 
-    except IOError as msg:
-        if msg.args[1] == "No such file or directory":
-            processed_docids = []
+    with open(tmp_file, mode="w", encoding="UTF-8") as fhdr:
+        json.dump(data, fhdr)
 
-    return processed_docids
+    os.replace(tmp_file, fname)
 
 
-def update_processed(log, processed_fname, file_dict):
+def update_watchlist(cfg, log, docid_list):
 
-    """Function:  update_processed
+    """Function:  update_watchlist
 
-    Description:  Update the processed file with new file entries.
+    Description:  Add the recalled docids to the watchlist for the watch
+        mode.
 
     Arguments:
+        (input) cfg -> Configuration setup
         (input) log -> Log class instance
-        (input) processed_fname -> Name of processed file
-        (input) file_dict -> Dictionary list of new files processed
+        (input) docid_list -> List of dictionaries containing docid information
 
     """
 
-    log.log_info(
-        f"update_processed:  Updating processed file: {processed_fname}")
-    file_dict = dict(file_dict)
+    if docid_list:
+        log.log_info(
+            f"update_watchlist:  Updating watchlist: {cfg.watch_file}")
+        watchlist = load_json_file(cfg.watch_file)
 
-    with open(processed_fname, mode="a", encoding="UTF-8") as fhdr:
-        for item in file_dict:
-            fhdr.write(item + "\n")
+        for docid_dict in docid_list:
+            watchlist[docid_dict["docid"]] = dict(docid_dict)
 
+        write_json_file(cfg.watch_file, watchlist)
 
-def process_failed(args, cfg, log, failed_dict):
 
-    """Function:  process_failed
+def prune_watchlist(cfg, log, file_docids, gone):
 
-    Description:  Process the failed files.
+    """Function:  prune_watchlist
+
+    Description:  Drop the docids from the watchlist which have no log files
+        left to watch, so the watchlist does not grow without bound.
 
     Arguments:
-        (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
         (input) log -> Log class instance
-        (input) failed_dict -> Dictionary list of failed files
+        (input) file_docids -> Dictionary of docid lists keyed by log file
+        (input) gone -> Set of log files which no longer exist
 
     """
 
-    log.log_info("process_failed:  Processing failed entries.")
-    dtg = datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d_%H%M%S")
-    failed_file = os.path.join(cfg.error_dir, "failed_process." + dtg)
-
-    with open(failed_file, mode="a", encoding="UTF-8") as fhdr:
-        fhdr.write(json.dumps(failed_dict, indent=4))
+    watched = {docid for fname, docids in file_docids.items()
+               if fname not in gone for docid in docids}
+    watchlist = load_json_file(cfg.watch_file)
+    dropped = sorted(set(watchlist) - watched)
 
-    # Send email if set
-    if args.get_val("-t", def_val=False):
-        subj = args.get_val("-s", def_val="") + " Process failed files"
-        mail = gen_class.setup_mail(args.get_val("-t"), subj=subj)
-        mail.add_2_msg(json.dumps(failed_dict, indent=4))
-        mail.send_mail()
+    if dropped:
+        log.log_info(
+            f"prune_watchlist:  Dropping docids with no log files: {dropped}")
+        write_json_file(cfg.watch_file, {
+            docid: docid_dict for docid, docid_dict in watchlist.items()
+            if docid not in dropped})
 
 
-def search_docid(args, cfg, docid_dict, log):
+def get_checkpoint_file(cfg):
 
-    """Function:  search_docid
+    """Function:  get_checkpoint_file
 
-    Description:  Call the process_docid and check on status of docid.
+    Description:  Get the name of the watch mode checkpoint file.
 
     Arguments:
-        (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
-        (input) docid_dict -> Dictionary of individual docid
-        (input) log -> Log class instance
-        (output) docid_status -> Dictionary of status of docid processing
+        (output) Name of the checkpoint file
 
     """
 
-    docid_status = {}
-    status = process_docid(args, cfg, docid_dict, log)
+    return getattr(
+        cfg, "checkpoint_file", None) or cfg.watch_file + ".checkpoint"
 
-    if not status:
-        log.log_err(f"search_docid: Error detected for docid: {docid_dict}")
-        docid_status[docid_dict["docid"]] = "Failed the process_docid process"
 
-    return docid_status
+def tail_log_file(fname, checkpoint, **kwargs):
 
+    """Function:  tail_log_file
 
-def remove_processed(cfg, log, file_dict):
+    Description:  Read the complete log entries appended to a log file since
+        the checkpoint.  If the log file has no checkpoint, the checkpoint of
+        the same inode is used, so a log file renamed by a log rotation is
+        read on from where it was left.  The log file is read from the start
+        if it has been replaced or truncated since the checkpoint.
 
-    """Function:  remove_processed
+    Arguments:
+        (input) fname -> Log file name
+        (input) checkpoint -> Dictionary of the file's inode and offset
+        (input) kwargs:
+            inodes -> Dictionary of the known checkpoints keyed by inode
+        (output) lines -> List of new log entries
+        (output) checkpoint -> Dictionary of the file's new inode and offset
+
+    """
+
+    lines = []
+    stat = os.stat(fname)
+    offset = 0
+
+    if not checkpoint:
+        checkpoint = kwargs.get("inodes", {}).get(stat.st_ino, None)
+
+    if checkpoint and checkpoint["inode"] == stat.st_ino \
+       and checkpoint["offset"] <= stat.st_size:
+        offset = checkpoint["offset"]
+
+    with open(fname, mode="rb") as fhdr:
+        fhdr.seek(offset)
+
+        for line in fhdr:
+            # Entry is still being written, pick it up on the next check
+            if not line.endswith(b"\n"):
+                break
+
+            offset += len(line)
+            lines.append(line.decode("UTF-8", errors="replace").rstrip("\r\n"))
+
+    return lines, {"inode": stat.st_ino, "offset": offset}
 
-    Description:  Removes any previous processed docids from the file_dict.
+
+def get_watch_files(args, cfg, watchlist, log):
+
+    """Function:  get_watch_files
+
+    Description:  Get the active log files to watch and the docids to match
+        in each of them.
 
     Arguments:
+        (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
+        (input) watchlist -> Dictionary of docid information keyed by docid
         (input) log -> Log class instance
-        (input) file_dict -> Dictionary list of docids
-        (output) file_dict -> Dict list of docids, processed docids removed
+        (output) file_docids -> Dictionary of docid lists keyed by log file
 
     """
 
-    file_dict = dict(file_dict)
-    log.log_info("remove_processed:  Removing previous processed docids.")
-    processed_docids = load_processed(cfg.processed_file)
+    file_docids = {}
+    cmd_files = {}
 
-    for p_docids in processed_docids:
-        if p_docids in file_dict:
-            file_dict.pop(p_docids)
+    for docid, docid_dict in watchlist.items():
+        cmd = get_command(cfg, docid_dict["command"])
 
-    return file_dict
+        if cmd not in cmd_files:
+            cmd_files[cmd] = [
+                fname for fname in get_log_files(args, cfg, docid_dict, log)
+                if not fname.endswith(".gz")]
 
+        for fname in cmd_files[cmd]:
+            file_docids.setdefault(fname, []).append(docid)
 
-def recall_search(args, cfg, log, file_dict):
+    return file_docids
 
-    """Function:  recall_search
 
-    Description:  Search for security recalled products in the pulled files
-        and process those files.
+def watch_logs(args, cfg, log, **kwargs):    # pylint:disable=R0914,R0912,R0915
+
+    """Function:  watch_logs
+
+    Description:  Check the active log files for new accesses to the
+        docids in the watchlist.  Only the log entries appended since the
+        last check are read.  On the first check the checkpoints are set to
+        the end of the log files.  After that a log file that is not in the
+        checkpoints is read on from the checkpoint of the same inode (i.e. a
+        log file renamed by a log rotation) or else from the start.  Log
+        files that disappear during the check are dropped, as are the docids
+        left with no log files to watch.  A log file that cannot be read is
+        skipped until the next check.  New log entries are processed the same
+        as the -P and -F options.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
         (input) log -> Log class instance
-        (input) file_dict -> Dictionary list of new pulled files to process
-        (output) failed_dict -> Dictionary list of files that failed to process
+        (input) kwargs:
+            mail_sink -> MailSink class instance
 
     """
 
-    log.log_info("recall_search:  Processing new pulled files.")
-    lines = []
-    docid_dict = {}
+    watchlist = load_json_file(cfg.watch_file)
+    checkpoint_file = get_checkpoint_file(cfg)
+    first_check = not os.path.exists(checkpoint_file)
+    checkpoints = load_json_file(checkpoint_file)
+    inodes = {checkpoint["inode"]: checkpoint
+              for checkpoint in checkpoints.values()}
+    file_docids = get_watch_files(args, cfg, watchlist, log)
+    log_jsons = {}
     failed_dict = {}
-    file_dict = dict(file_dict)
+    gone = set()
+    dtg = datetime.datetime.strftime(
+        datetime.datetime.now(), "%Y-%m-%dT%H:%M:%SZ")
 
-    for docid in file_dict:
-        log.log_info(
-            f"recall_search:  Docid: {docid} File: {file_dict[docid]}")
+    active_files = [
+        fname for fname in gen_libs.filename_search(
+            cfg.log_dir, cfg.log_type, add_path=True)
+        if not fname.endswith(".gz")]
 
+    for fname in sorted(set(active_files) | set(file_docids)):
         try:
-            with open(file_dict[docid], mode="r", encoding="UTF-8") as fhdr:
-                data = fhdr.readlines()
-                lines = [line.rstrip() for line in data]
+            # Unwatched files are kept at their end, so they are not read
+            #   from the start if they are watched later on
+            if first_check or fname not in file_docids:
+                stat = os.stat(fname)
+                checkpoints[fname] = {"inode": stat.st_ino,
+                                      "offset": stat.st_size}
+                continue
+
+            lines, checkpoints[fname] = tail_log_file(
+                fname, checkpoints.get(fname, None), inodes=inodes)
+
+        except FileNotFoundError:
+            log.log_warn(f"watch_logs:  Log file no longer exists: {fname}")
+            checkpoints.pop(fname, None)
+            gone.add(fname)
+            continue
+
+        except OSError as err:
+            log.log_err(f"watch_logs:  Unable to read log file: {fname}")
+            log.log_err(f"watch_logs:  Message: {err}")
+            continue
+
+        entries = {}
 
-        except IOError as msg:
-            log.log_err("recall_search: Failed to open file!")
-            failed_dict[docid] = msg.args[1]
-            lines = []
+        for line in lines:
+            for docid in file_docids[fname]:
+                if docid in line:
+                    entries.setdefault(docid, []).append(line)
 
-        if lines:
-            log.log_info("recall_search:  Searching for security recall.")
+        for docid in entries:
+            if docid not in log_jsons:
+                log_jsons[docid] = create_log_json(
+                    cfg, dict(watchlist[docid], docid=docid), dtg)
 
-        for line in lines:
-            if re.search(cfg.pattern, line):
-                fname = os.path.basename(file_dict[docid])
-                docid_dict["command"] = fname.split("-")[0]
-                docid_dict["pubdate"] = re.split(
-                    r"-|\.", fname)[re.split(
-                        r"-|\.", fname).index('PULLED') + 1]
-                docid_dict["docid"] = docid
-                break
+        merge_entries(log_jsons, entries, fname, get_server(args, fname), log)
 
-        if docid_dict:
-            log.log_info(f"recall_search:  Security recall product found in:"
-                         f" {file_dict[docid]}")
-            failed_dict.update(search_docid(args, cfg, docid_dict, log))
-            docid_dict = {}
+    # An empty log directory is taken as not available, not as no log files
+    if active_files:
+        prune_watchlist(cfg, log, file_docids, gone)
 
-    return failed_dict
+    mail_sink = kwargs.get("mail_sink", None)
+    writer = create_writer(args, cfg, log, mail_sink=mail_sink) \
+        if log_jsons and args.arg_exist("-i") else None
+    publisher = create_publisher(args, cfg, log, mail_sink=mail_sink) \
+        if log_jsons else None
 
+    try:
+        for docid, log_json in log_jsons.items():
+            log.log_info(f"watch_logs:  New log entries for docid: {docid}")
+
+            if not process_json(
+                    args, cfg, log, log_json, writer=writer,
+                    publisher=publisher, mail_sink=mail_sink):
+                log.log_err(f"watch_logs: Error detected for docid: {docid}")
+                failed_dict[docid] = "Failed the watch_logs process"
+
+    finally:
+        if writer:
+            writer.close()
+
+        if publisher:
+            publisher.close()
+            failed_dict.update(
+                {docid: "Failed the watch_logs process"
+                 for docid, status in publisher.published.items()
+                 if not status})
+
+    # Files no longer in the log directory are dropped
+    write_json_file(checkpoint_file, {
+        fname: checkpoints[fname]
+        for fname in set(active_files) | set(file_docids)
+        if fname in checkpoints})
 
-def recall_search2(args, cfg, log, docid_dict):
+    if failed_dict:
+        process_failed(
+            args, cfg, log, failed_dict,
+            mail_sink=kwargs.get("mail_sink", None))
 
-    """Function:  recall_search2
 
-    Description:  Get docids from an input file and process the docids.
+def watch_mode(args, cfg, log, **kwargs):
+
+    """Function:  watch_mode
+
+    Description:  Continuously watch the active log files for new accesses
+        to the docids in the watchlist.  The log files are checked every
+        watch_interval seconds until the program is interrupted.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
         (input) log -> Log class instance
-        (input) docid_dict -> Dictionary of docids to process
-        (output) failed_dict -> Dictionary of docids that failed to process
+        (input) kwargs:
+            mail_sink -> MailSink class instance
 
     """
 
-    docid_dict = dict(docid_dict)
-    t_docid = {}
-    failed_dict = {}
+    interval = getattr(cfg, "watch_interval", 60)
+    log.log_info(f"watch_mode:  Watching active log files every {interval}"
+                 f" seconds.")
 
-    for docid in docid_dict:
-        log.log_info(f"recall_search2:  Processing docid: {docid}")
-        t_docid["docid"] = docid
-        t_docid["command"] = docid_dict[docid]["command"]
-        t_docid["pubdate"] = docid_dict[docid]["pubdate"]
-        t_docid["pulldate"] = docid_dict[docid]["pulldate"]
-        failed_dict.update(search_docid(args, cfg, t_docid, log))
-        t_docid = {}
+    try:
+        while True:
+            watch_logs(args, cfg, log, **kwargs)
+            time.sleep(interval)
 
-    return failed_dict
+    except KeyboardInterrupt:
+        log.log_info("watch_mode:  Watch mode interrupted.")
 
 
-def process_files(args, cfg, log):
+def insert_files(args, cfg, log, insert_list,           # pylint:disable=R0914
+                 **kwargs):
 
-    """Function:  process_files
+    """Function:  insert_files
 
-    Description:  Processes the docid files.
+    Description:  Insert a list of pulled search files into Mongodb and move
+        them to the archive or error directory.  With the -j option the files
+        are processed by a pool of worker threads which share one Mongo
+        writer, each file with its own batch so the success of each file is
+        known.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
         (input) log -> Log class instance
+        (input) insert_list -> List of insert file names
+        (input) kwargs:
+            mail_sink -> MailSink class instance
 
     """
 
-    log.log_info("process_files:  Locating pulled files.")
-    docid_files = []
-    yearmon = datetime.date.strftime(datetime.datetime.now(), "%Y/%m")
-    search_dir = []
+    processed_list = []
+    mail = None
+    mail_sink = kwargs.get("mail_sink", None)
+    jobs = get_jobs(args)
 
-    if args.get_val("-m", def_val=None):
-        search_dir.append(args.get_val("-m"))
+    if args.get_val("-t", def_val=False):
+        subj = args.get_val("-s", def_val="") + "Non-processed files"
+        mail = gen_class.setup_mail(args.get_val("-t"), subj=subj)
 
-    else:
-        for dir_entry in cfg.doc_dir:
-            dir_path = os.path.join(dir_entry, yearmon)
+    writer = create_writer(args, cfg, log, mail_sink=mail_sink) \
+        if insert_list else None
 
-            if os.path.isdir(dir_path):
-                search_dir.append(dir_path)
+    try:
+        if jobs > 1 and len(insert_list) > 1:
+            log.log_info(f"insert_files:  Starting worker pool: {jobs}")
+
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=jobs) as pool:
+                futures = [
+                    pool.submit(
+                        process_insert, args, cfg, fname, log,
+                        writer=MongoBatch(writer) if writer else None,
+                        mail_sink=mail_sink)
+                    for fname in insert_list]
+
+                # Results are kept in file order, same as a serial insert
+                processed_list = [
+                    fname for fname, future in zip(insert_list, futures)
+                    if future.result()]
 
-            else:
-                log.log_warn(f"process_files: {dir_path} does not exist")
+        else:
+            for fname in insert_list:
+                log.log_info(f"insert_files:  Processing file: {fname}")
+                status = process_insert(
+                    args, cfg, fname, log, writer=writer, mail_sink=mail_sink)
 
-    for docdir in search_dir:
-        log.log_info(f"process_files:  Searching directory: {docdir}")
-        tmp_list = gen_libs.filename_search(
-            docdir, cfg.file_regex, add_path=True)
-        docid_files.extend(tmp_list)
+                if status:
+                    processed_list.append(fname)
 
-    log.log_info("process_files:  Removing duplicate pulled docids.")
-    file_dict = {}
+    finally:
+        if writer:
+            writer.close()
 
-    for filename in docid_files:
-        docid = re.split(
-            r"-|\.", os.path.basename(filename))[
-                re.split(r"-|\.", filename).index('html') - 1]
+    if insert_list:
+        log.log_info("insert_files:  Post-processing of files.")
+        nonproc_list = cleanup_files(
+            insert_list, processed_list, cfg.marchive_dir, log)
+        non_processed(
+            nonproc_list, cfg.merror_dir, log, mail, mail_sink=mail_sink)
 
-        if docid not in file_dict:
-            file_dict[docid] = filename
 
-    file_dict = remove_processed(cfg, log, file_dict)
-    failed_dict = recall_search(args, cfg, log, file_dict)
+def inotify_init(dir_name):
 
-    if file_dict:
-        update_processed(log, cfg.processed_file, file_dict)
+    """Function:  inotify_init
 
-    if failed_dict:
-        process_failed(args, cfg, log, failed_dict)
+    Description:  Create a Linux inotify instance which watches a directory
+        for files that are closed after writing or moved into it.
 
+    Arguments:
+        (input) dir_name -> Directory to watch
+        (output) fd -> Inotify file descriptor or None if not available
 
-def file_input(args, cfg, log):
+    """
 
-    """Function:  file_input
+    # IN_CLOSE_WRITE | IN_MOVED_TO
+    mask = 0x00000008 | 0x00000080
 
-    Description:  Process docids via input file.
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+        watch = libc.inotify_add_watch(
+            fd, os.fsencode(dir_name), ctypes.c_uint32(mask)) \
+            if fd >= 0 else -1
+
+    except (OSError, AttributeError):
+        fd = watch = -1
+
+    # The watch failed on an open inotify instance
+    if watch < 0 <= fd:
+        os.close(fd)
+        fd = -1
+
+    return fd if fd >= 0 else None
+
+
+def inotify_read(fd, timeout):
+
+    """Function:  inotify_read
+
+    Description:  Wait for inotify events and return the names of the files
+        in the events.
+
+    Arguments:
+        (input) fd -> Inotify file descriptor
+        (input) timeout -> Number of seconds to wait for events
+        (output) names -> List of file names or None if events were lost
+
+    """
+
+    names = []
+
+    if select.select([fd], [], [], max(timeout, 0))[0]:
+        data = os.read(fd, 65536)
+        pos = 0
+
+        # struct inotify_event:  wd, mask, cookie, len, name[len]
+        while names is not None and pos + 16 <= len(data):
+            _, mask, _, length = struct.unpack_from("iIII", data, pos)
+            name = data[pos + 16:pos + 16 + length].rstrip(b"\0")
+            pos += 16 + length
+
+            # IN_Q_OVERFLOW
+            if mask & 0x00004000:
+                names = None
+
+            elif name:
+                names.append(os.fsdecode(name))
+
+    return names
+
+
+def monitor_insert(args, cfg, log, **kwargs):
+
+    """Function:  monitor_insert
+
+    Description:  Continuously monitor the insert directory and insert new
+        files into Mongodb as they arrive.  Inotify is used to detect the
+        files that are closed after writing or moved into the directory.  The
+        directory is also rescanned at the start and every monitor_interval
+        seconds, so files missed while the program was not running are
+        processed.  Runs until the program is interrupted.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
         (input) log -> Log class instance
+        (input) kwargs:
+            mail_sink -> MailSink class instance
 
     """
 
-    log.log_info("file_input:  Processing docids from input file.")
-    docid_dict = {}
-    file_list = gen_libs.file_2_list(args.get_val("-F"))
+    interval = getattr(cfg, "monitor_interval", 300)
+    fd = inotify_init(cfg.monitor_dir)
 
-    for line in file_list:
-        docid = line.split(" ")[0]
-        metadata = {
-            "command": line.split(" ")[1],
-            "pubdate": line.split(" ")[2],
-            "pulldate": line.split(" ")[3]}
+    if fd is None:
+        log.log_warn("monitor_insert:  Inotify not available, only rescanning"
+                     " the directory.")
 
-        if docid not in docid_dict:
-            docid_dict[docid] = metadata
+    log.log_info(f"monitor_insert:  Monitoring {cfg.monitor_dir}, rescanning"
+                 f" every {interval} seconds.")
 
-        else:
-            log.log_warn("file_input: Duplicate lines detected in file.")
-            log.log_warn(f"Docid: {docid}")
-            log.log_want(f"Line 1: {docid_dict[docid]}")
-            log.log_want(f"Line 2: {metadata}")
+    try:
+        while True:
+            log.log_info("monitor_insert:  Searching for new files.")
+            insert_files(
+                args, cfg, log, gen_libs.filename_search(
+                    cfg.monitor_dir, cfg.mfile_regex, add_path=True),
+                **kwargs)
+            next_scan = time.time() + interval
+            names = []
 
-    docid_dict = remove_processed(cfg, log, docid_dict)
-    failed_dict = recall_search2(args, cfg, log, docid_dict)
+            while fd is not None and names is not None \
+                    and time.time() < next_scan:
+                names = inotify_read(fd, next_scan - time.time())
+                insert_list = [
+                    os.path.join(cfg.monitor_dir, name)
+                    for name in dict.fromkeys(names or [])
+                    if re.search(cfg.mfile_regex, name)
+                    and os.path.isfile(os.path.join(cfg.monitor_dir, name))]
 
-    if docid_dict:
-        update_processed(log, cfg.processed_file, docid_dict)
+                if insert_list:
+                    insert_files(args, cfg, log, insert_list, **kwargs)
 
-    if failed_dict:
-        process_failed(args, cfg, log, failed_dict)
+            if fd is None:
+                time.sleep(interval)
+
+    except KeyboardInterrupt:
+        log.log_info("monitor_insert:  Monitor mode interrupted.")
 
+    finally:
+        if fd is not None:
+            os.close(fd)
 
-def insert_data(args, cfg, log):
+
+def insert_data(args, cfg, log, **kwargs):
 
     """Function:  insert_data
 
-    Description:  Insert pulled search files into Mongodb.
+    Description:  Insert pulled search files into Mongodb.  With the -L
+        option the insert directory is monitored for new files until the
+        program is interrupted.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) cfg -> Configuration setup
         (input) log -> Log class instance
+        (input) kwargs:
+            mail_sink -> MailSink class instance
 
     """
 
     log.log_info("insert_data:  Processing files to insert.")
-    processed_list = []
-    mail = None
 
-    if args.get_val("-t", def_val=False):
-        subj = args.get_val("-s", def_val="") + "Non-processed files"
-        mail = gen_class.setup_mail(args.get_val("-t"), subj=subj)
-
-    log.log_info("insert_data:  Searching for new files.")
-    insert_list = gen_libs.filename_search(
-        cfg.monitor_dir, cfg.mfile_regex, add_path=True)
+    if args.get_val("-L", def_val=False):
+        monitor_insert(args, cfg, log, **kwargs)
 
-    for fname in insert_list:
-        log.log_info(f"insert_data:  Processing file: {fname}")
-        status = process_insert(args, cfg, fname, log)
-
-        if status:
-            processed_list.append(fname)
-
-    if insert_list:
-        log.log_info("insert_data:  Post-processing of files.")
-        nonproc_list = cleanup_files(
-            insert_list, processed_list, cfg.marchive_dir, log)
-        non_processed(nonproc_list, cfg.merror_dir, log, mail)
+    else:
+        log.log_info("insert_data:  Searching for new files.")
+        insert_files(
+            args, cfg, log, gen_libs.filename_search(
+                cfg.monitor_dir, cfg.mfile_regex, add_path=True), **kwargs)
 
 
 def validate_dirs(cfg):
@@ -1306,6 +4952,14 @@ def validate_dirs(cfg):
     if not status:
         msg_dict[cfg.raw_archive_dir] = msg
 
+    # Where the Bloom filter sidecars are
+    if getattr(cfg, "bloom_dir", None):
+        status, msg = gen_libs.chk_crt_dir(
+            cfg.bloom_dir, write=True, create=True, no_print=True)
+
+        if not status:
+            msg_dict[cfg.bloom_dir] = msg
+
     return msg_dict
 
 
@@ -1339,7 +4993,7 @@ def mvalidate_dirs(cfg):
     return msg_dict
 
 
-def checks_dirs(args, cfg):
+def checks_dirs(args, cfg):                             # pylint:disable=R0912
 
     """Function:  checks_dirs
 
@@ -1386,6 +5040,36 @@ def checks_dirs(args, cfg):
             msg_dict2 = mvalidate_dirs(cfg)
             msg_dict, _, _ = gen_libs.merge_two_dicts(msg_dict, msg_dict2)
 
+    elif args.get_val("-W", def_val=False):
+        msg_dict = validate_dirs(cfg)
+
+        if args.get_val("-i", def_val=False):
+            msg_dict2 = mvalidate_dirs(cfg)
+            msg_dict, _, _ = gen_libs.merge_two_dicts(msg_dict, msg_dict2)
+
+        # Where the watchlist is
+        if not getattr(cfg, "watch_file", None):
+            msg_dict["watch_file"] = "Not set in the configuration file"
+
+    elif args.get_val("-B", def_val=False):
+        # Where archive log files are
+        status, msg = gen_libs.chk_crt_dir(
+            cfg.log_dir, read=True, no_print=True)
+
+        if not status:
+            msg_dict[cfg.log_dir] = msg
+
+        # Where the archive index is
+        if getattr(cfg, "index_dir", None):
+            status, msg = gen_libs.chk_crt_dir(
+                cfg.index_dir, write=True, create=True, no_print=True)
+
+            if not status:
+                msg_dict[cfg.index_dir] = msg
+
+        else:
+            msg_dict["index_dir"] = "Not set in the configuration file"
+
     return msg_dict
 
 
@@ -1436,7 +5120,7 @@ def run_program(args, func_dict):
             log_file, log_file, "INFO",
             "%(asctime)s %(levelname)s %(message)s", "%Y-%m-%dT%H:%M:%SZ")
         log.log_info("Program initialization.")
-        cfg = config_override(args, cfg)
+        cfg = load_parser(config_override(args, cfg))
         msg_dict = checks_dirs(args, cfg)
 
         if msg_dict:
@@ -1444,14 +5128,44 @@ def run_program(args, func_dict):
             log.log_err(f"Message: {msg_dict}")
 
         else:
-            for opt in set(args.get_args_keys()) & set(func_dict.keys()):
-                func_dict[opt](args, cfg, log)
+            run_options(args, cfg, log, func_dict)
 
     else:
         print("Error:  Logger Directory Check Failure")
         print(f"Error Message: {err_msg}")
 
 
+def run_options(args, cfg, log, func_dict):
+
+    """Function:  run_options
+
+    Description:  Call the functions of the options selected.  If mail_queue
+        is set, the emails of the run are sent through a mail sink which is
+        flushed before returning.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration setup
+        (input) log -> Log class instance
+        (input) func_dict -> Dict of function calls for different options
+
+    """
+
+    mail_sink = MailSink(log, queue_size=getattr(cfg, "mail_queue_size", 0)) \
+        if getattr(cfg, "mail_queue", False) else None
+
+    try:
+        for opt in set(args.get_args_keys()) & set(func_dict.keys()):
+            func_dict[opt](args, cfg, log, mail_sink=mail_sink)
+
+    finally:
+        if mail_sink:
+            log.log_info("run_options:  Flushing the mail queue.")
+
+            if not mail_sink.close():
+                log.log_err("run_options:  Not all emails were sent.")
+
+
 def main():
 
     """Function:  main
@@ -1475,12 +5189,17 @@ def main():
 
     dir_perms_chk = {"-d": 5, "-m": 5, "-n": 7}
     file_perms_chk = {"-F": 4}
-    func_dict = {"-P": process_files, "-I": insert_data, "-F": file_input}
-    opt_con_req_dict = {"-s": ["-t"]}
+    func_dict = {"-P": process_files, "-I": insert_data, "-F": file_input,
+                 "-B": build_index, "-W": watch_mode}
+    opt_con_req_dict = {"-s": ["-t"], "-L": ["-I"]}
     opt_multi_list = ["-s", "-t"]
     opt_req_list = ["-c", "-d"]
-    opt_val_list = ["-c", "-d", "-m", "-n", "-s", "-t", "-y", "-F"]
-    opt_xor_dict = {"-I": ["-P", "-F"], "-P": ["-I", "-F"], "-F": ["-I", "-P"]}
+    opt_val_list = ["-c", "-d", "-j", "-m", "-n", "-s", "-t", "-y", "-F"]
+    opt_xor_dict = {"-I": ["-P", "-F", "-B", "-W"],
+                    "-P": ["-I", "-F", "-B", "-W"],
+                    "-F": ["-I", "-P", "-B", "-W"],
+                    "-B": ["-I", "-P", "-F", "-W"],
+                    "-W": ["-I", "-P", "-F", "-B"]}
 
     # Process argument list from command line.
     args = gen_class.ArgParser(
@@ -1492,7 +5211,8 @@ def main():
        and args.arg_cond_req_or(opt_con_or=opt_con_req_dict)        \
        and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)            \
        and args.arg_xor_dict(opt_xor_val=opt_xor_dict)              \
-       and args.arg_file_chk(file_perm_chk=file_perms_chk):
+       and args.arg_file_chk(file_perm_chk=file_perms_chk)          \
+       and valid_jobs(args):
 
         try:
             prog_lock = gen_class.ProgramLock(
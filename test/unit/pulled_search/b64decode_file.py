@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  b64decode_file.py
+
+    Description:  Unit testing of b64decode_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/b64decode_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import base64
+import gzip
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_multiple_lines
+        test_small_chunks
+        test_empty_file
+        test_bad_padding
+        test_gunzip
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = b"{'command': 'eucom', 'docid': '90872590827590872345'," \
+            b" 'network': 'jwics', 'pubDate': '20230501'}"
+        self.encoded = base64.encodebytes(self.data)
+
+    def test_multiple_lines(self):
+
+        """Function:  test_multiple_lines
+
+        Description:  Test with encoded data split into multiple lines.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.b64decode_file(io.BytesIO(self.encoded)),
+            self.data)
+
+    def test_small_chunks(self):
+
+        """Function:  test_small_chunks
+
+        Description:  Test with chunks not aligned to the encoded blocks.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.b64decode_file(
+                io.BytesIO(self.encoded), chunk_size=7), self.data)
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(pulled_search.b64decode_file(io.BytesIO(b"")), b"")
+
+    def test_bad_padding(self):
+
+        """Function:  test_bad_padding
+
+        Description:  Test with truncated encoded data.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            pulled_search.b64decode_file(io.BytesIO(self.encoded[:-3]))
+
+    def test_gunzip(self):
+
+        """Function:  test_gunzip
+
+        Description:  Test with gzip compressed data decompressed as it is
+            decoded.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.b64decode_file(
+                io.BytesIO(base64.encodebytes(gzip.compress(self.data))),
+                chunk_size=7, gunzip=True), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
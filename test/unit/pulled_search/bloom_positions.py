@@ -0,0 +1,90 @@
+# Classification (U)
+
+"""Program:  bloom_positions.py
+
+    Description:  Unit testing of bloom_positions in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/bloom_positions.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_repeatable
+        test_in_range
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.token = "09109uosdhf"
+        self.num_bits = 96
+        self.num_hashes = 7
+
+    def test_repeatable(self):
+
+        """Function:  test_repeatable
+
+        Description:  Test the positions are the same for the same token.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.bloom_positions(
+                self.token, self.num_bits, self.num_hashes),
+            pulled_search.bloom_positions(
+                self.token, self.num_bits, self.num_hashes))
+
+    def test_in_range(self):
+
+        """Function:  test_in_range
+
+        Description:  Test the number and range of the positions.
+
+        Arguments:
+
+        """
+
+        positions = pulled_search.bloom_positions(
+            self.token, self.num_bits, self.num_hashes)
+
+        self.assertEqual(len(positions), self.num_hashes)
+        self.assertTrue(all(0 <= pos < self.num_bits for pos in positions))
+
+
+if __name__ == "__main__":
+    unittest.main()
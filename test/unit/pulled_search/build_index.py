@@ -0,0 +1,290 @@
+# Classification (U)
+
+"""Program:  build_index.py
+
+    Description:  Unit testing of build_index in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/build_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.log_dir = "/archive"
+        self.index_dir = "/index"
+        self.log_type = "access_log"
+        self.docid_token = "docid=([0-9A-Za-z]+)"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        get_written
+        test_worker_pool
+        test_removed_file
+        test_no_changes
+        test_new_files
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.month_dir = "/archive/intelink/2023/04"
+        self.log_files = ["/archive/intelink/2023/04/access_log.server.gz",
+                          "/archive/intelink/2023/04/access_log.server2.gz"]
+        self.fname3 = "/archive/intelink/2023/04/access_log.server3.gz"
+        self.entry = {"size": 10, "mtime": 1.5, "docids": {}}
+        self.index = {self.log_files[0]: self.entry}
+        self.index2 = {self.log_files[0]: self.entry,
+                       self.log_files[1]: self.entry}
+        self.index3 = {self.log_files[0]: self.entry,
+                       self.fname3: self.entry}
+        self.written = [(self.log_files[1], self.entry)]
+
+    @staticmethod
+    def get_written(mock_write):
+
+        """Function:  get_written
+
+        Description:  Get the entries and removed files of a write_index call.
+
+        Arguments:
+
+        """
+
+        args = mock_write.call_args[0]
+
+        return list(args[1]), args[2]
+
+    @mock.patch("pulled_search.write_index")
+    @mock.patch("pulled_search.open_index", mock.Mock())
+    @mock.patch("pulled_search.is_indexed", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.load_index")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.get_month_dirs")
+    @mock.patch("pulled_search.concurrent.futures.ProcessPoolExecutor")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_worker_pool(                               # pylint:disable=R0913
+            self, mock_log, mock_pool, mock_dirs, mock_search, mock_load,
+            mock_write):
+
+        """Function:  test_worker_pool
+
+        Description:  Test with -j option indexing with a worker pool.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "2"}
+        mock_pool.return_value.map.return_value = [self.entry]
+        mock_dirs.return_value = [self.month_dir]
+        mock_search.return_value = self.log_files
+        mock_load.return_value = dict(self.index)
+
+        pulled_search.build_index(self.args, self.cfg, mock_log)
+
+        self.assertEqual(self.get_written(mock_write), (self.written, []))
+        mock_pool.return_value.shutdown.assert_called_once_with()
+
+    @mock.patch("pulled_search.write_index")
+    @mock.patch("pulled_search.index_log_file")
+    @mock.patch("pulled_search.open_index", mock.Mock())
+    @mock.patch("pulled_search.is_indexed", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.load_index")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.get_month_dirs")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_removed_file(                              # pylint:disable=R0913
+            self, mock_log, mock_dirs, mock_search, mock_load, mock_index,
+            mock_write):
+
+        """Function:  test_removed_file
+
+        Description:  Test with a log file removed from the archive.
+
+        Arguments:
+
+        """
+
+        mock_dirs.return_value = [self.month_dir]
+        mock_search.return_value = self.log_files
+        mock_load.return_value = dict(self.index3)
+        mock_index.return_value = self.entry
+
+        pulled_search.build_index(self.args, self.cfg, mock_log)
+
+        self.assertEqual(
+            self.get_written(mock_write), (self.written, [self.fname3]))
+
+    @mock.patch("pulled_search.write_index")
+    @mock.patch("pulled_search.index_log_file")
+    @mock.patch("pulled_search.open_index")
+    @mock.patch("pulled_search.is_indexed", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.load_index")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.get_month_dirs")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_no_changes(                                # pylint:disable=R0913
+            self, mock_log, mock_dirs, mock_search, mock_load, mock_open,
+            mock_index, mock_write):
+
+        """Function:  test_no_changes
+
+        Description:  Test with no new or changed log files.
+
+        Arguments:
+
+        """
+
+        mock_dirs.return_value = [self.month_dir]
+        mock_search.return_value = self.log_files
+        mock_load.return_value = dict(self.index2)
+
+        pulled_search.build_index(self.args, self.cfg, mock_log)
+
+        mock_index.assert_not_called()
+        mock_write.assert_not_called()
+        mock_open.return_value.close.assert_called_once_with()
+
+    @mock.patch("pulled_search.write_index")
+    @mock.patch("pulled_search.index_log_file")
+    @mock.patch("pulled_search.open_index")
+    @mock.patch("pulled_search.is_indexed", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.load_index")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.get_month_dirs")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_new_files(                                 # pylint:disable=R0913
+            self, mock_log, mock_dirs, mock_search, mock_load, mock_open,
+            mock_index, mock_write):
+
+        """Function:  test_new_files
+
+        Description:  Test with only new log files being indexed.
+
+        Arguments:
+
+        """
+
+        mock_dirs.return_value = [self.month_dir]
+        mock_search.return_value = self.log_files
+        mock_load.return_value = dict(self.index)
+        mock_index.return_value = self.entry
+
+        pulled_search.build_index(self.args, self.cfg, mock_log)
+
+        mock_open.assert_called_once_with("/index/index.db")
+        mock_load.assert_called_once_with(
+            mock_open.return_value, self.month_dir)
+        self.assertEqual(self.get_written(mock_write), (self.written, []))
+        mock_index.assert_called_once_with(
+            self.log_files[1], self.cfg.docid_token)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+# Classification (U)
+
+"""Program:  check_bloom.py
+
+    Description:  Unit testing of check_bloom in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/check_bloom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_docid_present
+        test_docid_absent
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tokens = {"token" + str(cnt) for cnt in range(100)}
+        self.bloom = pulled_search.create_bloom(self.tokens)
+
+    def test_docid_present(self):
+
+        """Function:  test_docid_present
+
+        Description:  Test with docid in the filter.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(pulled_search.check_bloom(self.bloom, "token50"))
+
+    def test_docid_absent(self):
+
+        """Function:  test_docid_absent
+
+        Description:  Test with docid not in the filter.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(pulled_search.check_bloom(self.bloom, "09109uosdhf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# Classification (U)
+
+"""Program:  check_recall.py
+
+    Description:  Unit testing of check_recall in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/check_recall.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import re
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cached_verdict
+        test_changed_file
+        test_new_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pattern = re.compile(b"JAC.pull.subtype.*.SECURITY RECALL")
+        self.fname = os.path.join(
+            "test/unit/pulled_search/testfiles",
+            "CMD-LEV-PULLED-20221102-0000-GEN-LEV2-090109abcdef.html")
+        stat = os.stat(self.fname)
+        self.mtime = stat.st_mtime
+        self.size = stat.st_size
+
+    @mock.patch("pulled_search.is_recall")
+    def test_cached_verdict(self, mock_recall):
+
+        """Function:  test_cached_verdict
+
+        Description:  Test with an unchanged file in the cache.
+
+        Arguments:
+
+        """
+
+        verdicts = {self.fname: [self.mtime, self.size, False, 0]}
+
+        self.assertFalse(
+            pulled_search.check_recall(self.pattern, self.fname, verdicts))
+        mock_recall.assert_not_called()
+
+    def test_changed_file(self):
+
+        """Function:  test_changed_file
+
+        Description:  Test with a file which changed since it was cached.
+
+        Arguments:
+
+        """
+
+        verdicts = {self.fname: [self.mtime - 60, self.size, False, 0]}
+
+        self.assertTrue(
+            pulled_search.check_recall(self.pattern, self.fname, verdicts))
+        self.assertEqual(
+            verdicts[self.fname][0:3], [self.mtime, self.size, True])
+
+    def test_new_file(self):
+
+        """Function:  test_new_file
+
+        Description:  Test with a file which is not in the cache.
+
+        Arguments:
+
+        """
+
+        verdicts = {}
+
+        self.assertTrue(
+            pulled_search.check_recall(self.pattern, self.fname, verdicts))
+        self.assertEqual(
+            verdicts[self.fname][0:3], [self.mtime, self.size, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
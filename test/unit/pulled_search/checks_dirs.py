@@ -112,6 +112,12 @@ class UnitTest(unittest.TestCase):
         test_i_option
         test_p_option
         test_no_options
+        test_b_option_failure
+        test_b_option_no_index_dir
+        test_b_option
+        test_w_option_no_watch_file
+        test_w_option_mongo
+        test_w_option
 
     """
 
@@ -391,6 +397,112 @@ class UnitTest(unittest.TestCase):
         self.assertEqual(
             pulled_search.checks_dirs(self.args, self.cfg), self.results)
 
+    @mock.patch("pulled_search.gen_libs.chk_crt_dir")
+    def test_b_option_failure(self, mock_chk):
+
+        """Function:  test_b_option_failure
+
+        Description:  Test with -B option and index_dir failing validation.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-B": True}
+        self.cfg.index_dir = "/dir_path/index_dir"
+        mock_chk.side_effect = [(True, None), (False, "Index_dir failure")]
+
+        self.assertEqual(
+            pulled_search.checks_dirs(self.args, self.cfg),
+            {"/dir_path/index_dir": "Index_dir failure"})
+
+    @mock.patch("pulled_search.gen_libs.chk_crt_dir")
+    def test_b_option_no_index_dir(self, mock_chk):
+
+        """Function:  test_b_option_no_index_dir
+
+        Description:  Test with -B option and index_dir not set.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-B": True}
+        mock_chk.return_value = (True, None)
+
+        self.assertEqual(
+            pulled_search.checks_dirs(self.args, self.cfg),
+            {"index_dir": "Not set in the configuration file"})
+
+    @mock.patch("pulled_search.gen_libs.chk_crt_dir")
+    def test_b_option(self, mock_chk):
+
+        """Function:  test_b_option
+
+        Description:  Test with -B option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-B": True}
+        self.cfg.index_dir = "/dir_path/index_dir"
+        mock_chk.return_value = (True, None)
+
+        self.assertEqual(pulled_search.checks_dirs(self.args, self.cfg), {})
+
+    @mock.patch("pulled_search.validate_dirs", mock.Mock(return_value={}))
+    def test_w_option_no_watch_file(self):
+
+        """Function:  test_w_option_no_watch_file
+
+        Description:  Test with -W option and watch_file not set.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-W": True}
+
+        self.assertEqual(
+            pulled_search.checks_dirs(self.args, self.cfg),
+            {"watch_file": "Not set in the configuration file"})
+
+    @mock.patch("pulled_search.mvalidate_dirs")
+    @mock.patch("pulled_search.validate_dirs", mock.Mock(return_value={}))
+    def test_w_option_mongo(self, mock_mongo):
+
+        """Function:  test_w_option_mongo
+
+        Description:  Test with -W and -i options and mongo failure.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-W": True, "-i": True}
+        self.cfg.watch_file = "/dir_path/processed/watchlist"
+        mock_mongo.return_value = self.results4
+
+        self.assertEqual(
+            pulled_search.checks_dirs(self.args, self.cfg), self.results4)
+
+    @mock.patch("pulled_search.validate_dirs", mock.Mock(return_value={}))
+    def test_w_option(self):
+
+        """Function:  test_w_option
+
+        Description:  Test with -W option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-W": True}
+        self.cfg.watch_file = "/dir_path/processed/watchlist"
+
+        self.assertEqual(pulled_search.checks_dirs(self.args, self.cfg), {})
+
 
 if __name__ == "__main__":
     unittest.main()
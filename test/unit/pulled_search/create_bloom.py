@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  create_bloom.py
+
+    Description:  Unit testing of create_bloom in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/create_bloom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_tokens
+        test_sized_filter
+        test_tokens_added
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tokens = {"09109uosdhf", "09109abcdef"}
+        self.tokens2 = {"token" + str(cnt) for cnt in range(1000)}
+
+    def test_no_tokens(self):
+
+        """Function:  test_no_tokens
+
+        Description:  Test with no tokens, filter has the minimum size.
+
+        Arguments:
+
+        """
+
+        bloom = pulled_search.create_bloom(set())
+
+        self.assertEqual(bloom["bits"], 64)
+        self.assertFalse(any(bloom["filter"]))
+
+    def test_sized_filter(self):
+
+        """Function:  test_sized_filter
+
+        Description:  Test the filter is sized for the number of tokens.
+
+        Arguments:
+
+        """
+
+        bloom = pulled_search.create_bloom(self.tokens2)
+
+        self.assertEqual(bloom["bits"], 9586)
+        self.assertEqual(bloom["hashes"], 7)
+        self.assertEqual(len(bloom["filter"]), 1199)
+
+    def test_tokens_added(self):
+
+        """Function:  test_tokens_added
+
+        Description:  Test the tokens are added to the filter.
+
+        Arguments:
+
+        """
+
+        bloom = pulled_search.create_bloom(self.tokens)
+
+        for token in self.tokens:
+            self.assertTrue(pulled_search.check_bloom(bloom, token))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+# Classification (U)
+
+"""Program:  create_log_json.py
+
+    Description:  Unit testing of create_log_json in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/create_log_json.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.enclave = "ENCLAVE"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_create_log_json
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.dtg = "2023-03-06T08:45:03Z"
+        self.docid_dict = {"docid": "09109uosdhf", "command": "COMMAND",
+                           "pubdate": "20200102-101134",
+                           "pulldate": "20230426"}
+        self.results = {
+            "docid": "09109uosdhf", "command": "COMMAND",
+            "pubDate": "20200102-101134", "network": "ENCLAVE",
+            "asOf": "2023-03-06T08:45:03Z", "servers": {}}
+
+    def test_create_log_json(self):
+
+        """Function:  test_create_log_json
+
+        Description:  Test creating the JSON log document.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.create_log_json(
+                self.cfg, self.docid_dict, self.dtg), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
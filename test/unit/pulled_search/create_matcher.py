@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  create_matcher.py
+
+    Description:  Unit testing of create_matcher in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/create_matcher.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_overlapping_docids
+        test_multiple_docids
+        test_single_docid
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.docids = ["09109uosdhf"]
+        self.docids2 = ["09109uosdhf", "09109abcdef"]
+        self.docids3 = ["09109abc", "09109abcdef"]
+        self.line = "GET /ProductPage?docid=09109abcdef"
+        self.line2 = "GET /ProductPage?docid=09109zzzzzz"
+
+    def test_overlapping_docids(self):
+
+        """Function:  test_overlapping_docids
+
+        Description:  Test with one docid being part of another docid.
+
+        Arguments:
+
+        """
+
+        matcher = pulled_search.create_matcher(self.docids3)
+
+        self.assertEqual(matcher.search(self.line).group(), "09109abcdef")
+
+    def test_multiple_docids(self):
+
+        """Function:  test_multiple_docids
+
+        Description:  Test with multiple docids.
+
+        Arguments:
+
+        """
+
+        matcher = pulled_search.create_matcher(self.docids2)
+
+        self.assertTrue(matcher.search(self.line))
+        self.assertFalse(matcher.search(self.line2))
+
+    def test_single_docid(self):
+
+        """Function:  test_single_docid
+
+        Description:  Test with a single docid.
+
+        Arguments:
+
+        """
+
+        matcher = pulled_search.create_matcher(self.docids)
+
+        self.assertFalse(matcher.search(self.line))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# Classification (U)
+
+"""Program:  create_publisher.py
+
+    Description:  Unit testing of create_publisher in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/create_publisher.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_rabbitmq
+        test_mongo_option
+        test_email_option
+        test_rabbitmq
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = "Configuration"
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_no_rabbitmq(self, mock_log):
+
+        """Function:  test_no_rabbitmq
+
+        Description:  Test with no -r option.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            pulled_search.create_publisher(self.args, self.cfg, mock_log))
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_mongo_option(self, mock_log):
+
+        """Function:  test_mongo_option
+
+        Description:  Test with the -i option taking precedence over -r.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-r": True, "-i": True}
+
+        self.assertIsNone(
+            pulled_search.create_publisher(self.args, self.cfg, mock_log))
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_email_option(self, mock_log):
+
+        """Function:  test_email_option
+
+        Description:  Test with the -e option taking precedence over -r.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-r": True, "-e": True}
+
+        self.assertIsNone(
+            pulled_search.create_publisher(self.args, self.cfg, mock_log))
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_rabbitmq(self, mock_log):
+
+        """Function:  test_rabbitmq
+
+        Description:  Test with the -r option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-r": True}
+
+        self.assertIsInstance(
+            pulled_search.create_publisher(self.args, self.cfg, mock_log),
+            pulled_search.RmqPublisher)
+
+
+if __name__ == "__main__":
+    unittest.main()
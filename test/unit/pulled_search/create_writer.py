@@ -0,0 +1,220 @@
+# Classification (U)
+
+"""Program:  create_writer.py
+
+    Description:  Unit testing of create_writer in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/create_writer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-d": "/dir/path/config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mconfig = "mongo"
+        self.merror_dir = "/dir/path/merror_dir"
+        self.mongo_batch = 2
+
+
+class MCfgTest():                                       # pylint:disable=R0903
+
+    """Class:  MCfgTest
+
+    Description:  Class which is a representation of a mongo cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MCfgTest class.
+
+        Arguments:
+
+        """
+
+        self.dbs = "database"
+        self.tbl = "table"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_batch
+        test_batch_one
+        test_batch
+        test_upsert
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_no_batch(self, mock_log):
+
+        """Function:  test_no_batch
+
+        Description:  Test with mongo_batch not in the configuration.
+
+        Arguments:
+
+        """
+
+        del self.cfg.mongo_batch
+
+        self.assertIsNone(
+            pulled_search.create_writer(self.args, self.cfg, mock_log))
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_batch_one(self, mock_log):
+
+        """Function:  test_batch_one
+
+        Description:  Test with mongo_batch set to 1.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_batch = 1
+
+        self.assertIsNone(
+            pulled_search.create_writer(self.args, self.cfg, mock_log))
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_batch(self, mock_log, mock_load):
+
+        """Function:  test_batch
+
+        Description:  Test with mongo_batch greater than 1.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = MCfgTest()
+
+        self.assertIsInstance(
+            pulled_search.create_writer(self.args, self.cfg, mock_log),
+            pulled_search.MongoWriter)
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_upsert(self, mock_log, mock_load):
+
+        """Function:  test_upsert
+
+        Description:  Test with mongo_upsert set and mongo_batch set to 1.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = MCfgTest()
+        self.cfg.mongo_batch = 1
+        self.cfg.mongo_upsert = True
+
+        writer = pulled_search.create_writer(self.args, self.cfg, mock_log)
+
+        self.assertIsInstance(writer, pulled_search.MongoWriter)
+        self.assertTrue(writer.upsert)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,274 @@
+# Classification (U)
+
+"""Program:  email_json.py
+
+    Description:  Unit testing of email_json in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/email_json.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.to_addr = "name@domain"
+        self.subj = "Email_Subject"
+        self.error_dir = "/dir/path/error_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_email_body
+        test_email_attachment
+        test_email_part
+        test_email_compressed
+        test_email_body_sink
+        test_email_attachment_sink
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.log_json = {"docid": "09109uosdhf",
+                         "servers": {"server_name": ["line1"]}}
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    @mock.patch("pulled_search.gen_class.setup_mail")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_email_body(self, mock_log, mock_mail, mock_smtp):
+
+        """Function:  test_email_body
+
+        Description:  Test with the document in the body of the email.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-g": True}
+
+        pulled_search.email_json(self.args, self.cfg, mock_log, self.log_json)
+
+        mock_mail.return_value.add_2_msg.assert_called_once_with(
+            json.dumps(self.log_json))
+        mock_mail.return_value.send_mail.assert_called_once_with()
+        mock_smtp.assert_not_called()
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_email_attachment(self, mock_log, mock_smtp):
+
+        """Function:  test_email_attachment
+
+        Description:  Test with the document as an email attachment.
+
+        Arguments:
+
+        """
+
+        pulled_search.email_json(self.args, self.cfg, mock_log, self.log_json)
+
+        text = mock_smtp.return_value.sendmail.call_args[0][2]
+
+        self.assertIn('filename="09109uosdhf_docid"', text)
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_email_part(self, mock_log, mock_smtp):
+
+        """Function:  test_email_part
+
+        Description:  Test with a part of a document as an email attachment.
+
+        Arguments:
+
+        """
+
+        self.log_json["part"] = 2
+
+        pulled_search.email_json(self.args, self.cfg, mock_log, self.log_json)
+
+        text = mock_smtp.return_value.sendmail.call_args[0][2]
+
+        self.assertIn('filename="09109uosdhf_docid.part2"', text)
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_email_compressed(self, mock_log, mock_smtp):
+
+        """Function:  test_email_compressed
+
+        Description:  Test with a compressed payload as an email attachment.
+
+        Arguments:
+
+        """
+
+        self.cfg.payload_encoding = "gzip"
+
+        pulled_search.email_json(self.args, self.cfg, mock_log, self.log_json)
+
+        text = mock_smtp.return_value.sendmail.call_args[0][2]
+
+        self.assertIn("Content-Transfer-Encoding: 7bit", text)
+        self.assertIn("PSGZ1:", text)
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    @mock.patch("pulled_search.mail_message")
+    @mock.patch("pulled_search.gen_class.setup_mail")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_email_body_sink(self, mock_log, mock_mail, mock_message,
+                             mock_smtp):
+
+        """Function:  test_email_body_sink
+
+        Description:  Test with the email body sent through the mail sink.
+
+        Arguments:
+
+        """
+
+        mail_sink = mock.MagicMock()
+        message = ("user@host", ["name@domain"], "Message text")
+        mock_message.return_value = message
+        self.args.args_array = {"-g": True}
+
+        pulled_search.email_json(
+            self.args, self.cfg, mock_log, self.log_json, mail_sink=mail_sink)
+
+        mock_message.assert_called_once_with(mock_mail.return_value)
+        mail_sink.sendmail.assert_called_once_with(*message)
+        mock_mail.return_value.send_mail.assert_not_called()
+        mock_smtp.assert_not_called()
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_email_attachment_sink(self, mock_log, mock_smtp):
+
+        """Function:  test_email_attachment_sink
+
+        Description:  Test with the email attachment sent through the mail
+            sink.
+
+        Arguments:
+
+        """
+
+        mail_sink = mock.MagicMock()
+
+        pulled_search.email_json(
+            self.args, self.cfg, mock_log, self.log_json, mail_sink=mail_sink)
+
+        text = mail_sink.sendmail.call_args[0][2]
+
+        self.assertIn('filename="09109uosdhf_docid"', text)
+        mock_smtp.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  encode_payload.py
+
+    Description:  Unit testing of encode_payload in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/encode_payload.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import base64
+import gzip
+import json
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.payload_encoding = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_encoding
+        test_gzip_encoding
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.log_json = {"docid": "09109uosdhf",
+                         "servers": {"server_name": ["line1"] * 100}}
+
+    def test_no_encoding(self):
+
+        """Function:  test_no_encoding
+
+        Description:  Test with no payload encoding.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.encode_payload(self.cfg, self.log_json),
+            json.dumps(self.log_json))
+
+    def test_gzip_encoding(self):
+
+        """Function:  test_gzip_encoding
+
+        Description:  Test with the gzip payload encoding.
+
+        Arguments:
+
+        """
+
+        self.cfg.payload_encoding = "gzip"
+
+        data = pulled_search.encode_payload(self.cfg, self.log_json)
+
+        self.assertTrue(data.startswith("PSGZ1:"))
+        self.assertEqual(
+            json.loads(gzip.decompress(base64.b64decode(data[6:]))),
+            self.log_json)
+
+
+if __name__ == "__main__":
+    unittest.main()
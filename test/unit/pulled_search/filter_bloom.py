@@ -0,0 +1,137 @@
+# Classification (U)
+
+"""Program:  filter_bloom.py
+
+    Description:  Unit testing of filter_bloom in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/filter_bloom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.log_dir = "/dir/path/archive"
+        self.bloom_dir = "/dir/path/bloom"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_bloom
+        test_docids_ruled_out
+        test_docid_kept
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.fname = "/dir/path/archive/intelink/2023/04/access_log.server.gz"
+        self.bloom_file = \
+            "/dir/path/bloom/intelink/2023/04/access_log.server.gz.bloom"
+        self.docids = ["09109uosdhf", "09109abcdef"]
+        self.bloom = pulled_search.create_bloom({"09109abcdef"})
+
+    @mock.patch("pulled_search.load_bloom", mock.Mock(return_value=None))
+    def test_no_bloom(self):
+
+        """Function:  test_no_bloom
+
+        Description:  Test with no current Bloom filter for the log file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.filter_bloom(self.cfg, self.fname, self.docids),
+            (self.docids, self.bloom_file))
+
+    @mock.patch("pulled_search.load_bloom")
+    def test_docids_ruled_out(self, mock_load):
+
+        """Function:  test_docids_ruled_out
+
+        Description:  Test with all docids ruled out by the Bloom filter.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = pulled_search.create_bloom(set())
+
+        self.assertEqual(
+            pulled_search.filter_bloom(self.cfg, self.fname, self.docids),
+            ([], None))
+
+    @mock.patch("pulled_search.load_bloom")
+    def test_docid_kept(self, mock_load):
+
+        """Function:  test_docid_kept
+
+        Description:  Test with a docid kept by the Bloom filter.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.bloom
+
+        self.assertEqual(
+            pulled_search.filter_bloom(self.cfg, self.fname, self.docids),
+            (["09109abcdef"], None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -79,6 +79,7 @@ class UnitTest(unittest.TestCase):
         test_multiple_servers
         test_single_svr_multiple_entries
         test_single_svr_single_entry
+        test_parsed_entries
 
     """
 
@@ -299,7 +300,7 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "pulled_search.gen_libs.write_file", mock.Mock(return_value=True))
-    @mock.patch("pulled_search.re.match", mock.Mock(return_value=None))
+    @mock.patch("pulled_search.parse_line", mock.Mock(return_value=None))
     @mock.patch("pulled_search.gen_class.Logger")
     def test_parsing_failed(self, mock_log):
 
@@ -398,6 +399,28 @@ class UnitTest(unittest.TestCase):
                 self.cfg, mock_log, self.log_json)["servers"]["server_name"],
             self.results3)
 
+    @mock.patch(
+        "pulled_search.gen_libs.write_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_parsed_entries(self, mock_log):
+
+        """Function:  test_parsed_entries
+
+        Description:  Test with the parsed fields of the kept entries
+            returned in the parsed dictionary.
+
+        Arguments:
+
+        """
+
+        parsed = {}
+        pulled_search.filter_data(
+            self.cfg, mock_log, self.log_json3, parsed=parsed)
+
+        self.assertEqual(list(parsed), ["server_name", "server_name2"])
+        self.assertEqual(len(parsed["server_name"]), 1)
+        self.assertEqual(parsed["server_name"][0]["status"], "200")
+
 
 if __name__ == "__main__":
     unittest.main()
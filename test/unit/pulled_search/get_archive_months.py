@@ -0,0 +1,116 @@
+# Classification (U)
+
+"""Program:  get_archive_months.py
+
+    Description:  Unit testing of get_archive_months in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_archive_months.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pull_date
+        test_one_month
+        test_year_end
+        test_end_date_now
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pubdate = "20200210"
+
+    def test_pull_date(self):
+
+        """Function:  test_pull_date
+
+        Description:  Test with a pull date set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_archive_months(
+                self.pubdate, pulldate="20200415"),
+            ["2020/02", "2020/03", "2020/04"])
+
+    def test_one_month(self):
+
+        """Function:  test_one_month
+
+        Description:  Test with the pull date in the published month.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_archive_months(
+                self.pubdate, pulldate="20200228"), ["2020/02"])
+
+    def test_year_end(self):
+
+        """Function:  test_year_end
+
+        Description:  Test with the dates across a year end.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_archive_months("20191115", pulldate="20200105"),
+            ["2019/11", "2019/12", "2020/01"])
+
+    def test_end_date_now(self):
+
+        """Function:  test_end_date_now
+
+        Description:  Test with no pull date, ends yesterday.
+
+        Arguments:
+
+        """
+
+        months = pulled_search.get_archive_months(self.pubdate)
+
+        self.assertEqual(months[0], "2020/02")
+        self.assertGreater(len(months), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
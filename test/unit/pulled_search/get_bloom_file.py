@@ -0,0 +1,96 @@
+# Classification (U)
+
+"""Program:  get_bloom_file.py
+
+    Description:  Unit testing of get_bloom_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_bloom_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.log_dir = "/dir/path/archive"
+        self.bloom_dir = "/dir/path/bloom"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_get_bloom_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.fname = "/dir/path/archive/intelink/2023/04/access_log.server.gz"
+        self.results = \
+            "/dir/path/bloom/intelink/2023/04/access_log.server.gz.bloom"
+
+    def test_get_bloom_file(self):
+
+        """Function:  test_get_bloom_file
+
+        Description:  Test getting the Bloom filter file name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_bloom_file(self.cfg, self.fname), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  get_catalog_files.py
+
+    Description:  Unit testing of get_catalog_files in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_catalog_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.log_dir = os.path.join(
+            os.getcwd(), "test/unit/pulled_search/tmp/get_catalog_files")
+        self.catalog_file = os.path.join(self.log_dir, "catalog.db")
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_catalog_files
+        test_cached_dirs
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.results = []
+
+        for yearmon in ["2023/01", "2023/02", "2023/03"]:
+            month_dir = os.path.join(self.cfg.log_dir, "intelink", yearmon)
+            os.makedirs(month_dir)
+
+            for name in ["intelink-access_log.server2.gz",
+                         "intelink-access_log.server1", "other_log.server1"]:
+                with open(os.path.join(month_dir, name), mode="w",
+                          encoding="UTF-8") as f_hdr:
+                    f_hdr.write("Line1\n")
+
+            os.utime(month_dir, (1000, 1000))
+
+            if yearmon != "2023/03":
+                self.results.extend([
+                    os.path.join(month_dir, "intelink-access_log.server1"),
+                    os.path.join(
+                        month_dir, "intelink-access_log.server2.gz")])
+
+    def test_catalog_files(self):
+
+        """Function:  test_catalog_files
+
+        Description:  Test with the log files in the date range.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_catalog_files(
+                self.cfg, "intelink", "20230115", "intelink.*access_log",
+                pulldate="20230220"), self.results)
+
+    @mock.patch("pulled_search.os.scandir", wraps=os.scandir)
+    def test_cached_dirs(self, mock_scandir):
+
+        """Function:  test_cached_dirs
+
+        Description:  Test with the unchanged directories not listed again.
+
+        Arguments:
+
+        """
+
+        pulled_search.get_catalog_files(
+            self.cfg, "intelink", "20230115", "intelink.*access_log",
+            pulldate="20230220")
+
+        self.assertEqual(
+            pulled_search.get_catalog_files(
+                self.cfg, "intelink", "20230115", "intelink.*access_log",
+                pulldate="20230220"), self.results)
+        self.assertEqual(mock_scandir.call_count, 2)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cfg.log_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
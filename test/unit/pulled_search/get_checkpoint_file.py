@@ -0,0 +1,127 @@
+# Classification (U)
+
+"""Program:  get_checkpoint_file.py
+
+    Description:  Unit testing of get_checkpoint_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_checkpoint_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.watch_file = "/dir/path/watchlist"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_checkpoint_file_none
+        test_checkpoint_file_set
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    def test_checkpoint_file_none(self):
+
+        """Function:  test_checkpoint_file_none
+
+        Description:  Test with checkpoint_file set to None.
+
+        Arguments:
+
+        """
+
+        self.cfg.checkpoint_file = None
+
+        self.assertEqual(
+            pulled_search.get_checkpoint_file(self.cfg),
+            "/dir/path/watchlist.checkpoint")
+
+    def test_checkpoint_file_set(self):
+
+        """Function:  test_checkpoint_file_set
+
+        Description:  Test with checkpoint_file set.
+
+        Arguments:
+
+        """
+
+        self.cfg.checkpoint_file = "/dir/path/checkpoint"
+
+        self.assertEqual(
+            pulled_search.get_checkpoint_file(self.cfg),
+            "/dir/path/checkpoint")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with checkpoint_file not in the configuration.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_checkpoint_file(self.cfg),
+            "/dir/path/watchlist.checkpoint")
+
+
+if __name__ == "__main__":
+    unittest.main()
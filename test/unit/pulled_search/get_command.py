@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  get_command.py
+
+    Description:  Unit testing of get_command in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_command.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.command = {"eucom": "intelink"}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mapped_command
+        test_not_mapped
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    def test_mapped_command(self):
+
+        """Function:  test_mapped_command
+
+        Description:  Test with command mapped to a different keyword.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_command(self.cfg, "EUCOM"), "intelink")
+
+    def test_not_mapped(self):
+
+        """Function:  test_not_mapped
+
+        Description:  Test with command not mapped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_command(self.cfg, "COMMAND"), "command")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  get_doc_id.py
+
+    Description:  Unit testing of get_doc_id in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_doc_id.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_same_doc
+        test_different_doc
+        test_key_format
+        test_different_occurrence
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.doc = {"docid": "09109uosdhf", "server": "Server1",
+                    "entry": "Line1", "command": "intelink"}
+        self.doc2 = {"docid": "09109uosdhf", "server": "Server1",
+                     "entry": "Line2", "command": "intelink"}
+
+    def test_same_doc(self):
+
+        """Function:  test_same_doc
+
+        Description:  Test with the same contents giving the same key.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_doc_id(self.doc),
+            pulled_search.get_doc_id(dict(self.doc, command="other")))
+
+    def test_different_doc(self):
+
+        """Function:  test_different_doc
+
+        Description:  Test with different entries giving different keys.
+
+        Arguments:
+
+        """
+
+        self.assertNotEqual(
+            pulled_search.get_doc_id(self.doc),
+            pulled_search.get_doc_id(self.doc2))
+
+    def test_key_format(self):
+
+        """Function:  test_key_format
+
+        Description:  Test with the key being a sha256 hex digest.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(len(pulled_search.get_doc_id(self.doc)), 64)
+
+    def test_different_occurrence(self):
+
+        """Function:  test_different_occurrence
+
+        Description:  Test with repeated entries giving different keys.
+
+        Arguments:
+
+        """
+
+        self.assertNotEqual(
+            pulled_search.get_doc_id(dict(self.doc, occurrence=0)),
+            pulled_search.get_doc_id(dict(self.doc, occurrence=1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
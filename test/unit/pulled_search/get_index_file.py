@@ -0,0 +1,93 @@
+# Classification (U)
+
+"""Program:  get_index_file.py
+
+    Description:  Unit testing of get_index_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_index_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.log_dir = "/archive"
+        self.index_dir = "/index"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_index_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    def test_index_file(self):
+
+        """Function:  test_index_file
+
+        Description:  Test with the index database in the index directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_index_file(self.cfg), "/index/index.db")
+
+
+if __name__ == "__main__":
+    unittest.main()
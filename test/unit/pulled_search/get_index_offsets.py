@@ -0,0 +1,155 @@
+# Classification (U)
+
+"""Program:  get_index_offsets.py
+
+    Description:  Unit testing of get_index_offsets in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_index_offsets.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_current
+        test_not_indexed
+        test_no_docids
+        test_offsets
+        test_multiple_chunks
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "/archive/intelink/2023/04/access_log.server.gz"
+        self.fname2 = "/archive/intelink/2023/04/access_log.server2.gz"
+        self.docids = ["09109uosdhf", "09109abcdef"]
+        self.entry = {
+            "size": 10, "mtime": 1.5,
+            "docids": {"09109uosdhf": [0, 70], "09109abcdef": [25, 70]}}
+        self.conn = pulled_search.open_index(":memory:")
+        pulled_search.write_index(self.conn, [(self.fname, self.entry)], [])
+
+    @mock.patch("pulled_search.is_indexed", mock.Mock(return_value=False))
+    def test_not_current(self):
+
+        """Function:  test_not_current
+
+        Description:  Test with log file changed since being indexed.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            pulled_search.get_index_offsets(
+                self.conn, self.fname, self.docids))
+
+    def test_not_indexed(self):
+
+        """Function:  test_not_indexed
+
+        Description:  Test with log file not in the index.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            pulled_search.get_index_offsets(
+                self.conn, self.fname2, self.docids))
+
+    @mock.patch("pulled_search.is_indexed", mock.Mock(return_value=True))
+    def test_no_docids(self):
+
+        """Function:  test_no_docids
+
+        Description:  Test with none of the docids in the log file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_index_offsets(
+                self.conn, self.fname, ["09109zzzzzz"]), [])
+
+    @mock.patch("pulled_search.is_indexed", mock.Mock(return_value=True))
+    def test_offsets(self):
+
+        """Function:  test_offsets
+
+        Description:  Test with the docids in the log file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_index_offsets(
+                self.conn, self.fname, self.docids), [0, 25, 70])
+
+    @mock.patch("pulled_search.is_indexed", mock.Mock(return_value=True))
+    def test_multiple_chunks(self):
+
+        """Function:  test_multiple_chunks
+
+        Description:  Test with the docids looked up over several queries.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_index_offsets(
+                self.conn, self.fname, self.docids, chunk_size=1),
+            [0, 25, 70])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
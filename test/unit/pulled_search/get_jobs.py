@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  get_jobs.py
+
+    Description:  Unit testing of get_jobs in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_jobs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_jobs_set
+        test_jobs_not_set
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_jobs_set(self):
+
+        """Function:  test_jobs_set
+
+        Description:  Test with -j option set.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "8"}
+
+        self.assertEqual(pulled_search.get_jobs(self.args), 8)
+
+    def test_jobs_not_set(self):
+
+        """Function:  test_jobs_not_set
+
+        Description:  Test with -j option not set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(pulled_search.get_jobs(self.args), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
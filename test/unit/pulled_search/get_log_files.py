@@ -0,0 +1,237 @@
+# Classification (U)
+
+"""Program:  get_log_files.py
+
+    Description:  Unit testing of get_log_files in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_log_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.log_type = "access_log"
+        self.log_dir = "/dir_path/log"
+        self.command = {"eucom": "intelink"}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_archive_pulldate
+        test_archive_no_pulldate
+        test_active_logs
+        test_archive_catalog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.args_array = {"-a": True}
+        self.docid_dict = {"docid": "09109uosdhf", "command": "EUCOM",
+                           "pubdate": "20200102-101134"}
+        self.docid_dict2 = {"docid": "09109uosdhf", "command": "EUCOM",
+                            "pubdate": "20200102-101134",
+                            "pulldate": "20230426"}
+        self.log_files = ["/path/logs/access.log1", "/path/logs/access.log2"]
+
+    @mock.patch("pulled_search.get_archive_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_archive_pulldate(self, mock_log, mock_archive):
+
+        """Function:  test_archive_pulldate
+
+        Description:  Test with archive option and pulldate set.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array
+
+        mock_archive.return_value = self.log_files
+
+        self.assertEqual(
+            pulled_search.get_log_files(
+                self.args, self.cfg, self.docid_dict2, mock_log),
+            self.log_files)
+        mock_archive.assert_called_once_with(
+            "/dir_path/log", "intelink", "20200102-101134",
+            "intelink.*access_log", pulldate="20230426")
+
+    @mock.patch("pulled_search.get_archive_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_archive_no_pulldate(self, mock_log, mock_archive):
+
+        """Function:  test_archive_no_pulldate
+
+        Description:  Test with archive option and no pulldate.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array
+
+        mock_archive.return_value = self.log_files
+
+        self.assertEqual(
+            pulled_search.get_log_files(
+                self.args, self.cfg, self.docid_dict, mock_log),
+            self.log_files)
+        mock_archive.assert_called_once_with(
+            "/dir_path/log", "intelink", "20200102-101134",
+            "intelink.*access_log", pulldate=None)
+
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_active_logs(self, mock_log, mock_search):
+
+        """Function:  test_active_logs
+
+        Description:  Test with active log files.
+
+        Arguments:
+
+        """
+
+        mock_search.return_value = self.log_files
+
+        self.assertEqual(
+            pulled_search.get_log_files(
+                self.args, self.cfg, self.docid_dict, mock_log),
+            self.log_files)
+
+    @mock.patch("pulled_search.get_archive_files")
+    @mock.patch("pulled_search.get_catalog_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_archive_catalog(self, mock_log, mock_catalog, mock_archive):
+
+        """Function:  test_archive_catalog
+
+        Description:  Test with archive option and catalog_file set.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array
+        self.cfg.catalog_file = "/dir_path/catalog.db"
+        mock_catalog.return_value = self.log_files
+
+        self.assertEqual(
+            pulled_search.get_log_files(
+                self.args, self.cfg, self.docid_dict2, mock_log),
+            self.log_files)
+        mock_catalog.assert_called_once_with(
+            self.cfg, "intelink", "20200102-101134", "intelink.*access_log",
+            pulldate="20230426")
+        mock_archive.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  get_month_dirs.py
+
+    Description:  Unit testing of get_month_dirs in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_month_dirs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_skip_non_date_dirs
+        test_month_dirs
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.archive_dir = "test/unit/pulled_search/tmp/archive"
+        self.month_dir = os.path.join(self.archive_dir, "intelink/2023/04")
+        self.month_dir2 = os.path.join(self.archive_dir, "intelink/2023/05")
+        self.month_dir3 = os.path.join(self.archive_dir, "usacic/2022/12")
+        os.makedirs(self.month_dir)
+        os.makedirs(self.month_dir2)
+        os.makedirs(self.month_dir3)
+
+    def test_skip_non_date_dirs(self):
+
+        """Function:  test_skip_non_date_dirs
+
+        Description:  Test with directories which are not year or month
+            directories.
+
+        Arguments:
+
+        """
+
+        os.makedirs(os.path.join(self.archive_dir, "intelink/tmp/04"))
+        os.makedirs(os.path.join(self.archive_dir, "intelink/2023/old"))
+
+        self.assertEqual(
+            pulled_search.get_month_dirs(self.archive_dir),
+            [self.month_dir, self.month_dir2, self.month_dir3])
+
+    def test_month_dirs(self):
+
+        """Function:  test_month_dirs
+
+        Description:  Test with command/year/month directories.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_month_dirs(self.archive_dir),
+            [self.month_dir, self.month_dir2, self.month_dir3])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.archive_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
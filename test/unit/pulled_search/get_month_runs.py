@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  get_month_runs.py
+
+    Description:  Unit testing of get_month_runs in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_month_runs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_months
+        test_one_run
+        test_year_end
+        test_gap
+
+    """
+
+    def test_no_months(self):
+
+        """Function:  test_no_months
+
+        Description:  Test with no months.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(pulled_search.get_month_runs([]), [])
+
+    def test_one_run(self):
+
+        """Function:  test_one_run
+
+        Description:  Test with consecutive months.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_month_runs(["2020/01", "2020/02", "2020/03"]),
+            [("2020/01", "2020/03")])
+
+    def test_year_end(self):
+
+        """Function:  test_year_end
+
+        Description:  Test with consecutive months across a year end.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_month_runs(["2019/12", "2020/01"]),
+            [("2019/12", "2020/01")])
+
+    def test_gap(self):
+
+        """Function:  test_gap
+
+        Description:  Test with a gap between the months.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_month_runs(["2020/01", "2020/02", "2020/05"]),
+            [("2020/01", "2020/02"), ("2020/05", "2020/05")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# Classification (U)
+
+"""Program:  get_part_suffix.py
+
+    Description:  Unit testing of get_part_suffix in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_part_suffix.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_part
+        test_part
+
+    """
+
+    def test_not_part(self):
+
+        """Function:  test_not_part
+
+        Description:  Test with a whole JSON log document.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_part_suffix({"docid": "09109uosdhf"}), "")
+
+    def test_part(self):
+
+        """Function:  test_part
+
+        Description:  Test with a part of a JSON log document.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_part_suffix(
+                {"docid": "09109uosdhf", "part": 2, "total": 3}), ".part2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Classification (U)
+
+"""Program:  get_processed.py
+
+    Description:  Unit testing of get_processed in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_processed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import sqlite3
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_processed_docids
+        test_no_docids
+        test_multiple_chunks
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute(
+            "CREATE TABLE processed (docid TEXT PRIMARY KEY, month TEXT)")
+        self.conn.executemany(
+            "INSERT INTO processed (docid, month) VALUES (?, '202401')",
+            [("090109abcdef",), ("090109fedcba",)])
+        self.docids = ["090109abcdef", "090109000000", "090109fedcba"]
+        self.results = {"090109abcdef", "090109fedcba"}
+
+    def test_processed_docids(self):
+
+        """Function:  test_processed_docids
+
+        Description:  Test with processed docids in the list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_processed(self.conn, self.docids), self.results)
+
+    def test_no_docids(self):
+
+        """Function:  test_no_docids
+
+        Description:  Test with an empty list of docids.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(pulled_search.get_processed(self.conn, []), set())
+
+    def test_multiple_chunks(self):
+
+        """Function:  test_multiple_chunks
+
+        Description:  Test with the docids checked over several queries.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_processed(self.conn, self.docids, chunk_size=1),
+            self.results)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+# Classification (U)
+
+"""Program:  get_search_window.py
+
+    Description:  Unit testing of get_search_window in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_search_window.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import datetime
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pulldate
+        test_no_pulldate
+        test_pubdate_time
+        test_bad_date
+        test_no_pubdate
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.docid_dict = {"docid": "09109uosdhf", "command": "eucom",
+                           "pubdate": "20230228", "pulldate": "20230302"}
+        self.start_dt = datetime.datetime(2023, 2, 27)
+
+    def test_pulldate(self):
+
+        """Function:  test_pulldate
+
+        Description:  Test with a pulled date.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_search_window(self.docid_dict),
+            (self.start_dt, datetime.datetime(2023, 3, 4)))
+
+    def test_no_pulldate(self):
+
+        """Function:  test_no_pulldate
+
+        Description:  Test with no pulled date, window ends after now.
+
+        Arguments:
+
+        """
+
+        del self.docid_dict["pulldate"]
+
+        start_dt, end_dt = pulled_search.get_search_window(self.docid_dict)
+
+        self.assertEqual(start_dt, self.start_dt)
+        self.assertGreater(end_dt, datetime.datetime.now())
+
+    def test_pubdate_time(self):
+
+        """Function:  test_pubdate_time
+
+        Description:  Test with a time in the published date.
+
+        Arguments:
+
+        """
+
+        self.docid_dict["pubdate"] = "20230228-101134"
+
+        self.assertEqual(
+            pulled_search.get_search_window(self.docid_dict)[0],
+            self.start_dt)
+
+    def test_bad_date(self):
+
+        """Function:  test_bad_date
+
+        Description:  Test with a published date that is not a date.
+
+        Arguments:
+
+        """
+
+        self.docid_dict["pubdate"] = "2023"
+
+        self.assertIsNone(pulled_search.get_search_window(self.docid_dict))
+
+    def test_no_pubdate(self):
+
+        """Function:  test_no_pubdate
+
+        Description:  Test with no published date.
+
+        Arguments:
+
+        """
+
+        del self.docid_dict["pubdate"]
+
+        self.assertIsNone(pulled_search.get_search_window(self.docid_dict))
+
+
+if __name__ == "__main__":
+    unittest.main()
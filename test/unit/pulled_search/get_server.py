@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  get_server.py
+
+    Description:  Unit testing of get_server in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_server.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_archive_gz
+        test_archive_non_gz
+        test_active_log
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args_array = {"-a": True}
+        self.fname = "/path/logs/access.log1.servername.gz"
+        self.fname2 = "/path/logs/access.log1.servername"
+
+    def test_archive_gz(self):
+
+        """Function:  test_archive_gz
+
+        Description:  Test with archive option with gunzipped file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array
+
+        self.assertEqual(
+            pulled_search.get_server(self.args, self.fname), "servername")
+
+    def test_archive_non_gz(self):
+
+        """Function:  test_archive_non_gz
+
+        Description:  Test with archive option with non-gunzipped file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array
+
+        self.assertEqual(
+            pulled_search.get_server(self.args, self.fname2), "servername")
+
+    @mock.patch("pulled_search.socket.gethostname",
+                mock.Mock(return_value="hostname"))
+    def test_active_log(self):
+
+        """Function:  test_active_log
+
+        Description:  Test with active log file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_server(self.args, self.fname), "hostname")
+
+
+if __name__ == "__main__":
+    unittest.main()
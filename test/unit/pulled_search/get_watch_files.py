@@ -0,0 +1,154 @@
+# Classification (U)
+
+"""Program:  get_watch_files.py
+
+    Description:  Unit testing of get_watch_files in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/get_watch_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.log_type = "access_log"
+        self.log_dir = "/dir_path/log"
+        self.command = {"eucom": "intelink"}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_watchlist
+        test_multiple_commands
+        test_shared_command
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = mock.Mock()
+        self.cfg = CfgTest()
+        self.docid = "09109uosdhf"
+        self.docid2 = "09109abcdef"
+        self.watchlist = {
+            self.docid: {"docid": self.docid, "command": "EUCOM"},
+            self.docid2: {"docid": self.docid2, "command": "intelink"}}
+        self.watchlist2 = {
+            self.docid: {"docid": self.docid, "command": "EUCOM"},
+            self.docid2: {"docid": self.docid2, "command": "ACIC"}}
+        self.log_files = ["/dir_path/log/intelink_access_log",
+                          "/dir_path/log/intelink_access_log.1.gz"]
+        self.log_files2 = ["/dir_path/log/acic_access_log"]
+
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_empty_watchlist(self, mock_log, mock_files):
+
+        """Function:  test_empty_watchlist
+
+        Description:  Test with an empty watchlist.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.get_watch_files(self.args, self.cfg, {}, mock_log),
+            {})
+        mock_files.assert_not_called()
+
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_multiple_commands(self, mock_log, mock_files):
+
+        """Function:  test_multiple_commands
+
+        Description:  Test with docids for different commands.
+
+        Arguments:
+
+        """
+
+        mock_files.side_effect = [self.log_files, self.log_files2]
+
+        self.assertEqual(
+            pulled_search.get_watch_files(
+                self.args, self.cfg, self.watchlist2, mock_log),
+            {self.log_files[0]: [self.docid],
+             self.log_files2[0]: [self.docid2]})
+
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_shared_command(self, mock_log, mock_files):
+
+        """Function:  test_shared_command
+
+        Description:  Test with docids for the same command, the log files
+            are only listed once and compressed files are skipped.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.log_files
+
+        self.assertEqual(
+            pulled_search.get_watch_files(
+                self.args, self.cfg, self.watchlist, mock_log),
+            {self.log_files[0]: [self.docid, self.docid2]})
+        self.assertEqual(mock_files.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
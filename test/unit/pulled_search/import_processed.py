@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  import_processed.py
+
+    Description:  Unit testing of import_processed in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/import_processed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import sqlite3
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_import_file
+        test_import_dupes
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "test/unit/pulled_search/tmp/processed"
+        self.docids = ["090109abcdef", "090109fedcba"]
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.executescript("""
+            CREATE TABLE processed (docid TEXT PRIMARY KEY, month TEXT);
+            CREATE TABLE imports (path TEXT PRIMARY KEY);
+            """)
+
+    def test_import_file(self):
+
+        """Function:  test_import_file
+
+        Description:  Test with importing a flat processed file.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as fhdr:
+            fhdr.write("\n".join(self.docids) + "\n\n")
+
+        self.assertEqual(
+            pulled_search.import_processed(self.conn, self.fname), 2)
+        self.assertEqual(
+            self.conn.execute("SELECT path FROM imports").fetchall(),
+            [(os.path.abspath(self.fname),)])
+
+    def test_import_dupes(self):
+
+        """Function:  test_import_dupes
+
+        Description:  Test with duplicate docids in the flat processed file.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as fhdr:
+            fhdr.write("\n".join(self.docids + self.docids) + "\n")
+
+        self.assertEqual(
+            pulled_search.import_processed(self.conn, self.fname), 2)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# Classification (U)
+
+"""Program:  index_log_file.py
+
+    Description:  Unit testing of index_log_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/index_log_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_gzip_file
+        test_plain_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.basepath = "test/unit/pulled_search/testfiles"
+        self.fname = os.path.join(
+            self.basepath, "test_access_log.servername")
+        self.fname2 = os.path.join(
+            self.basepath, "test_access_log.servername.gz")
+        self.docid_token = "docid=([0-9A-Za-z]+)"
+        self.results = {"09109uosdhf": [0, 70], "09109abcdef": [25, 70]}
+
+    def test_gzip_file(self):
+
+        """Function:  test_gzip_file
+
+        Description:  Test with a gzip compressed file.
+
+        Arguments:
+
+        """
+
+        entry = pulled_search.index_log_file(self.fname2, self.docid_token)
+
+        self.assertEqual(entry["docids"], self.results)
+        self.assertEqual(entry["size"], os.stat(self.fname2).st_size)
+
+    def test_plain_file(self):
+
+        """Function:  test_plain_file
+
+        Description:  Test with a plain file.
+
+        Arguments:
+
+        """
+
+        entry = pulled_search.index_log_file(self.fname, self.docid_token)
+
+        self.assertEqual(entry["docids"], self.results)
+        self.assertEqual(entry["mtime"], os.stat(self.fname).st_mtime)
+
+
+if __name__ == "__main__":
+    unittest.main()
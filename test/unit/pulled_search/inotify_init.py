@@ -0,0 +1,117 @@
+# Classification (U)
+
+"""Program:  inotify_init.py
+
+    Description:  Unit testing of inotify_init in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/inotify_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_watch_dir
+        test_missing_dir
+        test_no_inotify
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_name = os.path.join(
+            os.getcwd(), "test/unit/pulled_search/tmp")
+        self.fd = None
+
+    def test_watch_dir(self):
+
+        """Function:  test_watch_dir
+
+        Description:  Test with a directory to watch.
+
+        Arguments:
+
+        """
+
+        self.fd = pulled_search.inotify_init(self.dir_name)
+
+        self.assertIsInstance(self.fd, int)
+
+    def test_missing_dir(self):
+
+        """Function:  test_missing_dir
+
+        Description:  Test with a directory that does not exist.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            pulled_search.inotify_init(
+                os.path.join(self.dir_name, "missing_dir")))
+
+    @mock.patch("pulled_search.ctypes.CDLL")
+    def test_no_inotify(self, mock_cdll):
+
+        """Function:  test_no_inotify
+
+        Description:  Test with inotify not available.
+
+        Arguments:
+
+        """
+
+        mock_cdll.side_effect = OSError("Not found")
+
+        self.assertIsNone(pulled_search.inotify_init(self.dir_name))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if self.fd is not None:
+            os.close(self.fd)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  inotify_read.py
+
+    Description:  Unit testing of inotify_read in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/inotify_read.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import struct
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_events
+        test_events
+        test_overflow
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.read_fd, self.write_fd = os.pipe()
+        self.name = b"file1_mongo.json\0\0\0\0"
+        self.event = struct.pack("iIII", 1, 0x08, 0, len(self.name)) \
+            + self.name
+        self.event2 = struct.pack("iIII", 1, 0x80, 5, 8) + b"file2\0\0\0"
+
+    def test_no_events(self):
+
+        """Function:  test_no_events
+
+        Description:  Test with no events before the timeout.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(pulled_search.inotify_read(self.read_fd, 0), [])
+
+    def test_events(self):
+
+        """Function:  test_events
+
+        Description:  Test with close write and moved to events.
+
+        Arguments:
+
+        """
+
+        os.write(self.write_fd, self.event + self.event2)
+
+        self.assertEqual(
+            pulled_search.inotify_read(self.read_fd, 1),
+            ["file1_mongo.json", "file2"])
+
+    def test_overflow(self):
+
+        """Function:  test_overflow
+
+        Description:  Test with the event queue overflowed.
+
+        Arguments:
+
+        """
+
+        os.write(self.write_fd, self.event + struct.pack(
+            "iIII", -1, 0x4000, 0, 0))
+
+        self.assertIsNone(pulled_search.inotify_read(self.read_fd, 1))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -107,6 +107,10 @@ class UnitTest(unittest.TestCase):
         test_with_preamble
         test_with_no_mail
         test_with_mail
+        test_with_writer
+        test_with_workers
+        test_with_workers_one_file
+        test_with_monitor
 
     """
 
@@ -271,6 +275,115 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             pulled_search.insert_data(self.args, self.cfg, mock_log))
 
+    @mock.patch("pulled_search.non_processed", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.cleanup_files", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.process_insert")
+    @mock.patch("pulled_search.create_writer")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_with_writer(self, mock_log, mock_search, mock_writer,
+                         mock_insert):
+
+        """Function:  test_with_writer
+
+        Description:  Test with a Mongo writer shared by all of the files.
+
+        Arguments:
+
+        """
+
+        mock_search.return_value = self.insert_list3
+        mock_insert.return_value = True
+
+        pulled_search.insert_data(self.args, self.cfg, mock_log)
+
+        mock_insert.assert_called_with(
+            self.args, self.cfg, "/path/file2", mock_log,
+            writer=mock_writer.return_value, mail_sink=None)
+        mock_writer.return_value.close.assert_called_once_with()
+
+    @mock.patch("pulled_search.non_processed", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.cleanup_files")
+    @mock.patch("pulled_search.process_insert")
+    @mock.patch("pulled_search.create_writer")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_with_workers(self, mock_log, mock_search, mock_writer,
+                          mock_insert, mock_cleanup):
+
+        """Function:  test_with_workers
+
+        Description:  Test with a worker pool and one file failing.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "2"}
+        mock_search.return_value = self.insert_list3
+        mock_insert.side_effect = \
+            lambda args, cfg, fname, log, **kwargs: fname == "/path/file1"
+
+        pulled_search.insert_data(self.args, self.cfg, mock_log)
+
+        mock_writer.assert_called_once_with(
+            self.args, self.cfg, mock_log, mail_sink=None)
+        mock_writer.return_value.close.assert_called_once_with()
+        self.assertEqual(mock_insert.call_count, 2)
+        mock_cleanup.assert_called_once_with(
+            self.insert_list3, ["/path/file1"], self.cfg.marchive_dir,
+            mock_log)
+
+    @mock.patch("pulled_search.non_processed", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.cleanup_files", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.process_insert")
+    @mock.patch("pulled_search.create_writer")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_with_workers_one_file(self, mock_log, mock_search, mock_writer,
+                                   mock_insert):
+
+        """Function:  test_with_workers_one_file
+
+        Description:  Test with a worker pool and a single file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "2"}
+        mock_search.return_value = self.insert_list2
+        mock_insert.return_value = True
+
+        pulled_search.insert_data(self.args, self.cfg, mock_log)
+
+        mock_insert.assert_called_once_with(
+            self.args, self.cfg, "/path/file1", mock_log,
+            writer=mock_writer.return_value, mail_sink=None)
+
+    @mock.patch("pulled_search.insert_files")
+    @mock.patch("pulled_search.monitor_insert")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_with_monitor(self, mock_log, mock_search, mock_monitor,
+                          mock_files):
+
+        """Function:  test_with_monitor
+
+        Description:  Test with the -L option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-L": True}
+
+        pulled_search.insert_data(self.args, self.cfg, mock_log)
+
+        mock_monitor.assert_called_once_with(self.args, self.cfg, mock_log)
+        mock_search.assert_not_called()
+        mock_files.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,240 @@
+# Classification (U)
+
+"""Program:  insert_files.py
+
+    Description:  Unit testing of insert_files in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/insert_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mfile_regex = "*_insert.json"
+        self.monitor_dir = "/dir_path/monitor_dir"
+        self.merror_dir = "/dir/path/error_dir"
+        self.marchive_dir = "/dir/path/archive_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_files
+        test_serial
+        test_workers
+        test_with_mail
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.insert_list = ["/path/file1", "/path/file2"]
+
+    @mock.patch("pulled_search.non_processed")
+    @mock.patch("pulled_search.cleanup_files")
+    @mock.patch("pulled_search.process_insert")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_no_files(self, mock_log, mock_insert, mock_cleanup,
+                      mock_nonproc):
+
+        """Function:  test_no_files
+
+        Description:  Test with no files to insert.
+
+        Arguments:
+
+        """
+
+        pulled_search.insert_files(self.args, self.cfg, mock_log, [])
+
+        mock_insert.assert_not_called()
+        mock_cleanup.assert_not_called()
+        mock_nonproc.assert_not_called()
+
+    @mock.patch("pulled_search.non_processed")
+    @mock.patch("pulled_search.cleanup_files")
+    @mock.patch("pulled_search.process_insert")
+    @mock.patch("pulled_search.create_writer")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_serial(self, mock_log, mock_writer, mock_insert, mock_cleanup,
+                    mock_nonproc):
+
+        """Function:  test_serial
+
+        Description:  Test with the files inserted one at a time.
+
+        Arguments:
+
+        """
+
+        mock_insert.side_effect = [True, False]
+        mock_cleanup.return_value = ["/path/file2"]
+
+        pulled_search.insert_files(
+            self.args, self.cfg, mock_log, self.insert_list)
+
+        mock_cleanup.assert_called_once_with(
+            self.insert_list, ["/path/file1"], self.cfg.marchive_dir,
+            mock_log)
+        mock_nonproc.assert_called_once_with(
+            ["/path/file2"], self.cfg.merror_dir, mock_log, None,
+            mail_sink=None)
+        mock_writer.return_value.close.assert_called_once_with()
+
+    @mock.patch("pulled_search.non_processed", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.cleanup_files")
+    @mock.patch("pulled_search.process_insert")
+    @mock.patch("pulled_search.create_writer")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_workers(self, mock_log, mock_writer, mock_insert,
+                     mock_cleanup):
+
+        """Function:  test_workers
+
+        Description:  Test with the files inserted by a worker pool, the
+            workers share one writer with a batch for each file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "2"}
+        mock_insert.side_effect = \
+            lambda args, cfg, fname, log, **kwargs: fname == "/path/file2"
+
+        pulled_search.insert_files(
+            self.args, self.cfg, mock_log, self.insert_list)
+
+        mock_writer.assert_called_once_with(
+            self.args, self.cfg, mock_log, mail_sink=None)
+        batches = [call[1]["writer"] for call in mock_insert.call_args_list]
+        self.assertIsNot(batches[0], batches[1])
+        self.assertTrue(
+            all(batch.writer is mock_writer.return_value
+                for batch in batches))
+        mock_writer.return_value.close.assert_called_once_with()
+        mock_cleanup.assert_called_once_with(
+            self.insert_list, ["/path/file2"], self.cfg.marchive_dir,
+            mock_log)
+
+    @mock.patch("pulled_search.non_processed")
+    @mock.patch("pulled_search.cleanup_files", mock.Mock(return_value=[]))
+    @mock.patch("pulled_search.process_insert", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.create_writer", mock.Mock(return_value=None))
+    @mock.patch("pulled_search.gen_class.setup_mail")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_with_mail(self, mock_log, mock_mail, mock_nonproc):
+
+        """Function:  test_with_mail
+
+        Description:  Test with a mail instance for the non-processed files.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-t": "name@domain"}
+
+        pulled_search.insert_files(
+            self.args, self.cfg, mock_log, self.insert_list)
+
+        mock_mail.assert_called_once_with(
+            "name@domain", subj="Non-processed files")
+        mock_nonproc.assert_called_once_with(
+            [], self.cfg.merror_dir, mock_log, mock_mail.return_value,
+            mail_sink=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -233,6 +233,7 @@ class UnitTest(unittest.TestCase):
         test_mongo_failed_email
         test_mongo_failed
         test_mongo_successful
+        test_mongo_failed_mail_sink
 
     """
 
@@ -320,6 +321,36 @@ class UnitTest(unittest.TestCase):
         self.assertTrue(pulled_search.insert_mongo(
             self.args, self.cfg, self.logger, self.data))
 
+    @mock.patch("pulled_search.gen_libs.write_file",
+                mock.Mock(return_value=True))
+    @mock.patch("pulled_search.mongo_libs.ins_doc",
+                mock.Mock(return_value=(False, "mongo failure")))
+    @mock.patch("pulled_search.mail_message")
+    @mock.patch("pulled_search.gen_class.setup_mail")
+    @mock.patch("pulled_search.gen_libs.load_module")
+    def test_mongo_failed_mail_sink(self, mock_load, mock_mail, mock_message):
+
+        """Function:  test_mongo_failed_mail_sink
+
+        Description:  Test with the email of a failed Mongo data insertion
+            sent through the mail sink.
+
+        Arguments:
+
+        """
+
+        mail_sink = mock.MagicMock()
+        message = ("user@host", ["email_address"], "Message text")
+        self.args.args_array["-t"] = "email_address"
+        mock_load.return_value = self.mcfg
+        mock_mail.return_value = self.mail
+        mock_message.return_value = message
+
+        self.assertFalse(pulled_search.insert_mongo(
+            self.args, self.cfg, self.logger, self.data, mail_sink=mail_sink))
+        mock_message.assert_called_once_with(self.mail)
+        mail_sink.sendmail.assert_called_once_with(*message)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  is_base64_file.py
+
+    Description:  Unit testing of is_base64_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/is_base64_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import base64
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_multiple_lines
+        test_short_file
+        test_json_file
+        test_text_file
+        test_binary_file
+        test_empty_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = b"{'command': 'eucom', 'docid': '90872590827590872345'," \
+            b" 'network': 'jwics', 'pubDate': '20230501'}"
+        self.encoded = base64.encodebytes(self.data)
+
+    def test_multiple_lines(self):
+
+        """Function:  test_multiple_lines
+
+        Description:  Test with encoded data split into multiple lines.
+
+        Arguments:
+
+        """
+
+        f_hdr = io.BytesIO(self.encoded)
+
+        self.assertTrue(pulled_search.is_base64_file(f_hdr))
+        self.assertEqual(f_hdr.tell(), 0)
+
+    def test_short_file(self):
+
+        """Function:  test_short_file
+
+        Description:  Test with encoded data shorter than the check size.
+
+        Arguments:
+
+        """
+
+        f_hdr = io.BytesIO(base64.b64encode(b"{'docid': '1'}"))
+
+        self.assertTrue(pulled_search.is_base64_file(f_hdr))
+
+    def test_json_file(self):
+
+        """Function:  test_json_file
+
+        Description:  Test with a JSON file.
+
+        Arguments:
+
+        """
+
+        f_hdr = io.BytesIO(b'{"docid": "90349823749", "command": "eucom"}')
+
+        self.assertFalse(pulled_search.is_base64_file(f_hdr))
+        self.assertEqual(f_hdr.tell(), 0)
+
+    def test_text_file(self):
+
+        """Function:  test_text_file
+
+        Description:  Test with a text file.
+
+        Arguments:
+
+        """
+
+        f_hdr = io.BytesIO(b"This is testing of a string1\n")
+
+        self.assertFalse(pulled_search.is_base64_file(f_hdr))
+
+    def test_binary_file(self):
+
+        """Function:  test_binary_file
+
+        Description:  Test with a non-ascii file.
+
+        Arguments:
+
+        """
+
+        f_hdr = io.BytesIO(b"\xff\xfe\x00\x01")
+
+        self.assertFalse(pulled_search.is_base64_file(f_hdr))
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty file.
+
+        Arguments:
+
+        """
+
+        f_hdr = io.BytesIO(b"")
+
+        self.assertFalse(pulled_search.is_base64_file(f_hdr))
+
+
+if __name__ == "__main__":
+    unittest.main()
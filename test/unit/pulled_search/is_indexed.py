@@ -0,0 +1,100 @@
+# Classification (U)
+
+"""Program:  is_indexed.py
+
+    Description:  Unit testing of is_indexed in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/is_indexed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_changed_mtime
+        test_changed_size
+        test_current
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = os.path.join(
+            "test/unit/pulled_search/testfiles", "test_access_log.servername")
+        stat = os.stat(self.fname)
+        self.entry = {"size": stat.st_size, "mtime": stat.st_mtime}
+
+    def test_changed_mtime(self):
+
+        """Function:  test_changed_mtime
+
+        Description:  Test with log file modified after being indexed.
+
+        Arguments:
+
+        """
+
+        self.entry["mtime"] = self.entry["mtime"] - 10
+
+        self.assertFalse(pulled_search.is_indexed(self.entry, self.fname))
+
+    def test_changed_size(self):
+
+        """Function:  test_changed_size
+
+        Description:  Test with log file size changed since being indexed.
+
+        Arguments:
+
+        """
+
+        self.entry["size"] = self.entry["size"] + 10
+
+        self.assertFalse(pulled_search.is_indexed(self.entry, self.fname))
+
+    def test_current(self):
+
+        """Function:  test_current
+
+        Description:  Test with index entry current for the log file.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(pulled_search.is_indexed(self.entry, self.fname))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  is_recall.py
+
+    Description:  Unit testing of is_recall in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/is_recall.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import re
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pattern_found
+        test_no_pattern
+        test_empty_file
+        test_missing_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pattern = re.compile(b"JAC.pull.subtype.*.SECURITY RECALL")
+        self.basepath = "test/unit/pulled_search/testfiles"
+        self.fname = os.path.join(
+            self.basepath,
+            "CMD-LEV-PULLED-20221102-0000-GEN-LEV2-090109abcdef.html")
+        self.fname2 = os.path.join(self.basepath, "test_recall_search2.txt")
+        self.fname3 = os.path.join(self.basepath, "test_recall_search.txt")
+        self.fname4 = os.path.join(self.basepath, "test_recall_search0.txt")
+
+    def test_pattern_found(self):
+
+        """Function:  test_pattern_found
+
+        Description:  Test with pattern found.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(pulled_search.is_recall(self.pattern, self.fname))
+
+    def test_no_pattern(self):
+
+        """Function:  test_no_pattern
+
+        Description:  Test with no pattern found.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(pulled_search.is_recall(self.pattern, self.fname2))
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with empty file.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(pulled_search.is_recall(self.pattern, self.fname3))
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with missing file.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(IOError):
+            pulled_search.is_recall(self.pattern, self.fname4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  load_bloom.py
+
+    Description:  Unit testing of load_bloom in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/load_bloom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_file
+        test_stale_file
+        test_bad_file
+        test_load_bloom
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.basepath = "test/unit/pulled_search/tmp"
+        self.bloom_dir = os.path.join(self.basepath, "bloom")
+        self.bloom_file = os.path.join(
+            self.bloom_dir, "test_access_log.servername.bloom")
+        self.fname = os.path.join(
+            "test/unit/pulled_search/testfiles", "test_access_log.servername")
+        stat = os.stat(self.fname)
+        self.bloom = {"bits": 64, "hashes": 1, "size": stat.st_size,
+                      "mtime": stat.st_mtime,
+                      "filter": bytearray(b"\x01" * 8)}
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with no Bloom filter file.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            pulled_search.load_bloom(self.bloom_file, self.fname))
+
+    def test_stale_file(self):
+
+        """Function:  test_stale_file
+
+        Description:  Test with Bloom filter file for a changed log file.
+
+        Arguments:
+
+        """
+
+        self.bloom["size"] = 1
+        pulled_search.write_bloom(self.bloom_file, self.bloom)
+
+        self.assertIsNone(
+            pulled_search.load_bloom(self.bloom_file, self.fname))
+
+    def test_bad_file(self):
+
+        """Function:  test_bad_file
+
+        Description:  Test with a corrupted Bloom filter file.
+
+        Arguments:
+
+        """
+
+        os.makedirs(self.bloom_dir)
+
+        with open(self.bloom_file, mode="w", encoding="UTF-8") as fhdr:
+            fhdr.write("{bad")
+
+        self.assertIsNone(
+            pulled_search.load_bloom(self.bloom_file, self.fname))
+
+    def test_load_bloom(self):
+
+        """Function:  test_load_bloom
+
+        Description:  Test loading a current Bloom filter file.
+
+        Arguments:
+
+        """
+
+        pulled_search.write_bloom(self.bloom_file, self.bloom)
+
+        self.assertEqual(
+            pulled_search.load_bloom(self.bloom_file, self.fname), self.bloom)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isdir(self.bloom_dir):
+            shutil.rmtree(self.bloom_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  load_index.py
+
+    Description:  Unit testing of load_index in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/load_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_entries
+        test_load_index
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.month_dir = "/archive/intelink/2023/04"
+        self.fname = "/archive/intelink/2023/04/access_log.server.gz"
+        self.fname2 = "/archive/intelink/2023/05/access_log.server.gz"
+        self.conn = pulled_search.open_index(":memory:")
+        self.conn.executemany(
+            "INSERT INTO files VALUES (?, ?, 10, 1.5)",
+            [(self.fname, self.month_dir),
+             (self.fname2, "/archive/intelink/2023/05")])
+        self.results = {self.fname: {"size": 10, "mtime": 1.5}}
+
+    def test_no_entries(self):
+
+        """Function:  test_no_entries
+
+        Description:  Test with no log files indexed in the directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.load_index(
+                self.conn, "/archive/intelink/2023/06"), {})
+
+    def test_load_index(self):
+
+        """Function:  test_load_index
+
+        Description:  Test with the log files indexed in the directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.load_index(self.conn, self.month_dir), self.results)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Classification (U)
+
+"""Program:  load_json_file.py
+
+    Description:  Unit testing of load_json_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/load_json_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_file
+        test_load_json_file
+        test_corrupt_file
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.basepath = "test/unit/pulled_search/tmp"
+        self.watch_file = os.path.join(self.basepath, "watchlist")
+        self.watchlist = {"09109uosdhf": {
+            "docid": "09109uosdhf", "command": "EUCOM",
+            "pubdate": "20200102"}}
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with no file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(pulled_search.load_json_file(self.watch_file), {})
+
+    def test_load_json_file(self):
+
+        """Function:  test_load_json_file
+
+        Description:  Test loading the file.
+
+        Arguments:
+
+        """
+
+        pulled_search.write_json_file(self.watch_file, self.watchlist)
+
+        self.assertEqual(
+            pulled_search.load_json_file(self.watch_file), self.watchlist)
+
+    def test_corrupt_file(self):
+
+        """Function:  test_corrupt_file
+
+        Description:  Test with a corrupt file, it is read as empty.
+
+        Arguments:
+
+        """
+
+        with open(self.watch_file, mode="w", encoding="UTF-8") as fhdr:
+            fhdr.write('{"09109uosdhf": {"docid": "091')
+
+        self.assertEqual(pulled_search.load_json_file(self.watch_file), {})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.exists(self.watch_file):
+            os.remove(self.watch_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  load_parser.py
+
+    Description:  Unit testing of load_parser in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/load_parser.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.regex = r"(?P<ip>.*?) (?P<url>.*?)?$"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_regex
+        test_load_parser
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    def test_no_regex(self):
+
+        """Function:  test_no_regex
+
+        Description:  Test with no regex in the configuration.
+
+        Arguments:
+
+        """
+
+        del self.cfg.regex
+        cfg = pulled_search.load_parser(self.cfg)
+
+        self.assertFalse(hasattr(cfg, "parser"))
+
+    def test_load_parser(self):
+
+        """Function:  test_load_parser
+
+        Description:  Test with the regex compiled.
+
+        Arguments:
+
+        """
+
+        cfg = pulled_search.load_parser(self.cfg)
+
+        self.assertEqual(cfg.parser.pattern, self.cfg.regex)
+
+
+if __name__ == "__main__":
+    unittest.main()
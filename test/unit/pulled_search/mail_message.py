@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  mail_message.py
+
+    Description:  Unit testing of mail_message in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mail_message.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_string_to
+        test_list_to
+        test_list_subject
+        test_no_subject
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mail = mock.MagicMock()
+        self.mail.to = "name@domain"
+        self.mail.frm = "user@host"
+        self.mail.subj = "Subject line"
+        self.mail.msg = "Message line\n"
+
+    def test_string_to(self):
+
+        """Function:  test_string_to
+
+        Description:  Test with a to address string.
+
+        Arguments:
+
+        """
+
+        frm, to_addr, text = pulled_search.mail_message(self.mail)
+
+        self.assertEqual((frm, to_addr), ("user@host", ["name@domain"]))
+        self.assertIn("To: name@domain\n", text)
+        self.assertIn("Subject: Subject line\n", text)
+        self.assertTrue(text.endswith("\n\nMessage line\n"))
+
+    def test_list_to(self):
+
+        """Function:  test_list_to
+
+        Description:  Test with a list of to addresses.
+
+        Arguments:
+
+        """
+
+        self.mail.to = ["name@domain", "name2@domain"]
+
+        _, to_addr, text = pulled_search.mail_message(self.mail)
+
+        self.assertEqual(to_addr, ["name@domain", "name2@domain"])
+        self.assertIn("To: name@domain, name2@domain\n", text)
+
+    def test_list_subject(self):
+
+        """Function:  test_list_subject
+
+        Description:  Test with a subject line made of a list of words.
+
+        Arguments:
+
+        """
+
+        self.mail.subj = ["Pulled", "Search", "Error"]
+
+        _, _, text = pulled_search.mail_message(self.mail)
+
+        self.assertIn("Subject: Pulled Search Error\n", text)
+
+    def test_no_subject(self):
+
+        """Function:  test_no_subject
+
+        Description:  Test with no subject line.
+
+        Arguments:
+
+        """
+
+        self.mail.subj = None
+
+        _, _, text = pulled_search.mail_message(self.mail)
+
+        self.assertIn("Subject: \n", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
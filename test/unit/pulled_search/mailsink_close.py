@@ -0,0 +1,124 @@
+# Classification (U)
+
+"""Program:  mailsink_close.py
+
+    Description:  Unit testing of MailSink.close in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mailsink_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import smtplib
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_close
+        test_quit_failed
+        test_close_twice
+        tearDown
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log):                        # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = pulled_search.MailSink(mock_log)
+        self.message = ("user@host", "name@domain", "Message text")
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test with the queue flushed and the session closed.
+
+        Arguments:
+
+        """
+
+        smtp = mock.MagicMock()
+        self.sink.smtp = smtp
+
+        self.assertTrue(self.sink.close())
+        self.assertIsNone(self.sink.thread)
+        self.assertIsNone(self.sink.smtp)
+        smtp.quit.assert_called_once_with()
+
+    def test_quit_failed(self):
+
+        """Function:  test_quit_failed
+
+        Description:  Test with the SMTP session already closed by the
+            server.
+
+        Arguments:
+
+        """
+
+        smtp = mock.MagicMock()
+        smtp.quit.side_effect = smtplib.SMTPServerDisconnected()
+        self.sink.smtp = smtp
+
+        self.assertTrue(self.sink.close())
+        self.assertIsNone(self.sink.smtp)
+
+    def test_close_twice(self):
+
+        """Function:  test_close_twice
+
+        Description:  Test with the mail sink closed twice.
+
+        Arguments:
+
+        """
+
+        self.sink.close()
+
+        self.assertTrue(self.sink.close())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# Classification (U)
+
+"""Program:  mailsink_connect.py
+
+    Description:  Unit testing of MailSink.connect in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mailsink_connect.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect
+        test_already_connected
+        tearDown
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log):                        # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = pulled_search.MailSink(mock_log)
+        self.message = ("user@host", "name@domain", "Message text")
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    def test_connect(self, mock_smtp):
+
+        """Function:  test_connect
+
+        Description:  Test with the SMTP session opened.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.sink.connect(), mock_smtp.return_value)
+        mock_smtp.assert_called_once_with("localhost")
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    def test_already_connected(self, mock_smtp):
+
+        """Function:  test_already_connected
+
+        Description:  Test with the SMTP session already open.
+
+        Arguments:
+
+        """
+
+        smtp = mock.MagicMock()
+        self.sink.smtp = smtp
+
+        self.assertEqual(self.sink.connect(), smtp)
+        mock_smtp.assert_not_called()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
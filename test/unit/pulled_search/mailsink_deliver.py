@@ -0,0 +1,128 @@
+# Classification (U)
+
+"""Program:  mailsink_deliver.py
+
+    Description:  Unit testing of MailSink.deliver in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mailsink_deliver.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import smtplib
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_deliver
+        test_reconnect
+        test_reconnect_failed
+        tearDown
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log):                        # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = pulled_search.MailSink(mock_log)
+        self.message = ("user@host", "name@domain", "Message text")
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    def test_deliver(self, mock_smtp):
+
+        """Function:  test_deliver
+
+        Description:  Test with the message sent.
+
+        Arguments:
+
+        """
+
+        self.sink.deliver(self.message)
+
+        mock_smtp.return_value.sendmail.assert_called_once_with(*self.message)
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    def test_reconnect(self, mock_smtp):
+
+        """Function:  test_reconnect
+
+        Description:  Test with the SMTP session dropped by the server.
+
+        Arguments:
+
+        """
+
+        smtp = mock.MagicMock()
+        smtp.sendmail.side_effect = smtplib.SMTPServerDisconnected()
+        self.sink.smtp = smtp
+
+        self.sink.deliver(self.message)
+
+        self.assertEqual(self.sink.smtp, mock_smtp.return_value)
+        mock_smtp.return_value.sendmail.assert_called_once_with(*self.message)
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    def test_reconnect_failed(self, mock_smtp):
+
+        """Function:  test_reconnect_failed
+
+        Description:  Test with the SMTP server not reachable.
+
+        Arguments:
+
+        """
+
+        smtp = mock.MagicMock()
+        smtp.sendmail.side_effect = smtplib.SMTPServerDisconnected()
+        self.sink.smtp = smtp
+        mock_smtp.side_effect = ConnectionRefusedError()
+
+        with self.assertRaises(ConnectionRefusedError):
+            self.sink.deliver(self.message)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# Classification (U)
+
+"""Program:  mailsink_init.py
+
+    Description:  Unit testing of MailSink.__init__ in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mailsink_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_default_queue
+        test_queue_size
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_default_queue(self, mock_log):
+
+        """Function:  test_default_queue
+
+        Description:  Test with no limit on the mail queue.
+
+        Arguments:
+
+        """
+
+        sink = pulled_search.MailSink(mock_log)
+
+        self.assertEqual(
+            (sink.host, sink.smtp, sink.queue.maxsize), ("localhost", None, 0))
+        self.assertTrue(sink.thread.is_alive())
+        sink.close()
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_queue_size(self, mock_log):
+
+        """Function:  test_queue_size
+
+        Description:  Test with a limit on the mail queue.
+
+        Arguments:
+
+        """
+
+        sink = pulled_search.MailSink(mock_log, queue_size=10)
+
+        self.assertEqual(sink.queue.maxsize, 10)
+        sink.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  mailsink_run.py
+
+    Description:  Unit testing of MailSink.run in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mailsink_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_run
+        test_failure_continues
+        tearDown
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log):                        # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = pulled_search.MailSink(mock_log)
+        self.message = ("user@host", "name@domain", "Message text")
+
+    @mock.patch("pulled_search.MailSink.deliver")
+    def test_run(self, mock_deliver):
+
+        """Function:  test_run
+
+        Description:  Test with the queued emails sent in order.
+
+        Arguments:
+
+        """
+
+        message2 = ("user@host", "name2@domain", "Message text 2")
+
+        self.sink.sendmail(*self.message)
+        self.sink.sendmail(*message2)
+        self.sink.queue.join()
+
+        self.assertEqual(
+            mock_deliver.call_args_list,
+            [mock.call(self.message), mock.call(message2)])
+
+    @mock.patch("pulled_search.MailSink.deliver")
+    def test_failure_continues(self, mock_deliver):
+
+        """Function:  test_failure_continues
+
+        Description:  Test with the sender thread carrying on after a failed
+            email.
+
+        Arguments:
+
+        """
+
+        mock_deliver.side_effect = [OSError("Connection refused"), None]
+
+        self.sink.sendmail(*self.message)
+        self.sink.sendmail(*self.message)
+        self.sink.queue.join()
+
+        self.assertEqual(mock_deliver.call_count, 2)
+        self.assertEqual(self.sink.failures, 1)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
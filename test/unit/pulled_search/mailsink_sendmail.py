@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  mailsink_sendmail.py
+
+    Description:  Unit testing of MailSink.sendmail in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mailsink_sendmail.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sendmail
+        test_single_session
+        tearDown
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log):                        # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = pulled_search.MailSink(mock_log)
+        self.message = ("user@host", "name@domain", "Message text")
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    def test_sendmail(self, mock_smtp):
+
+        """Function:  test_sendmail
+
+        Description:  Test with a message sent over SMTP.
+
+        Arguments:
+
+        """
+
+        self.sink.sendmail(*self.message)
+
+        self.assertTrue(self.sink.close())
+        mock_smtp.return_value.sendmail.assert_called_once_with(*self.message)
+        mock_smtp.return_value.quit.assert_called_once_with()
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    def test_single_session(self, mock_smtp):
+
+        """Function:  test_single_session
+
+        Description:  Test with several messages sent over one SMTP session.
+
+        Arguments:
+
+        """
+
+        for _ in range(3):
+            self.sink.sendmail(*self.message)
+
+        self.sink.close()
+
+        mock_smtp.assert_called_once_with("localhost")
+        self.assertEqual(mock_smtp.return_value.sendmail.call_count, 3)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -243,6 +243,7 @@ class UnitTest(unittest.TestCase):
         test_programlock_true
         test_programlock_false
         test_programlock_id
+        test_valid_jobs_false
 
     """
 
@@ -608,6 +609,30 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(pulled_search.main())
 
+    @mock.patch("pulled_search.run_program", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_class.ProgramLock")
+    @mock.patch("pulled_search.gen_libs.help_func")
+    @mock.patch("pulled_search.gen_class.ArgParser")
+    def test_valid_jobs_false(self, mock_arg, mock_help, mock_lock):
+
+        """Function:  test_valid_jobs_false
+
+        Description:  Test with an invalid -j option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "abc"
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        with gen_libs.no_std_out():
+            self.assertFalse(pulled_search.main())
+
+        mock_lock.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  match_docids.py
+
+    Description:  Unit testing of match_docids in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/match_docids.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import re
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_match
+        test_substring
+        test_token
+        test_token_partial
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.line = "GET /doc/09109abcdef.html docid=09109uosdhf"
+        self.docids = ["09109uosdhf", "09109abcdef"]
+        self.token_regex = re.compile("docid=([0-9A-Za-z]+)")
+
+    def test_no_match(self):
+
+        """Function:  test_no_match
+
+        Description:  Test with none of the docids in the log entry.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.match_docids(self.line, ["09109zzzzzz"]), [])
+
+    def test_substring(self):
+
+        """Function:  test_substring
+
+        Description:  Test with the docids anywhere in the log entry.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.match_docids(self.line, self.docids), self.docids)
+
+    def test_token(self):
+
+        """Function:  test_token
+
+        Description:  Test with only the docid tokens matched.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.match_docids(
+                self.line, self.docids, self.token_regex), ["09109uosdhf"])
+
+    def test_token_partial(self):
+
+        """Function:  test_token_partial
+
+        Description:  Test with a docid which is part of a docid token.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.match_docids(
+                self.line, ["09109uos"], self.token_regex), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  merge_entries.py
+
+    Description:  Unit testing of merge_entries in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/merge_entries.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_entries
+        test_existing_server
+        test_new_server
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "server_name"
+        self.fname = "Log_File_Name"
+        self.docid = "09109uosdhf"
+        self.entries = {self.docid: ["Line1", "Line2"]}
+        self.log_jsons = {self.docid: {"docid": self.docid, "servers": {}}}
+        self.log_jsons2 = {
+            self.docid: {"docid": self.docid,
+                         "servers": {"server_name": ["Line0"]}}}
+        self.results = {
+            self.docid: {"docid": self.docid,
+                         "servers": {"server_name": ["Line1", "Line2"]}}}
+        self.results2 = {
+            self.docid: {
+                "docid": self.docid,
+                "servers": {"server_name": ["Line0", "Line1", "Line2"]}}}
+        self.results3 = {self.docid: {"docid": self.docid, "servers": {}}}
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_no_entries(self, mock_log):
+
+        """Function:  test_no_entries
+
+        Description:  Test with no log entries.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.merge_entries(
+                self.log_jsons, {}, self.fname, self.server, mock_log),
+            self.results3)
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_existing_server(self, mock_log):
+
+        """Function:  test_existing_server
+
+        Description:  Test with entries added to an existing server.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.merge_entries(
+                self.log_jsons2, self.entries, self.fname, self.server,
+                mock_log), self.results2)
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_new_server(self, mock_log):
+
+        """Function:  test_new_server
+
+        Description:  Test with entries added to a new server.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.merge_entries(
+                self.log_jsons, self.entries, self.fname, self.server,
+                mock_log), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
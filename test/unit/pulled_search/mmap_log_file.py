@@ -0,0 +1,242 @@
+# Classification (U)
+
+"""Program:  mmap_log_file.py
+
+    Description:  Unit testing of mmap_log_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mmap_log_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import re
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_file
+        test_no_entries
+        test_no_newline
+        test_crlf_lines
+        test_multiple_docids
+        test_single_docid
+        test_token_match
+        test_no_docids
+        test_repeated_docid
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.basepath = "test/unit/pulled_search/testfiles"
+        self.fname = os.path.join(
+            self.basepath, "test_access_log.servername")
+        self.tmp_dir = "test/unit/pulled_search/tmp/mmap"
+        self.tmp_file = os.path.join(self.tmp_dir, "access_log")
+        self.docid = "09109uosdhf"
+        self.docid2 = "09109abcdef"
+        self.line1 = "line 1 docid=09109uosdhf"
+        self.line2 = "line 2 docid=09109abcdef"
+        self.line4 = "line 4 docid=09109uosdhf docid=09109abcdef"
+        self.results = {self.docid: [self.line1, self.line4]}
+        self.results2 = {self.docid: [self.line1, self.line4],
+                         self.docid2: [self.line2, self.line4]}
+
+    def write_file(self, data):
+
+        """Function:  write_file
+
+        Description:  Write a temporary log file.
+
+        Arguments:
+
+        """
+
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+        with open(self.tmp_file, mode="wb") as fhdr:
+            fhdr.write(data)
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty file.
+
+        Arguments:
+
+        """
+
+        self.write_file(b"")
+
+        self.assertEqual(
+            pulled_search.mmap_log_file(self.tmp_file, [self.docid]), {})
+
+    def test_no_entries(self):
+
+        """Function:  test_no_entries
+
+        Description:  Test with no entries found.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.mmap_log_file(self.fname, ["09109zzzzzz"]), {})
+
+    def test_no_newline(self):
+
+        """Function:  test_no_newline
+
+        Description:  Test with docid on the last line with no newline.
+
+        Arguments:
+
+        """
+
+        self.write_file(b"line 0\n" + self.line1.encode())
+
+        self.assertEqual(
+            pulled_search.mmap_log_file(self.tmp_file, [self.docid]),
+            {self.docid: [self.line1]})
+
+    def test_crlf_lines(self):
+
+        """Function:  test_crlf_lines
+
+        Description:  Test with carriage return line endings.
+
+        Arguments:
+
+        """
+
+        self.write_file(self.line1.encode() + b"\r\n" +
+                        self.line4.encode() + b"\r\n")
+
+        self.assertEqual(
+            pulled_search.mmap_log_file(self.tmp_file, [self.docid]),
+            self.results)
+
+    def test_multiple_docids(self):
+
+        """Function:  test_multiple_docids
+
+        Description:  Test with multiple docids, entries are in file order.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.mmap_log_file(
+                self.fname, [self.docid, self.docid2]), self.results2)
+
+    def test_single_docid(self):
+
+        """Function:  test_single_docid
+
+        Description:  Test with a single docid.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.mmap_log_file(self.fname, [self.docid]),
+            self.results)
+
+    def test_token_match(self):
+
+        """Function:  test_token_match
+
+        Description:  Test with the docids matched against the docid tokens.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.mmap_log_file(
+                self.fname, ["09109uos", self.docid2],
+                token_regex=re.compile("docid=([0-9A-Za-z]+)")),
+            {self.docid2: [self.line2, self.line4]})
+
+    def test_no_docids(self):
+
+        """Function:  test_no_docids
+
+        Description:  Test with no docids to search for.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(pulled_search.mmap_log_file(self.fname, []), {})
+
+    def test_repeated_docid(self):
+
+        """Function:  test_repeated_docid
+
+        Description:  Test with a docid repeated in a log entry, the entry is
+            returned once.
+
+        Arguments:
+
+        """
+
+        line = self.line1 + " ref=" + self.docid
+        self.write_file(line.encode() + b"\n" + self.line2.encode() + b"\n")
+
+        self.assertEqual(
+            pulled_search.mmap_log_file(
+                self.tmp_file, [self.docid, self.docid2]),
+            {self.docid: [line], self.docid2: [self.line2]})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isdir(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
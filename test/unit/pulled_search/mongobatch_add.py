@@ -0,0 +1,92 @@
+# Classification (U)
+
+"""Program:  mongobatch_add.py
+
+    Description:  Unit testing of MongoBatch.add in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongobatch_add.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_batch_full
+        test_batch_not_full
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.writer = mock.Mock()
+        self.writer.batch_size = 2
+        self.writer.insert.return_value = False
+        self.doc = {"docid": "09109uosdhf", "entry": "Line1"}
+        self.doc2 = {"docid": "09109uosdhf", "entry": "Line2"}
+        self.batch = pulled_search.MongoBatch(self.writer)
+
+    def test_batch_full(self):
+
+        """Function:  test_batch_full
+
+        Description:  Test with the batch full, the batch is inserted.
+
+        Arguments:
+
+        """
+
+        self.batch.add(self.doc)
+
+        self.assertFalse(self.batch.add(self.doc2))
+        self.writer.insert.assert_called_once_with([self.doc, self.doc2])
+        self.assertEqual(self.batch.docs, [])
+
+    def test_batch_not_full(self):
+
+        """Function:  test_batch_not_full
+
+        Description:  Test with the batch not full, nothing is inserted.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.batch.add(self.doc))
+        self.writer.insert.assert_not_called()
+        self.assertEqual(self.batch.docs, [self.doc])
+
+
+if __name__ == "__main__":
+    unittest.main()
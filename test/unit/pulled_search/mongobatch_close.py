@@ -0,0 +1,90 @@
+# Classification (U)
+
+"""Program:  mongobatch_close.py
+
+    Description:  Unit testing of MongoBatch.close in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongobatch_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_earlier_failure
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.writer = mock.Mock()
+        self.writer.batch_size = 1
+        self.writer.insert.return_value = True
+        self.batch = pulled_search.MongoBatch(self.writer)
+
+    def test_earlier_failure(self):
+
+        """Function:  test_earlier_failure
+
+        Description:  Test with an earlier batch of the file failing.
+
+        Arguments:
+
+        """
+
+        self.writer.insert.side_effect = [False, True]
+        self.batch.add({"docid": "09109uosdhf", "entry": "Line1"})
+
+        self.assertFalse(self.batch.close())
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test with the remaining documents inserted and the
+            writer left open.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.batch.close())
+        self.writer.insert.assert_called_once_with([])
+        self.writer.close.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
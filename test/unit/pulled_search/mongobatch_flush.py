@@ -0,0 +1,94 @@
+# Classification (U)
+
+"""Program:  mongobatch_flush.py
+
+    Description:  Unit testing of MongoBatch.flush in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongobatch_flush.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_insert_failed
+        test_insert_passed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.writer = mock.Mock()
+        self.writer.batch_size = 5
+        self.doc = {"docid": "09109uosdhf", "entry": "Line1"}
+        self.batch = pulled_search.MongoBatch(self.writer)
+        self.batch.docs = [self.doc]
+
+    def test_insert_failed(self):
+
+        """Function:  test_insert_failed
+
+        Description:  Test with the insert failing, the batch status is
+            kept.
+
+        Arguments:
+
+        """
+
+        self.writer.insert.return_value = False
+
+        self.assertFalse(self.batch.flush())
+        self.assertFalse(self.batch.status)
+
+    def test_insert_passed(self):
+
+        """Function:  test_insert_passed
+
+        Description:  Test with the documents inserted through the writer.
+
+        Arguments:
+
+        """
+
+        self.writer.insert.return_value = True
+
+        self.assertTrue(self.batch.flush())
+        self.writer.insert.assert_called_once_with([self.doc])
+        self.assertEqual(self.batch.docs, [])
+        self.assertTrue(self.batch.status)
+
+
+if __name__ == "__main__":
+    unittest.main()
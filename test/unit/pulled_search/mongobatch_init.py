@@ -0,0 +1,73 @@
+# Classification (U)
+
+"""Program:  mongobatch_init.py
+
+    Description:  Unit testing of MongoBatch.__init__ in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongobatch_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_init
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.writer = mock.Mock()
+        self.writer.batch_size = 2
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test with the batch using the writer's batch size.
+
+        Arguments:
+
+        """
+
+        batch = pulled_search.MongoBatch(self.writer)
+
+        self.assertEqual(
+            (batch.writer, batch.batch_size, batch.docs, batch.status),
+            (self.writer, 2, [], True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+# Classification (U)
+
+"""Program:  mongowriter_add.py
+
+    Description:  Unit testing of MongoWriter.add in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongowriter_add.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-d": "/dir/path/config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mconfig = "mongo"
+        self.merror_dir = "/dir/path/merror_dir"
+        self.mongo_batch = 2
+
+
+class MCfgTest():                                       # pylint:disable=R0903
+
+    """Class:  MCfgTest
+
+    Description:  Class which is a representation of a mongo cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MCfgTest class.
+
+        Arguments:
+
+        """
+
+        self.dbs = "database"
+        self.tbl = "table"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_batch_full_failed
+        test_batch_full
+        test_batch_not_full
+        test_batch_queued
+
+    """
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log, mock_load):             # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = MCfgTest()
+        self.writer = pulled_search.MongoWriter(
+            ArgParser(), CfgTest(), mock_log)
+        self.doc = {"docid": "09109uosdhf", "entry": "Line1"}
+
+    @mock.patch("pulled_search.MongoWriter.flush")
+    def test_batch_full_failed(self, mock_flush):
+
+        """Function:  test_batch_full_failed
+
+        Description:  Test with a full batch failing to insert.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = False
+        self.writer.add(self.doc)
+
+        self.assertFalse(self.writer.add(self.doc))
+
+    @mock.patch("pulled_search.MongoWriter.flush")
+    def test_batch_full(self, mock_flush):
+
+        """Function:  test_batch_full
+
+        Description:  Test with the batch full, the batch is inserted.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = True
+        self.writer.add(self.doc)
+
+        self.assertTrue(self.writer.add(self.doc))
+        mock_flush.assert_called_once_with()
+
+    @mock.patch("pulled_search.MongoWriter.flush")
+    def test_batch_not_full(self, mock_flush):
+
+        """Function:  test_batch_not_full
+
+        Description:  Test with the batch not full.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.writer.add(self.doc))
+        self.assertEqual(self.writer.docs, [self.doc])
+        mock_flush.assert_not_called()
+
+    @mock.patch("pulled_search.MongoWriter.flush")
+    def test_batch_queued(self, mock_flush):
+
+        """Function:  test_batch_queued
+
+        Description:  Test with a writer thread, the full batch is queued.
+
+        Arguments:
+
+        """
+
+        self.writer.queue = mock.Mock()
+        self.writer.add(self.doc)
+
+        self.assertTrue(self.writer.add(self.doc))
+        self.writer.queue.put.assert_called_once_with([self.doc, self.doc])
+        self.assertEqual(self.writer.docs, [])
+        mock_flush.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+# Classification (U)
+
+"""Program:  mongowriter_close.py
+
+    Description:  Unit testing of MongoWriter.close in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongowriter_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-d": "/dir/path/config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mconfig = "mongo"
+        self.merror_dir = "/dir/path/merror_dir"
+        self.mongo_batch = 2
+
+
+class MCfgTest():                                       # pylint:disable=R0903
+
+    """Class:  MCfgTest
+
+    Description:  Class which is a representation of a mongo cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MCfgTest class.
+
+        Arguments:
+
+        """
+
+        self.dbs = "database"
+        self.tbl = "table"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_connected
+        test_close
+        test_writer_thread
+
+    """
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log, mock_load):             # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = MCfgTest()
+        self.writer = pulled_search.MongoWriter(
+            ArgParser(), CfgTest(), mock_log)
+        self.coll = mock.Mock()
+
+    @mock.patch("pulled_search.MongoWriter.flush")
+    def test_not_connected(self, mock_flush):
+
+        """Function:  test_not_connected
+
+        Description:  Test with no connection to Mongo.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = False
+
+        self.assertFalse(self.writer.close())
+
+    @mock.patch("pulled_search.MongoWriter.flush")
+    def test_close(self, mock_flush):
+
+        """Function:  test_close
+
+        Description:  Test with the remaining documents inserted and the
+            connection closed.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = True
+        self.writer.coll = self.coll
+
+        self.assertTrue(self.writer.close())
+        self.coll.disconnect.assert_called_once_with()
+        self.assertIsNone(self.writer.coll)
+
+    @mock.patch("pulled_search.MongoWriter.flush")
+    def test_writer_thread(self, mock_flush):
+
+        """Function:  test_writer_thread
+
+        Description:  Test with a writer thread, the thread is stopped.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = True
+        self.writer.queue = mock.Mock()
+        thread = self.writer.thread = mock.Mock()
+
+        self.assertTrue(self.writer.close())
+        self.writer.queue.put.assert_called_once_with(None)
+        thread.join.assert_called_once_with()
+        self.assertIsNone(self.writer.thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+# Classification (U)
+
+"""Program:  mongowriter_connect.py
+
+    Description:  Unit testing of MongoWriter.connect in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongowriter_connect.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-d": "/dir/path/config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mconfig = "mongo"
+        self.merror_dir = "/dir/path/merror_dir"
+        self.mongo_batch = 2
+
+
+class MCfgTest():                                       # pylint:disable=R0903
+
+    """Class:  MCfgTest
+
+    Description:  Class which is a representation of a mongo cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MCfgTest class.
+
+        Arguments:
+
+        """
+
+        self.dbs = "database"
+        self.tbl = "table"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect_failed
+        test_already_connected
+        test_connect
+
+    """
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log, mock_load):             # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = MCfgTest()
+        self.writer = pulled_search.MongoWriter(
+            ArgParser(), CfgTest(), mock_log)
+        self.coll = mock.Mock()
+
+    @mock.patch("pulled_search.mongo_libs.crt_coll_inst")
+    def test_connect_failed(self, mock_coll):
+
+        """Function:  test_connect_failed
+
+        Description:  Test with failure to connect to Mongo.
+
+        Arguments:
+
+        """
+
+        self.coll.connect.return_value = (False, "Connection error")
+        mock_coll.return_value = self.coll
+
+        self.assertFalse(self.writer.connect())
+        self.assertIsNone(self.writer.coll)
+        self.assertEqual(self.writer.err_msg, "Connection error")
+
+    @mock.patch("pulled_search.mongo_libs.crt_coll_inst")
+    def test_already_connected(self, mock_coll):
+
+        """Function:  test_already_connected
+
+        Description:  Test with an existing connection, it is reused.
+
+        Arguments:
+
+        """
+
+        self.writer.coll = self.coll
+
+        self.assertTrue(self.writer.connect())
+        mock_coll.assert_not_called()
+
+    @mock.patch("pulled_search.mongo_libs.crt_coll_inst")
+    def test_connect(self, mock_coll):
+
+        """Function:  test_connect
+
+        Description:  Test with connecting to Mongo.
+
+        Arguments:
+
+        """
+
+        self.coll.connect.return_value = (True, None)
+        mock_coll.return_value = self.coll
+
+        self.assertTrue(self.writer.connect())
+        self.assertEqual(self.writer.coll, self.coll)
+        mock_coll.assert_called_once_with(
+            self.writer.mcfg, "database", "table")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+# Classification (U)
+
+"""Program:  mongowriter_flush.py
+
+    Description:  Unit testing of MongoWriter.flush in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongowriter_flush.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-d": "/dir/path/config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mconfig = "mongo"
+        self.merror_dir = "/dir/path/merror_dir"
+        self.mongo_batch = 2
+
+
+class MCfgTest():                                       # pylint:disable=R0903
+
+    """Class:  MCfgTest
+
+    Description:  Class which is a representation of a mongo cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MCfgTest class.
+
+        Arguments:
+
+        """
+
+        self.dbs = "database"
+        self.tbl = "table"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_writer_thread_failed
+        test_writer_thread
+        test_in_line
+
+    """
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log, mock_load):             # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = MCfgTest()
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.writer = pulled_search.MongoWriter(self.args, self.cfg, mock_log)
+        self.doc = {"docid": "09109uosdhf", "entry": "Line1"}
+        self.doc2 = {"docid": "09109uosdhf", "entry": "Line2"}
+
+    @mock.patch("pulled_search.MongoWriter.insert")
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_writer_thread_failed(self, mock_log, mock_load, mock_insert):
+
+        """Function:  test_writer_thread_failed
+
+        Description:  Test with a writer thread and a failed batch, the
+            failure is only reported once.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_queue = 1
+        mock_load.return_value = MCfgTest()
+        mock_insert.side_effect = [False, True]
+        writer = pulled_search.MongoWriter(self.args, self.cfg, mock_log)
+        writer.add(self.doc)
+        writer.add(self.doc2)
+
+        self.assertFalse(writer.flush())
+
+        writer.add(self.doc)
+
+        self.assertTrue(writer.flush())
+        writer.close()
+
+    @mock.patch("pulled_search.MongoWriter.insert")
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_writer_thread(self, mock_log, mock_load, mock_insert):
+
+        """Function:  test_writer_thread
+
+        Description:  Test with a writer thread, flush waits for the queued
+            batches to be inserted.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_queue = 1
+        mock_load.return_value = MCfgTest()
+        mock_insert.return_value = True
+        writer = pulled_search.MongoWriter(self.args, self.cfg, mock_log)
+
+        for doc in [self.doc, self.doc2, self.doc]:
+            writer.add(doc)
+
+        self.assertTrue(writer.flush())
+        self.assertEqual(
+            mock_insert.call_args_list,
+            [mock.call([self.doc, self.doc2]), mock.call([self.doc])])
+        writer.close()
+
+    @mock.patch("pulled_search.MongoWriter.insert")
+    def test_in_line(self, mock_insert):
+
+        """Function:  test_in_line
+
+        Description:  Test with no writer thread, the batch is inserted.
+
+        Arguments:
+
+        """
+
+        mock_insert.return_value = False
+        self.writer.docs = [self.doc]
+
+        self.assertFalse(self.writer.flush())
+        mock_insert.assert_called_once_with([self.doc])
+        self.assertEqual(self.writer.docs, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
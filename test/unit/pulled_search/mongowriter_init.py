@@ -0,0 +1,208 @@
+# Classification (U)
+
+"""Program:  mongowriter_init.py
+
+    Description:  Unit testing of MongoWriter.__init__ in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongowriter_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-d": "/dir/path/config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mconfig = "mongo"
+        self.merror_dir = "/dir/path/merror_dir"
+        self.mongo_batch = 2
+
+
+class MCfgTest():                                       # pylint:disable=R0903
+
+    """Class:  MCfgTest
+
+    Description:  Class which is a representation of a mongo cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MCfgTest class.
+
+        Arguments:
+
+        """
+
+        self.dbs = "database"
+        self.tbl = "table"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default_batch
+        test_batch_size
+        test_writer_thread
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.mcfg = MCfgTest()
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_default_batch(self, mock_log, mock_load):
+
+        """Function:  test_default_batch
+
+        Description:  Test with mongo_batch not in the configuration.
+
+        Arguments:
+
+        """
+
+        del self.cfg.mongo_batch
+        mock_load.return_value = self.mcfg
+        writer = pulled_search.MongoWriter(self.args, self.cfg, mock_log)
+
+        self.assertEqual(writer.batch_size, 1)
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_batch_size(self, mock_log, mock_load):
+
+        """Function:  test_batch_size
+
+        Description:  Test with mongo_batch in the configuration.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.mcfg
+        writer = pulled_search.MongoWriter(self.args, self.cfg, mock_log)
+
+        self.assertEqual(writer.batch_size, 2)
+        self.assertEqual(writer.mcfg, self.mcfg)
+        self.assertEqual(writer.docs, [])
+        mock_load.assert_called_once_with("mongo", "/dir/path/config")
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_writer_thread(self, mock_log, mock_load):
+
+        """Function:  test_writer_thread
+
+        Description:  Test with mongo_queue set, a writer thread is started.
+
+        Arguments:
+
+        """
+
+        self.cfg.mongo_queue = 3
+        mock_load.return_value = self.mcfg
+        writer = pulled_search.MongoWriter(self.args, self.cfg, mock_log)
+
+        self.assertEqual(writer.queue.maxsize, 3)
+        self.assertTrue(writer.thread.is_alive())
+        writer.close()
+        self.assertIsNone(writer.thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,295 @@
+# Classification (U)
+
+"""Program:  mongowriter_insert.py
+
+    Description:  Unit testing of MongoWriter.insert in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongowriter_insert.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-d": "/dir/path/config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mconfig = "mongo"
+        self.merror_dir = "/dir/path/merror_dir"
+        self.mongo_batch = 2
+
+
+class MCfgTest():                                       # pylint:disable=R0903
+
+    """Class:  MCfgTest
+
+    Description:  Class which is a representation of a mongo cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MCfgTest class.
+
+        Arguments:
+
+        """
+
+        self.dbs = "database"
+        self.tbl = "table"
+
+
+class BulkWriteError(Exception):
+
+    """Class:  BulkWriteError
+
+    Description:  Class stub holder for pymongo.errors.BulkWriteError class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, details):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        super().__init__("batch op errors occurred")
+        self.details = details
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_batch
+        test_connect_failed
+        test_insert_error
+        test_partial_failure
+        test_bulk_insert
+        test_upsert
+
+    """
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log, mock_load):             # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = MCfgTest()
+        self.writer = pulled_search.MongoWriter(
+            ArgParser(), CfgTest(), mock_log)
+        self.coll = mock.Mock()
+        self.doc = {"docid": "09109uosdhf", "entry": "Line1"}
+        self.doc2 = {"docid": "09109uosdhf", "entry": "Line2"}
+        self.docs = [self.doc, self.doc2]
+
+    @mock.patch("pulled_search.MongoWriter.connect")
+    def test_empty_batch(self, mock_connect):
+
+        """Function:  test_empty_batch
+
+        Description:  Test with no documents in the batch.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.writer.insert([]))
+        mock_connect.assert_not_called()
+
+    @mock.patch("pulled_search.MongoWriter.write_failed")
+    @mock.patch("pulled_search.MongoWriter.connect")
+    def test_connect_failed(self, mock_connect, mock_failed):
+
+        """Function:  test_connect_failed
+
+        Description:  Test with failure to connect, all documents failed.
+
+        Arguments:
+
+        """
+
+        mock_connect.return_value = False
+
+        self.assertFalse(self.writer.insert(self.docs))
+        mock_failed.assert_called_once_with([self.doc, self.doc2])
+
+    @mock.patch("pulled_search.MongoWriter.write_failed")
+    def test_insert_error(self, mock_failed):
+
+        """Function:  test_insert_error
+
+        Description:  Test with an error with no details, all documents
+            failed.
+
+        Arguments:
+
+        """
+
+        self.writer.coll = self.coll
+        self.coll.db_coll.insert_many.side_effect = \
+            ValueError("Server error")
+
+        self.assertFalse(self.writer.insert(self.docs))
+        mock_failed.assert_called_once_with([self.doc, self.doc2])
+        self.assertEqual(self.writer.err_msg, "Server error")
+
+    @mock.patch("pulled_search.MongoWriter.write_failed")
+    def test_partial_failure(self, mock_failed):
+
+        """Function:  test_partial_failure
+
+        Description:  Test with one document failing in the bulk insert.
+
+        Arguments:
+
+        """
+
+        self.writer.coll = self.coll
+        self.coll.db_coll.insert_many.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 1, "errmsg": "Error"}]})
+
+        self.assertFalse(self.writer.insert(self.docs))
+        mock_failed.assert_called_once_with([self.doc2])
+
+    @mock.patch("pulled_search.MongoWriter.write_failed")
+    def test_bulk_insert(self, mock_failed):
+
+        """Function:  test_bulk_insert
+
+        Description:  Test with the documents inserted.
+
+        Arguments:
+
+        """
+
+        self.writer.coll = self.coll
+
+        self.assertTrue(self.writer.insert(self.docs))
+        self.coll.db_coll.insert_many.assert_called_once_with(
+            [self.doc, self.doc2], ordered=False)
+        mock_failed.assert_not_called()
+
+    @mock.patch("pulled_search.UpdateOne")
+    @mock.patch("pulled_search.MongoWriter.write_failed")
+    def test_upsert(self, mock_failed, mock_update):
+
+        """Function:  test_upsert
+
+        Description:  Test with the documents upserted by content key.
+
+        Arguments:
+
+        """
+
+        mock_update.side_effect = lambda *args, **kwargs: (args, kwargs)
+        self.writer.coll = self.coll
+        self.writer.upsert = True
+        self.doc["server"] = "Server1"
+        doc_id = pulled_search.get_doc_id(self.doc)
+
+        self.assertTrue(self.writer.insert([self.doc]))
+        self.coll.db_coll.bulk_write.assert_called_once_with(
+            [(({"_id": doc_id}, {"$setOnInsert": self.doc}),
+              {"upsert": True})], ordered=False)
+        self.coll.db_coll.insert_many.assert_not_called()
+        mock_failed.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
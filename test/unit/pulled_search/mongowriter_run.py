@@ -0,0 +1,215 @@
+# Classification (U)
+
+"""Program:  mongowriter_run.py
+
+    Description:  Unit testing of MongoWriter.run in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongowriter_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import queue
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-d": "/dir/path/config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mconfig = "mongo"
+        self.merror_dir = "/dir/path/merror_dir"
+        self.mongo_batch = 2
+
+
+class MCfgTest():                                       # pylint:disable=R0903
+
+    """Class:  MCfgTest
+
+    Description:  Class which is a representation of a mongo cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MCfgTest class.
+
+        Arguments:
+
+        """
+
+        self.dbs = "database"
+        self.tbl = "table"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_thread_error
+        test_insert_failed
+        test_stop
+
+    """
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log, mock_load):             # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = MCfgTest()
+        self.writer = pulled_search.MongoWriter(
+            ArgParser(), CfgTest(), mock_log)
+        self.writer.queue = queue.Queue()
+        self.docs = [{"docid": "09109uosdhf", "entry": "Line1"}]
+
+    @mock.patch("pulled_search.MongoWriter.insert")
+    def test_thread_error(self, mock_insert):
+
+        """Function:  test_thread_error
+
+        Description:  Test with an error in the writer thread, the thread
+            keeps running.
+
+        Arguments:
+
+        """
+
+        mock_insert.side_effect = [IOError("Disk full"), True]
+
+        for item in [self.docs, self.docs, None]:
+            self.writer.queue.put(item)
+
+        self.writer.run()
+
+        self.assertEqual(self.writer.failures, 1)
+        self.assertEqual(mock_insert.call_count, 2)
+        self.writer.queue.join()
+
+    @mock.patch("pulled_search.MongoWriter.insert")
+    def test_insert_failed(self, mock_insert):
+
+        """Function:  test_insert_failed
+
+        Description:  Test with a batch failing to insert.
+
+        Arguments:
+
+        """
+
+        mock_insert.return_value = False
+
+        for item in [self.docs, None]:
+            self.writer.queue.put(item)
+
+        self.writer.run()
+
+        self.assertEqual(self.writer.failures, 1)
+
+    @mock.patch("pulled_search.MongoWriter.insert")
+    def test_stop(self, mock_insert):
+
+        """Function:  test_stop
+
+        Description:  Test with the writer thread stopped.
+
+        Arguments:
+
+        """
+
+        self.writer.queue.put(None)
+        self.writer.run()
+
+        mock_insert.assert_not_called()
+        self.assertEqual(self.writer.failures, 0)
+        self.writer.queue.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
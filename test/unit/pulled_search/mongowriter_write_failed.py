@@ -0,0 +1,192 @@
+# Classification (U)
+
+"""Program:  mongowriter_write_failed.py
+
+    Description:  Unit testing of MongoWriter.write_failed in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/mongowriter_write_failed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-d": "/dir/path/config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mconfig = "mongo"
+        self.merror_dir = "/dir/path/merror_dir"
+        self.mongo_batch = 2
+
+
+class MCfgTest():                                       # pylint:disable=R0903
+
+    """Class:  MCfgTest
+
+    Description:  Class which is a representation of a mongo cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MCfgTest class.
+
+        Arguments:
+
+        """
+
+        self.dbs = "database"
+        self.tbl = "table"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_email
+        test_write_failed
+
+    """
+
+    @mock.patch("pulled_search.gen_libs.load_module")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log, mock_load):             # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = MCfgTest()
+        self.args = ArgParser()
+        self.writer = pulled_search.MongoWriter(self.args, CfgTest(), mock_log)
+        self.doc = {"docid": "09109uosdhf", "entry": "Line1"}
+        self.doc2 = {"docid": "09109uosdhf", "entry": "Line2"}
+        self.fname = "/dir/path/merror_dir/09109uosdhf.failed_to_insert.json"
+
+    @mock.patch("pulled_search.gen_class.setup_mail")
+    @mock.patch("pulled_search.gen_libs.write_file")
+    def test_email(self, mock_write, mock_mail):
+
+        """Function:  test_email
+
+        Description:  Test with an email sent for the failed documents.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = "name@domain"
+
+        self.writer.write_failed([self.doc, self.doc2])
+
+        self.assertEqual(mock_write.call_count, 2)
+        mock_mail.return_value.add_2_msg.assert_called_with(
+            "File: " + self.fname)
+        mock_mail.return_value.send_mail.assert_called_once_with()
+
+    @mock.patch("pulled_search.gen_class.setup_mail")
+    @mock.patch("pulled_search.gen_libs.write_file")
+    def test_write_failed(self, mock_write, mock_mail):
+
+        """Function:  test_write_failed
+
+        Description:  Test with the failed documents written to file.
+
+        Arguments:
+
+        """
+
+        self.writer.write_failed([self.doc, self.doc2])
+
+        mock_write.assert_called_with(
+            fname=self.fname, mode="a", data=self.doc2)
+        mock_mail.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+# Classification (U)
+
+"""Program:  monitor_insert.py
+
+    Description:  Unit testing of monitor_insert in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/monitor_insert.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mfile_regex = "_mongo.json"
+        self.monitor_dir = "/dir_path/monitor_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_inotify
+        test_new_files
+        test_overflow
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = mock.Mock()
+        self.cfg = CfgTest()
+        self.insert_list = ["/dir_path/monitor_dir/file1_mongo.json"]
+        self.names = ["file2_mongo.json", "file2.tmp", "file2_mongo.json"]
+
+    @mock.patch("pulled_search.time.sleep")
+    @mock.patch("pulled_search.insert_files")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.inotify_init", mock.Mock(return_value=None))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_no_inotify(self, mock_log, mock_search, mock_files, mock_sleep):
+
+        """Function:  test_no_inotify
+
+        Description:  Test with inotify not available, only rescans.
+
+        Arguments:
+
+        """
+
+        self.cfg.monitor_interval = 30
+        mock_search.return_value = self.insert_list
+        mock_sleep.side_effect = [None, KeyboardInterrupt]
+
+        pulled_search.monitor_insert(self.args, self.cfg, mock_log)
+
+        self.assertEqual(mock_files.call_count, 2)
+        mock_files.assert_called_with(
+            self.args, self.cfg, mock_log, self.insert_list)
+        mock_sleep.assert_called_with(30)
+        mock_log.log_warn.assert_called_once()
+
+    @mock.patch("pulled_search.os.close")
+    @mock.patch("pulled_search.os.path.isfile", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.time.time", mock.Mock(return_value=0))
+    @mock.patch("pulled_search.insert_files")
+    @mock.patch("pulled_search.inotify_read")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.inotify_init", mock.Mock(return_value=5))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_new_files(self, mock_log, mock_search, mock_read, mock_files,
+                       mock_close):
+
+        """Function:  test_new_files
+
+        Description:  Test with new files detected by inotify.
+
+        Arguments:
+
+        """
+
+        mock_search.return_value = self.insert_list
+        mock_read.side_effect = [self.names, [], KeyboardInterrupt]
+
+        pulled_search.monitor_insert(self.args, self.cfg, mock_log)
+
+        self.assertEqual(mock_files.call_count, 2)
+        mock_files.assert_called_with(
+            self.args, self.cfg, mock_log,
+            ["/dir_path/monitor_dir/file2_mongo.json"])
+        mock_read.assert_called_with(5, 300)
+        mock_close.assert_called_once_with(5)
+
+    @mock.patch("pulled_search.os.close", mock.Mock(return_value=None))
+    @mock.patch("pulled_search.time.time", mock.Mock(return_value=0))
+    @mock.patch("pulled_search.insert_files")
+    @mock.patch("pulled_search.inotify_read")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.inotify_init", mock.Mock(return_value=5))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_overflow(self, mock_log, mock_search, mock_read, mock_files):
+
+        """Function:  test_overflow
+
+        Description:  Test with inotify events lost, directory rescanned.
+
+        Arguments:
+
+        """
+
+        mock_search.return_value = self.insert_list
+        mock_read.side_effect = [None, KeyboardInterrupt]
+
+        pulled_search.monitor_insert(self.args, self.cfg, mock_log)
+
+        self.assertEqual(mock_search.call_count, 2)
+        self.assertEqual(mock_files.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  open_catalog.py
+
+    Description:  Unit testing of open_catalog in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/open_catalog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_catalog
+        test_existing_catalog
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.catalog_file = os.path.join(
+            os.getcwd(), "test/unit/pulled_search/tmp/open_catalog.db")
+
+    def test_new_catalog(self):
+
+        """Function:  test_new_catalog
+
+        Description:  Test with the catalog created.
+
+        Arguments:
+
+        """
+
+        conn = pulled_search.open_catalog(self.catalog_file)
+        tables = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+            " ORDER BY name")]
+        conn.close()
+
+        self.assertEqual(tables, ["dirs", "files"])
+
+    def test_existing_catalog(self):
+
+        """Function:  test_existing_catalog
+
+        Description:  Test with the entries of an existing catalog kept.
+
+        Arguments:
+
+        """
+
+        conn = pulled_search.open_catalog(self.catalog_file)
+
+        with conn:
+            conn.execute("INSERT INTO dirs VALUES ('/dir/path', 1.0)")
+
+        conn.close()
+        conn = pulled_search.open_catalog(self.catalog_file)
+        rows = conn.execute("SELECT * FROM dirs").fetchall()
+        conn.close()
+
+        self.assertEqual(rows, [("/dir/path", 1.0)])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.catalog_file):
+            os.remove(self.catalog_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
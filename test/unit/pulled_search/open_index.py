@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  open_index.py
+
+    Description:  Unit testing of open_index in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/open_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_create_tables
+        test_existing_index
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.basepath = "test/unit/pulled_search/tmp"
+        self.index_file = os.path.join(self.basepath, "open_index.db")
+        self.fname = "/archive/intelink/2023/04/access_log.server.gz"
+        self.tables = ["files", "postings"]
+
+    def test_create_tables(self):
+
+        """Function:  test_create_tables
+
+        Description:  Test with the tables created in a new index.
+
+        Arguments:
+
+        """
+
+        conn = pulled_search.open_index(self.index_file)
+        tables = [name for name, in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+            " ORDER BY name")]
+        conn.close()
+
+        self.assertEqual(tables, self.tables)
+
+    def test_existing_index(self):
+
+        """Function:  test_existing_index
+
+        Description:  Test with an existing index being reopened.
+
+        Arguments:
+
+        """
+
+        conn = pulled_search.open_index(self.index_file)
+
+        with conn:
+            conn.execute(
+                "INSERT INTO postings VALUES ('09109uosdhf', ?, 0)",
+                (self.fname,))
+
+        conn.close()
+        conn = pulled_search.open_index(self.index_file)
+        count = conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+        conn.close()
+
+        self.assertEqual(count, 1)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.index_file):
+            os.remove(self.index_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Classification (U)
+
+"""Program:  open_log.py
+
+    Description:  Unit testing of open_log in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/open_log.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_gzip_file
+        test_plain_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.basepath = "test/unit/pulled_search/testfiles"
+        self.fname = os.path.join(
+            self.basepath, "test_access_log.servername")
+        self.fname2 = os.path.join(
+            self.basepath, "test_access_log.servername.gz")
+        self.results = "line 1 docid=09109uosdhf\n"
+
+    def test_gzip_file(self):
+
+        """Function:  test_gzip_file
+
+        Description:  Test with a gzip compressed file.
+
+        Arguments:
+
+        """
+
+        with pulled_search.open_log(self.fname2) as fhdr:
+            self.assertEqual(fhdr.readline(), self.results)
+
+    def test_plain_file(self):
+
+        """Function:  test_plain_file
+
+        Description:  Test with a plain file.
+
+        Arguments:
+
+        """
+
+        with pulled_search.open_log(self.fname) as fhdr:
+            self.assertEqual(fhdr.readline(), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
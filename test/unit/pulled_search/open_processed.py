@@ -0,0 +1,116 @@
+# Classification (U)
+
+"""Program:  open_processed.py
+
+    Description:  Unit testing of open_processed in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/open_processed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import sqlite3
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_database
+        test_import_once
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "test/unit/pulled_search/tmp/processed"
+        self.docid = "090109abcdef"
+        self.docid2 = "090109fedcba"
+
+    def test_new_database(self):
+
+        """Function:  test_new_database
+
+        Description:  Test with no flat processed file.
+
+        Arguments:
+
+        """
+
+        conn = pulled_search.open_processed(self.fname)
+        rows = conn.execute("SELECT docid FROM processed").fetchall()
+        conn.close()
+
+        self.assertEqual(rows, [])
+        self.assertTrue(os.path.isfile(self.fname + ".db"))
+
+    def test_import_once(self):
+
+        """Function:  test_import_once
+
+        Description:  Test with the flat processed file only imported the
+            first time the database is opened.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as fhdr:
+            fhdr.write(self.docid + "\n")
+
+        pulled_search.open_processed(self.fname).close()
+
+        with open(self.fname, mode="a", encoding="UTF-8") as fhdr:
+            fhdr.write(self.docid2 + "\n")
+
+        conn = pulled_search.open_processed(self.fname)
+        rows = conn.execute("SELECT docid FROM processed").fetchall()
+        conn.close()
+
+        self.assertEqual(rows, [(self.docid,)])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fname in [self.fname, self.fname + ".db"]:
+            if os.path.isfile(fname):
+                os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
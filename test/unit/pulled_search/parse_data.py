@@ -16,6 +16,7 @@
 # Standard
 import sys
 import os
+import json
 import unittest
 import mock
 
@@ -97,6 +98,13 @@ class UnitTest(unittest.TestCase):
         test_multiple_servers
         test_single_svr_multiple_entries
         test_single_svr_single_entry
+        test_parsed_entries
+        test_writer
+        test_own_writer
+        test_repeated_entries
+        test_no_upsert
+        test_chunked_repeated
+        test_mail_sink
 
     """
 
@@ -200,6 +208,193 @@ class UnitTest(unittest.TestCase):
             pulled_search.parse_data(
                 self.args, self.cfg, mock_log, self.log_json))
 
+    @mock.patch(
+        "pulled_search.gen_libs.write_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.parse_line")
+    @mock.patch("pulled_search.insert_mongo")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_parsed_entries(self, mock_log, mock_insert, mock_parse):
+
+        """Function:  test_parsed_entries
+
+        Description:  Test with entries already parsed, the entries are not
+            parsed again.
+
+        Arguments:
+
+        """
+
+        mock_insert.return_value = True
+        parsed = {"server_name": [
+            {"userid": "user", "url": "host/path", "ip": "1.1.1.1"}]}
+
+        self.assertTrue(
+            pulled_search.parse_data(
+                self.args, self.cfg, mock_log, self.log_json, parsed=parsed))
+        mock_parse.assert_not_called()
+        self.assertEqual(mock_insert.call_args[0][3]["url"],
+                         "https://host/path")
+        self.assertNotIn("ip", mock_insert.call_args[0][3])
+
+    @mock.patch(
+        "pulled_search.gen_libs.write_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.insert_mongo")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_writer(self, mock_log, mock_insert):
+
+        """Function:  test_writer
+
+        Description:  Test with a Mongo writer passed in, the documents are
+            added to the writer and the writer is flushed.
+
+        Arguments:
+
+        """
+
+        writer = mock.Mock()
+        writer.add.return_value = True
+        writer.flush.return_value = False
+
+        self.assertFalse(
+            pulled_search.parse_data(
+                self.args, self.cfg, mock_log, self.log_json2, writer=writer))
+        self.assertEqual(writer.add.call_count, 2)
+        writer.close.assert_not_called()
+        mock_insert.assert_not_called()
+
+    @mock.patch(
+        "pulled_search.gen_libs.write_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.create_writer")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_own_writer(self, mock_log, mock_writer):
+
+        """Function:  test_own_writer
+
+        Description:  Test with bulk inserts set and no Mongo writer passed
+            in, a writer is created and closed.
+
+        Arguments:
+
+        """
+
+        mock_writer.return_value.add.return_value = True
+        mock_writer.return_value.close.return_value = True
+
+        self.assertTrue(
+            pulled_search.parse_data(
+                self.args, self.cfg, mock_log, self.log_json))
+        mock_writer.return_value.close.assert_called_once_with()
+
+    @mock.patch(
+        "pulled_search.gen_libs.write_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_repeated_entries(self, mock_log):
+
+        """Function:  test_repeated_entries
+
+        Description:  Test with identical log entries on a server and
+            upserts, each document gets its own occurrence and key.
+
+        Arguments:
+
+        """
+
+        writer = mock.Mock()
+        writer.add.return_value = True
+        writer.flush.return_value = True
+        self.cfg.mongo_upsert = True
+
+        pulled_search.parse_data(
+            self.args, self.cfg, mock_log, self.log_json2, writer=writer)
+        docs = [call[0][0] for call in writer.add.call_args_list]
+
+        self.assertEqual([doc["occurrence"] for doc in docs], [0, 1])
+        self.assertNotEqual(
+            pulled_search.get_doc_id(docs[0]),
+            pulled_search.get_doc_id(docs[1]))
+
+    @mock.patch(
+        "pulled_search.gen_libs.write_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_no_upsert(self, mock_log):
+
+        """Function:  test_no_upsert
+
+        Description:  Test with identical log entries on a server and no
+            upserts, the documents have no occurrence.
+
+        Arguments:
+
+        """
+
+        writer = mock.Mock()
+        writer.add.return_value = True
+        writer.flush.return_value = True
+
+        pulled_search.parse_data(
+            self.args, self.cfg, mock_log, self.log_json2, writer=writer)
+
+        for call in writer.add.call_args_list:
+            self.assertNotIn("occurrence", call[0][0])
+
+    @mock.patch(
+        "pulled_search.gen_libs.write_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_chunked_repeated(self, mock_log):
+
+        """Function:  test_chunked_repeated
+
+        Description:  Test with identical log entries on a server split
+            across the parts of a document, each document keeps its
+            occurrence in the whole document.
+
+        Arguments:
+
+        """
+
+        writer = mock.Mock()
+        writer.add.return_value = True
+        writer.flush.return_value = True
+        self.cfg.mongo_upsert = True
+        self.log_json["servers"]["server_name"] = [self.entry1] * 5
+        parts = pulled_search.split_log_json(
+            self.log_json, 2 * (len(json.dumps(self.entry1)) + 2) + 19)
+
+        for part in parts:
+            pulled_search.parse_data(
+                self.args, self.cfg, mock_log, part, writer=writer)
+
+        docs = [call[0][0] for call in writer.add.call_args_list]
+
+        self.assertEqual(len(parts), 3)
+        self.assertEqual([doc["occurrence"] for doc in docs], [0, 1, 2, 3, 4])
+        self.assertEqual(
+            len({pulled_search.get_doc_id(doc) for doc in docs}), 5)
+
+    @mock.patch(
+        "pulled_search.gen_libs.write_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.create_writer", mock.Mock(return_value=None))
+    @mock.patch("pulled_search.insert_mongo")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_mail_sink(self, mock_log, mock_insert):
+
+        """Function:  test_mail_sink
+
+        Description:  Test with the mail sink passed on to the Mongo
+            insertion.
+
+        Arguments:
+
+        """
+
+        mail_sink = mock.MagicMock()
+        mock_insert.return_value = True
+
+        self.assertTrue(pulled_search.parse_data(
+            self.args, self.cfg, mock_log, self.log_json,
+            mail_sink=mail_sink))
+        self.assertEqual(mock_insert.call_args[1]["mail_sink"], mail_sink)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,124 @@
+# Classification (U)
+
+"""Program:  parse_line.py
+
+    Description:  Unit testing of parse_line in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/parse_line.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import re
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.regex = r"(?P<ip>\d+\.\d+\.\d+\.\d+) (?P<url>.*?)?$"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_unparsable
+        test_compiled_parser
+        test_no_parser
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.line = "1.1.1.1 host/path?docid=09109uosdhf"
+        self.results = {"ip": "1.1.1.1", "url": "host/path?docid=09109uosdhf"}
+
+    def test_unparsable(self):
+
+        """Function:  test_unparsable
+
+        Description:  Test with an unparsable log entry.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(pulled_search.parse_line(self.cfg, "bad entry"))
+
+    def test_compiled_parser(self):
+
+        """Function:  test_compiled_parser
+
+        Description:  Test with a compiled parser in the configuration.
+
+        Arguments:
+
+        """
+
+        self.cfg.parser = re.compile(self.cfg.regex)
+
+        self.assertEqual(
+            pulled_search.parse_line(self.cfg, self.line), self.results)
+
+    def test_no_parser(self):
+
+        """Function:  test_no_parser
+
+        Description:  Test with no compiled parser in the configuration.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.parse_line(self.cfg, self.line), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+# Classification (U)
+
+"""Program:  parse_literal.py
+
+    Description:  Unit testing of parse_literal in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/parse_literal.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dictionary
+        test_nested
+        test_escapes
+        test_scalars
+        test_empty
+        test_invalid
+        test_trailing_data
+        test_no_calls
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.log_json = {
+            "docid": "90872590827590872345", "command": "eucom",
+            "servers": {"Server1": ["Line1", "Line2"], "Server2": []}}
+
+    def test_dictionary(self):
+
+        """Function:  test_dictionary
+
+        Description:  Test with a dictionary written by str().
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.parse_literal(str(self.log_json)), self.log_json)
+
+    def test_nested(self):
+
+        """Function:  test_nested
+
+        Description:  Test with nested dictionaries and lists.
+
+        Arguments:
+
+        """
+
+        data = {"a": [{"b": [[], {}]}, ["c", {"d": "e"}]]}
+
+        self.assertEqual(pulled_search.parse_literal(str(data)), data)
+
+    def test_escapes(self):
+
+        """Function:  test_escapes
+
+        Description:  Test with strings that have quotes and escapes.
+
+        Arguments:
+
+        """
+
+        data = ["It's", 'say "hi"', "both ' \"", "tab\t", "\x00", "\u20ac",
+                "back\\slash"]
+
+        self.assertEqual(pulled_search.parse_literal(str(data)), data)
+
+    def test_scalars(self):
+
+        """Function:  test_scalars
+
+        Description:  Test with numbers, True, False and None.
+
+        Arguments:
+
+        """
+
+        data = {"a": 1, "b": -2.5, "c": 1e-07, "d": True, "e": False,
+                "f": None, 3: "int key"}
+
+        self.assertEqual(pulled_search.parse_literal(str(data)), data)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no data.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            pulled_search.parse_literal("")
+
+    def test_invalid(self):
+
+        """Function:  test_invalid
+
+        Description:  Test with invalid literals.
+
+        Arguments:
+
+        """
+
+        for data in ["{", "{'a'}", "{'a':}", "[1 2]", "[1,,2]", "{]",
+                     "{'a' 1}", "{[]: 1}", "name"]:
+            with self.assertRaises(ValueError):
+                pulled_search.parse_literal(data)
+
+    def test_trailing_data(self):
+
+        """Function:  test_trailing_data
+
+        Description:  Test with data after the literal.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            pulled_search.parse_literal("{'a': 1}}")
+
+    def test_no_calls(self):
+
+        """Function:  test_no_calls
+
+        Description:  Test with a function call in the data.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            pulled_search.parse_literal("{'a': open('file')}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+# Classification (U)
+
+"""Program:  plan_search.py
+
+    Description:  Unit testing of plan_search in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/plan_search.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.enclave = "ENCLAVE"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_docids
+        test_archive_files
+        test_archive_month_runs
+        test_active_files
+        test_prune_files
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.docid = "09109uosdhf"
+        self.docid2 = "09109abcdef"
+        self.cmd_list = [
+            {"docid": self.docid, "command": "EUCOM", "pubdate": "20200102",
+             "pulldate": "20200215"},
+            {"docid": self.docid2, "command": "EUCOM", "pubdate": "20200202",
+             "pulldate": "20200315"}]
+        self.log_files = ["/path/2020/01/access.log1.server1.gz",
+                          "/path/2020/02/access.log1.server1.gz",
+                          "/path/2020/03/access.log1.server1.gz"]
+        self.log_files2 = ["/path/logs/access.log1", "/path/logs/access.log2"]
+        self.file_docids = {
+            "/path/2020/01/access.log1.server1.gz": [self.docid],
+            "/path/2020/02/access.log1.server1.gz": [self.docid, self.docid2],
+            "/path/2020/03/access.log1.server1.gz": [self.docid2]}
+        self.file_docids2 = {
+            "/path/logs/access.log1": [self.docid, self.docid2],
+            "/path/logs/access.log2": [self.docid, self.docid2]}
+
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_no_docids(self, mock_log, mock_files):
+
+        """Function:  test_no_docids
+
+        Description:  Test with no docids for the command.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.plan_search(self.args, self.cfg, [], mock_log), {})
+        mock_files.assert_not_called()
+
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_archive_files(self, mock_log, mock_files):
+
+        """Function:  test_archive_files
+
+        Description:  Test with the archive months of the docids listed once.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-a": True}
+        mock_files.return_value = self.log_files
+
+        self.assertEqual(
+            pulled_search.plan_search(
+                self.args, self.cfg, self.cmd_list, mock_log),
+            self.file_docids)
+        mock_files.assert_called_once_with(
+            self.args, self.cfg,
+            {"command": "EUCOM", "pubdate": "20200101",
+             "pulldate": "20200301"}, mock_log)
+
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_archive_month_runs(self, mock_log, mock_files):
+
+        """Function:  test_archive_month_runs
+
+        Description:  Test with a gap between the archive months.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-a": True}
+        self.cmd_list[1]["pubdate"] = "20200502"
+        self.cmd_list[1]["pulldate"] = "20200515"
+        mock_files.side_effect = [
+            self.log_files[0:2], ["/path/2020/05/access.log1.server1.gz"]]
+
+        self.assertEqual(
+            pulled_search.plan_search(
+                self.args, self.cfg, self.cmd_list, mock_log),
+            {"/path/2020/01/access.log1.server1.gz": [self.docid],
+             "/path/2020/02/access.log1.server1.gz": [self.docid],
+             "/path/2020/05/access.log1.server1.gz": [self.docid2]})
+        self.assertEqual(mock_files.call_count, 2)
+
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_active_files(self, mock_log, mock_files):
+
+        """Function:  test_active_files
+
+        Description:  Test with active files listed once for the command.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.log_files2
+
+        self.assertEqual(
+            pulled_search.plan_search(
+                self.args, self.cfg, self.cmd_list, mock_log),
+            self.file_docids2)
+        self.assertEqual(mock_files.call_count, 1)
+
+    @mock.patch("pulled_search.prune_log_files")
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_prune_files(self, mock_log, mock_files, mock_prune):
+
+        """Function:  test_prune_files
+
+        Description:  Test with the log files pruned for each docid.
+
+        Arguments:
+
+        """
+
+        self.cfg.prune_files = True
+        mock_files.return_value = self.log_files2
+        mock_prune.side_effect = [self.log_files2, self.log_files2[1:]]
+
+        self.assertEqual(
+            pulled_search.plan_search(
+                self.args, self.cfg, self.cmd_list, mock_log),
+            {"/path/logs/access.log1": [self.docid],
+             "/path/logs/access.log2": [self.docid, self.docid2]})
+        self.assertEqual(mock_prune.call_count, 2)
+        mock_prune.assert_called_with(
+            self.cfg, self.log_files2, self.cmd_list[1], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
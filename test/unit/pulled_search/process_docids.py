@@ -0,0 +1,488 @@
+# Classification (U)
+
+"""Program:  process_docids.py
+
+    Description:  Unit testing of process_docids in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/process_docids.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.log_type = "access_log"
+        self.log_dir = "/dir_path/log"
+        self.outfile = "/dir/path/outfile"
+        self.command = {"eucom": "intelink"}
+        self.enclave = "ENCLAVE"
+        self.search_backend = "checklog"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_archive_shared_files
+        test_active_single_listing
+        test_multiple_commands
+        test_process_json_failed
+        test_single_docid
+        test_empty_list
+        test_native_backend
+        test_native_default
+        test_worker_pool
+        test_worker_pool_checklog
+        test_watchlist
+        test_mongo_writer
+        test_rmq_publisher
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.args_array = {"-a": True}
+        self.docid = "09109uosdhf"
+        self.docid2 = "09109abcdef"
+        self.docid_dict = {"docid": self.docid, "command": "EUCOM",
+                           "pubdate": "20200102", "pulldate": "20200302"}
+        self.docid_dict2 = {"docid": self.docid2, "command": "intelink",
+                            "pubdate": "20200202", "pulldate": "20200302"}
+        self.docid_dict3 = {"docid": self.docid2, "command": "COMMAND",
+                            "pubdate": "20200202", "pulldate": "20200302"}
+        self.log_files = ["/path/logs/access.log1", "/path/logs/access.log2"]
+        self.log_files2 = ["/path/intelink/2020/01/access.log1.server1.gz",
+                           "/path/intelink/2020/02/access.log1.server1.gz"]
+        self.entries = {self.docid: ["Line1 09109uosdhf"]}
+        self.results = {}
+        self.results2 = {self.docid: "Failed the process_docid process"}
+
+    @mock.patch("pulled_search.process_json", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.rm_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.split_data", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.run_checklog")
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_archive_shared_files(self, mock_log, mock_files, mock_chk):
+
+        """Function:  test_archive_shared_files
+
+        Description:  Test with archive files shared by multiple docids are
+            only searched once.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array
+
+        mock_files.return_value = self.log_files2
+        mock_chk.return_value = "/dir/path/outfile"
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict, self.docid_dict2],
+                mock_log), self.results)
+        self.assertEqual(mock_chk.call_count, 2)
+        mock_chk.assert_called_with(
+            self.cfg, self.log_files2[1], [self.docid, self.docid2])
+
+    @mock.patch("pulled_search.process_json", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.rm_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.split_data", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.run_checklog")
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_active_single_listing(self, mock_log, mock_files, mock_chk):
+
+        """Function:  test_active_single_listing
+
+        Description:  Test with active log files listed once per command.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.log_files
+        mock_chk.return_value = "/dir/path/outfile"
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict, self.docid_dict2],
+                mock_log), self.results)
+        self.assertEqual(mock_files.call_count, 1)
+        self.assertEqual(mock_chk.call_count, 2)
+
+    @mock.patch("pulled_search.process_json", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.rm_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.split_data", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.run_checklog")
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_multiple_commands(self, mock_log, mock_files, mock_chk):
+
+        """Function:  test_multiple_commands
+
+        Description:  Test with docids from multiple commands.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.log_files
+        mock_chk.return_value = "/dir/path/outfile"
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict, self.docid_dict3],
+                mock_log), self.results)
+        self.assertEqual(mock_files.call_count, 2)
+
+    @mock.patch("pulled_search.process_json", mock.Mock(return_value=False))
+    @mock.patch("pulled_search.rm_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.split_data", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.run_checklog")
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_process_json_failed(self, mock_log, mock_files, mock_chk):
+
+        """Function:  test_process_json_failed
+
+        Description:  Test with process_json failing to process.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.log_files
+        mock_chk.return_value = "/dir/path/outfile"
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict], mock_log),
+            self.results2)
+
+    @mock.patch("pulled_search.process_json", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.rm_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.split_data", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.run_checklog")
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_single_docid(self, mock_log, mock_files, mock_chk):
+
+        """Function:  test_single_docid
+
+        Description:  Test with a single docid.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.log_files
+        mock_chk.return_value = "/dir/path/outfile"
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict], mock_log),
+            self.results)
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_empty_list(self, mock_log):
+
+        """Function:  test_empty_list
+
+        Description:  Test with an empty docid list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [], mock_log), self.results)
+
+
+    @mock.patch("pulled_search.process_json", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.merge_entries", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.scan_log_file")
+    @mock.patch("pulled_search.run_checklog")
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_native_backend(self, mock_log, mock_files, mock_chk, mock_scan):
+
+        """Function:  test_native_backend
+
+        Description:  Test with the native search backend.
+
+        Arguments:
+
+        """
+
+        self.cfg.search_backend = "native"
+
+        mock_files.return_value = self.log_files
+        mock_scan.return_value = self.entries
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict], mock_log),
+            self.results)
+        self.assertEqual(mock_scan.call_count, 2)
+        mock_chk.assert_not_called()
+
+    @mock.patch("pulled_search.process_json", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.merge_entries", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.scan_log_file")
+    @mock.patch("pulled_search.get_log_files")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_native_default(self, mock_log, mock_files, mock_scan):
+
+        """Function:  test_native_default
+
+        Description:  Test with the search backend not set in the
+            configuration.
+
+        Arguments:
+
+        """
+
+        del self.cfg.search_backend
+
+        mock_files.return_value = self.log_files
+        mock_scan.return_value = self.entries
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict], mock_log),
+            self.results)
+        self.assertEqual(mock_scan.call_count, 2)
+
+    @mock.patch("pulled_search.search_command", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.concurrent.futures.ProcessPoolExecutor")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_worker_pool(self, mock_log, mock_pool):
+
+        """Function:  test_worker_pool
+
+        Description:  Test with -j option starting one worker pool for all
+            of the docids.
+
+        Arguments:
+
+        """
+
+        self.cfg.search_backend = "native"
+        self.args.args_array = {"-j": "4"}
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict, self.docid_dict3],
+                mock_log), self.results)
+        mock_pool.assert_called_once_with(max_workers=4)
+        mock_pool.return_value.shutdown.assert_called_once_with()
+
+    @mock.patch("pulled_search.search_command", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.concurrent.futures.ProcessPoolExecutor")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_worker_pool_checklog(self, mock_log, mock_pool):
+
+        """Function:  test_worker_pool_checklog
+
+        Description:  Test with -j option and the check_log backend.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "4"}
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict], mock_log),
+            self.results)
+        mock_pool.assert_not_called()
+
+    @mock.patch("pulled_search.update_watchlist")
+    @mock.patch("pulled_search.search_command")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_watchlist(self, mock_log, mock_search, mock_watch):
+
+        """Function:  test_watchlist
+
+        Description:  Test with watch_file set, the processed docids are
+            added to the watchlist.
+
+        Arguments:
+
+        """
+
+        self.cfg.watch_file = "/dir/path/watchlist"
+        mock_search.side_effect = [{}, self.results2]
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict3, self.docid_dict],
+                mock_log), self.results2)
+        mock_watch.assert_called_once_with(
+            self.cfg, mock_log, [self.docid_dict3])
+
+    @mock.patch("pulled_search.search_command")
+    @mock.patch("pulled_search.create_writer")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_mongo_writer(self, mock_log, mock_writer, mock_search):
+
+        """Function:  test_mongo_writer
+
+        Description:  Test with the -i option, one Mongo writer is used for
+            all of the commands.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-i": True}
+        mock_search.return_value = {}
+
+        pulled_search.process_docids(
+            self.args, self.cfg, [self.docid_dict, self.docid_dict3],
+            mock_log)
+
+        self.assertEqual(mock_writer.call_count, 1)
+        self.assertEqual(
+            mock_search.call_args[1]["writer"], mock_writer.return_value)
+        mock_writer.return_value.close.assert_called_once_with()
+
+    @mock.patch("pulled_search.search_command")
+    @mock.patch("pulled_search.create_publisher")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_rmq_publisher(self, mock_log, mock_publisher, mock_search):
+
+        """Function:  test_rmq_publisher
+
+        Description:  Test with the -r option, one RabbitMQ publisher is used
+            for all of the commands and its failures are returned.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-r": True}
+        mock_search.return_value = {}
+        mock_publisher.return_value.published = {
+            self.docid_dict["docid"]: True, self.docid_dict3["docid"]: False}
+
+        self.assertEqual(
+            pulled_search.process_docids(
+                self.args, self.cfg, [self.docid_dict, self.docid_dict3],
+                mock_log),
+            {self.docid_dict3["docid"]: "Failed the process_docid process"})
+        self.assertEqual(
+            mock_search.call_args[1]["publisher"],
+            mock_publisher.return_value)
+        mock_publisher.return_value.close.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@
 import sys
 import os
 import unittest
+import datetime
 import mock
 
 # Local
@@ -140,6 +141,7 @@ class UnitTest(unittest.TestCase):
         test_search_dir_multiple
         test_search_dir_single
         test_arg_m_option
+        test_watermark
 
     """
 
@@ -521,6 +523,43 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             pulled_search.process_files(self.args, self.cfg, mock_log))
 
+    @mock.patch("pulled_search.write_json_file")
+    @mock.patch("pulled_search.load_json_file")
+    @mock.patch("pulled_search.scan_doc_dir")
+    @mock.patch("pulled_search.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.recall_search")
+    @mock.patch("pulled_search.remove_processed")
+    @mock.patch("pulled_search.gen_libs.filename_search")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_watermark(self, mock_log, mock_search, mock_remove,
+                       mock_recall, mock_scan, mock_load, mock_write):
+
+        """Function:  test_watermark
+
+        Description:  Test with watermark_file set.
+
+        Arguments:
+
+        """
+
+        self.cfg.watermark_file = "/dir/path/watermarks.json"
+        mock_load.return_value = {}
+        mock_scan.return_value = self.docid_files
+        mock_remove.return_value = self.file_dict3
+        mock_recall.return_value = self.failed_dict
+        now = datetime.datetime.now()
+        prev_month = now.replace(day=1) - datetime.timedelta(days=1)
+
+        self.assertFalse(
+            pulled_search.process_files(self.args, self.cfg, mock_log))
+        mock_search.assert_not_called()
+        self.assertEqual(
+            [call[0][1] for call in mock_scan.call_args_list],
+            [os.path.join("/dir_path/doc_dir", prev_month.strftime("%Y/%m")),
+             os.path.join("/dir_path/doc_dir", now.strftime("%Y/%m"))])
+        mock_write.assert_called_once_with(
+            "/dir/path/watermarks.json", mock_load.return_value)
+
 
 if __name__ == "__main__":
     unittest.main()
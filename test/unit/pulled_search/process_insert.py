@@ -145,6 +145,7 @@ class UnitTest(unittest.TestCase):
         test_json_success
         test_json_failure
         test_with_encoded_data
+        test_json_part
 
     """
 
@@ -245,6 +246,28 @@ class UnitTest(unittest.TestCase):
             pulled_search.process_insert(
                 self.args, self.cfg, self.in_file, self.logger))
 
+    @mock.patch("pulled_search.read_insert_file")
+    @mock.patch("pulled_search.parse_data")
+    def test_json_part(self, mock_parse, mock_read):
+
+        """Function:  test_json_part
+
+        Description:  Test with a part of a split JSON log document.
+
+        Arguments:
+
+        """
+
+        log_json = {"docid": "09109uosdhf", "servers": {"server": ["line"]},
+                    "part": 2, "total": 3, "run_id": "runid"}
+        mock_read.return_value = log_json
+        mock_parse.return_value = True
+
+        self.assertTrue(
+            pulled_search.process_insert(
+                self.args, self.cfg, self.in_file, self.logger))
+        self.assertEqual(mock_parse.call_args[0][3], log_json)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -253,6 +253,10 @@ class UnitTest(unittest.TestCase):
         test_rabbitmq_pass
         test_rabbitmq_failed
         test_rabbitmq_failed_mail
+        test_rabbitmq_publisher
+        test_rabbitmq_chunked
+        test_email_chunked
+        test_mongo_mail_sink
 
     """
 
@@ -512,6 +516,104 @@ class UnitTest(unittest.TestCase):
             pulled_search.process_json(
                 self.args, self.cfg, mock_log, self.log_json))
 
+    @mock.patch("pulled_search.rabbitmq_class.pub_2_rmq")
+    @mock.patch("pulled_search.filter_data")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_rabbitmq_publisher(self, mock_log, mock_filter, mock_pub):
+
+        """Function:  test_rabbitmq_publisher
+
+        Description:  Test with the log entries added to a RabbitMQ
+            publisher.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array4
+        publisher = mock.MagicMock()
+        publisher.add.return_value = True
+        mock_filter.return_value = self.log_json2
+
+        self.assertTrue(
+            pulled_search.process_json(
+                self.args, self.cfg, mock_log, self.log_json,
+                publisher=publisher))
+        publisher.add.assert_called_once_with(self.log_json2)
+        mock_pub.assert_not_called()
+
+    @mock.patch("pulled_search.publish_json")
+    @mock.patch("pulled_search.filter_data")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_rabbitmq_chunked(self, mock_log, mock_filter, mock_pub):
+
+        """Function:  test_rabbitmq_chunked
+
+        Description:  Test with the JSON document published in parts.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array4
+        self.cfg.chunk_size = 10
+        mock_filter.return_value = self.log_json2
+        mock_pub.side_effect = [True, False]
+
+        self.assertFalse(
+            pulled_search.process_json(
+                self.args, self.cfg, mock_log, self.log_json))
+        self.assertEqual(
+            [call[0][3]["servers"] for call in mock_pub.call_args_list],
+            [{"server_name": ["line1"]}, {"server_name": ["line3"]}])
+
+    @mock.patch("pulled_search.email_json")
+    @mock.patch("pulled_search.filter_data")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_email_chunked(self, mock_log, mock_filter, mock_email):
+
+        """Function:  test_email_chunked
+
+        Description:  Test with the JSON document emailed in parts.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array3
+        self.cfg.chunk_size = 10
+        mock_filter.return_value = self.log_json2
+
+        self.assertTrue(
+            pulled_search.process_json(
+                self.args, self.cfg, mock_log, self.log_json))
+        self.assertEqual(mock_email.call_count, 2)
+
+    @mock.patch("pulled_search.parse_data", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.filter_data")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_mongo_mail_sink(self, mock_log, mock_filter):
+
+        """Function:  test_mongo_mail_sink
+
+        Description:  Test with the mail sink passed on to the Mongo
+            insertion.
+
+        Arguments:
+
+        """
+
+        mail_sink = mock.MagicMock()
+        self.args.args_array = self.args_array2
+        mock_filter.return_value = self.log_json2
+
+        self.assertTrue(
+            pulled_search.process_json(
+                self.args, self.cfg2, mock_log, self.log_json,
+                mail_sink=mail_sink))
+        self.assertEqual(
+            pulled_search.parse_data.call_args[1]["mail_sink"], mail_sink)
+
 
 if __name__ == "__main__":
     unittest.main()
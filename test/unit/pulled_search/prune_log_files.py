@@ -0,0 +1,221 @@
+# Classification (U)
+
+"""Program:  prune_log_files.py
+
+    Description:  Unit testing of prune_log_files in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/prune_log_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+import datetime
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.file_date_regex = r"-(\d{8})\."
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_date_stamps
+        test_date_days
+        test_bad_date_stamp
+        test_mtime
+        test_missing_file
+        test_mtime_cached
+        test_no_window
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.docid_dict = {"docid": "09109uosdhf", "command": "eucom",
+                           "pubdate": "20230228", "pulldate": "20230302"}
+        self.log_files = [
+            "/path/access_log-20230225.server1.gz",
+            "/path/access_log-20230227.server1.gz",
+            "/path/access_log-20230301.server1.gz",
+            "/path/access_log-20230303.server1.gz",
+            "/path/access_log-20230304.server1.gz"]
+        self.mtime = datetime.datetime(2023, 2, 26).timestamp()
+        self.mtime2 = datetime.datetime(2023, 2, 27, 12).timestamp()
+
+    def test_date_stamps(self):
+
+        """Function:  test_date_stamps
+
+        Description:  Test with the date stamps in the file names.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.prune_log_files(
+                self.cfg, self.log_files, self.docid_dict, {}),
+            self.log_files[1:4])
+
+    def test_date_days(self):
+
+        """Function:  test_date_days
+
+        Description:  Test with log files holding more than one day.
+
+        Arguments:
+
+        """
+
+        self.cfg.file_date_days = 3
+
+        self.assertEqual(
+            pulled_search.prune_log_files(
+                self.cfg, self.log_files, self.docid_dict, {}),
+            self.log_files[0:4])
+
+    @mock.patch("pulled_search.os.path.getmtime")
+    def test_bad_date_stamp(self, mock_mtime):
+
+        """Function:  test_bad_date_stamp
+
+        Description:  Test with a date stamp which is not a date.
+
+        Arguments:
+
+        """
+
+        mock_mtime.return_value = self.mtime
+
+        self.assertEqual(
+            pulled_search.prune_log_files(
+                self.cfg, ["/path/access_log-20231399.server1"],
+                self.docid_dict, {}), [])
+
+    @mock.patch("pulled_search.os.path.getmtime")
+    def test_mtime(self, mock_mtime):
+
+        """Function:  test_mtime
+
+        Description:  Test with no date stamps, modification time used.
+
+        Arguments:
+
+        """
+
+        self.cfg.file_date_regex = None
+        mock_mtime.side_effect = [self.mtime, self.mtime2]
+
+        self.assertEqual(
+            pulled_search.prune_log_files(
+                self.cfg, ["/path/access_log1", "/path/access_log2"],
+                self.docid_dict, {}), ["/path/access_log2"])
+
+    @mock.patch("pulled_search.os.path.getmtime")
+    def test_missing_file(self, mock_mtime):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a file which cannot be checked, kept.
+
+        Arguments:
+
+        """
+
+        self.cfg.file_date_regex = None
+        mock_mtime.side_effect = OSError("No such file")
+
+        self.assertEqual(
+            pulled_search.prune_log_files(
+                self.cfg, ["/path/access_log1"], self.docid_dict, {}),
+            ["/path/access_log1"])
+
+    @mock.patch("pulled_search.os.path.getmtime")
+    def test_mtime_cached(self, mock_mtime):
+
+        """Function:  test_mtime_cached
+
+        Description:  Test with the modification times already known.
+
+        Arguments:
+
+        """
+
+        mtimes = {"/path/access_log1": self.mtime2}
+
+        self.assertEqual(
+            pulled_search.prune_log_files(
+                self.cfg, ["/path/access_log1"], self.docid_dict, mtimes),
+            ["/path/access_log1"])
+        mock_mtime.assert_not_called()
+
+    def test_no_window(self):
+
+        """Function:  test_no_window
+
+        Description:  Test with no valid dates, no files pruned.
+
+        Arguments:
+
+        """
+
+        self.docid_dict["pubdate"] = "Unknown"
+
+        self.assertEqual(
+            pulled_search.prune_log_files(
+                self.cfg, self.log_files, self.docid_dict, {}),
+            self.log_files)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  prune_watchlist.py
+
+    Description:  Unit testing of prune_watchlist in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/prune_watchlist.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.watch_file = "/dir/path/watchlist"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_watched
+        test_no_log_files
+        test_log_files_gone
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.docid_dict = {"docid": "09109uosdhf", "command": "EUCOM",
+                           "pubdate": "20200102"}
+        self.docid_dict2 = {"docid": "09109abcdef", "command": "USACIC",
+                            "pubdate": "20200202"}
+        self.watchlist = {"09109uosdhf": self.docid_dict,
+                          "09109abcdef": self.docid_dict2}
+        self.file_docids = {"/path/intelink_access_log": ["09109uosdhf"],
+                            "/path/usacic_access_log": ["09109abcdef"]}
+
+    @mock.patch("pulled_search.write_json_file")
+    @mock.patch("pulled_search.load_json_file")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_all_watched(self, mock_log, mock_load, mock_write):
+
+        """Function:  test_all_watched
+
+        Description:  Test with log files for all of the docids.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.watchlist
+
+        pulled_search.prune_watchlist(
+            self.cfg, mock_log, self.file_docids, set())
+
+        mock_write.assert_not_called()
+
+    @mock.patch("pulled_search.write_json_file")
+    @mock.patch("pulled_search.load_json_file")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_no_log_files(self, mock_log, mock_load, mock_write):
+
+        """Function:  test_no_log_files
+
+        Description:  Test with a docid which has no log files.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.watchlist
+        del self.file_docids["/path/usacic_access_log"]
+
+        pulled_search.prune_watchlist(
+            self.cfg, mock_log, self.file_docids, set())
+
+        mock_write.assert_called_once_with(
+            "/dir/path/watchlist", {"09109uosdhf": self.docid_dict})
+
+    @mock.patch("pulled_search.write_json_file")
+    @mock.patch("pulled_search.load_json_file")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_log_files_gone(self, mock_log, mock_load, mock_write):
+
+        """Function:  test_log_files_gone
+
+        Description:  Test with the log files of a docid no longer existing.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.watchlist
+
+        pulled_search.prune_watchlist(
+            self.cfg, mock_log, self.file_docids, {"/path/usacic_access_log"})
+
+        mock_write.assert_called_once_with(
+            "/dir/path/watchlist", {"09109uosdhf": self.docid_dict})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+# Classification (U)
+
+"""Program:  publish_json.py
+
+    Description:  Unit testing of publish_json in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/publish_json.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.to_addr = "name@domain"
+        self.subj = "Email_Subject"
+        self.error_dir = "/dir/path/error_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_published
+        test_failed
+        test_failed_part
+        test_failed_mail
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.log_json = {"docid": "09109uosdhf",
+                         "servers": {"server_name": ["line1"]}}
+        self.fname = "/dir/path/error_dir/NonPublished.09109uosdhf."
+
+    @mock.patch("pulled_search.gen_libs.write_file")
+    @mock.patch("pulled_search.rabbitmq_class.pub_2_rmq")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_published(self, mock_log, mock_pub, mock_write):
+
+        """Function:  test_published
+
+        Description:  Test with the document published.
+
+        Arguments:
+
+        """
+
+        mock_pub.return_value = (True, None)
+
+        self.assertTrue(
+            pulled_search.publish_json(
+                self.args, self.cfg, mock_log, self.log_json))
+        mock_pub.assert_called_once_with(self.cfg, json.dumps(self.log_json))
+        mock_write.assert_not_called()
+
+    @mock.patch("pulled_search.gen_libs.write_file")
+    @mock.patch("pulled_search.rabbitmq_class.pub_2_rmq")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_failed(self, mock_log, mock_pub, mock_write):
+
+        """Function:  test_failed
+
+        Description:  Test with the document not published.
+
+        Arguments:
+
+        """
+
+        mock_pub.return_value = (False, "Error Message")
+
+        self.assertFalse(
+            pulled_search.publish_json(
+                self.args, self.cfg, mock_log, self.log_json))
+        self.assertTrue(mock_write.call_args[0][0].startswith(self.fname))
+
+    @mock.patch("pulled_search.gen_libs.write_file")
+    @mock.patch("pulled_search.rabbitmq_class.pub_2_rmq")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_failed_part(self, mock_log, mock_pub, mock_write):
+
+        """Function:  test_failed_part
+
+        Description:  Test with a part of a document not published.
+
+        Arguments:
+
+        """
+
+        mock_pub.return_value = (False, "Error Message")
+        self.log_json["part"] = 3
+
+        self.assertFalse(
+            pulled_search.publish_json(
+                self.args, self.cfg, mock_log, self.log_json))
+        self.assertTrue(
+            mock_write.call_args[0][0].startswith(
+                "/dir/path/error_dir/NonPublished.09109uosdhf.part3."))
+
+    @mock.patch("pulled_search.gen_class.setup_mail")
+    @mock.patch("pulled_search.gen_libs.write_file", mock.Mock())
+    @mock.patch("pulled_search.rabbitmq_class.pub_2_rmq")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_failed_mail(self, mock_log, mock_pub, mock_mail):
+
+        """Function:  test_failed_mail
+
+        Description:  Test with the publication failure emailed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-t": "name@domain"}
+        mock_pub.return_value = (False, "Error Message")
+
+        self.assertFalse(
+            pulled_search.publish_json(
+                self.args, self.cfg, mock_log, self.log_json))
+        mock_mail.return_value.send_mail.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,301 @@
+# Classification (U)
+
+"""Program:  read_insert_file.py
+
+    Description:  Unit testing of read_insert_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/read_insert_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import base64
+import io
+import gzip
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def text_loads(data):
+
+    """Function:  text_loads
+
+    Description:  Function stub holder for simplejson.loads, which only
+        accepts text.
+
+    Arguments:
+
+    """
+
+    if not isinstance(data, str):
+        raise TypeError("Input string must be text, not bytes")
+
+    return json.JSONDecoder().decode(data)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_encoded_data
+        test_json_data
+        test_text_data
+        test_bad_literal
+        test_encoded_json
+        test_bad_unicode
+        test_compressed_json
+        test_bad_compressed
+        test_json_from_file
+        test_decoded_text
+        test_text_only_parser
+        test_text_only_compressed
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        base = os.path.join(os.getcwd(), "test/unit/pulled_search")
+        self.in_file = os.path.join(base, "testfiles/test_docid.json")
+        self.in_file2 = os.path.join(base, "testfiles/test_docid2.json")
+        self.in_file3 = os.path.join(base, "testfiles/test_docid3.json")
+        self.tmp_file = os.path.join(base, "tmp/read_insert_file.json")
+        self.results = {
+            "command": "eucom", "docid": "90872590827590872345",
+            "network": "jwics", "pubDate": "20230501", "asOf": "20230501"}
+        self.results3 = {"docid": "90349823749", "command": "eucom"}
+
+    def test_encoded_data(self):
+
+        """Function:  test_encoded_data
+
+        Description:  Test with base64 encoded data.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.read_insert_file(self.in_file), self.results)
+
+    def test_json_data(self):
+
+        """Function:  test_json_data
+
+        Description:  Test with JSON data.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.read_insert_file(self.in_file3), self.results3)
+
+    def test_text_data(self):
+
+        """Function:  test_text_data
+
+        Description:  Test with data that is not JSON.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(pulled_search.read_insert_file(self.in_file2))
+
+    def test_bad_literal(self):
+
+        """Function:  test_bad_literal
+
+        Description:  Test with encoded data that is not a literal.
+
+        Arguments:
+
+        """
+
+        with open(self.tmp_file, mode="wb") as f_hdr:
+            f_hdr.write(base64.b64encode(b"{'docid': open('file')}"))
+
+        self.assertIsNone(pulled_search.read_insert_file(self.tmp_file))
+
+    def test_encoded_json(self):
+
+        """Function:  test_encoded_json
+
+        Description:  Test with base64 encoded JSON data.
+
+        Arguments:
+
+        """
+
+        with open(self.tmp_file, mode="wb") as f_hdr:
+            f_hdr.write(base64.encodebytes(json.dumps(self.results).encode()))
+
+        self.assertEqual(
+            pulled_search.read_insert_file(self.tmp_file), self.results)
+
+    def test_bad_unicode(self):
+
+        """Function:  test_bad_unicode
+
+        Description:  Test with encoded data that is not UTF-8.
+
+        Arguments:
+
+        """
+
+        with open(self.tmp_file, mode="wb") as f_hdr:
+            f_hdr.write(base64.b64encode(b"{'docid': '\xff\xfe'}"))
+
+        self.assertIsNone(pulled_search.read_insert_file(self.tmp_file))
+
+    def test_compressed_json(self):
+
+        """Function:  test_compressed_json
+
+        Description:  Test with a compressed JSON payload.
+
+        Arguments:
+
+        """
+
+        with open(self.tmp_file, mode="wb") as f_hdr:
+            f_hdr.write(b"PSGZ1:" + base64.encodebytes(
+                gzip.compress(json.dumps(self.results).encode())))
+
+        self.assertEqual(
+            pulled_search.read_insert_file(self.tmp_file), self.results)
+
+    def test_bad_compressed(self):
+
+        """Function:  test_bad_compressed
+
+        Description:  Test with a compressed payload that is not gzip data.
+
+        Arguments:
+
+        """
+
+        with open(self.tmp_file, mode="wb") as f_hdr:
+            f_hdr.write(b"PSGZ1:" + base64.encodebytes(
+                json.dumps(self.results).encode()))
+
+        self.assertIsNone(pulled_search.read_insert_file(self.tmp_file))
+
+    @mock.patch("pulled_search.json.load", wraps=json.load)
+    def test_json_from_file(self, mock_load):
+
+        """Function:  test_json_from_file
+
+        Description:  Test with plain JSON data, the data is parsed straight
+            from a text mode file handler.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.read_insert_file(self.in_file3), self.results3)
+        self.assertIsInstance(mock_load.call_args[0][0], io.TextIOWrapper)
+
+    @mock.patch("pulled_search.json.loads", wraps=json.loads)
+    def test_decoded_text(self, mock_loads):
+
+        """Function:  test_decoded_text
+
+        Description:  Test with base64 encoded JSON data, the decoded data
+            is passed to the parser as text.
+
+        Arguments:
+
+        """
+
+        with open(self.tmp_file, mode="wb") as f_hdr:
+            f_hdr.write(base64.encodebytes(json.dumps(self.results).encode()))
+
+        self.assertEqual(
+            pulled_search.read_insert_file(self.tmp_file), self.results)
+        self.assertIsInstance(mock_loads.call_args[0][0], str)
+
+    @mock.patch("pulled_search.json.loads", mock.Mock(side_effect=text_loads))
+    def test_text_only_parser(self):
+
+        """Function:  test_text_only_parser
+
+        Description:  Test with base64 encoded JSON and literal data parsed
+            by a JSON parser which only accepts text.
+
+        Arguments:
+
+        """
+
+        with open(self.tmp_file, mode="wb") as f_hdr:
+            f_hdr.write(base64.encodebytes(json.dumps(self.results).encode()))
+
+        self.assertEqual(
+            pulled_search.read_insert_file(self.tmp_file), self.results)
+        self.assertEqual(
+            pulled_search.read_insert_file(self.in_file), self.results)
+
+    @mock.patch("pulled_search.json.loads", mock.Mock(side_effect=text_loads))
+    def test_text_only_compressed(self):
+
+        """Function:  test_text_only_compressed
+
+        Description:  Test with a compressed JSON payload parsed by a JSON
+            parser which only accepts text.
+
+        Arguments:
+
+        """
+
+        with open(self.tmp_file, mode="wb") as f_hdr:
+            f_hdr.write(b"PSGZ1:" + base64.encodebytes(
+                gzip.compress(json.dumps(self.results).encode())))
+
+        self.assertEqual(
+            pulled_search.read_insert_file(self.tmp_file), self.results)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.tmp_file):
+            os.remove(self.tmp_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
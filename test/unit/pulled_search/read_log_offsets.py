@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  read_log_offsets.py
+
+    Description:  Unit testing of read_log_offsets in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/read_log_offsets.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import re
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_offsets
+        test_gzip_file
+        test_plain_file
+        test_token_match
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.basepath = "test/unit/pulled_search/testfiles"
+        self.fname = os.path.join(
+            self.basepath, "test_access_log.servername")
+        self.fname2 = os.path.join(
+            self.basepath, "test_access_log.servername.gz")
+        self.docid = "09109uosdhf"
+        self.docid2 = "09109abcdef"
+        self.offsets = [25, 70]
+        self.results = {
+            self.docid: ["line 4 docid=09109uosdhf docid=09109abcdef"],
+            self.docid2: ["line 2 docid=09109abcdef",
+                          "line 4 docid=09109uosdhf docid=09109abcdef"]}
+
+    def test_no_offsets(self):
+
+        """Function:  test_no_offsets
+
+        Description:  Test with no offsets, the file is not read.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.read_log_offsets(
+                "/no/such/file", [self.docid], []), {})
+
+    def test_gzip_file(self):
+
+        """Function:  test_gzip_file
+
+        Description:  Test with a gzip compressed file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.read_log_offsets(
+                self.fname2, [self.docid, self.docid2], self.offsets),
+            self.results)
+
+    def test_plain_file(self):
+
+        """Function:  test_plain_file
+
+        Description:  Test with a plain file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.read_log_offsets(
+                self.fname, [self.docid, self.docid2], self.offsets),
+            self.results)
+
+    def test_token_match(self):
+
+        """Function:  test_token_match
+
+        Description:  Test with the docids matched against the docid tokens.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.read_log_offsets(
+                self.fname2, ["09109uos", self.docid2], self.offsets,
+                re.compile("docid=([0-9A-Za-z]+)")),
+            {self.docid2: self.results[self.docid2]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  read_offset_lines.py
+
+    Description:  Unit testing of read_offset_lines in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/read_offset_lines.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_seek
+        test_stream
+        test_stream_stops
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = b"line 1\nline 2\nline 3\nline 4\n"
+        self.offsets = [7, 21]
+        self.results = [b"line 2\n", b"line 4\n"]
+
+    def test_seek(self):
+
+        """Function:  test_seek
+
+        Description:  Test with the lines read by seeking to the offsets.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(pulled_search.read_offset_lines(
+                io.BytesIO(self.data), self.offsets)), self.results)
+
+    def test_stream(self):
+
+        """Function:  test_stream
+
+        Description:  Test with the lines read by reading through the file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(pulled_search.read_offset_lines(
+                io.BytesIO(self.data), self.offsets, stream=True)),
+            self.results)
+
+    def test_stream_stops(self):
+
+        """Function:  test_stream_stops
+
+        Description:  Test with reading stopped after the last offset.
+
+        Arguments:
+
+        """
+
+        fhdr = io.BytesIO(self.data)
+
+        self.assertEqual(
+            list(pulled_search.read_offset_lines(fhdr, [7], stream=True)),
+            [b"line 2\n"])
+        self.assertEqual(fhdr.readline(), b"line 3\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,7 @@
 # Standard
 import sys
 import os
+import json
 import unittest
 import mock
 
@@ -75,6 +76,7 @@ class CfgTest():                                        # pylint:disable=R0903
 
         self.doc_dir = ["/dir_path/doc_dir"]
         self.pattern = "JAC.pull.subtype.*.SECURITY RECALL"
+        self.recall_cache = None
 
 
 class UnitTest(unittest.TestCase):
@@ -94,6 +96,9 @@ class UnitTest(unittest.TestCase):
         test_multiple_file_dict
         test_single_file_dict
         test_empty_file_dict
+        test_recall_cache
+        test_recall_cache_hit
+        tearDown
 
     """
 
@@ -130,8 +135,9 @@ class UnitTest(unittest.TestCase):
         self.results3 = {self.docid: "Failed the process_docid process"}
         self.docid_results = {}
         self.docid_results2 = {self.docid: "Failed the process_docid process"}
+        self.cache_file = "test/unit/pulled_search/tmp/recall_cache.json"
 
-    @mock.patch("pulled_search.search_docid")
+    @mock.patch("pulled_search.process_docids")
     @mock.patch("pulled_search.gen_class.Logger")
     def test_process_docid_passed(self, mock_log, mock_docid):
 
@@ -149,7 +155,7 @@ class UnitTest(unittest.TestCase):
             pulled_search.recall_search(
                 self.args, self.cfg, mock_log, self.file_dict6), self.results)
 
-    @mock.patch("pulled_search.search_docid")
+    @mock.patch("pulled_search.process_docids")
     @mock.patch("pulled_search.gen_class.Logger")
     def test_process_docid_failed(self, mock_log, mock_docid):
 
@@ -167,7 +173,7 @@ class UnitTest(unittest.TestCase):
             pulled_search.recall_search(
                 self.args, self.cfg, mock_log, self.file_dict6), self.results3)
 
-    @mock.patch("pulled_search.search_docid")
+    @mock.patch("pulled_search.process_docids")
     @mock.patch("pulled_search.gen_class.Logger")
     def test_pattern_found(self, mock_log, mock_docid):
 
@@ -275,6 +281,77 @@ class UnitTest(unittest.TestCase):
             pulled_search.recall_search(
                 self.args, self.cfg, mock_log, self.file_dict), self.results)
 
+    @mock.patch("pulled_search.process_docids")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_recall_cache(self, mock_log, mock_docid):
+
+        """Function:  test_recall_cache
+
+        Description:  Test with the recall verdicts written to the cache.
+
+        Arguments:
+
+        """
+
+        self.cfg.recall_cache = self.cache_file
+        mock_docid.return_value = self.docid_results
+
+        self.assertEqual(
+            pulled_search.recall_search(
+                self.args, self.cfg, mock_log, self.file_dict3), self.results)
+
+        with open(self.cache_file, mode="r", encoding="UTF-8") as fhdr:
+            verdicts = json.load(fhdr)
+
+        self.assertEqual(
+            {fname: verdict[2] for fname, verdict in verdicts.items()},
+            {self.fname2: False, self.fname4: False})
+
+    @mock.patch("pulled_search.is_recall")
+    @mock.patch("pulled_search.process_docids")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_recall_cache_hit(self, mock_log, mock_docid, mock_recall):
+
+        """Function:  test_recall_cache_hit
+
+        Description:  Test with the recall verdict taken from the cache and
+            the stale verdicts dropped.
+
+        Arguments:
+
+        """
+
+        stat = os.stat(self.fname3)
+        self.cfg.recall_cache = self.cache_file
+        mock_docid.return_value = self.docid_results
+
+        with open(self.cache_file, mode="w", encoding="UTF-8") as fhdr:
+            json.dump(
+                {self.fname3: [stat.st_mtime, stat.st_size, True, 0],
+                 self.fname0: [0, 0, False, 0]}, fhdr)
+
+        self.assertEqual(
+            pulled_search.recall_search(
+                self.args, self.cfg, mock_log, self.file_dict6), self.results)
+        mock_recall.assert_not_called()
+        mock_docid.assert_called_once()
+
+        with open(self.cache_file, mode="r", encoding="UTF-8") as fhdr:
+            self.assertEqual(list(json.load(fhdr)), [self.fname3])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.cache_file):
+            os.remove(self.cache_file)
+
 
 if __name__ == "__main__":
     unittest.main()
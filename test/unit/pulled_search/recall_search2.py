@@ -127,7 +127,7 @@ class UnitTest(unittest.TestCase):
         self.docid_results = {}
         self.docid_results2 = {docid: "Failed the process_docid process"}
 
-    @mock.patch("pulled_search.search_docid", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.process_docids", mock.Mock(return_value={}))
     @mock.patch("pulled_search.gen_class.Logger")
     def test_process_docid_passed(self, mock_log):
 
@@ -143,7 +143,7 @@ class UnitTest(unittest.TestCase):
             pulled_search.recall_search2(
                 self.args, self.cfg, mock_log, self.docid_dict2), self.results)
 
-    @mock.patch("pulled_search.search_docid")
+    @mock.patch("pulled_search.process_docids")
     @mock.patch("pulled_search.gen_class.Logger")
     def test_process_docid_failed(self, mock_log, mock_docid):
 
@@ -162,7 +162,7 @@ class UnitTest(unittest.TestCase):
                 self.args, self.cfg, mock_log, self.docid_dict2),
             self.results2)
 
-    @mock.patch("pulled_search.search_docid", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.process_docids", mock.Mock(return_value={}))
     @mock.patch("pulled_search.gen_class.Logger")
     def test_multiple_docid_dict(self, mock_log):
 
@@ -178,7 +178,7 @@ class UnitTest(unittest.TestCase):
             pulled_search.recall_search2(
                 self.args, self.cfg, mock_log, self.docid_dict3), self.results)
 
-    @mock.patch("pulled_search.search_docid", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.process_docids", mock.Mock(return_value={}))
     @mock.patch("pulled_search.gen_class.Logger")
     def test_single_docid_dict(self, mock_log):
 
@@ -194,7 +194,7 @@ class UnitTest(unittest.TestCase):
             pulled_search.recall_search2(
                 self.args, self.cfg, mock_log, self.docid_dict2), self.results)
 
-    @mock.patch("pulled_search.search_docid", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.process_docids", mock.Mock(return_value={}))
     @mock.patch("pulled_search.gen_class.Logger")
     def test_empty_docid_dict(self, mock_log):
 
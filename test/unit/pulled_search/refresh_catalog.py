@@ -0,0 +1,188 @@
+# Classification (U)
+
+"""Program:  refresh_catalog.py
+
+    Description:  Unit testing of refresh_catalog in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/refresh_catalog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_dir
+        test_unchanged_dir
+        test_changed_dir
+        test_recent_dir
+        test_missing_dir
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.base_dir = os.path.join(
+            os.getcwd(), "test/unit/pulled_search/tmp/refresh_catalog")
+        self.month_dir = os.path.join(self.base_dir, "intelink/2023/01")
+        os.makedirs(self.month_dir)
+        self.fname = os.path.join(
+            self.month_dir, "intelink-access_log-20230101.server1.gz")
+        self.fname2 = os.path.join(
+            self.month_dir, "intelink-access_log-20230102.server2")
+
+        with open(self.fname, mode="w", encoding="UTF-8") as f_hdr:
+            f_hdr.write("Line1\n")
+
+        os.utime(self.month_dir, (1000, 1000))
+        self.conn = pulled_search.open_catalog(":memory:")
+
+    def test_new_dir(self):
+
+        """Function:  test_new_dir
+
+        Description:  Test with a directory not in the catalog.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            pulled_search.refresh_catalog(
+                self.conn, self.month_dir, "intelink", "2023/01"))
+        self.assertEqual(
+            self.conn.execute(
+                "SELECT path, command, month, server, size, compressed"
+                " FROM files").fetchall(),
+            [(self.fname, "intelink", "2023/01", "server1", 6, 1)])
+
+    def test_unchanged_dir(self):
+
+        """Function:  test_unchanged_dir
+
+        Description:  Test with a directory not changed since last listed.
+
+        Arguments:
+
+        """
+
+        pulled_search.refresh_catalog(
+            self.conn, self.month_dir, "intelink", "2023/01")
+
+        self.assertFalse(
+            pulled_search.refresh_catalog(
+                self.conn, self.month_dir, "intelink", "2023/01"))
+
+    def test_changed_dir(self):
+
+        """Function:  test_changed_dir
+
+        Description:  Test with a file added to the directory.
+
+        Arguments:
+
+        """
+
+        pulled_search.refresh_catalog(
+            self.conn, self.month_dir, "intelink", "2023/01")
+
+        with open(self.fname2, mode="w", encoding="UTF-8") as f_hdr:
+            f_hdr.write("Line1\n")
+
+        os.utime(self.month_dir, (2000, 2000))
+
+        self.assertTrue(
+            pulled_search.refresh_catalog(
+                self.conn, self.month_dir, "intelink", "2023/01"))
+        self.assertEqual(
+            self.conn.execute(
+                "SELECT server, compressed FROM files ORDER BY path")
+            .fetchall(), [("server1", 1), ("server2", 0)])
+
+    def test_recent_dir(self):
+
+        """Function:  test_recent_dir
+
+        Description:  Test with a directory changed within the last seconds.
+
+        Arguments:
+
+        """
+
+        os.utime(self.month_dir)
+        pulled_search.refresh_catalog(
+            self.conn, self.month_dir, "intelink", "2023/01")
+
+        self.assertTrue(
+            pulled_search.refresh_catalog(
+                self.conn, self.month_dir, "intelink", "2023/01"))
+
+    def test_missing_dir(self):
+
+        """Function:  test_missing_dir
+
+        Description:  Test with a directory that does not exist.
+
+        Arguments:
+
+        """
+
+        missing_dir = os.path.join(self.base_dir, "intelink/2023/02")
+
+        self.assertTrue(
+            pulled_search.refresh_catalog(
+                self.conn, missing_dir, "intelink", "2023/02"))
+        self.assertFalse(
+            pulled_search.refresh_catalog(
+                self.conn, missing_dir, "intelink", "2023/02"))
+        self.assertEqual(
+            self.conn.execute("SELECT * FROM files").fetchall(), [])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+        shutil.rmtree(self.base_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -64,6 +64,7 @@ class UnitTest(unittest.TestCase):
         test_processed_docids_dupes
         test_processed_docids_exist
         test_processed_file_none
+        test_sqlite_store
 
     """
 
@@ -141,6 +142,28 @@ class UnitTest(unittest.TestCase):
             pulled_search.remove_processed(
                 self.cfg, mock_log, self.docid_files), self.results)
 
+    @mock.patch("pulled_search.open_processed", mock.Mock())
+    @mock.patch("pulled_search.get_processed")
+    @mock.patch("pulled_search.load_processed")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_sqlite_store(self, mock_log, mock_load, mock_get):
+
+        """Function:  test_sqlite_store
+
+        Description:  Test with the sqlite processed store.
+
+        Arguments:
+
+        """
+
+        self.cfg.processed_store = "sqlite"
+        mock_get.return_value = set(self.processed_file3)
+
+        self.assertEqual(
+            pulled_search.remove_processed(
+                self.cfg, mock_log, self.docid_files), self.results2)
+        mock_load.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
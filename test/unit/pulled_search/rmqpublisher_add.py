@@ -0,0 +1,207 @@
+# Classification (U)
+
+"""Program:  rmqpublisher_add.py
+
+    Description:  Unit testing of RmqPublisher.add in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/rmqpublisher_add.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-r": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.user = "user"
+        self.japd = "japd"
+        self.host = "hostname"
+        self.host_list = []
+        self.port = 5672
+        self.queue = "queuename"
+        self.r_key = "rkeyname"
+        self.exchange_name = "exchange_name"
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.error_dir = "/dir/path/error_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_published
+        test_not_published
+        test_part_not_published
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log):                        # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.publisher = pulled_search.RmqPublisher(
+            self.args, self.cfg, mock_log)
+        self.doc = {"docid": "09109uosdhf", "servers": {}}
+
+    @mock.patch("pulled_search.RmqPublisher.write_failed")
+    @mock.patch("pulled_search.RmqPublisher.publish")
+    def test_published(self, mock_publish, mock_write):
+
+        """Function:  test_published
+
+        Description:  Test with the document published.
+
+        Arguments:
+
+        """
+
+        mock_publish.return_value = True
+
+        self.assertTrue(self.publisher.add(self.doc))
+        self.assertEqual(self.publisher.published, {"09109uosdhf": True})
+        mock_publish.assert_called_once_with(self.doc)
+        mock_write.assert_not_called()
+
+    @mock.patch("pulled_search.RmqPublisher.write_failed")
+    @mock.patch("pulled_search.RmqPublisher.publish")
+    def test_not_published(self, mock_publish, mock_write):
+
+        """Function:  test_not_published
+
+        Description:  Test with the document not published.
+
+        Arguments:
+
+        """
+
+        mock_publish.return_value = False
+
+        self.assertFalse(self.publisher.add(self.doc))
+        self.assertEqual(self.publisher.published, {"09109uosdhf": False})
+        mock_write.assert_called_once_with(self.doc)
+
+    @mock.patch("pulled_search.RmqPublisher.write_failed")
+    @mock.patch("pulled_search.RmqPublisher.publish")
+    def test_part_not_published(self, mock_publish, mock_write):
+
+        """Function:  test_part_not_published
+
+        Description:  Test with one part of a docid not published.
+
+        Arguments:
+
+        """
+
+        mock_publish.side_effect = [False, True]
+
+        self.publisher.add(self.doc)
+
+        self.assertTrue(self.publisher.add(self.doc))
+        self.assertEqual(self.publisher.published, {"09109uosdhf": False})
+        mock_write.assert_called_once_with(self.doc)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+# Classification (U)
+
+"""Program:  rmqpublisher_close.py
+
+    Description:  Unit testing of RmqPublisher.close in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/rmqpublisher_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-r": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.user = "user"
+        self.japd = "japd"
+        self.host = "hostname"
+        self.host_list = []
+        self.port = 5672
+        self.queue = "queuename"
+        self.r_key = "rkeyname"
+        self.exchange_name = "exchange_name"
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.error_dir = "/dir/path/error_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_connected
+        test_failed_no_email
+        test_failed_email
+        test_close
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log):                        # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.publisher = pulled_search.RmqPublisher(
+            self.args, self.cfg, mock_log)
+        self.failed = ["/dir/path/error_dir/NonPublished.09109uosdhf.1",
+                       "/dir/path/error_dir/NonPublished.09109fedcba.2"]
+
+    @mock.patch("pulled_search.send_mail")
+    def test_not_connected(self, mock_send):
+
+        """Function:  test_not_connected
+
+        Description:  Test with no connection to RabbitMQ.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.publisher.close())
+        mock_send.assert_not_called()
+
+    @mock.patch("pulled_search.send_mail")
+    def test_failed_no_email(self, mock_send):
+
+        """Function:  test_failed_no_email
+
+        Description:  Test with failed documents and no email address.
+
+        Arguments:
+
+        """
+
+        self.publisher.failed_files = self.failed
+
+        self.assertFalse(self.publisher.close())
+        mock_send.assert_not_called()
+
+    @mock.patch("pulled_search.gen_class.setup_mail")
+    @mock.patch("pulled_search.send_mail")
+    def test_failed_email(self, mock_send, mock_mail):
+
+        """Function:  test_failed_email
+
+        Description:  Test with one email sent for all of the failed
+            documents.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = "name@domain"
+        self.publisher.failed_files = self.failed
+
+        self.assertFalse(self.publisher.close())
+        self.assertEqual(mock_mail.return_value.add_2_msg.call_count, 3)
+        mock_send.assert_called_once_with(
+            mock_mail.return_value, mail_sink=None)
+
+    @mock.patch("pulled_search.send_mail")
+    def test_close(self, mock_send):
+
+        """Function:  test_close
+
+        Description:  Test with the connection to RabbitMQ closed.
+
+        Arguments:
+
+        """
+
+        rmq = mock.MagicMock()
+        self.publisher.rmq = rmq
+
+        self.assertTrue(self.publisher.close())
+        self.assertIsNone(self.publisher.rmq)
+        rmq.close.assert_called_once_with()
+        mock_send.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+# Classification (U)
+
+"""Program:  rmqpublisher_connect.py
+
+    Description:  Unit testing of RmqPublisher.connect in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/rmqpublisher_connect.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-r": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.user = "user"
+        self.japd = "japd"
+        self.host = "hostname"
+        self.host_list = []
+        self.port = 5672
+        self.queue = "queuename"
+        self.r_key = "rkeyname"
+        self.exchange_name = "exchange_name"
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.error_dir = "/dir/path/error_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_already_connected
+        test_connect_failed
+        test_channel_closed
+        test_connect
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log):                        # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.publisher = pulled_search.RmqPublisher(
+            self.args, self.cfg, mock_log)
+        self.doc = {"docid": "09109uosdhf", "servers": {}}
+        self.doc2 = {"docid": "09109fedcba", "servers": {}}
+
+    @mock.patch("pulled_search.rabbitmq_class.RabbitMQPub")
+    def test_already_connected(self, mock_rmq):
+
+        """Function:  test_already_connected
+
+        Description:  Test with the publisher already connected.
+
+        Arguments:
+
+        """
+
+        self.publisher.rmq = mock.MagicMock()
+
+        self.assertTrue(self.publisher.connect())
+        mock_rmq.assert_not_called()
+
+    @mock.patch("pulled_search.rabbitmq_class.RabbitMQPub")
+    def test_connect_failed(self, mock_rmq):
+
+        """Function:  test_connect_failed
+
+        Description:  Test with the connection to RabbitMQ failing.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value.create_connection.return_value = \
+            (False, "Error Message")
+
+        self.assertFalse(self.publisher.connect())
+        self.assertEqual(
+            self.publisher.err_msg, "Connection failure: Error Message")
+        mock_rmq.return_value.close.assert_called_once_with()
+
+    @mock.patch("pulled_search.rabbitmq_class.RabbitMQPub")
+    def test_channel_closed(self, mock_rmq):
+
+        """Function:  test_channel_closed
+
+        Description:  Test with the RabbitMQ channel not open.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value.create_connection.return_value = (True, None)
+        mock_rmq.return_value.channel.is_open = False
+
+        self.assertFalse(self.publisher.connect())
+        self.assertIsNone(self.publisher.rmq)
+
+    @mock.patch("pulled_search.rabbitmq_class.RabbitMQPub")
+    def test_connect(self, mock_rmq):
+
+        """Function:  test_connect
+
+        Description:  Test with the connection to RabbitMQ made.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value.create_connection.return_value = (True, None)
+        mock_rmq.return_value.channel.is_open = True
+
+        self.assertTrue(self.publisher.connect())
+        self.assertTrue(self.publisher.connect())
+        mock_rmq.assert_called_once()
+        mock_rmq.return_value.channel.confirm_delivery.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
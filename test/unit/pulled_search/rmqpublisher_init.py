@@ -1,11 +1,11 @@
 # Classification (U)
 
-"""Program:  search_docid.py
+"""Program:  rmqpublisher_init.py
 
-    Description:  Unit testing of search_docid in pulled_search.py.
+    Description:  Unit testing of RmqPublisher.__init__ in pulled_search.py.
 
     Usage:
-        test/unit/pulled_search/search_docid.py
+        test/unit/pulled_search/rmqpublisher_init.py
 
     Arguments:
 
@@ -35,6 +35,8 @@ class ArgParser():                                      # pylint:disable=R0903
 
     Methods:
         __init__
+        arg_exist
+        get_val
 
     """
 
@@ -49,7 +51,31 @@ class ArgParser():                                      # pylint:disable=R0903
         """
 
         self.cmdline = None
-        self.args_array = {}
+        self.args_array = {"-r": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
 
 
 class CfgTest():                                        # pylint:disable=R0903
@@ -73,8 +99,19 @@ class CfgTest():                                        # pylint:disable=R0903
 
         """
 
-        self.doc_dir = ["/dir_path/doc_dir"]
-        self.pattern = "JAC.pull.subtype.*.SECURITY RECALL"
+        self.user = "user"
+        self.japd = "japd"
+        self.host = "hostname"
+        self.host_list = []
+        self.port = 5672
+        self.queue = "queuename"
+        self.r_key = "rkeyname"
+        self.exchange_name = "exchange_name"
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.error_dir = "/dir/path/error_dir"
 
 
 class UnitTest(unittest.TestCase):
@@ -85,8 +122,7 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
-        test_process_docid_passed
-        test_process_docid_failed
+        test_init
 
     """
 
@@ -102,44 +138,23 @@ class UnitTest(unittest.TestCase):
 
         self.args = ArgParser()
         self.cfg = CfgTest()
-        self.docid = "090109abcdef"
-        self.results = {}
-        self.results2 = {self.docid: "Failed the process_docid process"}
-        self.docid_dict = {"command": "CMD",
-                           "puddate": "20230102",
-                           "docid": self.docid}
-
-    @mock.patch("pulled_search.process_docid", mock.Mock(return_value=True))
-    @mock.patch("pulled_search.gen_class.Logger")
-    def test_process_docid_passed(self, mock_log):
 
-        """Function:  test_process_docid_passed
-
-        Description:  Test with the process_docid passing.
-
-        Arguments:
-
-        """
-
-        self.assertEqual(
-            pulled_search.search_docid(
-                self.args, self.cfg, self.docid_dict, mock_log), self.results)
-
-    @mock.patch("pulled_search.process_docid", mock.Mock(return_value=False))
     @mock.patch("pulled_search.gen_class.Logger")
-    def test_process_docid_failed(self, mock_log):
+    def test_init(self, mock_log):
 
-        """Function:  test_process_docid_failed
+        """Function:  test_init
 
-        Description:  Test with the process_docid failing.
+        Description:  Test with the publisher initialized.
 
         Arguments:
 
         """
 
+        publisher = pulled_search.RmqPublisher(self.args, self.cfg, mock_log)
+
         self.assertEqual(
-            pulled_search.search_docid(
-                self.args, self.cfg, self.docid_dict, mock_log), self.results2)
+            (publisher.rmq, publisher.published, publisher.failed_files),
+            (None, {}, []))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,225 @@
+# Classification (U)
+
+"""Program:  rmqpublisher_publish.py
+
+    Description:  Unit testing of RmqPublisher.publish in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/rmqpublisher_publish.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-r": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.user = "user"
+        self.japd = "japd"
+        self.host = "hostname"
+        self.host_list = []
+        self.port = 5672
+        self.queue = "queuename"
+        self.r_key = "rkeyname"
+        self.exchange_name = "exchange_name"
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.error_dir = "/dir/path/error_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_connected
+        test_publish_failed
+        test_publish_error
+        test_publish
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log):                        # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.publisher = pulled_search.RmqPublisher(
+            self.args, self.cfg, mock_log)
+        self.doc = {"docid": "09109uosdhf", "servers": {}}
+        self.doc2 = {"docid": "09109fedcba", "servers": {}}
+        self.rmq = mock.MagicMock()
+
+    @mock.patch("pulled_search.RmqPublisher.connect")
+    def test_not_connected(self, mock_connect):
+
+        """Function:  test_not_connected
+
+        Description:  Test with no connection to RabbitMQ.
+
+        Arguments:
+
+        """
+
+        mock_connect.return_value = False
+
+        self.assertFalse(self.publisher.publish(self.doc))
+
+    @mock.patch("pulled_search.RmqPublisher.connect")
+    def test_publish_failed(self, mock_connect):
+
+        """Function:  test_publish_failed
+
+        Description:  Test with the message not published.
+
+        Arguments:
+
+        """
+
+        mock_connect.return_value = True
+        self.rmq.publish_msg.return_value = False
+        self.publisher.rmq = self.rmq
+
+        self.assertFalse(self.publisher.publish(self.doc))
+        self.assertEqual(self.publisher.rmq, self.rmq)
+
+    @mock.patch("pulled_search.RmqPublisher.connect")
+    def test_publish_error(self, mock_connect):
+
+        """Function:  test_publish_error
+
+        Description:  Test with the message not confirmed by the broker.
+
+        Arguments:
+
+        """
+
+        mock_connect.return_value = True
+        self.rmq.publish_msg.side_effect = RuntimeError("Message was nacked")
+        self.publisher.rmq = self.rmq
+
+        self.assertFalse(self.publisher.publish(self.doc))
+        self.assertEqual(self.publisher.err_msg, "Message was nacked")
+        self.assertIsNone(self.publisher.rmq)
+        self.rmq.close.assert_called_once_with()
+
+    @mock.patch("pulled_search.RmqPublisher.connect")
+    def test_publish(self, mock_connect):
+
+        """Function:  test_publish
+
+        Description:  Test with the message published.
+
+        Arguments:
+
+        """
+
+        mock_connect.return_value = True
+        self.rmq.publish_msg.return_value = True
+        self.publisher.rmq = self.rmq
+
+        self.assertTrue(self.publisher.publish(self.doc))
+        self.rmq.publish_msg.assert_called_once_with(json.dumps(self.doc))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+# Classification (U)
+
+"""Program:  rmqpublisher_write_failed.py
+
+    Description:  Unit testing of RmqPublisher.write_failed in
+        pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/rmqpublisher_write_failed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-r": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.user = "user"
+        self.japd = "japd"
+        self.host = "hostname"
+        self.host_list = []
+        self.port = 5672
+        self.queue = "queuename"
+        self.r_key = "rkeyname"
+        self.exchange_name = "exchange_name"
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.error_dir = "/dir/path/error_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_failed_files
+        test_write_failed
+
+    """
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def setUp(self, mock_log):                        # pylint:disable=W0221
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.publisher = pulled_search.RmqPublisher(
+            self.args, self.cfg, mock_log)
+        self.doc = {"docid": "09109uosdhf", "servers": {}}
+        self.doc2 = {"docid": "09109fedcba", "servers": {}}
+
+    @mock.patch("pulled_search.gen_libs.write_file")
+    def test_failed_files(self, mock_write):
+
+        """Function:  test_failed_files
+
+        Description:  Test with the failed files recorded for the email.
+
+        Arguments:
+
+        """
+
+        self.publisher.write_failed(self.doc)
+        self.publisher.write_failed(self.doc2)
+
+        self.assertEqual(mock_write.call_count, 2)
+        self.assertEqual(len(self.publisher.failed_files), 2)
+        self.assertIn(".09109fedcba.", self.publisher.failed_files[1])
+
+    @mock.patch("pulled_search.gen_libs.write_file")
+    def test_write_failed(self, mock_write):
+
+        """Function:  test_write_failed
+
+        Description:  Test with the failed document written to file.
+
+        Arguments:
+
+        """
+
+        self.publisher.write_failed(self.doc)
+
+        fname = mock_write.call_args[0][0]
+
+        self.assertTrue(fname.startswith(
+            "/dir/path/error_dir/NonPublished.09109uosdhf."))
+        mock_write.assert_called_once_with(fname, mode="w", data=self.doc)
+        self.assertEqual(self.publisher.failed_files, [fname])
+
+
+if __name__ == "__main__":
+    unittest.main()
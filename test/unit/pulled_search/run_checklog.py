@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  run_checklog.py
+
+    Description:  Unit testing of run_checklog in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/run_checklog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.outfile = "/dir/path/outfile"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_multiple_docids
+        test_single_docid
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.fname = "/path/logs/access.log1"
+        self.docids = ["09109uosdhf"]
+        self.docids2 = ["09109uosdhf", "09109abcdef"]
+
+    @mock.patch("pulled_search.check_log.run_program",
+                mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_class.ArgParser")
+    def test_multiple_docids(self, mock_arg):
+
+        """Function:  test_multiple_docids
+
+        Description:  Test with multiple docids searched in one pass.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = True
+
+        self.assertTrue(
+            pulled_search.run_checklog(
+                self.cfg, self.fname, self.docids2).startswith(
+                    self.cfg.outfile))
+        self.assertEqual(mock_arg.call_args[0][0][6], self.docids2)
+
+    @mock.patch("pulled_search.check_log.run_program",
+                mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_class.ArgParser")
+    def test_single_docid(self, mock_arg):
+
+        """Function:  test_single_docid
+
+        Description:  Test with a single docid.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = True
+
+        self.assertTrue(
+            pulled_search.run_checklog(
+                self.cfg, self.fname, self.docids).startswith(
+                    self.cfg.outfile))
+
+
+if __name__ == "__main__":
+    unittest.main()
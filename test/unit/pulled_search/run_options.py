@@ -0,0 +1,208 @@
+# Classification (U)
+
+"""Program:  run_options.py
+
+    Description:  Unit testing of run_options in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/run_options.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_args_keys
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-P": True, "-c": "search"}
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mail_queue = False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_mail_queue
+        test_mail_queue
+        test_mail_queue_error
+        test_mail_not_sent
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.func = mock.Mock()
+        self.func_dict = {"-P": self.func, "-I": mock.Mock()}
+
+    @mock.patch("pulled_search.MailSink")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_no_mail_queue(self, mock_log, mock_sink):
+
+        """Function:  test_no_mail_queue
+
+        Description:  Test with no mail queue.
+
+        Arguments:
+
+        """
+
+        pulled_search.run_options(
+            self.args, self.cfg, mock_log, self.func_dict)
+
+        self.func.assert_called_once_with(
+            self.args, self.cfg, mock_log, mail_sink=None)
+        self.func_dict["-I"].assert_not_called()
+        mock_sink.assert_not_called()
+
+    @mock.patch("pulled_search.MailSink")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_mail_queue(self, mock_log, mock_sink):
+
+        """Function:  test_mail_queue
+
+        Description:  Test with the mail queue used during the run and
+            flushed after it.
+
+        Arguments:
+
+        """
+
+        self.cfg.mail_queue = True
+
+        pulled_search.run_options(
+            self.args, self.cfg, mock_log, self.func_dict)
+
+        self.func.assert_called_once_with(
+            self.args, self.cfg, mock_log, mail_sink=mock_sink.return_value)
+        mock_sink.return_value.close.assert_called_once_with()
+
+    @mock.patch("pulled_search.MailSink")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_mail_queue_error(self, mock_log, mock_sink):
+
+        """Function:  test_mail_queue_error
+
+        Description:  Test with the mail queue flushed when the run fails.
+
+        Arguments:
+
+        """
+
+        self.cfg.mail_queue = True
+        self.func.side_effect = KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            pulled_search.run_options(
+                self.args, self.cfg, mock_log, self.func_dict)
+
+        mock_sink.return_value.close.assert_called_once_with()
+
+    @mock.patch("pulled_search.MailSink")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_mail_not_sent(self, mock_log, mock_sink):
+
+        """Function:  test_mail_not_sent
+
+        Description:  Test with emails in the mail queue failing to send.
+
+        Arguments:
+
+        """
+
+        self.cfg.mail_queue = True
+        mock_sink.return_value.close.return_value = False
+
+        pulled_search.run_options(
+            self.args, self.cfg, mock_log, self.func_dict)
+
+        mock_log.log_err.assert_called_once_with(
+            "run_options:  Not all emails were sent.")
+
+
+if __name__ == "__main__":
+    unittest.main()
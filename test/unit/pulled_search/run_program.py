@@ -28,7 +28,7 @@ import version                                  # pylint:disable=E0401,C0413
 __version__ = version.__version__
 
 
-def process_files(args_array, cfg, log):
+def process_files(args_array, cfg, log, **kwargs):
 
     """Function:  process_files
 
@@ -40,7 +40,7 @@ def process_files(args_array, cfg, log):
 
     status = True
 
-    if args_array and cfg and log:
+    if args_array and cfg and log and kwargs:
         status = True
 
     return status
@@ -0,0 +1,231 @@
+# Classification (U)
+
+"""Program:  scan_doc_dir.py
+
+    Description:  Unit testing of scan_doc_dir in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/scan_doc_dir.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import datetime
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.file_regex = "-PULLED-.*.html"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        write_file
+        test_new_dir
+        test_unchanged_dir
+        test_new_file
+        test_changed_file
+        test_recent_dir
+        test_old_watermarks
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.docdir = os.path.join(
+            os.getcwd(), "test/unit/pulled_search/tmp/scan_doc_dir")
+        os.makedirs(self.docdir)
+        self.fname = os.path.join(
+            self.docdir, "CMD-LEV-PULLED-20230102-0000-GEN-090109abcdef.html")
+        self.fname2 = os.path.join(
+            self.docdir, "CMD-LEV-PULLED-20230103-0000-GEN-090109fedcba.html")
+        self.write_file(self.fname)
+        self.write_file(os.path.join(self.docdir, "other.txt"))
+        os.utime(self.docdir, (1000, 1000))
+        self.watermarks = {}
+
+    def write_file(self, fname):
+
+        """Function:  write_file
+
+        Description:  Write a test file.
+
+        Arguments:
+
+        """
+
+        with open(fname, mode="w", encoding="UTF-8") as f_hdr:
+            f_hdr.write("Line1\n")
+
+    def test_new_dir(self):
+
+        """Function:  test_new_dir
+
+        Description:  Test with a directory with no watermark.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.scan_doc_dir(
+                self.cfg, self.docdir, self.watermarks), [self.fname])
+        self.assertEqual(self.watermarks[self.docdir]["mtime"], 1000)
+        self.assertEqual(
+            list(self.watermarks[self.docdir]["files"]),
+            [os.path.basename(self.fname)])
+
+    def test_unchanged_dir(self):
+
+        """Function:  test_unchanged_dir
+
+        Description:  Test with a directory not changed since the last run.
+
+        Arguments:
+
+        """
+
+        pulled_search.scan_doc_dir(self.cfg, self.docdir, self.watermarks)
+
+        self.assertEqual(
+            pulled_search.scan_doc_dir(
+                self.cfg, self.docdir, self.watermarks), [])
+
+    def test_new_file(self):
+
+        """Function:  test_new_file
+
+        Description:  Test with a file added since the last run.
+
+        Arguments:
+
+        """
+
+        pulled_search.scan_doc_dir(self.cfg, self.docdir, self.watermarks)
+        self.write_file(self.fname2)
+        os.utime(self.docdir, (2000, 2000))
+
+        self.assertEqual(
+            pulled_search.scan_doc_dir(
+                self.cfg, self.docdir, self.watermarks), [self.fname2])
+        self.assertEqual(len(self.watermarks[self.docdir]["files"]), 2)
+
+    def test_changed_file(self):
+
+        """Function:  test_changed_file
+
+        Description:  Test with a file replaced since the last run.
+
+        Arguments:
+
+        """
+
+        pulled_search.scan_doc_dir(self.cfg, self.docdir, self.watermarks)
+        os.utime(self.fname, (3000, 3000))
+        os.utime(self.docdir, (2000, 2000))
+
+        self.assertEqual(
+            pulled_search.scan_doc_dir(
+                self.cfg, self.docdir, self.watermarks), [self.fname])
+
+    def test_recent_dir(self):
+
+        """Function:  test_recent_dir
+
+        Description:  Test with a directory changed within the last seconds.
+
+        Arguments:
+
+        """
+
+        os.utime(self.docdir)
+        pulled_search.scan_doc_dir(self.cfg, self.docdir, self.watermarks)
+
+        self.assertEqual(self.watermarks[self.docdir]["mtime"], -1)
+        self.assertEqual(
+            pulled_search.scan_doc_dir(
+                self.cfg, self.docdir, self.watermarks), [])
+
+    def test_old_watermarks(self):
+
+        """Function:  test_old_watermarks
+
+        Description:  Test with watermarks not checked in over 62 days.
+
+        Arguments:
+
+        """
+
+        old_date = datetime.date.today() - datetime.timedelta(days=63)
+        self.watermarks["/dir/path/2020/01"] = {
+            "mtime": 1000, "files": {}, "checked": old_date.isoformat()}
+
+        pulled_search.scan_doc_dir(self.cfg, self.docdir, self.watermarks)
+
+        self.assertEqual(list(self.watermarks), [self.docdir])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.docdir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+# Classification (U)
+
+"""Program:  scan_log_file.py
+
+    Description:  Unit testing of scan_log_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/scan_log_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import re
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_entries
+        test_gzip_file
+        test_multiple_docids
+        test_single_docid
+        test_collect_tokens
+        test_plain_file_mmap
+        test_token_match
+        test_substring_match
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.basepath = "test/unit/pulled_search/testfiles"
+        self.fname = os.path.join(
+            self.basepath, "test_access_log.servername")
+        self.fname2 = os.path.join(
+            self.basepath, "test_access_log.servername.gz")
+        self.docid = "09109uosdhf"
+        self.docid2 = "09109abcdef"
+        self.line1 = "line 1 docid=09109uosdhf"
+        self.line2 = "line 2 docid=09109abcdef"
+        self.line4 = "line 4 docid=09109uosdhf docid=09109abcdef"
+        self.results = {self.docid: [self.line1, self.line4]}
+        self.results2 = {self.docid: [self.line1, self.line4],
+                         self.docid2: [self.line2, self.line4]}
+
+    def test_no_entries(self):
+
+        """Function:  test_no_entries
+
+        Description:  Test with no entries found.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.scan_log_file(self.fname, ["09109zzzzzz"]), {})
+
+    def test_gzip_file(self):
+
+        """Function:  test_gzip_file
+
+        Description:  Test with a gzip compressed file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.scan_log_file(
+                self.fname2, [self.docid, self.docid2]), self.results2)
+
+    def test_multiple_docids(self):
+
+        """Function:  test_multiple_docids
+
+        Description:  Test with multiple docids.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.scan_log_file(
+                self.fname, [self.docid, self.docid2]), self.results2)
+
+    def test_single_docid(self):
+
+        """Function:  test_single_docid
+
+        Description:  Test with a single docid.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.scan_log_file(self.fname, [self.docid]),
+            self.results)
+
+    def test_collect_tokens(self):
+
+        """Function:  test_collect_tokens
+
+        Description:  Test collecting the docid tokens of every log entry.
+
+        Arguments:
+
+        """
+
+        tokens = set()
+
+        self.assertEqual(
+            pulled_search.scan_log_file(
+                self.fname, ["nodocid"],
+                token_regex=re.compile("docid=([0-9A-Za-z]+)"),
+                tokens=tokens), {})
+        self.assertEqual(tokens, {self.docid, self.docid2})
+
+    @mock.patch("pulled_search.mmap_log_file")
+    def test_plain_file_mmap(self, mock_mmap):
+
+        """Function:  test_plain_file_mmap
+
+        Description:  Test with a plain file, the file is memory mapped.
+
+        Arguments:
+
+        """
+
+        mock_mmap.return_value = self.results
+
+        self.assertEqual(
+            pulled_search.scan_log_file(self.fname, [self.docid]),
+            self.results)
+        mock_mmap.assert_called_once_with(
+            self.fname, [self.docid], token_regex=None)
+
+    def test_token_match(self):
+
+        """Function:  test_token_match
+
+        Description:  Test with the docids matched against the docid tokens.
+
+        Arguments:
+
+        """
+
+        token_regex = re.compile("docid=([0-9A-Za-z]+)")
+
+        self.assertEqual(
+            pulled_search.scan_log_file(
+                self.fname2, ["09109uos", self.docid2],
+                token_regex=token_regex),
+            {self.docid2: [self.line2, self.line4]})
+        self.assertEqual(
+            pulled_search.scan_log_file(
+                self.fname, ["09109uos"], token_regex=token_regex), {})
+
+    def test_substring_match(self):
+
+        """Function:  test_substring_match
+
+        Description:  Test with the docids matched anywhere in the entry.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.scan_log_file(self.fname2, ["09109uos"]),
+            {"09109uos": [self.line1, self.line4]})
+
+
+if __name__ == "__main__":
+    unittest.main()
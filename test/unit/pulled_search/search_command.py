@@ -0,0 +1,191 @@
+# Classification (U)
+
+"""Program:  search_command.py
+
+    Description:  Unit testing of search_command in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/search_command.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.enclave = "ENCLAVE"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_process_json_failed
+        test_search_plan
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.docid = "09109uosdhf"
+        self.docid2 = "09109abcdef"
+        self.cmd_list = [
+            {"docid": self.docid, "command": "EUCOM", "pubdate": "20200102"},
+            {"docid": self.docid2, "command": "EUCOM", "pubdate": "20200202"}]
+        self.file_docids = {
+            "/path/2020/01/access.log1.server1.gz": [self.docid],
+            "/path/2020/02/access.log1.server1.gz": [self.docid, self.docid2]}
+        self.results = {}
+        self.results2 = {self.docid: "Failed the process_docid process",
+                         self.docid2: "Failed the process_docid process"}
+
+    @mock.patch("pulled_search.process_json", mock.Mock(return_value=False))
+    @mock.patch("pulled_search.search_files", mock.Mock(return_value={}))
+    @mock.patch("pulled_search.plan_search")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_process_json_failed(self, mock_log, mock_plan):
+
+        """Function:  test_process_json_failed
+
+        Description:  Test with process_json failing to process.
+
+        Arguments:
+
+        """
+
+        mock_plan.return_value = self.file_docids
+
+        self.assertEqual(
+            pulled_search.search_command(
+                self.args, self.cfg, self.cmd_list, mock_log),
+            self.results2)
+
+    @mock.patch("pulled_search.process_json", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.search_files")
+    @mock.patch("pulled_search.plan_search")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_search_plan(self, mock_log, mock_plan, mock_search):
+
+        """Function:  test_search_plan
+
+        Description:  Test with the log files searched as planned.
+
+        Arguments:
+
+        """
+
+        mock_plan.return_value = self.file_docids
+
+        self.assertEqual(
+            pulled_search.search_command(
+                self.args, self.cfg, self.cmd_list, mock_log, dtg="DTG"),
+            self.results)
+        mock_plan.assert_called_once_with(
+            self.args, self.cfg, self.cmd_list, mock_log)
+        self.assertEqual(mock_search.call_args[0][2], self.file_docids)
+        self.assertEqual(
+            list(mock_search.call_args[0][3]), [self.docid, self.docid2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,386 @@
+# Classification (U)
+
+"""Program:  search_files.py
+
+    Description:  Unit testing of search_files in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/search_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import re
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Pool():                                           # pylint:disable=R0903
+
+    """Class:  Pool
+
+    Description:  Class stub holder for a worker pool class.
+
+    Methods:
+        __init__
+        map
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.called = 0
+
+    def map(self, func, *iterables):
+
+        """Method:  map
+
+        Description:  Method stub holder for Executor.map.
+
+        Arguments:
+
+        """
+
+        self.called += 1
+
+        return map(func, *iterables)
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.outfile = "/dir/path/outfile"
+        self.search_backend = "native"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_checklog_backend
+        test_worker_pool
+        test_serial_search
+        test_archive_index
+        test_bloom_filter
+        test_bloom_repeat_search
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.pool = Pool()
+        self.docid = "09109uosdhf"
+        self.docid2 = "09109abcdef"
+        self.basepath = "test/unit/pulled_search/testfiles"
+        self.bloom_dir = "test/unit/pulled_search/tmp/bloom"
+        self.fname = os.path.join(
+            self.basepath, "test_access_log.servername")
+        self.fname2 = os.path.join(
+            self.basepath, "test_access_log.servername.gz")
+        self.file_docids = {self.fname: [self.docid],
+                            self.fname2: [self.docid, self.docid2]}
+        self.line1 = "line 1 docid=09109uosdhf"
+        self.line2 = "line 2 docid=09109abcdef"
+        self.line4 = "line 4 docid=09109uosdhf docid=09109abcdef"
+        self.results = {
+            self.docid: {"docid": self.docid, "servers": {"servername": [
+                self.line1, self.line4, self.line1, self.line4]}},
+            self.docid2: {"docid": self.docid2, "servers": {"servername": [
+                self.line2, self.line4]}}}
+
+    def log_jsons(self):
+
+        """Function:  log_jsons
+
+        Description:  Return empty JSON log documents.
+
+        Arguments:
+
+        """
+
+        return {self.docid: {"docid": self.docid, "servers": {}},
+                self.docid2: {"docid": self.docid2, "servers": {}}}
+
+    @mock.patch("pulled_search.rm_file", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.split_data")
+    @mock.patch("pulled_search.run_checklog")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_checklog_backend(self, mock_log, mock_chk, mock_split):
+
+        """Function:  test_checklog_backend
+
+        Description:  Test with the check_log backend.
+
+        Arguments:
+
+        """
+
+        self.cfg.search_backend = "checklog"
+        mock_chk.return_value = "/dir/path/outfile"
+        mock_split.return_value = {}
+
+        pulled_search.search_files(
+            self.args, self.cfg, self.file_docids, self.log_jsons(),
+            mock_log)
+
+        self.assertEqual(mock_chk.call_count, 2)
+        self.assertEqual(mock_split.call_count, 2)
+
+    @mock.patch("pulled_search.socket.gethostname",
+                mock.Mock(return_value="servername"))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_worker_pool(self, mock_log):
+
+        """Function:  test_worker_pool
+
+        Description:  Test with a worker pool, results are the same as a
+            serial search.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.search_files(
+                self.args, self.cfg, self.file_docids, self.log_jsons(),
+                mock_log, pool=self.pool), self.results)
+        self.assertEqual(self.pool.called, 1)
+
+    @mock.patch("pulled_search.socket.gethostname",
+                mock.Mock(return_value="servername"))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_serial_search(self, mock_log):
+
+        """Function:  test_serial_search
+
+        Description:  Test with a serial search.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.search_files(
+                self.args, self.cfg, self.file_docids, self.log_jsons(),
+                mock_log), self.results)
+
+    @mock.patch("pulled_search.read_log_offsets")
+    @mock.patch("pulled_search.scan_log_file")
+    @mock.patch("pulled_search.open_index")
+    @mock.patch("pulled_search.get_index_offsets")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_archive_index(                             # pylint:disable=R0913
+            self, mock_log, mock_offsets, mock_open, mock_scan, mock_read):
+
+        """Function:  test_archive_index
+
+        Description:  Test with the archive index, indexed files are read at
+            their offsets and other files are scanned.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-a": True}
+        self.cfg.index_dir = "/dir/path/index"
+        self.cfg.docid_token = "docid=([0-9A-Za-z]+)"
+        mock_offsets.side_effect = [None, [0, 70]]
+        mock_scan.return_value = {}
+        mock_read.return_value = {}
+
+        pulled_search.search_files(
+            self.args, self.cfg, self.file_docids, self.log_jsons(),
+            mock_log)
+
+        mock_open.assert_called_once_with("/dir/path/index/index.db")
+        mock_open.return_value.close.assert_called_once_with()
+        mock_scan.assert_called_once_with(
+            self.fname, [self.docid],
+            token_regex=re.compile(self.cfg.docid_token))
+        mock_read.assert_called_once_with(
+            self.fname2, [self.docid, self.docid2], [0, 70],
+            re.compile(self.cfg.docid_token))
+
+    @mock.patch("pulled_search.search_log_file")
+    @mock.patch("pulled_search.filter_bloom")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_bloom_filter(self, mock_log, mock_filter, mock_search):
+
+        """Function:  test_bloom_filter
+
+        Description:  Test with Bloom filter sidecars, log files ruled out by
+            the sidecar are not searched.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-a": True}
+        self.cfg.bloom_dir = "/dir/path/bloom"
+        self.cfg.docid_token = "docid=([0-9A-Za-z]+)"
+        mock_filter.side_effect = [
+            ([], None), ([self.docid2], "/dir/path/bloom/file.bloom")]
+        mock_search.return_value = {}
+
+        pulled_search.search_files(
+            self.args, self.cfg, self.file_docids, self.log_jsons(),
+            mock_log)
+
+        mock_search.assert_called_once_with(
+            self.fname2, [self.docid2], None, "/dir/path/bloom/file.bloom",
+            "docid=([0-9A-Za-z]+)")
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_bloom_repeat_search(self, mock_log):
+
+        """Function:  test_bloom_repeat_search
+
+        Description:  Test with the same search run twice, the search which
+            writes the Bloom filter sidecar and the search which uses it
+            return the same log entries.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-a": True}
+        self.cfg.log_dir = self.basepath
+        self.cfg.bloom_dir = self.bloom_dir
+        self.cfg.docid_token = "docid=([0-9A-Za-z]+)"
+        docids = [self.docid, self.docid2, "09109uos"]
+        file_docids = {self.fname2: docids}
+
+        results = pulled_search.search_files(
+            self.args, self.cfg, dict(file_docids),
+            {docid: {"docid": docid, "servers": {}} for docid in docids},
+            mock_log)
+        results2 = pulled_search.search_files(
+            self.args, self.cfg, dict(file_docids),
+            {docid: {"docid": docid, "servers": {}} for docid in docids},
+            mock_log)
+
+        self.assertTrue(os.listdir(self.bloom_dir))
+        self.assertEqual(results, results2)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isdir(self.bloom_dir):
+            shutil.rmtree(self.bloom_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+# Classification (U)
+
+"""Program:  search_log_file.py
+
+    Description:  Unit testing of search_log_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/search_log_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_with_offsets
+        test_no_offsets
+        test_write_bloom
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "/path/logs/access_log.server.gz"
+        self.docids = ["09109uosdhf"]
+        self.offsets = [0, 70]
+        self.results = {"09109uosdhf": ["Line1"]}
+
+    @mock.patch("pulled_search.scan_log_file")
+    @mock.patch("pulled_search.read_log_offsets")
+    def test_with_offsets(self, mock_read, mock_scan):
+
+        """Function:  test_with_offsets
+
+        Description:  Test with offsets from the archive index.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = self.results
+
+        self.assertEqual(
+            pulled_search.search_log_file(
+                self.fname, self.docids, self.offsets), self.results)
+        mock_scan.assert_not_called()
+
+    @mock.patch("pulled_search.scan_log_file")
+    def test_no_offsets(self, mock_scan):
+
+        """Function:  test_no_offsets
+
+        Description:  Test with no offsets, the file is scanned.
+
+        Arguments:
+
+        """
+
+        mock_scan.return_value = self.results
+
+        self.assertEqual(
+            pulled_search.search_log_file(self.fname, self.docids),
+            self.results)
+
+    @mock.patch("pulled_search.write_bloom")
+    def test_write_bloom(self, mock_write):
+
+        """Function:  test_write_bloom
+
+        Description:  Test with a Bloom filter file, the sidecar is written
+            from the scan.
+
+        Arguments:
+
+        """
+
+        fname = "test/unit/pulled_search/testfiles/test_access_log.servername"
+
+        self.assertEqual(
+            pulled_search.search_log_file(
+                fname, ["09109abcdef"], None, "/path/bloom/file.bloom",
+                "docid=([0-9A-Za-z]+)"),
+            {"09109abcdef": ["line 2 docid=09109abcdef",
+                             "line 4 docid=09109uosdhf docid=09109abcdef"]})
+
+        bloom = mock_write.call_args[0][1]
+
+        self.assertEqual(mock_write.call_args[0][0], "/path/bloom/file.bloom")
+        self.assertEqual(bloom["size"], os.stat(fname).st_size)
+        self.assertTrue(pulled_search.check_bloom(bloom, "09109uosdhf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
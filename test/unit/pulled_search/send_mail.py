@@ -0,0 +1,93 @@
+# Classification (U)
+
+"""Program:  send_mail.py
+
+    Description:  Unit testing of send_mail in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/send_mail.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_mail_sink
+        test_mail_sink
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mail = mock.MagicMock()
+        self.message = ("user@host", ["name@domain"], "Message text")
+
+    def test_no_mail_sink(self):
+
+        """Function:  test_no_mail_sink
+
+        Description:  Test with the email sent now.
+
+        Arguments:
+
+        """
+
+        pulled_search.send_mail(self.mail)
+
+        self.mail.send_mail.assert_called_once_with()
+
+    @mock.patch("pulled_search.mail_message")
+    def test_mail_sink(self, mock_message):
+
+        """Function:  test_mail_sink
+
+        Description:  Test with the message of the email queued in the mail
+            sink.
+
+        Arguments:
+
+        """
+
+        mail_sink = mock.MagicMock()
+        mock_message.return_value = self.message
+
+        pulled_search.send_mail(self.mail, mail_sink=mail_sink)
+
+        mock_message.assert_called_once_with(self.mail)
+        mail_sink.sendmail.assert_called_once_with(*self.message)
+        self.mail.send_mail.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# Classification (U)
+
+"""Program:  send_smtp.py
+
+    Description:  Unit testing of send_smtp in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/send_smtp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_mail_sink
+        test_mail_sink
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.message = ("user@host", "name@domain", "Message text")
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    def test_no_mail_sink(self, mock_smtp):
+
+        """Function:  test_no_mail_sink
+
+        Description:  Test with the message sent over a new SMTP session.
+
+        Arguments:
+
+        """
+
+        pulled_search.send_smtp(*self.message)
+
+        mock_smtp.return_value.sendmail.assert_called_once_with(*self.message)
+        mock_smtp.return_value.quit.assert_called_once_with()
+
+    @mock.patch("pulled_search.smtplib.SMTP")
+    def test_mail_sink(self, mock_smtp):
+
+        """Function:  test_mail_sink
+
+        Description:  Test with the message queued in the mail sink.
+
+        Arguments:
+
+        """
+
+        mail_sink = mock.MagicMock()
+
+        pulled_search.send_smtp(*self.message, mail_sink=mail_sink)
+
+        mail_sink.sendmail.assert_called_once_with(*self.message)
+        mock_smtp.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
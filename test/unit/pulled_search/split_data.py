@@ -0,0 +1,198 @@
+# Classification (U)
+
+"""Program:  split_data.py
+
+    Description:  Unit testing of split_data in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/split_data.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_file_not_exist
+        test_file_empty
+        test_existing_server
+        test_multiple_docids
+        test_single_docid
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ofile = "/path/file_name_processed"
+        self.server = "server_name"
+        self.fname = "Log_File_Name"
+        self.docid = "09109uosdhf"
+        self.docid2 = "09109abcdef"
+        self.file_log = ["Line1 09109uosdhf", "Line2 09109abcdef",
+                         "Line3 09109uosdhf 09109abcdef"]
+        self.log_jsons = {
+            self.docid: {"docid": self.docid, "servers": {}}}
+        self.log_jsons2 = {
+            self.docid: {"docid": self.docid, "servers": {}},
+            self.docid2: {"docid": self.docid2, "servers": {}}}
+        self.log_jsons3 = {
+            self.docid: {"docid": self.docid,
+                         "servers": {"server_name": ["Line0 09109uosdhf"]}}}
+        self.results = {
+            self.docid: {"docid": self.docid, "servers": {}}}
+        self.results2 = {
+            self.docid: {
+                "docid": self.docid,
+                "servers": {"server_name": [
+                    "Line1 09109uosdhf", "Line3 09109uosdhf 09109abcdef"]}}}
+        self.results3 = {
+            self.docid: {
+                "docid": self.docid,
+                "servers": {"server_name": [
+                    "Line1 09109uosdhf", "Line3 09109uosdhf 09109abcdef"]}},
+            self.docid2: {
+                "docid": self.docid2,
+                "servers": {"server_name": [
+                    "Line2 09109abcdef", "Line3 09109uosdhf 09109abcdef"]}}}
+        self.results4 = {
+            self.docid: {
+                "docid": self.docid,
+                "servers": {"server_name": [
+                    "Line0 09109uosdhf", "Line1 09109uosdhf",
+                    "Line3 09109uosdhf 09109abcdef"]}}}
+
+    @mock.patch("pulled_search.os.path.exists", mock.Mock(return_value=False))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_file_not_exist(self, mock_log):
+
+        """Function:  test_file_not_exist
+
+        Description:  Test with file not existing.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.split_data(
+                self.ofile, self.log_jsons, self.fname, self.server,
+                mock_log), self.results)
+
+    @mock.patch("pulled_search.os.path.exists", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_libs.is_empty_file",
+                mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_file_empty(self, mock_log):
+
+        """Function:  test_file_empty
+
+        Description:  Test with empty file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.split_data(
+                self.ofile, self.log_jsons, self.fname, self.server,
+                mock_log), self.results)
+
+    @mock.patch("pulled_search.os.path.exists", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_libs.is_empty_file",
+                mock.Mock(return_value=False))
+    @mock.patch("pulled_search.gen_libs.file_2_list")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_existing_server(self, mock_log, mock_list):
+
+        """Function:  test_existing_server
+
+        Description:  Test with entries appended to an existing server.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.file_log
+
+        self.assertEqual(
+            pulled_search.split_data(
+                self.ofile, self.log_jsons3, self.fname, self.server,
+                mock_log), self.results4)
+
+    @mock.patch("pulled_search.os.path.exists", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_libs.is_empty_file",
+                mock.Mock(return_value=False))
+    @mock.patch("pulled_search.gen_libs.file_2_list")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_multiple_docids(self, mock_log, mock_list):
+
+        """Function:  test_multiple_docids
+
+        Description:  Test with entries split between multiple docids.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.file_log
+
+        self.assertEqual(
+            pulled_search.split_data(
+                self.ofile, self.log_jsons2, self.fname, self.server,
+                mock_log), self.results3)
+
+    @mock.patch("pulled_search.os.path.exists", mock.Mock(return_value=True))
+    @mock.patch("pulled_search.gen_libs.is_empty_file",
+                mock.Mock(return_value=False))
+    @mock.patch("pulled_search.gen_libs.file_2_list")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_single_docid(self, mock_log, mock_list):
+
+        """Function:  test_single_docid
+
+        Description:  Test with entries for a single docid.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.file_log
+
+        self.assertEqual(
+            pulled_search.split_data(
+                self.ofile, self.log_jsons, self.fname, self.server,
+                mock_log), self.results2)
+
+
+if __name__ == "__main__":
+    unittest.main()
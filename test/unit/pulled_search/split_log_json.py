@@ -0,0 +1,178 @@
+# Classification (U)
+
+"""Program:  split_log_json.py
+
+    Description:  Unit testing of split_log_json in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/split_log_json.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_servers
+        test_single_part
+        test_oversized_line
+        test_multiple_servers
+        test_multiple_parts
+        test_repeated_offsets
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.log_json = {
+            "docid": "09109uosdhf",
+            "command": "COMMAND",
+            "asOf": "20200306 084503",
+            "servers": {"server_name": ["line1", "line2", "line3"]}}
+        self.log_json2 = {
+            "docid": "09109uosdhf",
+            "command": "COMMAND",
+            "asOf": "20200306 084503",
+            "servers": {"server1": ["line1", "line2"],
+                        "server2": ["line3"]}}
+
+    def test_no_servers(self):
+
+        """Function:  test_no_servers
+
+        Description:  Test with no log entries.
+
+        Arguments:
+
+        """
+
+        self.log_json["servers"] = {}
+
+        self.assertEqual(
+            pulled_search.split_log_json(self.log_json, 10), [self.log_json])
+
+    def test_single_part(self):
+
+        """Function:  test_single_part
+
+        Description:  Test with the log entries fitting in one part.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            pulled_search.split_log_json(self.log_json, 1000),
+            [self.log_json])
+
+    def test_oversized_line(self):
+
+        """Function:  test_oversized_line
+
+        Description:  Test with log entries larger than the chunk size.
+
+        Arguments:
+
+        """
+
+        parts = pulled_search.split_log_json(self.log_json, 1)
+
+        self.assertEqual(
+            [part["servers"] for part in parts],
+            [{"server_name": ["line1"]}, {"server_name": ["line2"]},
+             {"server_name": ["line3"]}])
+
+    def test_multiple_servers(self):
+
+        """Function:  test_multiple_servers
+
+        Description:  Test with the servers split across the parts.
+
+        Arguments:
+
+        """
+
+        parts = pulled_search.split_log_json(self.log_json2, 40)
+
+        self.assertEqual(
+            [part["servers"] for part in parts],
+            [{"server1": ["line1", "line2"]}, {"server2": ["line3"]}])
+
+    def test_multiple_parts(self):
+
+        """Function:  test_multiple_parts
+
+        Description:  Test with the part headers of the parts.
+
+        Arguments:
+
+        """
+
+        parts = pulled_search.split_log_json(self.log_json, 40)
+
+        self.assertEqual(
+            [(part["part"], part["total"]) for part in parts],
+            [(1, 2), (2, 2)])
+        self.assertEqual(parts[0]["run_id"], parts[1]["run_id"])
+        self.assertEqual(parts[1]["docid"], self.log_json["docid"])
+        self.assertEqual(
+            parts[0]["servers"]["server_name"]
+            + parts[1]["servers"]["server_name"],
+            self.log_json["servers"]["server_name"])
+
+    def test_repeated_offsets(self):
+
+        """Function:  test_repeated_offsets
+
+        Description:  Test with the offsets of log entries repeated across
+            the parts.
+
+        Arguments:
+
+        """
+
+        self.log_json["servers"]["server_name"] = [
+            "line1", "line2", "line1", "line1", "line2", "line3"]
+
+        parts = pulled_search.split_log_json(self.log_json, 40)
+
+        self.assertEqual(
+            [part["servers"]["server_name"] for part in parts],
+            [["line1", "line2"], ["line1", "line1"], ["line2", "line3"]])
+        self.assertEqual(
+            [part["offsets"] for part in parts],
+            [{}, {"server_name": {"line1": 1}},
+             {"server_name": {"line2": 1}}])
+
+
+if __name__ == "__main__":
+    unittest.main()
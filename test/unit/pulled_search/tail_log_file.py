@@ -0,0 +1,202 @@
+# Classification (U)
+
+"""Program:  tail_log_file.py
+
+    Description:  Unit testing of tail_log_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/tail_log_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_partial_line
+        test_replaced_file
+        test_truncated_file
+        test_new_entries
+        test_no_checkpoint
+        test_inode_checkpoint
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = "test/unit/pulled_search/tmp/tail"
+        self.fname = os.path.join(self.tmp_dir, "access_log")
+        self.line1 = "line 1 docid=09109uosdhf"
+        self.line2 = "line 2 docid=09109abcdef"
+        self.data = (self.line1 + "\n").encode()
+        self.data2 = (self.line2 + "\r\n").encode()
+
+    def write_file(self, data, mode="wb"):
+
+        """Function:  write_file
+
+        Description:  Write the temporary log file.
+
+        Arguments:
+
+        """
+
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+        with open(self.fname, mode=mode) as fhdr:
+            fhdr.write(data)
+
+        return {"inode": os.stat(self.fname).st_ino,
+                "offset": os.stat(self.fname).st_size}
+
+    def test_partial_line(self):
+
+        """Function:  test_partial_line
+
+        Description:  Test with an entry still being written.
+
+        Arguments:
+
+        """
+
+        checkpoint = self.write_file(self.data)
+        self.write_file(b"line 2 docid", mode="ab")
+
+        self.assertEqual(
+            pulled_search.tail_log_file(self.fname, checkpoint),
+            ([], checkpoint))
+
+    def test_replaced_file(self):
+
+        """Function:  test_replaced_file
+
+        Description:  Test with the log file replaced since the checkpoint.
+
+        Arguments:
+
+        """
+
+        checkpoint = self.write_file(self.data)
+        checkpoint["inode"] += 1
+
+        lines, _ = pulled_search.tail_log_file(self.fname, checkpoint)
+
+        self.assertEqual(lines, [self.line1])
+
+    def test_truncated_file(self):
+
+        """Function:  test_truncated_file
+
+        Description:  Test with the log file truncated since the checkpoint.
+
+        Arguments:
+
+        """
+
+        checkpoint = self.write_file(self.data + self.data2)
+        self.write_file(self.data)
+
+        lines, _ = pulled_search.tail_log_file(self.fname, checkpoint)
+
+        self.assertEqual(lines, [self.line1])
+
+    def test_new_entries(self):
+
+        """Function:  test_new_entries
+
+        Description:  Test with entries appended since the checkpoint.
+
+        Arguments:
+
+        """
+
+        checkpoint = self.write_file(self.data)
+        checkpoint2 = self.write_file(self.data2, mode="ab")
+
+        self.assertEqual(
+            pulled_search.tail_log_file(self.fname, checkpoint),
+            ([self.line2], checkpoint2))
+
+    def test_no_checkpoint(self):
+
+        """Function:  test_no_checkpoint
+
+        Description:  Test with no checkpoint, the file is read from the
+            start.
+
+        Arguments:
+
+        """
+
+        checkpoint = self.write_file(self.data + self.data2)
+
+        self.assertEqual(
+            pulled_search.tail_log_file(self.fname, None),
+            ([self.line1, self.line2], checkpoint))
+
+    def test_inode_checkpoint(self):
+
+        """Function:  test_inode_checkpoint
+
+        Description:  Test with no checkpoint for the file name, the
+            checkpoint of the same inode is used.
+
+        Arguments:
+
+        """
+
+        checkpoint = self.write_file(self.data)
+        checkpoint2 = self.write_file(self.data2, mode="ab")
+
+        self.assertEqual(
+            pulled_search.tail_log_file(
+                self.fname, None, inodes={checkpoint["inode"]: checkpoint}),
+            ([self.line2], checkpoint2))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isdir(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,33 +6,136 @@
 
 echo ""
 echo "Unit test:  pulled_search.py"
+/usr/bin/python ./test/unit/pulled_search/b64decode_file.py
+/usr/bin/python ./test/unit/pulled_search/bloom_positions.py
+/usr/bin/python ./test/unit/pulled_search/build_index.py
+/usr/bin/python ./test/unit/pulled_search/check_bloom.py
+/usr/bin/python ./test/unit/pulled_search/check_recall.py
 /usr/bin/python ./test/unit/pulled_search/checks_dirs.py
 /usr/bin/python ./test/unit/pulled_search/cleanup_files.py
 /usr/bin/python ./test/unit/pulled_search/config_override.py
-/usr/bin/python ./test/unit/pulled_search/filter_data.py
+/usr/bin/python ./test/unit/pulled_search/create_bloom.py
+/usr/bin/python ./test/unit/pulled_search/create_log_json.py
+/usr/bin/python ./test/unit/pulled_search/create_matcher.py
+/usr/bin/python ./test/unit/pulled_search/create_publisher.py
+/usr/bin/python ./test/unit/pulled_search/create_writer.py
+/usr/bin/python ./test/unit/pulled_search/email_json.py
+/usr/bin/python ./test/unit/pulled_search/encode_payload.py
 /usr/bin/python ./test/unit/pulled_search/file_input.py
+/usr/bin/python ./test/unit/pulled_search/filter_bloom.py
+/usr/bin/python ./test/unit/pulled_search/filter_data.py
 /usr/bin/python ./test/unit/pulled_search/get_archive_files.py
+/usr/bin/python ./test/unit/pulled_search/get_archive_months.py
+/usr/bin/python ./test/unit/pulled_search/get_bloom_file.py
+/usr/bin/python ./test/unit/pulled_search/get_catalog_files.py
+/usr/bin/python ./test/unit/pulled_search/get_checkpoint_file.py
+/usr/bin/python ./test/unit/pulled_search/get_command.py
+/usr/bin/python ./test/unit/pulled_search/get_doc_id.py
+/usr/bin/python ./test/unit/pulled_search/get_index_file.py
+/usr/bin/python ./test/unit/pulled_search/get_index_offsets.py
+/usr/bin/python ./test/unit/pulled_search/get_jobs.py
+/usr/bin/python ./test/unit/pulled_search/get_log_files.py
+/usr/bin/python ./test/unit/pulled_search/get_month_dirs.py
+/usr/bin/python ./test/unit/pulled_search/get_month_runs.py
+/usr/bin/python ./test/unit/pulled_search/get_part_suffix.py
+/usr/bin/python ./test/unit/pulled_search/get_processed.py
+/usr/bin/python ./test/unit/pulled_search/get_search_window.py
+/usr/bin/python ./test/unit/pulled_search/get_server.py
+/usr/bin/python ./test/unit/pulled_search/get_watch_files.py
 /usr/bin/python ./test/unit/pulled_search/help_message.py
+/usr/bin/python ./test/unit/pulled_search/import_processed.py
+/usr/bin/python ./test/unit/pulled_search/index_log_file.py
+/usr/bin/python ./test/unit/pulled_search/inotify_init.py
+/usr/bin/python ./test/unit/pulled_search/inotify_read.py
 /usr/bin/python ./test/unit/pulled_search/insert_data.py
+/usr/bin/python ./test/unit/pulled_search/insert_files.py
 /usr/bin/python ./test/unit/pulled_search/insert_mongo.py
 /usr/bin/python ./test/unit/pulled_search/is_base64.py
+/usr/bin/python ./test/unit/pulled_search/is_base64_file.py
+/usr/bin/python ./test/unit/pulled_search/is_indexed.py
+/usr/bin/python ./test/unit/pulled_search/is_recall.py
+/usr/bin/python ./test/unit/pulled_search/load_bloom.py
+/usr/bin/python ./test/unit/pulled_search/load_index.py
+/usr/bin/python ./test/unit/pulled_search/load_json_file.py
+/usr/bin/python ./test/unit/pulled_search/load_parser.py
 /usr/bin/python ./test/unit/pulled_search/load_processed.py
+/usr/bin/python ./test/unit/pulled_search/mail_message.py
+/usr/bin/python ./test/unit/pulled_search/mailsink_close.py
+/usr/bin/python ./test/unit/pulled_search/mailsink_connect.py
+/usr/bin/python ./test/unit/pulled_search/mailsink_deliver.py
+/usr/bin/python ./test/unit/pulled_search/mailsink_init.py
+/usr/bin/python ./test/unit/pulled_search/mailsink_run.py
+/usr/bin/python ./test/unit/pulled_search/mailsink_sendmail.py
 /usr/bin/python ./test/unit/pulled_search/main.py
+/usr/bin/python ./test/unit/pulled_search/match_docids.py
+/usr/bin/python ./test/unit/pulled_search/merge_entries.py
+/usr/bin/python ./test/unit/pulled_search/mmap_log_file.py
+/usr/bin/python ./test/unit/pulled_search/mongobatch_add.py
+/usr/bin/python ./test/unit/pulled_search/mongobatch_close.py
+/usr/bin/python ./test/unit/pulled_search/mongobatch_flush.py
+/usr/bin/python ./test/unit/pulled_search/mongobatch_init.py
+/usr/bin/python ./test/unit/pulled_search/mongowriter_add.py
+/usr/bin/python ./test/unit/pulled_search/mongowriter_close.py
+/usr/bin/python ./test/unit/pulled_search/mongowriter_connect.py
+/usr/bin/python ./test/unit/pulled_search/mongowriter_flush.py
+/usr/bin/python ./test/unit/pulled_search/mongowriter_init.py
+/usr/bin/python ./test/unit/pulled_search/mongowriter_insert.py
+/usr/bin/python ./test/unit/pulled_search/mongowriter_run.py
+/usr/bin/python ./test/unit/pulled_search/mongowriter_write_failed.py
+/usr/bin/python ./test/unit/pulled_search/monitor_insert.py
 /usr/bin/python ./test/unit/pulled_search/mvalidate_dirs.py
 /usr/bin/python ./test/unit/pulled_search/non_processed.py
+/usr/bin/python ./test/unit/pulled_search/open_catalog.py
+/usr/bin/python ./test/unit/pulled_search/open_index.py
+/usr/bin/python ./test/unit/pulled_search/open_log.py
+/usr/bin/python ./test/unit/pulled_search/open_log_bytes.py
+/usr/bin/python ./test/unit/pulled_search/open_processed.py
 /usr/bin/python ./test/unit/pulled_search/parse_data.py
-/usr/bin/python ./test/unit/pulled_search/process_data.py
-/usr/bin/python ./test/unit/pulled_search/process_docid.py
+/usr/bin/python ./test/unit/pulled_search/parse_line.py
+/usr/bin/python ./test/unit/pulled_search/parse_literal.py
+/usr/bin/python ./test/unit/pulled_search/plan_search.py
+/usr/bin/python ./test/unit/pulled_search/process_docids.py
 /usr/bin/python ./test/unit/pulled_search/process_failed.py
 /usr/bin/python ./test/unit/pulled_search/process_files.py
 /usr/bin/python ./test/unit/pulled_search/process_insert.py
 /usr/bin/python ./test/unit/pulled_search/process_json.py
+/usr/bin/python ./test/unit/pulled_search/prune_log_files.py
+/usr/bin/python ./test/unit/pulled_search/prune_watchlist.py
+/usr/bin/python ./test/unit/pulled_search/publish_json.py
+/usr/bin/python ./test/unit/pulled_search/read_insert_file.py
+/usr/bin/python ./test/unit/pulled_search/read_log_offsets.py
+/usr/bin/python ./test/unit/pulled_search/read_offset_lines.py
 /usr/bin/python ./test/unit/pulled_search/recall_search.py
 /usr/bin/python ./test/unit/pulled_search/recall_search2.py
+/usr/bin/python ./test/unit/pulled_search/refresh_catalog.py
 /usr/bin/python ./test/unit/pulled_search/remove_processed.py
 /usr/bin/python ./test/unit/pulled_search/rm_file.py
+/usr/bin/python ./test/unit/pulled_search/rmqpublisher_add.py
+/usr/bin/python ./test/unit/pulled_search/rmqpublisher_close.py
+/usr/bin/python ./test/unit/pulled_search/rmqpublisher_connect.py
+/usr/bin/python ./test/unit/pulled_search/rmqpublisher_init.py
+/usr/bin/python ./test/unit/pulled_search/rmqpublisher_publish.py
+/usr/bin/python ./test/unit/pulled_search/rmqpublisher_write_failed.py
+/usr/bin/python ./test/unit/pulled_search/run_checklog.py
+/usr/bin/python ./test/unit/pulled_search/run_options.py
 /usr/bin/python ./test/unit/pulled_search/run_program.py
-/usr/bin/python ./test/unit/pulled_search/search_docid.py
+/usr/bin/python ./test/unit/pulled_search/scan_doc_dir.py
+/usr/bin/python ./test/unit/pulled_search/scan_log_file.py
+/usr/bin/python ./test/unit/pulled_search/search_command.py
+/usr/bin/python ./test/unit/pulled_search/search_files.py
+/usr/bin/python ./test/unit/pulled_search/search_log_file.py
+/usr/bin/python ./test/unit/pulled_search/send_mail.py
+/usr/bin/python ./test/unit/pulled_search/send_smtp.py
+/usr/bin/python ./test/unit/pulled_search/split_data.py
+/usr/bin/python ./test/unit/pulled_search/split_log_json.py
+/usr/bin/python ./test/unit/pulled_search/tail_log_file.py
 /usr/bin/python ./test/unit/pulled_search/update_processed.py
+/usr/bin/python ./test/unit/pulled_search/update_watchlist.py
+/usr/bin/python ./test/unit/pulled_search/valid_jobs.py
 /usr/bin/python ./test/unit/pulled_search/validate_dirs.py
+/usr/bin/python ./test/unit/pulled_search/watch_logs.py
+/usr/bin/python ./test/unit/pulled_search/watch_mode.py
+/usr/bin/python ./test/unit/pulled_search/write_bloom.py
+/usr/bin/python ./test/unit/pulled_search/write_index.py
+/usr/bin/python ./test/unit/pulled_search/write_json_file.py
 /usr/bin/python ./test/unit/pulled_search/write_summary.py
@@ -17,6 +17,7 @@
 import sys
 import os
 import shutil
+import sqlite3
 import unittest
 import mock
 
@@ -47,6 +48,26 @@ def file_to_list(fname):
     return filelist
 
 
+def db_to_list(fname):
+
+    """Function:  db_to_list
+
+    Description:  Read the docids in a processed docids database into a list.
+
+    Arguments:
+        (input) fname -> Name of processed file
+        (output) docids -> Sorted list of docids
+
+    """
+
+    conn = sqlite3.connect(fname + ".db")
+    docids = [docid for docid, in conn.execute(
+        "SELECT docid FROM processed ORDER BY docid")]
+    conn.close()
+
+    return docids
+
+
 class UnitTest(unittest.TestCase):
 
     """Class:  UnitTest
@@ -61,6 +82,9 @@ class UnitTest(unittest.TestCase):
         test_update_existing_file
         test_create_new_file2
         test_create_new_file
+        test_sqlite_store
+        test_sqlite_import
+        test_sqlite_retention
         tearDown
 
     """
@@ -200,6 +224,68 @@ class UnitTest(unittest.TestCase):
 
         self.assertTrue(os.path.isfile(self.fname2))
 
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_sqlite_store(self, mock_log):
+
+        """Function:  test_sqlite_store
+
+        Description:  Test with the sqlite processed store.
+
+        Arguments:
+
+        """
+
+        pulled_search.update_processed(
+            mock_log, self.fname2, self.file_dict2, store="sqlite")
+
+        self.assertEqual(db_to_list(self.fname2), self.results3)
+        self.assertFalse(os.path.isfile(self.fname2))
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_sqlite_import(self, mock_log):
+
+        """Function:  test_sqlite_import
+
+        Description:  Test with the flat processed file imported into the
+            sqlite processed store.
+
+        Arguments:
+
+        """
+
+        shutil.copy2(
+            os.path.join(self.basepath, self.basefile), self.basepath2)
+        pulled_search.update_processed(
+            mock_log, self.fname, self.file_dict3, store="sqlite")
+
+        self.assertEqual(db_to_list(self.fname), self.results2)
+
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_sqlite_retention(self, mock_log):
+
+        """Function:  test_sqlite_retention
+
+        Description:  Test with old docids dropped from the sqlite processed
+            store.
+
+        Arguments:
+
+        """
+
+        conn = pulled_search.open_processed(self.fname2)
+
+        with conn:
+            conn.execute(
+                "INSERT INTO processed (docid, month) VALUES (?, ?)",
+                ("090109000000", "200001"))
+
+        conn.close()
+        pulled_search.update_processed(
+            mock_log, self.fname2, self.file_dict, store="sqlite",
+            retention=12)
+
+        self.assertEqual(db_to_list(self.fname2), self.results)
+
     def tearDown(self):
 
         """Function:  tearDown
@@ -216,6 +302,10 @@ class UnitTest(unittest.TestCase):
         if os.path.isfile(self.fname2):
             os.remove(self.fname2)
 
+        for fname in [self.fname + ".db", self.fname2 + ".db"]:
+            if os.path.isfile(fname):
+                os.remove(fname)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  update_watchlist.py
+
+    Description:  Unit testing of update_watchlist in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/update_watchlist.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.watch_file = "/dir/path/watchlist"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_list
+        test_update_watchlist
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.docid_dict = {"docid": "09109uosdhf", "command": "EUCOM",
+                           "pubdate": "20200102"}
+        self.docid_dict2 = {"docid": "09109abcdef", "command": "EUCOM",
+                            "pubdate": "20200202"}
+        self.watchlist = {"09109uosdhf": self.docid_dict}
+        self.results = {"09109uosdhf": self.docid_dict,
+                        "09109abcdef": self.docid_dict2}
+
+    @mock.patch("pulled_search.write_json_file")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_empty_list(self, mock_log, mock_write):
+
+        """Function:  test_empty_list
+
+        Description:  Test with no docids to add.
+
+        Arguments:
+
+        """
+
+        pulled_search.update_watchlist(self.cfg, mock_log, [])
+
+        mock_write.assert_not_called()
+
+    @mock.patch("pulled_search.write_json_file")
+    @mock.patch("pulled_search.load_json_file")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_update_watchlist(self, mock_log, mock_load, mock_write):
+
+        """Function:  test_update_watchlist
+
+        Description:  Test with docids added to the watchlist.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.watchlist
+
+        pulled_search.update_watchlist(
+            self.cfg, mock_log, [self.docid_dict, self.docid_dict2])
+
+        mock_write.assert_called_once_with(
+            "/dir/path/watchlist", self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+# Classification (U)
+
+"""Program:  valid_jobs.py
+
+    Description:  Unit testing of valid_jobs in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/valid_jobs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_set
+        test_valid_value
+        test_invalid_value
+        test_below_one
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_not_set(self):
+
+        """Function:  test_not_set
+
+        Description:  Test with -j option not set.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(pulled_search.valid_jobs(self.args))
+
+    def test_valid_value(self):
+
+        """Function:  test_valid_value
+
+        Description:  Test with a positive integer.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "8"}
+
+        self.assertTrue(pulled_search.valid_jobs(self.args))
+
+    def test_invalid_value(self):
+
+        """Function:  test_invalid_value
+
+        Description:  Test with a non-numeric value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "abc"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(pulled_search.valid_jobs(self.args))
+
+    def test_below_one(self):
+
+        """Function:  test_below_one
+
+        Description:  Test with a value below one.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "0"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(pulled_search.valid_jobs(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -72,6 +72,7 @@ class UnitTest(unittest.TestCase):
         test_outfile_failure
         test_log_dir_failure
         test_no_failures
+        test_bloom_dir_fail
 
     """
 
@@ -237,6 +238,26 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual(pulled_search.validate_dirs(self.cfg), self.results)
 
+    @mock.patch("pulled_search.gen_libs.chk_crt_dir")
+    def test_bloom_dir_fail(self, mock_chk):
+
+        """Function:  test_bloom_dir_fail
+
+        Description:  Test with failure on bloom_dir directory.
+
+        Arguments:
+
+        """
+
+        self.cfg.bloom_dir = "/dir_path/bloom_dir"
+        mock_chk.side_effect = [
+            self.chk, self.chk, self.chk, self.chk, self.chk, self.chk,
+            (False, "Bloom_dir failure")]
+
+        self.assertEqual(
+            pulled_search.validate_dirs(self.cfg),
+            {"/dir_path/bloom_dir": "Bloom_dir failure"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,427 @@
+# Classification (U)
+
+"""Program:  watch_logs.py
+
+    Description:  Unit testing of watch_logs in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/watch_logs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-W": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = "test/unit/pulled_search/tmp/watch"
+        self.log_dir = os.path.join(self.tmp_dir, "logs")
+        self.log_type = "access_log"
+        self.command = {"eucom": "intelink"}
+        self.enclave = "ENCLAVE"
+        self.watch_file = os.path.join(self.tmp_dir, "watchlist")
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_process_json_failed
+        test_unwatched_file
+        test_rotated_file
+        test_new_entries
+        test_first_check
+        test_logrotate_rename
+        test_file_vanished
+        test_permission_error
+        test_watchlist_pruned
+        test_empty_log_dir
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.docid = "09109uosdhf"
+        self.fname = os.path.join(self.cfg.log_dir, "intelink_access_log")
+        self.fname2 = os.path.join(self.cfg.log_dir, "usacic_access_log")
+        self.line1 = "line 1 docid=09109uosdhf"
+        self.line2 = "line 2 docid=09109abcdef"
+        os.makedirs(self.cfg.log_dir)
+        self.append_log(self.fname, self.line1)
+        self.append_log(self.fname2, self.line1)
+        pulled_search.write_json_file(self.cfg.watch_file, {
+            self.docid: {"docid": self.docid, "command": "EUCOM",
+                         "pubdate": "20200102"}})
+
+    @staticmethod
+    def append_log(fname, line):
+
+        """Function:  append_log
+
+        Description:  Append a log entry to a log file.
+
+        Arguments:
+
+        """
+
+        with open(fname, mode="a", encoding="UTF-8") as fhdr:
+            fhdr.write(line + "\n")
+
+    @mock.patch("pulled_search.process_failed")
+    @mock.patch("pulled_search.process_json", mock.Mock(return_value=False))
+    @mock.patch("pulled_search.socket.gethostname",
+                mock.Mock(return_value="servername"))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_process_json_failed(self, mock_log, mock_failed):
+
+        """Function:  test_process_json_failed
+
+        Description:  Test with process_json failing to process.
+
+        Arguments:
+
+        """
+
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+        self.append_log(self.fname, self.line1)
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+
+        mock_failed.assert_called_once_with(
+            self.args, self.cfg, mock_log,
+            {self.docid: "Failed the watch_logs process"}, mail_sink=None)
+
+    @mock.patch("pulled_search.process_json")
+    @mock.patch("pulled_search.socket.gethostname",
+                mock.Mock(return_value="servername"))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_unwatched_file(self, mock_log, mock_json):
+
+        """Function:  test_unwatched_file
+
+        Description:  Test with entries appended to an unwatched log file.
+
+        Arguments:
+
+        """
+
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+        self.append_log(self.fname2, self.line1)
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+
+        mock_json.assert_not_called()
+        self.assertEqual(
+            pulled_search.load_json_file(
+                self.cfg.watch_file + ".checkpoint")[self.fname2]["offset"],
+            os.stat(self.fname2).st_size)
+
+    @mock.patch("pulled_search.process_json")
+    @mock.patch("pulled_search.socket.gethostname",
+                mock.Mock(return_value="servername"))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_rotated_file(self, mock_log, mock_json):
+
+        """Function:  test_rotated_file
+
+        Description:  Test with a new log file after the first check, the
+            file is read from the start.
+
+        Arguments:
+
+        """
+
+        mock_json.return_value = True
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+        fname = self.fname + ".1"
+        self.append_log(fname, self.line1)
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+
+        log_json = mock_json.call_args[0][3]
+
+        self.assertEqual(log_json["servers"], {"servername": [self.line1]})
+
+    @mock.patch("pulled_search.process_json")
+    @mock.patch("pulled_search.socket.gethostname",
+                mock.Mock(return_value="servername"))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_new_entries(self, mock_log, mock_json):
+
+        """Function:  test_new_entries
+
+        Description:  Test with new entries appended to a watched log file.
+
+        Arguments:
+
+        """
+
+        mock_json.return_value = True
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+        self.append_log(self.fname, self.line2)
+        self.append_log(self.fname, self.line1)
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+
+        log_json = mock_json.call_args[0][3]
+
+        self.assertEqual(mock_json.call_count, 1)
+        self.assertEqual(log_json["docid"], self.docid)
+        self.assertEqual(log_json["command"], "EUCOM")
+        self.assertEqual(log_json["servers"], {"servername": [self.line1]})
+
+    @mock.patch("pulled_search.process_json")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_first_check(self, mock_log, mock_json):
+
+        """Function:  test_first_check
+
+        Description:  Test with the first check, the checkpoints are set to
+            the end of the log files.
+
+        Arguments:
+
+        """
+
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+
+        mock_json.assert_not_called()
+        self.assertEqual(
+            pulled_search.load_json_file(self.cfg.watch_file + ".checkpoint"),
+            {self.fname: {"inode": os.stat(self.fname).st_ino,
+                          "offset": os.stat(self.fname).st_size},
+             self.fname2: {"inode": os.stat(self.fname2).st_ino,
+                           "offset": os.stat(self.fname2).st_size}})
+
+    @mock.patch("pulled_search.process_json")
+    @mock.patch("pulled_search.socket.gethostname",
+                mock.Mock(return_value="servername"))
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_logrotate_rename(self, mock_log, mock_json):
+
+        """Function:  test_logrotate_rename
+
+        Description:  Test with a watched log file renamed by a log rotation
+            and a new log file created, the renamed file is read on from its
+            checkpoint and the new file is read from the start.
+
+        Arguments:
+
+        """
+
+        mock_json.return_value = True
+
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+        self.append_log(self.fname, self.line2)
+        os.rename(self.fname, self.fname + ".1")
+        self.append_log(self.fname, self.line1)
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+        self.append_log(self.fname + ".1", self.line1)
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+
+        self.assertEqual(mock_json.call_count, 2)
+        self.assertEqual(
+            mock_json.call_args_list[0][0][3]["servers"],
+            {"servername": [self.line1]})
+        self.assertEqual(
+            mock_json.call_args_list[1][0][3]["servers"],
+            {"servername": [self.line1]})
+
+    @mock.patch("pulled_search.tail_log_file")
+    @mock.patch("pulled_search.process_json")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_file_vanished(self, mock_log, mock_json, mock_tail):
+
+        """Function:  test_file_vanished
+
+        Description:  Test with a log file removed during the check, the file
+            is dropped from the checkpoints.
+
+        Arguments:
+
+        """
+
+        mock_tail.side_effect = FileNotFoundError
+
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+
+        mock_json.assert_not_called()
+        self.assertEqual(
+            list(pulled_search.load_json_file(
+                self.cfg.watch_file + ".checkpoint")), [self.fname2])
+
+    @mock.patch("pulled_search.tail_log_file")
+    @mock.patch("pulled_search.process_json")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_permission_error(self, mock_log, mock_json, mock_tail):
+
+        """Function:  test_permission_error
+
+        Description:  Test with a log file which cannot be read, the file is
+            skipped and keeps its checkpoint.
+
+        Arguments:
+
+        """
+
+        mock_tail.side_effect = PermissionError("Permission denied")
+
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+        checkpoints = pulled_search.load_json_file(
+            self.cfg.watch_file + ".checkpoint")
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+
+        mock_json.assert_not_called()
+        self.assertEqual(mock_log.log_err.call_count, 2)
+        self.assertEqual(
+            pulled_search.load_json_file(self.cfg.watch_file + ".checkpoint"),
+            checkpoints)
+        self.assertIn(
+            self.docid, pulled_search.load_json_file(self.cfg.watch_file))
+
+    @mock.patch("pulled_search.tail_log_file")
+    @mock.patch("pulled_search.process_json")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_watchlist_pruned(self, mock_log, mock_json, mock_tail):
+
+        """Function:  test_watchlist_pruned
+
+        Description:  Test with the only log file of a docid removed, the
+            docid is dropped from the watchlist.
+
+        Arguments:
+
+        """
+
+        mock_tail.side_effect = FileNotFoundError
+
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+
+        mock_json.assert_not_called()
+        self.assertEqual(
+            pulled_search.load_json_file(self.cfg.watch_file), {})
+
+    @mock.patch("pulled_search.process_json")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_empty_log_dir(self, mock_log, mock_json):
+
+        """Function:  test_empty_log_dir
+
+        Description:  Test with no log files in the log directory, the
+            watchlist is kept.
+
+        Arguments:
+
+        """
+
+        os.remove(self.fname)
+        os.remove(self.fname2)
+
+        pulled_search.watch_logs(self.args, self.cfg, mock_log)
+
+        mock_json.assert_not_called()
+        self.assertIn(
+            self.docid, pulled_search.load_json_file(self.cfg.watch_file))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isdir(self.cfg.tmp_dir):
+            shutil.rmtree(self.cfg.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# Classification (U)
+
+"""Program:  watch_mode.py
+
+    Description:  Unit testing of watch_mode in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/watch_mode.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.watch_file = "/dir/path/watchlist"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_watch_interval
+        test_interrupted
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = mock.Mock()
+        self.cfg = CfgTest()
+
+    @mock.patch("pulled_search.time.sleep")
+    @mock.patch("pulled_search.watch_logs")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_watch_interval(self, mock_log, mock_watch, mock_sleep):
+
+        """Function:  test_watch_interval
+
+        Description:  Test with watch_interval set.
+
+        Arguments:
+
+        """
+
+        self.cfg.watch_interval = 5
+        mock_sleep.side_effect = [None, KeyboardInterrupt]
+
+        pulled_search.watch_mode(self.args, self.cfg, mock_log)
+
+        self.assertEqual(mock_watch.call_count, 2)
+        mock_sleep.assert_called_with(5)
+
+    @mock.patch("pulled_search.time.sleep")
+    @mock.patch("pulled_search.watch_logs")
+    @mock.patch("pulled_search.gen_class.Logger")
+    def test_interrupted(self, mock_log, mock_watch, mock_sleep):
+
+        """Function:  test_interrupted
+
+        Description:  Test with the watch mode interrupted.
+
+        Arguments:
+
+        """
+
+        mock_sleep.side_effect = KeyboardInterrupt
+
+        pulled_search.watch_mode(self.args, self.cfg, mock_log)
+
+        mock_watch.assert_called_once_with(self.args, self.cfg, mock_log)
+        mock_sleep.assert_called_once_with(60)
+
+
+if __name__ == "__main__":
+    unittest.main()
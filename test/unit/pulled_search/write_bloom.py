@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  write_bloom.py
+
+    Description:  Unit testing of write_bloom in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/write_bloom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_create_directory
+        test_write_bloom
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.basepath = "test/unit/pulled_search/tmp"
+        self.bloom_dir = os.path.join(self.basepath, "bloom")
+        self.bloom_file = os.path.join(
+            self.bloom_dir, "2023", "04", "access_log.server.bloom")
+        self.bloom = {"bits": 64, "hashes": 1, "size": 10, "mtime": 1.5,
+                      "filter": bytearray(b"\x01" * 8)}
+
+    def test_create_directory(self):
+
+        """Function:  test_create_directory
+
+        Description:  Test with Bloom filter directory being created.
+
+        Arguments:
+
+        """
+
+        pulled_search.write_bloom(self.bloom_file, self.bloom)
+
+        self.assertTrue(os.path.isfile(self.bloom_file))
+
+    def test_write_bloom(self):
+
+        """Function:  test_write_bloom
+
+        Description:  Test writing the Bloom filter file.
+
+        Arguments:
+
+        """
+
+        pulled_search.write_bloom(self.bloom_file, self.bloom)
+
+        with open(self.bloom_file, mode="r", encoding="UTF-8") as fhdr:
+            data = fhdr.read()
+
+        self.assertIn('"filter": "AQEBAQEBAQE="', data)
+        self.assertFalse(os.path.exists(self.bloom_file + ".tmp"))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isdir(self.bloom_dir):
+            shutil.rmtree(self.bloom_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  write_index.py
+
+    Description:  Unit testing of write_index in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/write_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        get_postings
+        test_new_entry
+        test_replaced_entry
+        test_removed_entry
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.month_dir = "/archive/intelink/2023/04"
+        self.fname = "/archive/intelink/2023/04/access_log.server.gz"
+        self.fname2 = "/archive/intelink/2023/04/access_log.server2.gz"
+        self.entry = {"size": 10, "mtime": 1.5,
+                      "docids": {"09109uosdhf": [0, 70], "09109abcdef": [25]}}
+        self.entry2 = {"size": 20, "mtime": 2.5,
+                       "docids": {"09109abcdef": [40]}}
+        self.conn = pulled_search.open_index(":memory:")
+
+    def get_postings(self):
+
+        """Function:  get_postings
+
+        Description:  Get the postings in the index.
+
+        Arguments:
+
+        """
+
+        return self.conn.execute(
+            "SELECT docid, file, offset FROM postings"
+            " ORDER BY file, offset").fetchall()
+
+    def test_new_entry(self):
+
+        """Function:  test_new_entry
+
+        Description:  Test with a new log file entry.
+
+        Arguments:
+
+        """
+
+        pulled_search.write_index(self.conn, [(self.fname, self.entry)], [])
+
+        self.assertEqual(
+            pulled_search.load_index(self.conn, self.month_dir),
+            {self.fname: {"size": 10, "mtime": 1.5}})
+        self.assertEqual(
+            self.get_postings(),
+            [("09109uosdhf", self.fname, 0), ("09109abcdef", self.fname, 25),
+             ("09109uosdhf", self.fname, 70)])
+
+    def test_replaced_entry(self):
+
+        """Function:  test_replaced_entry
+
+        Description:  Test with a changed log file entry.
+
+        Arguments:
+
+        """
+
+        pulled_search.write_index(self.conn, [(self.fname, self.entry)], [])
+        pulled_search.write_index(self.conn, [(self.fname, self.entry2)], [])
+
+        self.assertEqual(
+            pulled_search.load_index(self.conn, self.month_dir),
+            {self.fname: {"size": 20, "mtime": 2.5}})
+        self.assertEqual(
+            self.get_postings(), [("09109abcdef", self.fname, 40)])
+
+    def test_removed_entry(self):
+
+        """Function:  test_removed_entry
+
+        Description:  Test with a removed log file entry.
+
+        Arguments:
+
+        """
+
+        pulled_search.write_index(
+            self.conn, [(self.fname, self.entry), (self.fname2, self.entry2)],
+            [])
+        pulled_search.write_index(self.conn, [], [self.fname])
+
+        self.assertEqual(
+            list(pulled_search.load_index(self.conn, self.month_dir)),
+            [self.fname2])
+        self.assertEqual(
+            self.get_postings(), [("09109abcdef", self.fname2, 40)])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
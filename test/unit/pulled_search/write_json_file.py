@@ -0,0 +1,86 @@
+# Classification (U)
+
+"""Program:  write_json_file.py
+
+    Description:  Unit testing of write_json_file in pulled_search.py.
+
+    Usage:
+        test/unit/pulled_search/write_json_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import pulled_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_write_json_file
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.basepath = "test/unit/pulled_search/tmp"
+        self.fname = os.path.join(self.basepath, "json_file")
+        self.data = {"key": {"inode": 10, "offset": 20}}
+
+    def test_write_json_file(self):
+
+        """Function:  test_write_json_file
+
+        Description:  Test writing the JSON file.
+
+        Arguments:
+
+        """
+
+        pulled_search.write_json_file(self.fname, self.data)
+
+        self.assertEqual(pulled_search.load_json_file(self.fname), self.data)
+        self.assertFalse(os.path.exists(self.fname + ".tmp"))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.exists(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
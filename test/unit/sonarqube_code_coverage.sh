@@ -8,35 +8,138 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=pulled_search test/unit/pulled_search/b64decode_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/bloom_positions.py
+coverage run -a --source=pulled_search test/unit/pulled_search/build_index.py
+coverage run -a --source=pulled_search test/unit/pulled_search/check_bloom.py
+coverage run -a --source=pulled_search test/unit/pulled_search/check_recall.py
 coverage run -a --source=pulled_search test/unit/pulled_search/checks_dirs.py
 coverage run -a --source=pulled_search test/unit/pulled_search/cleanup_files.py
 coverage run -a --source=pulled_search test/unit/pulled_search/config_override.py
+coverage run -a --source=pulled_search test/unit/pulled_search/create_bloom.py
+coverage run -a --source=pulled_search test/unit/pulled_search/create_log_json.py
+coverage run -a --source=pulled_search test/unit/pulled_search/create_matcher.py
+coverage run -a --source=pulled_search test/unit/pulled_search/create_publisher.py
+coverage run -a --source=pulled_search test/unit/pulled_search/create_writer.py
+coverage run -a --source=pulled_search test/unit/pulled_search/email_json.py
+coverage run -a --source=pulled_search test/unit/pulled_search/encode_payload.py
 coverage run -a --source=pulled_search test/unit/pulled_search/file_input.py
+coverage run -a --source=pulled_search test/unit/pulled_search/filter_bloom.py
 coverage run -a --source=pulled_search test/unit/pulled_search/filter_data.py
 coverage run -a --source=pulled_search test/unit/pulled_search/get_archive_files.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_archive_months.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_bloom_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_catalog_files.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_checkpoint_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_command.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_doc_id.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_index_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_index_offsets.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_jobs.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_log_files.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_month_dirs.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_month_runs.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_part_suffix.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_processed.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_search_window.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_server.py
+coverage run -a --source=pulled_search test/unit/pulled_search/get_watch_files.py
 coverage run -a --source=pulled_search test/unit/pulled_search/help_message.py
+coverage run -a --source=pulled_search test/unit/pulled_search/import_processed.py
+coverage run -a --source=pulled_search test/unit/pulled_search/index_log_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/inotify_init.py
+coverage run -a --source=pulled_search test/unit/pulled_search/inotify_read.py
 coverage run -a --source=pulled_search test/unit/pulled_search/insert_data.py
+coverage run -a --source=pulled_search test/unit/pulled_search/insert_files.py
 coverage run -a --source=pulled_search test/unit/pulled_search/insert_mongo.py
 coverage run -a --source=pulled_search test/unit/pulled_search/is_base64.py
+coverage run -a --source=pulled_search test/unit/pulled_search/is_base64_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/is_indexed.py
+coverage run -a --source=pulled_search test/unit/pulled_search/is_recall.py
+coverage run -a --source=pulled_search test/unit/pulled_search/load_bloom.py
+coverage run -a --source=pulled_search test/unit/pulled_search/load_index.py
+coverage run -a --source=pulled_search test/unit/pulled_search/load_json_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/load_parser.py
 coverage run -a --source=pulled_search test/unit/pulled_search/load_processed.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mail_message.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mailsink_close.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mailsink_connect.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mailsink_deliver.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mailsink_init.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mailsink_run.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mailsink_sendmail.py
 coverage run -a --source=pulled_search test/unit/pulled_search/main.py
+coverage run -a --source=pulled_search test/unit/pulled_search/match_docids.py
+coverage run -a --source=pulled_search test/unit/pulled_search/merge_entries.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mmap_log_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongobatch_add.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongobatch_close.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongobatch_flush.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongobatch_init.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongowriter_add.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongowriter_close.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongowriter_connect.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongowriter_flush.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongowriter_init.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongowriter_insert.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongowriter_run.py
+coverage run -a --source=pulled_search test/unit/pulled_search/mongowriter_write_failed.py
+coverage run -a --source=pulled_search test/unit/pulled_search/monitor_insert.py
 coverage run -a --source=pulled_search test/unit/pulled_search/mvalidate_dirs.py
 coverage run -a --source=pulled_search test/unit/pulled_search/non_processed.py
+coverage run -a --source=pulled_search test/unit/pulled_search/open_catalog.py
+coverage run -a --source=pulled_search test/unit/pulled_search/open_index.py
+coverage run -a --source=pulled_search test/unit/pulled_search/open_log.py
+coverage run -a --source=pulled_search test/unit/pulled_search/open_log_bytes.py
+coverage run -a --source=pulled_search test/unit/pulled_search/open_processed.py
 coverage run -a --source=pulled_search test/unit/pulled_search/parse_data.py
-coverage run -a --source=pulled_search test/unit/pulled_search/process_data.py
-coverage run -a --source=pulled_search test/unit/pulled_search/process_docid.py
+coverage run -a --source=pulled_search test/unit/pulled_search/parse_line.py
+coverage run -a --source=pulled_search test/unit/pulled_search/parse_literal.py
+coverage run -a --source=pulled_search test/unit/pulled_search/plan_search.py
+coverage run -a --source=pulled_search test/unit/pulled_search/process_docids.py
 coverage run -a --source=pulled_search test/unit/pulled_search/process_failed.py
 coverage run -a --source=pulled_search test/unit/pulled_search/process_files.py
 coverage run -a --source=pulled_search test/unit/pulled_search/process_insert.py
 coverage run -a --source=pulled_search test/unit/pulled_search/process_json.py
+coverage run -a --source=pulled_search test/unit/pulled_search/prune_log_files.py
+coverage run -a --source=pulled_search test/unit/pulled_search/prune_watchlist.py
+coverage run -a --source=pulled_search test/unit/pulled_search/publish_json.py
+coverage run -a --source=pulled_search test/unit/pulled_search/read_insert_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/read_log_offsets.py
+coverage run -a --source=pulled_search test/unit/pulled_search/read_offset_lines.py
 coverage run -a --source=pulled_search test/unit/pulled_search/recall_search.py
 coverage run -a --source=pulled_search test/unit/pulled_search/recall_search2.py
+coverage run -a --source=pulled_search test/unit/pulled_search/refresh_catalog.py
 coverage run -a --source=pulled_search test/unit/pulled_search/remove_processed.py
 coverage run -a --source=pulled_search test/unit/pulled_search/rm_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/rmqpublisher_add.py
+coverage run -a --source=pulled_search test/unit/pulled_search/rmqpublisher_close.py
+coverage run -a --source=pulled_search test/unit/pulled_search/rmqpublisher_connect.py
+coverage run -a --source=pulled_search test/unit/pulled_search/rmqpublisher_init.py
+coverage run -a --source=pulled_search test/unit/pulled_search/rmqpublisher_publish.py
+coverage run -a --source=pulled_search test/unit/pulled_search/rmqpublisher_write_failed.py
+coverage run -a --source=pulled_search test/unit/pulled_search/run_checklog.py
+coverage run -a --source=pulled_search test/unit/pulled_search/run_options.py
 coverage run -a --source=pulled_search test/unit/pulled_search/run_program.py
-coverage run -a --source=pulled_search test/unit/pulled_search/search_docid.py
+coverage run -a --source=pulled_search test/unit/pulled_search/scan_doc_dir.py
+coverage run -a --source=pulled_search test/unit/pulled_search/scan_log_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/search_command.py
+coverage run -a --source=pulled_search test/unit/pulled_search/search_files.py
+coverage run -a --source=pulled_search test/unit/pulled_search/search_log_file.py
+coverage run -a --source=pulled_search test/unit/pulled_search/send_mail.py
+coverage run -a --source=pulled_search test/unit/pulled_search/send_smtp.py
+coverage run -a --source=pulled_search test/unit/pulled_search/split_data.py
+coverage run -a --source=pulled_search test/unit/pulled_search/split_log_json.py
+coverage run -a --source=pulled_search test/unit/pulled_search/tail_log_file.py
 coverage run -a --source=pulled_search test/unit/pulled_search/update_processed.py
+coverage run -a --source=pulled_search test/unit/pulled_search/update_watchlist.py
+coverage run -a --source=pulled_search test/unit/pulled_search/valid_jobs.py
 coverage run -a --source=pulled_search test/unit/pulled_search/validate_dirs.py
+coverage run -a --source=pulled_search test/unit/pulled_search/watch_logs.py
+coverage run -a --source=pulled_search test/unit/pulled_search/watch_mode.py
+coverage run -a --source=pulled_search test/unit/pulled_search/write_bloom.py
+coverage run -a --source=pulled_search test/unit/pulled_search/write_index.py
+coverage run -a --source=pulled_search test/unit/pulled_search/write_json_file.py
 coverage run -a --source=pulled_search test/unit/pulled_search/write_summary.py
 
 echo ""
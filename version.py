@@ -6,4 +6,4 @@
 
 """
 
-__version__ = "0.2.14"
+__version__ = "0.3.0"